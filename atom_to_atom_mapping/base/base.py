@@ -2,11 +2,22 @@
 
 from abc import ABC, abstractmethod
 from logging import Logger
-from typing import Any, Dict, List, Optional, Sequence
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from atom_to_atom_mapping.utility.failure_report import FailureReport
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+from atom_to_atom_mapping.utility.pipeline import iterate_in_background
 
 
 class AtomToAtomMappingBase(ABC):
-    """ The chemical reaction compound atom-to-atom mapping base class. """
+    """
+    The chemical reaction compound atom-to-atom mapping base class. The `default_batch_size` attribute is the size of
+    the batches of the default `iter_map_reaction_smiles` method, and it can be adjusted by the subclasses that map
+    the batches more efficiently in the larger or smaller sizes.
+    """
+
+    default_batch_size = 100
 
     def __init__(
             self,
@@ -20,6 +31,8 @@ class AtomToAtomMappingBase(ABC):
 
         self.logger = logger
 
+        self.failure_report = None
+
     @property
     def logger(
             self
@@ -45,6 +58,66 @@ class AtomToAtomMappingBase(ABC):
 
         self._logger = value
 
+    @property
+    def failure_report(
+            self
+    ) -> Optional[FailureReport]:
+        """
+        Get the value of the failure report. If the failure report is utilized, the atom-to-atom mapping failures are
+        aggregated into it instead of being logged individually, and the per-reaction progress is not logged.
+
+        :returns: The value of the failure report.
+        """
+
+        return self._failure_report
+
+    @failure_report.setter
+    def failure_report(
+            self,
+            value: Optional[FailureReport]
+    ) -> None:
+        """
+        Set the value of the failure report.
+
+        :parameter value: The value of the failure report.
+        """
+
+        self._failure_report = value
+
+    def _log_failure(
+            self,
+            reaction_smiles: Optional[str],
+            exception_handle: BaseException
+    ) -> None:
+        """
+        Log an unsuccessful atom-to-atom mapping of a chemical reaction SMILES string, or add it to the failure report
+        if the failure report is utilized. This method should be called while the exception is handled.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+        :parameter exception_handle: The exception of the failure.
+        """
+
+        if self.failure_report is not None:
+            self.failure_report.add_failure(
+                reaction_smiles=reaction_smiles,
+                exception_handle=exception_handle
+            )
+
+        elif self.logger is not None:
+            self.logger.error(
+                msg=(
+                    "The atom-to-atom mapping of the chemical reaction SMILES string '{reaction_smiles}' has been "
+                    "unsuccessful."
+                ).format(
+                    reaction_smiles=reaction_smiles
+                )
+            )
+
+            self.logger.debug(
+                msg=exception_handle,
+                exc_info=True
+            )
+
     @abstractmethod
     def map_reaction_smiles(
             self,
@@ -62,11 +135,128 @@ class AtomToAtomMappingBase(ABC):
     def map_reaction_smiles_strings(
             self,
             reaction_smiles_strings: Sequence[str]
-    ) -> List[Dict[str, Any]]:
+    ) -> MappingResultBatch:
         """
         Map the chemical reaction SMILES strings.
 
         :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
 
-        :returns: The mapped chemical reaction SMILES strings.
+        :returns: The batch of the mapped chemical reaction SMILES strings. The batch is backed by the typed columns,
+            and the dictionary view of the outputs is available using the `to_dicts` method or by iteration.
+        """
+
+    @staticmethod
+    def _get_reaction_smiles_batches(
+            reaction_smiles_strings: Iterable[str],
+            batch_size: int
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Get the batches of the chemical reaction SMILES strings without materializing the complete iterable.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter batch_size: The size of the batch.
+
+        :returns: The iterator of the input index of the first chemical reaction SMILES string of each batch and the
+            batch.
+        """
+
+        reaction_smiles_iterator = iter(reaction_smiles_strings)
+
+        reaction_smiles_index = 0
+
+        while True:
+            reaction_smiles_batch = list(islice(reaction_smiles_iterator, max(1, batch_size)))
+
+            if len(reaction_smiles_batch) == 0:
+                break
+
+            yield reaction_smiles_index, reaction_smiles_batch
+
+            reaction_smiles_index += len(reaction_smiles_batch)
+
+    def _preprocess_reaction_smiles_batch(
+            self,
+            reaction_smiles_strings: List[str]
+    ) -> Any:
+        """
+        Pre-process a batch of the chemical reaction SMILES strings before the atom-to-atom mapping. By default, the
+        batch is not modified.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+
+        :returns: The pre-processed batch.
+        """
+
+        return reaction_smiles_strings
+
+    def _get_preprocessed_reaction_smiles_batches(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            batch_size: int,
+            maximum_number_of_prefetched_batches: int = 0
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Get the pre-processed batches of the chemical reaction SMILES strings. If the batches are prefetched, the
+        reading and pre-processing of the next batches run in a background thread and overlap with the atom-to-atom
+        mapping of the current batch.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter batch_size: The size of the batch.
+        :parameter maximum_number_of_prefetched_batches: The maximum number of batches that are pre-processed ahead of
+            the atom-to-atom mapping. The value `0` indicates that the batches should not be prefetched.
+
+        :returns: The iterator of the input index of the first chemical reaction SMILES string of each batch and the
+            pre-processed batch.
+        """
+
+        preprocessed_reaction_smiles_batches = (
+            (
+                reaction_smiles_index,
+                self._preprocess_reaction_smiles_batch(
+                    reaction_smiles_strings=reaction_smiles_batch
+                ),
+            ) for reaction_smiles_index, reaction_smiles_batch in self._get_reaction_smiles_batches(
+                reaction_smiles_strings=reaction_smiles_strings,
+                batch_size=batch_size
+            )
+        )
+
+        if maximum_number_of_prefetched_batches > 0:
+            preprocessed_reaction_smiles_batches = iterate_in_background(
+                iterable=preprocessed_reaction_smiles_batches,
+                maximum_queue_size=maximum_number_of_prefetched_batches
+            )
+
+        yield from preprocessed_reaction_smiles_batches
+
+    def iter_map_reaction_smiles(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            batch_size: Optional[int] = None,
+            return_indices: bool = False,
+            **kwargs
+    ) -> Iterator[Union[Dict[str, Any], Tuple[int, Dict[str, Any]]]]:
+        """
+        Map the chemical reaction SMILES strings and yield the outputs as soon as each batch has been mapped.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter batch_size: The size of the batch. The value `None` indicates that the `default_batch_size` attribute
+            of the class should be utilized.
+        :parameter return_indices: The indicator of whether the input indices of the chemical reaction SMILES strings
+            should be yielded together with the outputs.
+        :parameter kwargs: The keyword arguments for the adjustment of the `map_reaction_smiles_strings` method.
+
+        :returns: The iterator of the mapped chemical reaction SMILES strings, optionally with their input indices.
         """
+
+        for reaction_smiles_index, reaction_smiles_batch in self._get_reaction_smiles_batches(
+            reaction_smiles_strings=reaction_smiles_strings,
+            batch_size=self.default_batch_size if batch_size is None else batch_size
+        ):
+            for output_index, output in enumerate(
+                self.map_reaction_smiles_strings(
+                    reaction_smiles_batch,
+                    **kwargs
+                )
+            ):
+                yield (reaction_smiles_index + output_index, output) if return_indices else output
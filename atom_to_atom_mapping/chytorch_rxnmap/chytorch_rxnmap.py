@@ -1,12 +1,15 @@
 """ The ``atom_to_atom_mapping.chytorch_rxnmap`` package ``chytorch_rxnmap`` module. """
 
-from typing import Dict, List, Optional, Sequence, Union
+from logging import Logger
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
 
-from chython import smiles
+from chython import ReactionContainer, smiles
 
 from tqdm.auto import tqdm
 
 from atom_to_atom_mapping.base.base import AtomToAtomMappingBase
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch, MappingResultBatchBuilder
+from atom_to_atom_mapping.utility.molecule_cache import MoleculeCache, get_reaction_compound_smiles_strings
 
 
 class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
@@ -15,6 +18,97 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
     class.
     """
 
+    def __init__(
+            self,
+            logger: Optional[Logger] = None,
+            maximum_molecule_cache_size: int = 0
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        :parameter maximum_molecule_cache_size: The maximum number of the parsed chemical compounds that are cached, so
+            that the chemical reactions are assembled from the cached chemical compounds. The value `0` indicates that
+            the chemical compounds should not be cached.
+        """
+
+        super().__init__(
+            logger=logger
+        )
+
+        self.molecule_cache = MoleculeCache(
+            maximum_size=maximum_molecule_cache_size
+        ) if maximum_molecule_cache_size > 0 else None
+
+    def _parse_reaction_smiles(
+            self,
+            reaction_smiles: str,
+            **kwargs
+    ) -> Any:
+        """
+        Parse a chemical reaction SMILES string. If the molecule cache is utilized, the chemical reaction is assembled
+        from the copies of the cached chemical compounds, whose atoms are renumbered to be unique within the chemical
+        reaction.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
+            { `chython.files.daylight.smiles.smiles` }.
+
+        :returns: The chemical reaction.
+        """
+
+        parsing_kwargs = {
+            "ignore": kwargs.get("ignore", True),
+            "ignore_stereo": kwargs.get("ignore_stereo", False),
+            "ignore_bad_isotopes": kwargs.get("ignore_bad_isotopes", False),
+            "keep_implicit": kwargs.get("keep_implicit", False),
+            "ignore_carbon_radicals": kwargs.get("ignore_carbon_radicals", False),
+            "ignore_aromatic_radicals": kwargs.get("ignore_aromatic_radicals", True),
+        }
+
+        reaction_compound_smiles_strings = None
+
+        if self.molecule_cache is not None and ":" not in reaction_smiles:
+            reaction_compound_smiles_strings = get_reaction_compound_smiles_strings(
+                reaction_smiles=reaction_smiles
+            )
+
+        if reaction_compound_smiles_strings is None:
+            return smiles(
+                reaction_smiles,
+                remap=kwargs.get("remap", False),
+                **parsing_kwargs
+            )
+
+        parsing_key = tuple(sorted(parsing_kwargs.items()))
+
+        reaction_compounds, number_of_atoms = list(), 0
+
+        for compound_smiles_strings in reaction_compound_smiles_strings:
+            reaction_compounds.append(list())
+
+            for compound_smiles in compound_smiles_strings:
+                compound = self.molecule_cache.get(
+                    key=("chython", compound_smiles, parsing_key, ),
+                    function=lambda: smiles(compound_smiles, **parsing_kwargs)
+                )
+
+                reaction_compounds[-1].append(compound.remap(
+                    {
+                        atom_number: number_of_atoms + atom_index
+                        for atom_index, atom_number in enumerate(compound, start=1)
+                    },
+                    copy=True
+                ))
+
+                number_of_atoms += len(compound)
+
+        return ReactionContainer(
+            reactants=reaction_compounds[0],
+            reagents=reaction_compounds[1],
+            products=reaction_compounds[2]
+        )
+
     def _map_reaction_smiles(
             self,
             reaction_smiles: str,
@@ -31,15 +125,9 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
         """
 
         try:
-            reaction = smiles(
-                reaction_smiles,
-                ignore=kwargs.get("ignore", True),
-                remap=kwargs.get("remap", False),
-                ignore_stereo=kwargs.get("ignore_stereo", False),
-                ignore_bad_isotopes=kwargs.get("ignore_bad_isotopes", False),
-                keep_implicit=kwargs.get("keep_implicit", False),
-                ignore_carbon_radicals=kwargs.get("ignore_carbon_radicals", False),
-                ignore_aromatic_radicals=kwargs.get("ignore_aromatic_radicals", True)
+            reaction = self._parse_reaction_smiles(
+                reaction_smiles=reaction_smiles,
+                **kwargs
             )
 
             kwargs.pop("return_score", None)
@@ -56,20 +144,10 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
             }
 
         except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=(
-                        "The atom-to-atom mapping of the chemical reaction SMILES string '{reaction_smiles:s}' has "
-                        "been unsuccessful."
-                    ).format(
-                        reaction_smiles=reaction_smiles
-                    )
-                )
-
-                self.logger.debug(
-                    msg=exception_handle,
-                    exc_info=True
-                )
+            self._log_failure(
+                reaction_smiles=reaction_smiles,
+                exception_handle=exception_handle
+            )
 
             return {
                 "mapped_reaction_smiles": None,
@@ -91,7 +169,7 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
         :returns: The mapped chemical reaction SMILES string and atom-to-atom mapping confidence score.
         """
 
-        if self.logger is not None:
+        if self.logger is not None and self.failure_report is None:
             self.logger.info(
                 msg=(
                     "The atom-to-atom mapping of the chemical reaction SMILES string using the Chytorch RxnMap "
@@ -104,7 +182,7 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
             **kwargs
         )
 
-        if self.logger is not None:
+        if self.logger is not None and self.failure_report is None:
             self.logger.info(
                 msg=(
                     "The atom-to-atom mapping of the chemical reaction SMILES string using the Chytorch RxnMap "
@@ -118,7 +196,7 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
             self,
             reaction_smiles_strings: Sequence[str],
             **kwargs
-    ) -> List[Dict[str, Optional[Union[float, str]]]]:
+    ) -> MappingResultBatch:
         """
         Map the chemical reaction SMILES strings.
 
@@ -126,7 +204,7 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
         :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions and methods:
             { `chython.files.daylight.smiles.smiles`, `chython.algorithms.mapping.attention.Attention.reset_mapping` }.
 
-        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping confidence scores.
+        :returns: The batch of the mapped chemical reaction SMILES strings and atom-to-atom mapping confidence scores.
         """
 
         if self.logger is not None:
@@ -137,7 +215,7 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
                 )
             )
 
-        chytorch_rxnmap_outputs = list()
+        chytorch_rxnmap_outputs = MappingResultBatchBuilder()
 
         tqdm_description = "Mapping the chemical reaction SMILES strings"
 
@@ -162,4 +240,58 @@ class ChytorchRxnMapAtomToAtomMapping(AtomToAtomMappingBase):
                 )
             )
 
-        return chytorch_rxnmap_outputs
+            if self.molecule_cache is not None:
+                self.logger.info(
+                    msg=(
+                        "The molecule cache hit rate: {hit_rate:.2%} (Number of Hits: {number_of_hits:d}, Number of "
+                        "Misses: {number_of_misses:d})."
+                    ).format(
+                        **self.molecule_cache.get_summary()
+                    )
+                )
+
+        return chytorch_rxnmap_outputs.build()
+
+    def iter_map_reaction_smiles(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            return_indices: bool = False,
+            **kwargs
+    ) -> Iterator[Union[Dict[str, Optional[Union[float, str]]], Tuple[int, Dict[str, Optional[Union[float, str]]]]]]:
+        """
+        Map the chemical reaction SMILES strings and yield the outputs as soon as each chemical reaction SMILES string
+        has been mapped.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter return_indices: The indicator of whether the input indices of the chemical reaction SMILES strings
+            should be yielded together with the outputs.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions and methods:
+            { `chython.files.daylight.smiles.smiles`, `chython.algorithms.mapping.attention.Attention.reset_mapping` }.
+
+        :returns: The iterator of the mapped chemical reaction SMILES strings and atom-to-atom mapping confidence
+            scores, optionally with their input indices.
+        """
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the Chytorch "
+                    "RxnMap approach has been started."
+                )
+            )
+
+        for reaction_smiles_index, reaction_smiles in enumerate(reaction_smiles_strings):
+            chytorch_rxnmap_output = self._map_reaction_smiles(
+                reaction_smiles=reaction_smiles,
+                **kwargs
+            )
+
+            yield (reaction_smiles_index, chytorch_rxnmap_output) if return_indices else chytorch_rxnmap_output
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the Chytorch "
+                    "RxnMap approach has been completed."
+                )
+            )
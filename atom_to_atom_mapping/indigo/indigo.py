@@ -1,18 +1,152 @@
 """ The ``atom_to_atom_mapping.indigo`` package ``indigo`` module. """
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from functools import partial
-from typing import Dict, List, Optional, Sequence, Union
+from logging import Logger
+from math import ceil
+from re import compile
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from indigo import Indigo
 
 from pqdm.processes import pqdm
 
+from pyarrow import array
+
 from atom_to_atom_mapping.base.base import AtomToAtomMappingBase
+from atom_to_atom_mapping.utility.cpu_resources import get_cpu_resource_manager
+from atom_to_atom_mapping.utility.failure_report import FAILURE_RECORD_KEY, FailureReport, get_failure_record
+from atom_to_atom_mapping.utility.mapping_result_batch import OUTPUT_COLUMN_ARROW_DATA_TYPES, MappingResultBatch
+from atom_to_atom_mapping.utility.molecule_cache import (
+    MoleculeCache,
+    get_reaction_compound_smiles_strings,
+    merge_molecule_cache_summaries,
+)
+from atom_to_atom_mapping.utility.reaction_record_file import RXN_BLOCK_PREFIX
+from atom_to_atom_mapping.utility.time_budget import TimeBudget
+from atom_to_atom_mapping.utility.worker_recycling import WorkerRecyclingProcessPool, merge_worker_memory_summaries
+
+
+SMILES_ATOM_TOKEN_PATTERN = compile(
+    r"(\[[^\]]+]|Br?|Cl?|N|O|S|P|F|I|b|c|n|o|s|p|\*|\%[0-9]{2}|[0-9])"
+)
+
+_process_indigo_molecule_caches: Dict[int, Tuple[Indigo, MoleculeCache]] = dict()
+
+
+def _get_process_indigo_molecule_cache(
+        maximum_molecule_cache_size: int
+) -> Tuple[Indigo, MoleculeCache]:
+    """
+    Get the Indigo session and the molecule cache of the current process. The cached chemical compounds are bound to
+    the Indigo session, which is therefore shared by all of the chemical reactions that are mapped in the process. The
+    molecule caches are keyed by their maximum size, so that the instances with the different maximum sizes do not
+    share the molecule cache of the first one.
+
+    :parameter maximum_molecule_cache_size: The maximum number of the cached chemical compounds.
+
+    :returns: The Indigo session and the molecule cache of the current process.
+    """
+
+    if maximum_molecule_cache_size not in _process_indigo_molecule_caches:
+        _process_indigo_molecule_caches[maximum_molecule_cache_size] = (
+            Indigo(),
+            MoleculeCache(
+                maximum_size=maximum_molecule_cache_size
+            ),
+        )
+
+    return _process_indigo_molecule_caches[maximum_molecule_cache_size]
 
 
 class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
     """ The `Indigo <https://github.com/epam/Indigo>`_ chemical reaction compound atom-to-atom mapping class. """
 
+    def __init__(
+            self,
+            logger: Optional[Logger] = None,
+            maximum_molecule_cache_size: int = 0
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        :parameter maximum_molecule_cache_size: The maximum number of the parsed chemical compounds that are cached per
+            process, so that the chemical reactions are assembled from the cached chemical compounds. The value `0`
+            indicates that the chemical compounds should not be cached.
+        """
+
+        super().__init__(
+            logger=logger
+        )
+
+        self.maximum_molecule_cache_size = maximum_molecule_cache_size
+
+        self.worker_memory_summary: Optional[Dict[str, Any]] = None
+        self.molecule_cache_summary: Optional[Dict[str, Any]] = None
+
+    def _load_reaction(
+            self,
+            reaction_smiles: str
+    ) -> Tuple[Indigo, Any]:
+        """
+        Load a chemical reaction SMILES string as an Indigo query reaction. If the molecule cache is utilized, the query
+        reaction is assembled from the cached chemical compounds. The chemical reaction SMILES strings that cannot be
+        split into the individual chemical compounds, such as the ones with the atom map numbers, CXSMILES extensions
+        or component-level grouping, are loaded without the molecule cache. The RXN blocks are loaded directly as Indigo
+        reactions, without the conversion to the chemical reaction SMILES strings.
+
+        :parameter reaction_smiles: The SMILES string or the RXN block of the chemical reaction.
+
+        :returns: The Indigo session and the Indigo query reaction.
+        """
+
+        if reaction_smiles.startswith(RXN_BLOCK_PREFIX):
+            indigo_ = Indigo()
+
+            return indigo_, indigo_.loadReaction(
+                string=reaction_smiles
+            )
+
+        reaction_compound_smiles_strings = None
+
+        if self.maximum_molecule_cache_size > 0 and ":" not in reaction_smiles:
+            reaction_compound_smiles_strings = get_reaction_compound_smiles_strings(
+                reaction_smiles=reaction_smiles
+            )
+
+        if reaction_compound_smiles_strings is None or any(
+            compound_smiles.startswith("(") for compound_smiles_strings in reaction_compound_smiles_strings
+            for compound_smiles in compound_smiles_strings
+        ):
+            indigo_ = Indigo()
+
+            return indigo_, indigo_.loadReactionSmarts(
+                string=reaction_smiles
+            )
+
+        indigo_, molecule_cache = _get_process_indigo_molecule_cache(
+            maximum_molecule_cache_size=self.maximum_molecule_cache_size
+        )
+
+        reaction = indigo_.createQueryReaction()
+
+        for add_compound_function, compound_smiles_strings in zip(
+            (reaction.addReactant, reaction.addCatalyst, reaction.addProduct, ),
+            reaction_compound_smiles_strings
+        ):
+            for compound_smiles in compound_smiles_strings:
+                add_compound_function(
+                    molecule_cache.get(
+                        key=("indigo", compound_smiles, ),
+                        function=lambda: indigo_.loadSmarts(compound_smiles)
+                    )
+                )
+
+        return indigo_, reaction
+
     def _map_reaction_smiles(
             self,
             reaction_smiles: str,
@@ -42,21 +176,21 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
         :parameter canonicalize_reaction_smiles: The indicator of whether the chemical reaction SMILES string should be
             canonicalized.
 
-        :returns: The mapped chemical reaction SMILES string and atom-to-atom mapping status code.
+        :returns: The mapped chemical reaction SMILES string and atom-to-atom mapping status code. If the failure report
+            is utilized, an unsuccessful output also contains the record of the failure, so that the failures in the
+            worker processes can be collected into the failure report of the main process.
         """
 
         try:
-            indigo_ = Indigo()
+            indigo_, reaction = self._load_reaction(
+                reaction_smiles=reaction_smiles
+            )
 
             indigo_.setOption(
                 option="aam-timeout",
                 value1=timeout_period_in_ms
             )
 
-            reaction = indigo_.loadReactionSmarts(
-                string=reaction_smiles
-            )
-
             status_code = reaction.automap(
                 mode="".join([
                     handle_existing_atom_map_numbers if handle_existing_atom_map_numbers in [
@@ -80,26 +214,302 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
             }
 
         except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=(
-                        "The atom-to-atom mapping of the chemical reaction SMILES string '{reaction_smiles:s}' has "
-                        "been unsuccessful."
-                    ).format(
-                        reaction_smiles=reaction_smiles
-                    )
-                )
+            if self.failure_report is not None:
+                return {
+                    "mapped_reaction_smiles": None,
+                    "status_code": None,
+                    FAILURE_RECORD_KEY: get_failure_record(
+                        reaction_smiles=reaction_smiles,
+                        exception_handle=exception_handle
+                    ),
+                }
 
-                self.logger.debug(
-                    msg=exception_handle,
-                    exc_info=True
-                )
+            self._log_failure(
+                reaction_smiles=reaction_smiles,
+                exception_handle=exception_handle
+            )
 
             return {
                 "mapped_reaction_smiles": None,
                 "status_code": None,
             }
 
+    def _map_reaction_smiles_batch(
+            self,
+            reaction_smiles_strings: Sequence[str],
+            **kwargs
+    ) -> List[Dict[str, Optional[Union[int, str]]]]:
+        """
+        Map a batch of the chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+        :parameter kwargs: The keyword arguments for the adjustment of the `_map_reaction_smiles` method.
+
+        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping status codes of the batch.
+        """
+
+        return [
+            self._map_reaction_smiles(
+                reaction_smiles=reaction_smiles,
+                **kwargs
+            ) for reaction_smiles in reaction_smiles_strings
+        ]
+
+    def _map_reaction_smiles_batch_and_get_molecule_cache_summary(
+            self,
+            reaction_smiles_strings: Sequence[str],
+            **kwargs
+    ) -> Tuple[List[Dict[str, Optional[Union[int, str]]]], Optional[Dict[str, Any]]]:
+        """
+        Map a batch of the chemical reaction SMILES strings and get the molecule cache summary of the batch, so that
+        the molecule cache summaries of the processes can be merged.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+        :parameter kwargs: The keyword arguments for the adjustment of the `_map_reaction_smiles` method.
+
+        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping status codes of the batch, and
+            the molecule cache summary of the batch.
+        """
+
+        if self.maximum_molecule_cache_size == 0:
+            return self._map_reaction_smiles_batch(
+                reaction_smiles_strings=reaction_smiles_strings,
+                **kwargs
+            ), None
+
+        _, molecule_cache = _get_process_indigo_molecule_cache(
+            maximum_molecule_cache_size=self.maximum_molecule_cache_size
+        )
+
+        number_of_hits, number_of_misses = molecule_cache.number_of_hits, molecule_cache.number_of_misses
+
+        indigo_batch_outputs = self._map_reaction_smiles_batch(
+            reaction_smiles_strings=reaction_smiles_strings,
+            **kwargs
+        )
+
+        return indigo_batch_outputs, merge_molecule_cache_summaries(
+            molecule_cache_summaries=[{
+                "number_of_hits": molecule_cache.number_of_hits - number_of_hits,
+                "number_of_misses": molecule_cache.number_of_misses - number_of_misses,
+            }, ]
+        )
+
+    def _collect_molecule_cache_summaries(
+            self,
+            batch_outputs: Iterable[Tuple[int, Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]]]
+    ) -> Iterator[Tuple[int, List[Dict[str, Optional[Union[int, str]]]]]]:
+        """
+        Collect the molecule cache summaries of the batches into the molecule cache summary of the instance, and the
+        failure records of the batches into the failure report of the instance, if relevant.
+
+        :parameter batch_outputs: The input indices, outputs and molecule cache summaries of the batches.
+
+        :returns: The iterator of the input indices and outputs of the batches.
+        """
+
+        for reaction_smiles_index, (indigo_batch_output, molecule_cache_summary) in batch_outputs:
+            self.molecule_cache_summary = merge_molecule_cache_summaries(
+                molecule_cache_summaries=[self.molecule_cache_summary, molecule_cache_summary, ]
+            )
+
+            if self.failure_report is not None:
+                indigo_batch_output = list(self.failure_report.collect_failure_records(
+                    outputs=indigo_batch_output
+                ))
+
+            yield reaction_smiles_index, indigo_batch_output
+
+    def _log_molecule_cache_summary(
+            self
+    ) -> None:
+        """ Log the molecule cache summary of the instance, if relevant. """
+
+        if self.logger is not None and self.molecule_cache_summary is not None:
+            self.logger.info(
+                msg=(
+                    "The molecule cache hit rate: {hit_rate:.2%} (Number of Hits: {number_of_hits:d}, Number of "
+                    "Misses: {number_of_misses:d})."
+                ).format(
+                    **self.molecule_cache_summary
+                )
+            )
+
+    @staticmethod
+    def _estimate_reaction_smiles_cost(
+            reaction_smiles: str
+    ) -> int:
+        """
+        Estimate the relative atom-to-atom mapping cost of a chemical reaction SMILES string from the number of atoms
+        and bonds of the reactants and products. The number of bonds is derived from the number of atoms, compounds and
+        ring closures, so that the chemical reaction SMILES string does not need to be parsed.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+        :returns: The estimated relative atom-to-atom mapping cost of the chemical reaction SMILES string.
+        """
+
+        reaction_smiles_sides = reaction_smiles.split(" ")[0].split(">")
+
+        reaction_side_sizes = list()
+
+        for reaction_smiles_side in (reaction_smiles_sides[0], reaction_smiles_sides[-1], ):
+            smiles_tokens = SMILES_ATOM_TOKEN_PATTERN.findall(reaction_smiles_side)
+
+            number_of_ring_closures = sum(
+                smiles_token[0] == "%" or smiles_token.isdigit() for smiles_token in smiles_tokens
+            ) // 2
+            number_of_atoms = len(smiles_tokens) - 2 * number_of_ring_closures
+            number_of_compounds = len([
+                compound_smiles for compound_smiles in reaction_smiles_side.split(".") if compound_smiles != ""
+            ])
+
+            reaction_side_sizes.append(
+                number_of_atoms + max(0, number_of_atoms - number_of_compounds + number_of_ring_closures)
+            )
+
+        return (reaction_side_sizes[0] + 1) * (reaction_side_sizes[1] + 1)
+
+    @staticmethod
+    def _get_longest_first_reaction_smiles_index_batches(
+            reaction_smiles_costs: Sequence[int],
+            number_of_processes: int,
+            maximum_batch_size: int = 100
+    ) -> List[List[int]]:
+        """
+        Get the batches of the input indices of the chemical reaction SMILES strings in the descending order of their
+        estimated cost. Each batch receives a fraction of the remaining estimated cost, so that the most expensive
+        chemical reactions are dispatched first in small batches, the cheap chemical reactions are packed together, and
+        the batches shrink towards the end of the run to balance the load of the processes.
+
+        :parameter reaction_smiles_costs: The estimated costs of the chemical reaction SMILES strings.
+        :parameter number_of_processes: The number of processes.
+        :parameter maximum_batch_size: The maximum size of a batch.
+
+        :returns: The batches of the input indices of the chemical reaction SMILES strings.
+        """
+
+        remaining_cost = sum(reaction_smiles_costs)
+
+        reaction_smiles_index_batches, reaction_smiles_index_batch, batch_cost, target_batch_cost = list(), list(), 0, 0
+
+        for reaction_smiles_index in sorted(
+            range(len(reaction_smiles_costs)),
+            key=lambda index: reaction_smiles_costs[index],
+            reverse=True
+        ):
+            if len(reaction_smiles_index_batch) == 0:
+                target_batch_cost = remaining_cost / (4 * number_of_processes)
+
+            reaction_smiles_index_batch.append(reaction_smiles_index)
+
+            batch_cost += reaction_smiles_costs[reaction_smiles_index]
+
+            if batch_cost >= target_batch_cost or len(reaction_smiles_index_batch) >= maximum_batch_size:
+                reaction_smiles_index_batches.append(reaction_smiles_index_batch)
+
+                remaining_cost -= batch_cost
+
+                reaction_smiles_index_batch, batch_cost = list(), 0
+
+        if len(reaction_smiles_index_batch) > 0:
+            reaction_smiles_index_batches.append(reaction_smiles_index_batch)
+
+        return reaction_smiles_index_batches
+
+    def _map_reaction_smiles_strings_longest_first(
+            self,
+            reaction_smiles_strings: Sequence[str],
+            number_of_processes: int,
+            maximum_number_of_tasks_per_worker: Optional[int] = None,
+            maximum_worker_memory_in_mb: Optional[float] = None,
+            **kwargs
+    ) -> List[Dict[str, Optional[Union[int, str]]]]:
+        """
+        Map the chemical reaction SMILES strings in the descending order of their estimated cost using a process pool,
+        and restore the input order of the outputs.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter number_of_processes: The number of processes.
+        :parameter maximum_number_of_tasks_per_worker: The number of task batches after which a worker process is
+            recycled. The value `None` indicates that the worker processes should not be recycled based on the number
+            of task batches.
+        :parameter maximum_worker_memory_in_mb: The resident set size in megabytes above which a worker process is
+            recycled. The value `None` indicates that the worker processes should not be recycled based on the resident
+            set size.
+        :parameter kwargs: The keyword arguments for the adjustment of the `_map_reaction_smiles` method.
+
+        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping status codes in the input order.
+        """
+
+        start_time = perf_counter()
+
+        number_of_processes = get_cpu_resource_manager().get_layout(
+            number_of_processes=number_of_processes
+        )["number_of_processes"]
+
+        reaction_smiles_index_batches = self._get_longest_first_reaction_smiles_index_batches(
+            reaction_smiles_costs=[
+                self._estimate_reaction_smiles_cost(
+                    reaction_smiles=reaction_smiles
+                ) for reaction_smiles in reaction_smiles_strings
+            ],
+            number_of_processes=number_of_processes
+        )
+
+        indigo_outputs = [None, ] * len(reaction_smiles_strings)
+
+        with WorkerRecyclingProcessPool(
+            number_of_processes=number_of_processes,
+            maximum_number_of_tasks_per_worker=maximum_number_of_tasks_per_worker,
+            maximum_worker_memory_in_mb=maximum_worker_memory_in_mb,
+            logger=self.logger
+        ) as worker_recycling_process_pool:
+            for batch_index, indigo_batch_outputs in self._collect_molecule_cache_summaries(
+                batch_outputs=self._submit_reaction_smiles_batches_as_completed(
+                    process_pool=worker_recycling_process_pool,
+                    function=partial(
+                        self._map_reaction_smiles_batch_and_get_molecule_cache_summary,
+                        **kwargs
+                    ),
+                    reaction_smiles_batches=(
+                        (batch_index, [
+                            reaction_smiles_strings[reaction_smiles_index]
+                            for reaction_smiles_index in reaction_smiles_index_batch
+                        ]) for batch_index, reaction_smiles_index_batch in enumerate(reaction_smiles_index_batches)
+                    ),
+                    maximum_number_of_pending_batches=2 * number_of_processes
+                )
+            ):
+                for reaction_smiles_index, indigo_output in zip(
+                    reaction_smiles_index_batches[batch_index],
+                    indigo_batch_outputs
+                ):
+                    indigo_outputs[reaction_smiles_index] = indigo_output
+
+            worker_memory_summary = worker_recycling_process_pool.get_memory_summary()
+
+        self.worker_memory_summary = merge_worker_memory_summaries(
+            worker_memory_summaries=[self.worker_memory_summary, worker_memory_summary, ]
+        )
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The longest-first scheduling has dispatched {number_of_reactions:d} chemical reaction SMILES "
+                    "strings as {number_of_batches:d} batches of {minimum_batch_size:d} to {maximum_batch_size:d} "
+                    "chemical reactions (Makespan: {makespan_in_s:.1f} s)."
+                ).format(
+                    number_of_reactions=len(reaction_smiles_strings),
+                    number_of_batches=len(reaction_smiles_index_batches),
+                    minimum_batch_size=min(map(len, reaction_smiles_index_batches), default=0),
+                    maximum_batch_size=max(map(len, reaction_smiles_index_batches), default=0),
+                    makespan_in_s=perf_counter() - start_time
+                )
+            )
+
+        return indigo_outputs
+
     def map_reaction_smiles(
             self,
             reaction_smiles: str,
@@ -132,7 +542,7 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
         :returns: The mapped chemical reaction SMILES string and atom-to-atom mapping status code.
         """
 
-        if self.logger is not None:
+        if self.logger is not None and self.failure_report is None:
             self.logger.info(
                 msg=(
                     "The atom-to-atom mapping of the chemical reaction SMILES string using the Indigo approach has "
@@ -151,7 +561,12 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
             canonicalize_reaction_smiles=canonicalize_reaction_smiles
         )
 
-        if self.logger is not None:
+        if self.failure_report is not None:
+            indigo_output, = self.failure_report.collect_failure_records(
+                outputs=[indigo_output, ]
+            )
+
+        elif self.logger is not None:
             self.logger.info(
                 msg=(
                     "The atom-to-atom mapping of the chemical reaction SMILES string using the Indigo approach has "
@@ -161,6 +576,153 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
 
         return indigo_output
 
+    @staticmethod
+    def _get_timeout_periods_in_ms(
+            timeout_period_in_ms: int,
+            maximum_timeout_period_in_ms: int,
+            timeout_escalation_factor: float
+    ) -> List[int]:
+        """
+        Get the timeout periods of the passes of the timeout escalation.
+
+        :parameter timeout_period_in_ms: The timeout period in milliseconds of the first pass.
+        :parameter maximum_timeout_period_in_ms: The maximum timeout period in milliseconds.
+        :parameter timeout_escalation_factor: The factor by which the timeout period is increased between the passes.
+
+        :returns: The timeout periods in milliseconds of the passes.
+        """
+
+        timeout_periods_in_ms = [max(1, timeout_period_in_ms), ]
+
+        while timeout_periods_in_ms[-1] < maximum_timeout_period_in_ms:
+            timeout_periods_in_ms.append(min(
+                maximum_timeout_period_in_ms,
+                max(timeout_periods_in_ms[-1] + 1, ceil(timeout_periods_in_ms[-1] * timeout_escalation_factor))
+            ))
+
+        return timeout_periods_in_ms
+
+    def _map_reaction_smiles_strings_with_timeout_escalation(
+            self,
+            reaction_smiles_strings: Sequence[str],
+            timeout_period_in_ms: int,
+            maximum_timeout_period_in_ms: int,
+            timeout_escalation_factor: float,
+            **kwargs
+    ) -> MappingResultBatch:
+        """
+        Map the chemical reaction SMILES strings in several passes with the progressively longer timeout periods. The
+        first pass maps all of the chemical reaction SMILES strings, while each further pass re-maps only the chemical
+        reaction SMILES strings whose atom-to-atom mapping has timed out or failed in the previous pass. If the failure
+        report is utilized, only the failures of the last pass are added to it, so that the re-mapped chemical reaction
+        SMILES strings are not reported more than once.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter timeout_period_in_ms: The timeout period in milliseconds of the first pass.
+        :parameter maximum_timeout_period_in_ms: The maximum timeout period in milliseconds.
+        :parameter timeout_escalation_factor: The factor by which the timeout period is increased between the passes.
+        :parameter kwargs: The keyword arguments for the adjustment of the `map_reaction_smiles_strings` method.
+
+        :returns: The batch of the mapped chemical reaction SMILES strings, atom-to-atom mapping status codes, and
+            1-based indices of the passes that have mapped the chemical reaction SMILES strings.
+        """
+
+        mapped_reaction_smiles_strings = [None, ] * len(reaction_smiles_strings)
+        status_codes = [None, ] * len(reaction_smiles_strings)
+        mapping_passes = [None, ] * len(reaction_smiles_strings)
+
+        pending_reaction_smiles_indices = list(range(len(reaction_smiles_strings)))
+
+        failure_report, pass_failure_report = self.failure_report, None
+
+        try:
+            for mapping_pass, pass_timeout_period_in_ms in enumerate(
+                self._get_timeout_periods_in_ms(
+                    timeout_period_in_ms=timeout_period_in_ms,
+                    maximum_timeout_period_in_ms=maximum_timeout_period_in_ms,
+                    timeout_escalation_factor=timeout_escalation_factor
+                ),
+                start=1
+            ):
+                if len(pending_reaction_smiles_indices) == 0:
+                    break
+
+                if failure_report is not None:
+                    pass_failure_report = FailureReport(
+                        maximum_number_of_examples=failure_report.maximum_number_of_examples
+                    )
+
+                    self.failure_report = pass_failure_report
+
+                indigo_outputs = self.map_reaction_smiles_strings(
+                    [
+                        reaction_smiles_strings[reaction_smiles_index]
+                        for reaction_smiles_index in pending_reaction_smiles_indices
+                    ],
+                    timeout_period_in_ms=pass_timeout_period_in_ms,
+                    **kwargs
+                )
+
+                unsuccessful_reaction_smiles_indices = list()
+
+                for reaction_smiles_index, mapped_reaction_smiles, status_code in zip(
+                    pending_reaction_smiles_indices,
+                    indigo_outputs.column("mapped_reaction_smiles").to_pylist(),
+                    indigo_outputs.column("status_code").to_pylist()
+                ):
+                    mapped_reaction_smiles_strings[reaction_smiles_index] = mapped_reaction_smiles
+                    status_codes[reaction_smiles_index] = status_code
+
+                    if mapped_reaction_smiles is None or status_code != 1:
+                        unsuccessful_reaction_smiles_indices.append(reaction_smiles_index)
+
+                    else:
+                        mapping_passes[reaction_smiles_index] = mapping_pass
+
+                if self.logger is not None:
+                    self.logger.info(
+                        msg=(
+                            "The timeout escalation pass {mapping_pass:d} (Timeout Period: {timeout_period_in_ms:d} "
+                            "ms) has mapped {number_of_mapped_reactions:d} out of {number_of_reactions:d} chemical "
+                            "reaction SMILES strings."
+                        ).format(
+                            mapping_pass=mapping_pass,
+                            timeout_period_in_ms=pass_timeout_period_in_ms,
+                            number_of_mapped_reactions=(
+                                len(pending_reaction_smiles_indices) - len(unsuccessful_reaction_smiles_indices)
+                            ),
+                            number_of_reactions=len(pending_reaction_smiles_indices)
+                        )
+                    )
+
+                pending_reaction_smiles_indices = unsuccessful_reaction_smiles_indices
+
+        finally:
+            if failure_report is not None:
+                self.failure_report = failure_report
+
+                if pass_failure_report is not None:
+                    failure_report.update(
+                        failure_report=pass_failure_report
+                    )
+
+        return MappingResultBatch(
+            columns={
+                "mapped_reaction_smiles": array(
+                    obj=mapped_reaction_smiles_strings,
+                    type=OUTPUT_COLUMN_ARROW_DATA_TYPES["mapped_reaction_smiles"]
+                ),
+                "status_code": array(
+                    obj=status_codes,
+                    type=OUTPUT_COLUMN_ARROW_DATA_TYPES["status_code"]
+                ),
+                "mapping_pass": array(
+                    obj=mapping_passes,
+                    type=OUTPUT_COLUMN_ARROW_DATA_TYPES["mapping_pass"]
+                ),
+            }
+        )
+
     def map_reaction_smiles_strings(
             self,
             reaction_smiles_strings: Sequence[str],
@@ -171,8 +733,14 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
             ignore_atom_valences: bool = False,
             ignore_atom_radicals: bool = False,
             canonicalize_reaction_smiles: bool = False,
-            number_of_processes: int = 1
-    ) -> List[Dict[str, Optional[Union[int, str]]]]:
+            number_of_processes: int = 1,
+            maximum_number_of_tasks_per_worker: Optional[int] = None,
+            maximum_worker_memory_in_mb: Optional[float] = None,
+            scheduling_mode: str = "input_order",
+            maximum_timeout_period_in_ms: Optional[int] = None,
+            timeout_escalation_factor: float = 4.0,
+            time_budget: Optional[TimeBudget] = None
+    ) -> MappingResultBatch:
         """
         Map the chemical reaction SMILES strings.
 
@@ -191,28 +759,96 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
         :parameter canonicalize_reaction_smiles: The indicator of whether the chemical reaction SMILES string should be
             canonicalized.
         :parameter number_of_processes: The number of processes.
+        :parameter maximum_number_of_tasks_per_worker: The number of task batches after which a worker process is
+            recycled, if relevant. The value `None` indicates that the worker processes should not be recycled based on
+            the number of task batches.
+        :parameter maximum_worker_memory_in_mb: The resident set size in megabytes above which a worker process is
+            recycled, if relevant. The value `None` indicates that the worker processes should not be recycled based on
+            the resident set size.
+        :parameter scheduling_mode: The indicator of the order in which the chemical reaction SMILES strings are
+            dispatched to the processes. The value choices are: { `input_order`, `longest_first` }. The `longest_first`
+            mode dispatches the chemical reactions with the largest estimated cost first, which reduces the makespan of
+            the skewed datasets. The outputs are returned in the input order regardless of the mode.
+        :parameter maximum_timeout_period_in_ms: The maximum timeout period in milliseconds of the timeout escalation.
+            If specified, the chemical reaction SMILES strings are first mapped using the timeout period, and only the
+            unsuccessfully mapped chemical reaction SMILES strings are re-mapped in the further passes using the
+            progressively longer timeout periods up to the maximum timeout period. The value `None` indicates that the
+            timeout period should not be escalated.
+        :parameter timeout_escalation_factor: The factor by which the timeout period is increased between the passes of
+            the timeout escalation, if relevant.
+        :parameter time_budget: The time budget of the run. If specified, the timeout periods are reduced so that the
+            chemical reaction SMILES strings can be mapped within the remaining time budget even if all of them time
+            out. The value `None` indicates that the timeout periods should not be reduced.
 
-        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping status codes.
+        :returns: The batch of the mapped chemical reaction SMILES strings and atom-to-atom mapping status codes. If the
+            maximum timeout period is specified, the batch also contains the 1-based index of the pass that has mapped
+            each chemical reaction SMILES string, even if the time budget reduces the timeout escalation to one pass.
         """
 
-        if self.logger is not None:
-            self.logger.info(
-                msg=(
-                    "The atom-to-atom mapping of the chemical reaction SMILES strings using the Indigo approach has "
-                    "been started."
+        if time_budget is not None:
+            budgeted_timeout_period_in_ms = time_budget.get_timeout_period_in_ms(
+                timeout_period_in_ms=max(timeout_period_in_ms, maximum_timeout_period_in_ms or 0),
+                number_of_reactions=len(reaction_smiles_strings),
+                number_of_processes=number_of_processes
+            )
+
+            if budgeted_timeout_period_in_ms < max(timeout_period_in_ms, maximum_timeout_period_in_ms or 0):
+                if self.logger is not None:
+                    self.logger.info(
+                        msg=(
+                            "The timeout period has been reduced to {timeout_period_in_ms:d} ms to stay within the "
+                            "remaining time budget of {remaining_time_in_s:.1f} s."
+                        ).format(
+                            timeout_period_in_ms=budgeted_timeout_period_in_ms,
+                            remaining_time_in_s=time_budget.get_remaining_time_in_s()
+                        )
+                    )
+
+                timeout_period_in_ms = min(timeout_period_in_ms, budgeted_timeout_period_in_ms)
+
+                if maximum_timeout_period_in_ms is not None:
+                    maximum_timeout_period_in_ms = budgeted_timeout_period_in_ms
+
+        if maximum_timeout_period_in_ms is not None:
+            return self._map_reaction_smiles_strings_with_timeout_escalation(
+                reaction_smiles_strings=reaction_smiles_strings,
+                timeout_period_in_ms=timeout_period_in_ms,
+                maximum_timeout_period_in_ms=maximum_timeout_period_in_ms,
+                timeout_escalation_factor=timeout_escalation_factor,
+                handle_existing_atom_map_numbers=handle_existing_atom_map_numbers,
+                ignore_atom_charges=ignore_atom_charges,
+                ignore_atom_isotopes=ignore_atom_isotopes,
+                ignore_atom_valences=ignore_atom_valences,
+                ignore_atom_radicals=ignore_atom_radicals,
+                canonicalize_reaction_smiles=canonicalize_reaction_smiles,
+                number_of_processes=number_of_processes,
+                maximum_number_of_tasks_per_worker=maximum_number_of_tasks_per_worker,
+                maximum_worker_memory_in_mb=maximum_worker_memory_in_mb,
+                scheduling_mode=scheduling_mode,
+                time_budget=time_budget
+            )
+
+        if scheduling_mode not in ["input_order", "longest_first", ]:
+            raise ValueError(
+                "The scheduling mode '{scheduling_mode:s}' is not supported.".format(
+                    scheduling_mode=scheduling_mode
                 )
             )
 
-        pqdm_description = (
-            "Mapping the chemical reaction SMILES strings (Number of Processes: {number_of_processes:d})"
-        ).format(
-            number_of_processes=number_of_processes
-        )
+        if scheduling_mode == "longest_first" and number_of_processes > 1:
+            if self.logger is not None:
+                self.logger.info(
+                    msg=(
+                        "The atom-to-atom mapping of the chemical reaction SMILES strings using the Indigo approach "
+                        "has been started."
+                    )
+                )
 
-        indigo_outputs = pqdm(
-            array=reaction_smiles_strings,
-            function=partial(
-                self._map_reaction_smiles,
+            indigo_outputs = self._map_reaction_smiles_strings_longest_first(
+                reaction_smiles_strings=reaction_smiles_strings,
+                number_of_processes=number_of_processes,
+                maximum_number_of_tasks_per_worker=maximum_number_of_tasks_per_worker,
+                maximum_worker_memory_in_mb=maximum_worker_memory_in_mb,
                 timeout_period_in_ms=timeout_period_in_ms,
                 handle_existing_atom_map_numbers=handle_existing_atom_map_numbers,
                 ignore_atom_charges=ignore_atom_charges,
@@ -220,12 +856,83 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
                 ignore_atom_valences=ignore_atom_valences,
                 ignore_atom_radicals=ignore_atom_radicals,
                 canonicalize_reaction_smiles=canonicalize_reaction_smiles
-            ),
-            n_jobs=number_of_processes,
-            desc=pqdm_description,
-            total=len(reaction_smiles_strings),
-            ncols=len(pqdm_description) + (50 if number_of_processes == 1 else 75)
-        )
+            )
+
+            if self.logger is not None:
+                self.logger.info(
+                    msg=(
+                        "The atom-to-atom mapping of the chemical reaction SMILES strings using the Indigo approach "
+                        "has been completed."
+                    )
+                )
+
+            self._log_molecule_cache_summary()
+
+            return MappingResultBatch.from_outputs(
+                outputs=indigo_outputs
+            )
+
+        if self.maximum_molecule_cache_size > 0 or number_of_processes > 1 and (
+            maximum_number_of_tasks_per_worker is not None or maximum_worker_memory_in_mb is not None
+        ):
+            return MappingResultBatch.from_outputs(
+                outputs=self.iter_map_reaction_smiles(
+                    reaction_smiles_strings=reaction_smiles_strings,
+                    batch_size=max(1, min(100, ceil(len(reaction_smiles_strings) / (4 * number_of_processes)))),
+                    timeout_period_in_ms=timeout_period_in_ms,
+                    handle_existing_atom_map_numbers=handle_existing_atom_map_numbers,
+                    ignore_atom_charges=ignore_atom_charges,
+                    ignore_atom_isotopes=ignore_atom_isotopes,
+                    ignore_atom_valences=ignore_atom_valences,
+                    ignore_atom_radicals=ignore_atom_radicals,
+                    canonicalize_reaction_smiles=canonicalize_reaction_smiles,
+                    number_of_processes=number_of_processes,
+                    maximum_number_of_tasks_per_worker=maximum_number_of_tasks_per_worker,
+                    maximum_worker_memory_in_mb=maximum_worker_memory_in_mb
+                )
+            )
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The atom-to-atom mapping of the chemical reaction SMILES strings using the Indigo approach has "
+                    "been started."
+                )
+            )
+
+        with get_cpu_resource_manager().worker_process_environment(
+            number_of_processes=number_of_processes
+        ) as cpu_resource_layout:
+            number_of_processes = cpu_resource_layout["number_of_processes"]
+
+            pqdm_description = (
+                "Mapping the chemical reaction SMILES strings (Number of Processes: {number_of_processes:d})"
+            ).format(
+                number_of_processes=number_of_processes
+            )
+
+            indigo_outputs = pqdm(
+                array=reaction_smiles_strings,
+                function=partial(
+                    self._map_reaction_smiles,
+                    timeout_period_in_ms=timeout_period_in_ms,
+                    handle_existing_atom_map_numbers=handle_existing_atom_map_numbers,
+                    ignore_atom_charges=ignore_atom_charges,
+                    ignore_atom_isotopes=ignore_atom_isotopes,
+                    ignore_atom_valences=ignore_atom_valences,
+                    ignore_atom_radicals=ignore_atom_radicals,
+                    canonicalize_reaction_smiles=canonicalize_reaction_smiles
+                ),
+                n_jobs=number_of_processes,
+                desc=pqdm_description,
+                total=len(reaction_smiles_strings),
+                ncols=len(pqdm_description) + (50 if number_of_processes == 1 else 75)
+            )
+
+        if self.failure_report is not None:
+            indigo_outputs = list(self.failure_report.collect_failure_records(
+                outputs=indigo_outputs
+            ))
 
         if self.logger is not None:
             self.logger.info(
@@ -235,4 +942,239 @@ class IndigoAtomToAtomMapping(AtomToAtomMappingBase):
                 )
             )
 
-        return indigo_outputs
+        return MappingResultBatch.from_outputs(
+            outputs=indigo_outputs
+        )
+
+    def iter_map_reaction_smiles(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            batch_size: int = 100,
+            return_indices: bool = False,
+            timeout_period_in_ms: int = 10000,
+            handle_existing_atom_map_numbers: str = "discard",
+            ignore_atom_charges: bool = False,
+            ignore_atom_isotopes: bool = False,
+            ignore_atom_valences: bool = False,
+            ignore_atom_radicals: bool = False,
+            canonicalize_reaction_smiles: bool = False,
+            number_of_processes: int = 1,
+            maximum_number_of_tasks_per_worker: Optional[int] = None,
+            maximum_worker_memory_in_mb: Optional[float] = None
+    ) -> Iterator[Union[Dict[str, Optional[Union[int, str]]], Tuple[int, Dict[str, Optional[Union[int, str]]]]]]:
+        """
+        Map the chemical reaction SMILES strings and yield the outputs in the input order as soon as each batch has
+        been mapped. At most two batches per process are in flight at any time.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter batch_size: The size of the batch that is submitted to a process.
+        :parameter return_indices: The indicator of whether the input indices of the chemical reaction SMILES strings
+            should be yielded together with the outputs.
+        :parameter timeout_period_in_ms: The timeout period in milliseconds.
+        :parameter handle_existing_atom_map_numbers: The indicator of how the existing chemical reaction compound atom
+            map numbers should be handled. The value choices are: { `alter`, `clear`, `discard`, `keep` }.
+        :parameter ignore_atom_charges: The indicator of whether the chemical reaction compound atom charges should be
+            ignored.
+        :parameter ignore_atom_isotopes: The indicator of whether the chemical reaction compound atom isotopes should be
+            ignored.
+        :parameter ignore_atom_valences: The indicator of whether the chemical reaction compound atom valences should be
+            ignored.
+        :parameter ignore_atom_radicals: The indicator of whether the chemical reaction compound atom radicals should be
+            ignored.
+        :parameter canonicalize_reaction_smiles: The indicator of whether the chemical reaction SMILES string should be
+            canonicalized.
+        :parameter number_of_processes: The number of processes.
+        :parameter maximum_number_of_tasks_per_worker: The number of task batches after which a worker process is
+            recycled, if relevant. The value `None` indicates that the worker processes should not be recycled based on
+            the number of task batches.
+        :parameter maximum_worker_memory_in_mb: The resident set size in megabytes above which a worker process is
+            recycled, if relevant. The value `None` indicates that the worker processes should not be recycled based on
+            the resident set size.
+
+        :returns: The iterator of the mapped chemical reaction SMILES strings and atom-to-atom mapping status codes,
+            optionally with their input indices.
+        """
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the Indigo "
+                    "approach has been started."
+                )
+            )
+
+        map_reaction_smiles_batch_function = partial(
+            self._map_reaction_smiles_batch_and_get_molecule_cache_summary,
+            timeout_period_in_ms=timeout_period_in_ms,
+            handle_existing_atom_map_numbers=handle_existing_atom_map_numbers,
+            ignore_atom_charges=ignore_atom_charges,
+            ignore_atom_isotopes=ignore_atom_isotopes,
+            ignore_atom_valences=ignore_atom_valences,
+            ignore_atom_radicals=ignore_atom_radicals,
+            canonicalize_reaction_smiles=canonicalize_reaction_smiles
+        )
+
+        reaction_smiles_batches = self._get_reaction_smiles_batches(
+            reaction_smiles_strings=reaction_smiles_strings,
+            batch_size=batch_size
+        )
+
+        if number_of_processes == 1:
+            indigo_batch_outputs = (
+                (reaction_smiles_index, map_reaction_smiles_batch_function(reaction_smiles_batch))
+                for reaction_smiles_index, reaction_smiles_batch in reaction_smiles_batches
+            )
+
+            yield from self._yield_batch_outputs(
+                batch_outputs=self._collect_molecule_cache_summaries(
+                    batch_outputs=indigo_batch_outputs
+                ),
+                return_indices=return_indices
+            )
+
+        else:
+            with WorkerRecyclingProcessPool(
+                number_of_processes=get_cpu_resource_manager().get_layout(
+                    number_of_processes=number_of_processes
+                )["number_of_processes"],
+                maximum_number_of_tasks_per_worker=maximum_number_of_tasks_per_worker,
+                maximum_worker_memory_in_mb=maximum_worker_memory_in_mb,
+                logger=self.logger
+            ) as worker_recycling_process_pool:
+                yield from self._yield_batch_outputs(
+                    batch_outputs=self._collect_molecule_cache_summaries(
+                        batch_outputs=self._submit_reaction_smiles_batches(
+                            process_pool=worker_recycling_process_pool,
+                            function=map_reaction_smiles_batch_function,
+                            reaction_smiles_batches=reaction_smiles_batches,
+                            maximum_number_of_pending_batches=2 * number_of_processes
+                        )
+                    ),
+                    return_indices=return_indices
+                )
+
+                worker_memory_summary = worker_recycling_process_pool.get_memory_summary()
+
+            self.worker_memory_summary = merge_worker_memory_summaries(
+                worker_memory_summaries=[self.worker_memory_summary, worker_memory_summary, ]
+            )
+
+            if self.logger is not None:
+                self.logger.info(
+                    msg=(
+                        "The peak and average worker process memory: {peak_worker_memory_in_mb:.1f} MB and "
+                        "{average_worker_memory_in_mb:.1f} MB (Number of Recycles: {number_of_recycles:d})."
+                    ).format(
+                        **worker_memory_summary
+                    )
+                )
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the Indigo "
+                    "approach has been completed."
+                )
+            )
+
+        self._log_molecule_cache_summary()
+
+    @staticmethod
+    def _submit_reaction_smiles_batches(
+            process_pool: Union[ProcessPoolExecutor, WorkerRecyclingProcessPool],
+            function: Callable[[List[str]], Any],
+            reaction_smiles_batches: Iterator[Tuple[int, List[str]]],
+            maximum_number_of_pending_batches: int
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Submit the batches of the chemical reaction SMILES strings to a process pool and get the outputs in the input
+        order, while keeping the number of pending batches bounded.
+
+        :parameter process_pool: The process pool.
+        :parameter function: The function that maps a batch of the chemical reaction SMILES strings.
+        :parameter reaction_smiles_batches: The iterator of the input indices and batches of the chemical reaction
+            SMILES strings.
+        :parameter maximum_number_of_pending_batches: The maximum number of pending batches.
+
+        :returns: The iterator of the input indices and outputs of the batches.
+        """
+
+        pending_batches = deque()
+
+        for reaction_smiles_index, reaction_smiles_batch in reaction_smiles_batches:
+            pending_batches.append((
+                reaction_smiles_index,
+                process_pool.submit(function, reaction_smiles_batch),
+            ))
+
+            if len(pending_batches) >= maximum_number_of_pending_batches:
+                reaction_smiles_index, future = pending_batches.popleft()
+
+                yield reaction_smiles_index, future.result()
+
+        while len(pending_batches) > 0:
+            reaction_smiles_index, future = pending_batches.popleft()
+
+            yield reaction_smiles_index, future.result()
+
+    @staticmethod
+    def _submit_reaction_smiles_batches_as_completed(
+            process_pool: Union[ProcessPoolExecutor, WorkerRecyclingProcessPool],
+            function: Callable[[List[str]], Any],
+            reaction_smiles_batches: Iterator[Tuple[int, List[str]]],
+            maximum_number_of_pending_batches: int
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Submit the batches of the chemical reaction SMILES strings to a process pool in the order of the iterator and
+        get the outputs in the completion order, so that a slow batch does not delay the submission of the next
+        batches, while keeping the number of pending batches bounded.
+
+        :parameter process_pool: The process pool.
+        :parameter function: The function that maps a batch of the chemical reaction SMILES strings.
+        :parameter reaction_smiles_batches: The iterator of the identifiers and batches of the chemical reaction SMILES
+            strings.
+        :parameter maximum_number_of_pending_batches: The maximum number of pending batches.
+
+        :returns: The iterator of the identifiers and outputs of the batches.
+        """
+
+        pending_batches = dict()
+
+        reaction_smiles_batches = iter(reaction_smiles_batches)
+
+        while True:
+            for batch_identifier, reaction_smiles_batch in reaction_smiles_batches:
+                pending_batches[process_pool.submit(function, reaction_smiles_batch)] = batch_identifier
+
+                if len(pending_batches) >= maximum_number_of_pending_batches:
+                    break
+
+            if len(pending_batches) == 0:
+                break
+
+            completed_futures, _ = wait(
+                fs=list(pending_batches.keys()),
+                return_when=FIRST_COMPLETED
+            )
+
+            for completed_future in completed_futures:
+                yield pending_batches.pop(completed_future), completed_future.result()
+
+    @staticmethod
+    def _yield_batch_outputs(
+            batch_outputs: Iterable[Tuple[int, List[Dict[str, Optional[Union[int, str]]]]]],
+            return_indices: bool
+    ) -> Iterator[Union[Dict[str, Optional[Union[int, str]]], Tuple[int, Dict[str, Optional[Union[int, str]]]]]]:
+        """
+        Yield the individual outputs of the batches.
+
+        :parameter batch_outputs: The input indices and outputs of the batches.
+        :parameter return_indices: The indicator of whether the input indices should be yielded together with the
+            outputs.
+
+        :returns: The iterator of the outputs, optionally with their input indices.
+        """
+
+        for reaction_smiles_index, indigo_batch_output in batch_outputs:
+            for output_index, indigo_output in enumerate(indigo_batch_output):
+                yield (reaction_smiles_index + output_index, indigo_output) if return_indices else indigo_output
@@ -2,13 +2,21 @@
 
 from logging import Logger
 from math import ceil
-from typing import Dict, List, Optional, Sequence, Union
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from localmapper import localmapper
 
 from tqdm.auto import tqdm
 
 from atom_to_atom_mapping.base.base import AtomToAtomMappingBase
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch, MappingResultBatchBuilder
+from atom_to_atom_mapping.utility.reaction_pruning import (
+    prune_reaction_smiles,
+    prune_reaction_smiles_strings,
+    restore_pruned_reaction_compounds,
+)
+from atom_to_atom_mapping.utility.reaction_template_index import ReactionTemplateIndex
 
 
 class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
@@ -19,12 +27,21 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
     def __init__(
             self,
             logger: Optional[Logger] = None,
+            reaction_pruning_mode: Optional[str] = None,
+            reaction_template_index: Optional[ReactionTemplateIndex] = None,
             **kwargs
     ) -> None:
         """
         The `__init__` method of the class.
 
         :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        :parameter reaction_pruning_mode: The indicator of how the chemical reaction compounds that are unlikely to
+            contribute any atoms to the products should be pruned before the atom-to-atom mapping. The value choices
+            are: { `drop`, `move` }. The value `None` indicates that the chemical reaction compounds should not be
+            pruned.
+        :parameter reaction_template_index: The index of the known mapped chemical reaction templates, which are applied
+            before the LocalMapper model inference. The templates of the confident outputs of the LocalMapper model are
+            added to the index. The value `None` indicates that the templates should not be applied.
         :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
             { `localmapper.localmapper.localmapper.__init__` }.
         """
@@ -33,10 +50,105 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
             logger=logger
         )
 
+        self.reaction_pruning_mode = reaction_pruning_mode
+        self.reaction_template_index = reaction_template_index
+
         self.local_mapper = localmapper(
             **kwargs
         )
 
+        self.template_fast_path_summary = {
+            "number_of_reactions": 0,
+            "number_of_template_matches": 0,
+            "template_matching_time_in_s": 0.0,
+            "template_miss_time_in_s": 0.0,
+            "number_of_model_reactions": 0,
+            "model_inference_time_in_s": 0.0,
+        }
+
+    def get_template_fast_path_summary(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the summary of the chemical reaction template fast path.
+
+        :returns: The numbers of chemical reactions and template matches, the template match rate, the template matching
+            time, the part of it that has been spent on the chemical reactions without a template match, the model
+            inference time, and the estimated time that has been saved by the template matches.
+        """
+
+        average_model_inference_time_in_s = (
+            self.template_fast_path_summary["model_inference_time_in_s"] /
+            max(1, self.template_fast_path_summary["number_of_model_reactions"])
+        )
+
+        return {
+            **self.template_fast_path_summary,
+            "template_match_rate": (
+                self.template_fast_path_summary["number_of_template_matches"] /
+                max(1, self.template_fast_path_summary["number_of_reactions"])
+            ),
+            "estimated_saved_time_in_s": (
+                self.template_fast_path_summary["number_of_template_matches"] * average_model_inference_time_in_s -
+                self.template_fast_path_summary["template_matching_time_in_s"]
+            ),
+        }
+
+    def _map_reaction_smiles_strings_using_reaction_template_index(
+            self,
+            reaction_smiles_strings: Sequence[str]
+    ) -> List[Optional[Dict[str, Optional[Union[bool, str]]]]]:
+        """
+        Map the chemical reaction SMILES strings by the application of the known chemical reaction templates.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+        :returns: The mapped chemical reactions, mapped chemical reaction templates, and template match indicators. The
+            atom-to-atom mapping confidence indicators are not available for the template matches. The value `None`
+            indicates that no chemical reaction template has been matched.
+        """
+
+        if self.reaction_template_index is None:
+            return [None, ] * len(reaction_smiles_strings)
+
+        start_time = perf_counter()
+
+        template_outputs = list()
+
+        for reaction_smiles in reaction_smiles_strings:
+            reaction_start_time = perf_counter()
+
+            try:
+                template_output = self.reaction_template_index.map_reaction_smiles(
+                    reaction_smiles=reaction_smiles
+                )
+
+            except Exception as exception_handle:
+                if self.logger is not None:
+                    self.logger.debug(
+                        msg=exception_handle,
+                        exc_info=True
+                    )
+
+                template_output = None
+
+            if template_output is None:
+                self.template_fast_path_summary["template_miss_time_in_s"] += perf_counter() - reaction_start_time
+
+            template_outputs.append(None if template_output is None else {
+                **template_output,
+                "is_confident": None,
+                "mapped_by_template": True,
+            })
+
+        self.template_fast_path_summary["number_of_reactions"] += len(reaction_smiles_strings)
+        self.template_fast_path_summary["number_of_template_matches"] += sum(
+            template_output is not None for template_output in template_outputs
+        )
+        self.template_fast_path_summary["template_matching_time_in_s"] += perf_counter() - start_time
+
+        return template_outputs
+
     def map_reaction_smiles(
             self,
             reaction_smiles: str
@@ -47,13 +159,15 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
         :parameter reaction_smiles: The SMILES string of the chemical reaction.
 
         :returns: The mapped chemical reaction, mapped chemical reaction template, and atom-to-atom mapping confidence
-            indicator.
+            indicator, and the template match indicator if the known chemical reaction templates are applied.
         """
 
-        local_mapper_output = dict()
+        local_mapper_output, template_output = dict(), None
+
+        removed_compound_smiles_strings = list()
 
         try:
-            if self.logger is not None:
+            if self.logger is not None and self.failure_report is None:
                 self.logger.info(
                     msg=(
                         "The atom-to-atom mapping of the chemical reaction SMILES string using the LocalMapper "
@@ -61,29 +175,47 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     )
                 )
 
-            local_mapper_output = self.local_mapper.get_atom_map(
-                rxns=reaction_smiles,
-                return_dict=True
-            )
+            pruned_reaction_smiles = reaction_smiles
 
-        except Exception as exception_handle:
-            if self.logger is not None:
-                self.logger.error(
-                    msg=(
-                        "The atom-to-atom mapping of the chemical reaction SMILES string '{reaction_smiles:s}' has "
-                        "been unsuccessful."
-                    ).format(
-                        reaction_smiles=reaction_smiles
-                    )
+            if self.reaction_pruning_mode is not None:
+                pruned_reaction_smiles, removed_compound_smiles_strings = prune_reaction_smiles(
+                    reaction_smiles=reaction_smiles,
+                    pruning_mode=self.reaction_pruning_mode
                 )
 
-                self.logger.debug(
-                    msg=exception_handle,
-                    exc_info=True
+            template_output = self._map_reaction_smiles_strings_using_reaction_template_index(
+                reaction_smiles_strings=[pruned_reaction_smiles, ]
+            )[0]
+
+            if template_output is not None:
+                local_mapper_output = {
+                    "mapped_rxn": template_output["mapped_reaction_smiles"],
+                    "template": template_output["mapped_reaction_template_smarts"],
+                    "confident": template_output["is_confident"],
+                }
+
+            else:
+                local_mapper_output = self.local_mapper.get_atom_map(
+                    rxns=pruned_reaction_smiles,
+                    return_dict=True
                 )
 
+                if self.reaction_template_index is not None:
+                    self.reaction_template_index.add_outputs(
+                        outputs=[{
+                            "mapped_reaction_template_smarts": local_mapper_output.get("template", None),
+                            "is_confident": local_mapper_output.get("confident", None),
+                        }, ]
+                    )
+
+        except Exception as exception_handle:
+            self._log_failure(
+                reaction_smiles=reaction_smiles,
+                exception_handle=exception_handle
+            )
+
         finally:
-            if self.logger is not None:
+            if self.logger is not None and self.failure_report is None:
                 self.logger.info(
                     msg=(
                         "The atom-to-atom mapping of the chemical reaction SMILES string using the LocalMapper "
@@ -91,28 +223,205 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     )
                 )
 
-            return {
+            output = {
                 "mapped_reaction_smiles": local_mapper_output.get("mapped_rxn", None),
                 "mapped_reaction_template_smarts": local_mapper_output.get("template", None),
                 "is_confident": local_mapper_output.get("confident", None),
             }
 
+            if self.reaction_template_index is not None:
+                output["mapped_by_template"] = template_output is not None
+
+            return restore_pruned_reaction_compounds(
+                output=output,
+                removed_compound_smiles_strings=removed_compound_smiles_strings
+            )
+
+    def _preprocess_reaction_smiles_batch(
+            self,
+            reaction_smiles_strings: Sequence[str]
+    ) -> Tuple[List[str], Optional[List[List[str]]]]:
+        """
+        Pre-process a batch of the chemical reaction SMILES strings by pruning the chemical reaction compounds, if
+        relevant.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+
+        :returns: The pre-processed SMILES strings of the chemical reactions and the SMILES strings of the removed
+            chemical reaction compounds.
+        """
+
+        if self.reaction_pruning_mode is None:
+            return list(reaction_smiles_strings), None
+
+        return prune_reaction_smiles_strings(
+            reaction_smiles_strings=reaction_smiles_strings,
+            pruning_mode=self.reaction_pruning_mode
+        )
+
+    def _map_reaction_smiles_batch_using_local_mapper(
+            self,
+            reaction_smiles_strings: Sequence[str]
+    ) -> List[Dict[str, Optional[Union[bool, str]]]]:
+        """
+        Map a batch of the chemical reaction SMILES strings using the LocalMapper model. If the atom-to-atom mapping of
+        the batch is unsuccessful, the chemical reaction SMILES strings of the batch are mapped individually.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+
+        :returns: The mapped chemical reactions, mapped chemical reaction templates, and atom-to-atom mapping confidence
+            indicators of the batch.
+        """
+
+        if len(reaction_smiles_strings) == 0:
+            return list()
+
+        start_time = perf_counter()
+
+        local_mapper_outputs = list()
+
+        try:
+            local_mapper_batch_outputs = self.local_mapper.get_atom_map(
+                rxns=list(reaction_smiles_strings),
+                return_dict=True
+            )
+
+            for local_mapper_batch_output in local_mapper_batch_outputs:
+                local_mapper_outputs.append({
+                    "mapped_reaction_smiles": local_mapper_batch_output.get("mapped_rxn", None),
+                    "mapped_reaction_template_smarts": local_mapper_batch_output.get("template", None),
+                    "is_confident": local_mapper_batch_output.get("confident", None),
+                })
+
+        except Exception as exception_handle:
+            if self.logger is not None:
+                self.logger.warning(
+                    msg=(
+                        "The atom-to-atom mapping of the chemical reaction SMILES string batch has been "
+                        "unsuccessful. Switching to the atom-to-atom mapping of the individual chemical "
+                        "reaction SMILES strings of the batch."
+                    )
+                )
+
+                self.logger.debug(
+                    msg=exception_handle,
+                    exc_info=True
+                )
+
+            local_mapper_outputs = list()
+
+            for reaction_smiles in reaction_smiles_strings:
+                try:
+                    local_mapper_output = self.local_mapper.get_atom_map(
+                        rxns=reaction_smiles,
+                        return_dict=True
+                    )
+
+                    local_mapper_outputs.append({
+                        "mapped_reaction_smiles": local_mapper_output.get("mapped_rxn", None),
+                        "mapped_reaction_template_smarts": local_mapper_output.get("template", None),
+                        "is_confident": local_mapper_output.get("confident", None),
+                    })
+
+                except Exception as exception_handle:
+                    self._log_failure(
+                        reaction_smiles=reaction_smiles,
+                        exception_handle=exception_handle
+                    )
+
+                    local_mapper_outputs.append({
+                        "mapped_reaction_smiles": None,
+                        "mapped_reaction_template_smarts": None,
+                        "is_confident": None,
+                    })
+
+        self.template_fast_path_summary["number_of_model_reactions"] += len(reaction_smiles_strings)
+        self.template_fast_path_summary["model_inference_time_in_s"] += perf_counter() - start_time
+
+        if self.reaction_template_index is not None:
+            self.reaction_template_index.add_outputs(
+                outputs=local_mapper_outputs
+            )
+
+        return local_mapper_outputs
+
+    def _map_preprocessed_reaction_smiles_batch(
+            self,
+            preprocessed_reaction_smiles_batch: Tuple[List[str], Optional[List[List[str]]]]
+    ) -> List[Dict[str, Optional[Union[bool, str]]]]:
+        """
+        Map a pre-processed batch of the chemical reaction SMILES strings. The known chemical reaction templates are
+        applied first, if relevant, and only the remaining chemical reaction SMILES strings are mapped using the
+        LocalMapper model.
+
+        :parameter preprocessed_reaction_smiles_batch: The pre-processed batch of the chemical reaction SMILES strings.
+
+        :returns: The mapped chemical reactions, mapped chemical reaction templates, and atom-to-atom mapping confidence
+            indicators of the batch, and the template match indicators if the known chemical reaction templates are
+            applied.
+        """
+
+        reaction_smiles_strings, removed_compound_smiles_strings = preprocessed_reaction_smiles_batch
+
+        local_mapper_outputs = self._map_reaction_smiles_strings_using_reaction_template_index(
+            reaction_smiles_strings=reaction_smiles_strings
+        )
+
+        model_reaction_smiles_indices = [
+            reaction_smiles_index for reaction_smiles_index, local_mapper_output in enumerate(local_mapper_outputs)
+            if local_mapper_output is None
+        ]
+
+        for reaction_smiles_index, local_mapper_output in zip(
+            model_reaction_smiles_indices,
+            self._map_reaction_smiles_batch_using_local_mapper(
+                reaction_smiles_strings=[
+                    reaction_smiles_strings[reaction_smiles_index]
+                    for reaction_smiles_index in model_reaction_smiles_indices
+                ]
+            )
+        ):
+            if self.reaction_template_index is not None:
+                local_mapper_output = {
+                    **local_mapper_output,
+                    "mapped_by_template": False,
+                }
+
+            local_mapper_outputs[reaction_smiles_index] = local_mapper_output
+
+        if removed_compound_smiles_strings is not None:
+            local_mapper_outputs = [
+                restore_pruned_reaction_compounds(
+                    output=local_mapper_output,
+                    removed_compound_smiles_strings=removed_compound_smiles
+                ) for local_mapper_output, removed_compound_smiles in zip(
+                    local_mapper_outputs,
+                    removed_compound_smiles_strings
+                )
+            ]
+
+        return local_mapper_outputs
+
     def map_reaction_smiles_strings(
             self,
             reaction_smiles_strings: Sequence[str],
-            batch_size: int = 10
-    ) -> List[Dict[str, Optional[Union[bool, str]]]]:
+            batch_size: int = 10,
+            maximum_number_of_prefetched_batches: int = 0
+    ) -> MappingResultBatch:
         """
         Map the chemical reaction SMILES strings.
 
         :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
         :parameter batch_size: The size of the batch.
+        :parameter maximum_number_of_prefetched_batches: The maximum number of batches that are pre-processed in a
+            background thread ahead of the LocalMapper model inference. The value `0` indicates that the batches should
+            not be prefetched.
 
-        :returns: The mapped chemical reactions, mapped chemical reaction templates, and atom-to-atom mapping confidence
-            indicators.
+        :returns: The batch of the mapped chemical reactions, mapped chemical reaction templates, and atom-to-atom
+            mapping confidence indicators.
         """
 
-        local_mapper_outputs = list()
+        local_mapper_outputs = MappingResultBatchBuilder()
 
         try:
             if self.logger is not None:
@@ -127,78 +436,21 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
                 batch_size=batch_size
             )
 
-            for reaction_smiles_index in tqdm(
-                iterable=range(0, len(reaction_smiles_strings), batch_size),
+            for _, preprocessed_reaction_smiles_batch in tqdm(
+                iterable=self._get_preprocessed_reaction_smiles_batches(
+                    reaction_smiles_strings=reaction_smiles_strings,
+                    batch_size=batch_size,
+                    maximum_number_of_prefetched_batches=maximum_number_of_prefetched_batches
+                ),
                 desc=tqdm_description,
                 total=ceil(len(reaction_smiles_strings) / batch_size),
                 ncols=len(tqdm_description) + 50
             ):
-                try:
-                    local_mapper_batch_outputs = self.local_mapper.get_atom_map(
-                        rxns=reaction_smiles_strings[
-                            reaction_smiles_index: min(reaction_smiles_index + batch_size, len(reaction_smiles_strings))
-                        ],
-                        return_dict=True
+                local_mapper_outputs.extend(
+                    self._map_preprocessed_reaction_smiles_batch(
+                        preprocessed_reaction_smiles_batch=preprocessed_reaction_smiles_batch
                     )
-
-                    for local_mapper_batch_output in local_mapper_batch_outputs:
-                        local_mapper_outputs.append({
-                            "mapped_reaction_smiles": local_mapper_batch_output.get("mapped_rxn", None),
-                            "mapped_reaction_template_smarts": local_mapper_batch_output.get("template", None),
-                            "is_confident": local_mapper_batch_output.get("confident", None),
-                        })
-
-                except Exception as exception_handle:
-                    if self.logger is not None:
-                        self.logger.warning(
-                            msg=(
-                                "The atom-to-atom mapping of the chemical reaction SMILES string batch has been "
-                                "unsuccessful. Switching to the atom-to-atom mapping of the individual chemical "
-                                "reaction SMILES strings of the batch."
-                            )
-                        )
-
-                        self.logger.debug(
-                            msg=exception_handle,
-                            exc_info=True
-                        )
-
-                    for reaction_smiles in reaction_smiles_strings[
-                        reaction_smiles_index: min(reaction_smiles_index + batch_size, len(reaction_smiles_strings))
-                    ]:
-                        try:
-                            local_mapper_output = self.local_mapper.get_atom_map(
-                                rxns=reaction_smiles,
-                                return_dict=True
-                            )
-
-                            local_mapper_outputs.append({
-                                "mapped_reaction_smiles": local_mapper_output.get("mapped_rxn", None),
-                                "mapped_reaction_template_smarts": local_mapper_output.get("template", None),
-                                "is_confident": local_mapper_output.get("confident", None),
-                            })
-
-                        except Exception as exception_handle:
-                            if self.logger is not None:
-                                self.logger.error(
-                                    msg=(
-                                        "The atom-to-atom mapping of the chemical reaction SMILES string "
-                                        "'{reaction_smiles:s}' has been unsuccessful."
-                                    ).format(
-                                        reaction_smiles=reaction_smiles
-                                    )
-                                )
-
-                                self.logger.debug(
-                                    msg=exception_handle,
-                                    exc_info=True
-                                )
-
-                            local_mapper_outputs.append({
-                                "mapped_reaction_smiles": None,
-                                "mapped_reaction_template_smarts": None,
-                                "is_confident": None,
-                            })
+                )
 
             if self.logger is not None:
                 self.logger.info(
@@ -208,7 +460,19 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     )
                 )
 
-            return local_mapper_outputs
+                if self.reaction_template_index is not None:
+                    self.logger.info(
+                        msg=(
+                            "The total number of chemical reaction SMILES strings mapped using the known chemical "
+                            "reaction templates: {number_of_template_matches:d} out of {number_of_reactions:d} "
+                            "(Match Rate: {template_match_rate:.2%}, Miss Time: {template_miss_time_in_s:.1f} s, "
+                            "Estimated Saved Time: {estimated_saved_time_in_s:.1f} s)."
+                        ).format(
+                            **self.get_template_fast_path_summary()
+                        )
+                    )
+
+            return local_mapper_outputs.build()
 
         except Exception as exception_handle:
             if self.logger is not None:
@@ -221,4 +485,57 @@ class LocalMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     exc_info=True
                 )
 
-            return local_mapper_outputs
+            return local_mapper_outputs.build()
+
+    def iter_map_reaction_smiles(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            batch_size: int = 10,
+            return_indices: bool = False,
+            maximum_number_of_prefetched_batches: int = 0
+    ) -> Iterator[Union[Dict[str, Optional[Union[bool, str]]], Tuple[int, Dict[str, Optional[Union[bool, str]]]]]]:
+        """
+        Map the chemical reaction SMILES strings and yield the outputs as soon as each batch has been mapped.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter batch_size: The size of the batch.
+        :parameter return_indices: The indicator of whether the input indices of the chemical reaction SMILES strings
+            should be yielded together with the outputs.
+        :parameter maximum_number_of_prefetched_batches: The maximum number of batches that are read and pre-processed
+            in a background thread ahead of the LocalMapper model inference. The value `0` indicates that the batches
+            should not be prefetched.
+
+        :returns: The iterator of the mapped chemical reactions, mapped chemical reaction templates, and atom-to-atom
+            mapping confidence indicators, optionally with their input indices.
+        """
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the LocalMapper "
+                    "approach has been started."
+                )
+            )
+
+        for reaction_smiles_index, preprocessed_reaction_smiles_batch in self._get_preprocessed_reaction_smiles_batches(
+            reaction_smiles_strings=reaction_smiles_strings,
+            batch_size=batch_size,
+            maximum_number_of_prefetched_batches=maximum_number_of_prefetched_batches
+        ):
+            for output_index, local_mapper_output in enumerate(
+                self._map_preprocessed_reaction_smiles_batch(
+                    preprocessed_reaction_smiles_batch=preprocessed_reaction_smiles_batch
+                )
+            ):
+                yield (
+                    (reaction_smiles_index + output_index, local_mapper_output) if return_indices
+                    else local_mapper_output
+                )
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the LocalMapper "
+                    "approach has been completed."
+                )
+            )
@@ -1,14 +1,55 @@
 """ The ``atom_to_atom_mapping.rxnmapper`` package ``rxnmapper`` module. """
 
+from copy import copy
 from logging import Logger
 from math import ceil
-from typing import Dict, List, Optional, Sequence, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from rxnmapper import RXNMapper
 
+from torch import Tensor, cat, mean, no_grad
+from torch.nn import Module
+
 from tqdm.auto import tqdm
 
 from atom_to_atom_mapping.base.base import AtomToAtomMappingBase
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch, MappingResultBatchBuilder
+from atom_to_atom_mapping.utility.molecule_cache import MoleculeCache, get_reaction_compound_smiles_strings
+from atom_to_atom_mapping.utility.reaction_pruning import (
+    prune_reaction_smiles,
+    prune_reaction_smiles_strings,
+    restore_pruned_reaction_compounds,
+)
+
+
+def _get_truncated_model(
+        model: Module,
+        number_of_layers: int
+) -> Module:
+    """
+    Get the view of a single hidden layer group RXNMapper model whose encoder stops after a number of layers. The view
+    shares the parameters and submodules of the model, while the configuration of the model is left unchanged, so that
+    the model can still be utilized concurrently.
+
+    :parameter model: The RXNMapper model.
+    :parameter number_of_layers: The number of the executed encoder layers.
+
+    :returns: The view of the RXNMapper model.
+    """
+
+    truncated_config = copy(model.config)
+    truncated_config.num_hidden_layers = number_of_layers
+
+    truncated_encoder = copy(model.encoder)
+    truncated_encoder._modules = dict(model.encoder._modules)
+    truncated_encoder.config = truncated_config
+
+    truncated_model = copy(model)
+    truncated_model._modules = dict(model._modules)
+    truncated_model._modules["encoder"] = truncated_encoder
+    truncated_model.config = truncated_config
+
+    return truncated_model
 
 
 class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
@@ -18,20 +59,140 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
 
     def __init__(
             self,
-            logger: Optional[Logger] = None
+            logger: Optional[Logger] = None,
+            reaction_pruning_mode: Optional[str] = None,
+            maximum_number_of_tokens: Optional[int] = None,
+            fallback_atom_to_atom_mapping: Optional[AtomToAtomMappingBase] = None,
+            maximum_molecule_cache_size: int = 0,
+            truncate_forward_pass: bool = False
     ) -> None:
         """
         The `__init__` method of the class.
 
         :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        :parameter reaction_pruning_mode: The indicator of how the chemical reaction compounds that are unlikely to
+            contribute any atoms to the products should be pruned before the atom-to-atom mapping. The value choices
+            are: { `drop`, `move` }. The value `None` indicates that the chemical reaction compounds should not be
+            pruned.
+        :parameter maximum_number_of_tokens: The maximum number of RXNMapper model tokens of a chemical reaction SMILES
+            string. The value `None` indicates that the maximum number of position embeddings of the RXNMapper model
+            should be utilized.
+        :parameter fallback_atom_to_atom_mapping: The atom-to-atom mapping approach for the chemical reaction SMILES
+            strings that exceed the maximum number of RXNMapper model tokens. The value `None` indicates that such
+            chemical reaction SMILES strings should not be mapped. The approach that has mapped each chemical reaction
+            SMILES string is indicated in the `mapped_by` output column: { `rxnmapper`, `fallback`,
+            `skipped_overlong` }.
+        :parameter maximum_molecule_cache_size: The maximum number of the chemical compounds whose tokenization and
+            pruning features are cached. The value `0` indicates that the chemical compounds should not be cached.
+        :parameter truncate_forward_pass: The indicator of whether the forward pass of the RXNMapper model should stop
+            after the last layer whose attention weights are utilized for the atom-to-atom mapping. The outputs are
+            identical to the ones of the complete forward pass.
         """
 
         super().__init__(
             logger=logger
         )
 
+        self.reaction_pruning_mode = reaction_pruning_mode
+
         self.rxnmapper = RXNMapper()
 
+        if maximum_number_of_tokens is None:
+            maximum_number_of_tokens = getattr(
+                getattr(getattr(self.rxnmapper, "model", None), "config", None),
+                "max_position_embeddings",
+                512
+            )
+
+        self.maximum_number_of_tokens = maximum_number_of_tokens
+        self.fallback_atom_to_atom_mapping = fallback_atom_to_atom_mapping
+
+        self.token_length_routing_summary = {
+            "number_of_routed_reactions": 0,
+            "number_of_fallback_reactions": 0,
+        }
+
+        self.molecule_cache = MoleculeCache(
+            maximum_size=maximum_molecule_cache_size
+        ) if maximum_molecule_cache_size > 0 else None
+
+        if truncate_forward_pass:
+            if getattr(self.rxnmapper.model.config, "num_hidden_groups", 1) == 1:
+                self.rxnmapper.convert_batch_to_attns = self._convert_batch_to_attentions_using_truncated_forward_pass
+
+            elif self.logger is not None:
+                self.logger.warning(
+                    msg=(
+                        "The forward pass of the RXNMapper model cannot be truncated because the model has more than "
+                        "one hidden layer group. The complete forward pass is utilized instead."
+                    )
+                )
+
+    def _convert_batch_to_attentions_using_truncated_forward_pass(
+            self,
+            rxn_smiles_list: List[str],
+            force_layer: Optional[int] = None,
+            force_head: Optional[int] = None
+    ) -> List[Tensor]:
+        """
+        Convert a batch of the chemical reaction SMILES strings to the attention weights of the RXNMapper model. Unlike
+        the `rxnmapper.core.RXNMapper.convert_batch_to_attns` method, the forward pass stops after the last utilized
+        layer and only the utilized attention head is retained, while the operations that produce the attention weights
+        are the same. If a utilized layer is indexed from the end, the complete forward pass is utilized.
+
+        :parameter rxn_smiles_list: The SMILES strings of the chemical reactions of the batch.
+        :parameter force_layer: The index of the utilized layer. The value `None` indicates that the default layers of
+            the RXNMapper model should be utilized.
+        :parameter force_head: The index of the utilized attention head. The value `None` indicates that the default
+            attention head of the RXNMapper model should be utilized.
+
+        :returns: The token-by-token attention weights of the chemical reactions of the batch.
+        """
+
+        utilized_layers = self.rxnmapper.layers if force_layer is None else [force_layer, ]
+        utilized_head = self.rxnmapper.head if force_head is None else force_head
+
+        encoded_ids = self.rxnmapper.tokenizer.batch_encode_plus(
+            rxn_smiles_list,
+            padding=True,
+            return_tensors="pt"
+        )
+
+        model = self.rxnmapper.model
+
+        if min(utilized_layers) >= 0:
+            model = _get_truncated_model(
+                model=model,
+                number_of_layers=min(model.config.num_hidden_layers, max(utilized_layers) + 1)
+            )
+
+        with no_grad():
+            attentions = model(**{
+                key: value.to(self.rxnmapper.device) for key, value in encoded_ids.items()
+            })[2]
+
+        selected_attentions = cat(
+            [
+                attention.unsqueeze(1) for layer_index, attention in enumerate(attentions)
+                if layer_index in utilized_layers
+            ],
+            dim=1
+        )
+
+        del attentions
+
+        selected_attentions = mean(
+            selected_attentions[:, :, utilized_head, :, :],
+            dim=[1, ]
+        )
+
+        attention_masks = encoded_ids["attention_mask"].bool()
+
+        return [
+            selected_attention[attention_mask][:, attention_mask]
+            for selected_attention, attention_mask in zip(selected_attentions, attention_masks)
+        ]
+
     def map_reaction_smiles(
             self,
             reaction_smiles: str,
@@ -44,13 +205,16 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
         :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
             { `rxnmapper.core.RXNMapper.get_attention_guided_atom_maps` }.
 
-        :returns: The mapped chemical reaction SMILES string and atom-to-atom mapping confidence score.
+        :returns: The mapped chemical reaction SMILES string, atom-to-atom mapping confidence score, and approach that
+            has mapped the chemical reaction SMILES string.
         """
 
-        rxnmapper_output = dict()
+        rxnmapper_output = [dict(), ]
+
+        removed_compound_smiles_strings = list()
 
         try:
-            if self.logger is not None:
+            if self.logger is not None and self.failure_report is None:
                 self.logger.info(
                     msg=(
                         "The atom-to-atom mapping of the chemical reaction SMILES string using the RXNMapper approach "
@@ -58,19 +222,273 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     )
                 )
 
-            rxnmapper_output = self.rxnmapper.get_attention_guided_atom_maps(
-                rxns=[reaction_smiles, ],
+            pruned_reaction_smiles = reaction_smiles
+
+            if self.reaction_pruning_mode is not None:
+                pruned_reaction_smiles, removed_compound_smiles_strings = prune_reaction_smiles(
+                    reaction_smiles=reaction_smiles,
+                    pruning_mode=self.reaction_pruning_mode,
+                    molecule_cache=self.molecule_cache
+                )
+
+            if self._get_number_of_tokens(
+                reaction_smiles=pruned_reaction_smiles
+            ) > self.maximum_number_of_tokens:
+                fallback_output = self._map_overlong_reaction_smiles_strings(
+                    reaction_smiles_strings=[pruned_reaction_smiles, ]
+                )[0]
+
+                rxnmapper_output = [{
+                    "mapped_rxn": fallback_output["mapped_reaction_smiles"],
+                    "confidence": fallback_output["confidence_score"],
+                    "mapped_by": fallback_output["mapped_by"],
+                }, ]
+
+            else:
+                rxnmapper_output = self.rxnmapper.get_attention_guided_atom_maps(
+                    rxns=[pruned_reaction_smiles, ],
+                    **kwargs
+                )
+
+                rxnmapper_output[0]["mapped_by"] = "rxnmapper"
+
+        except Exception as exception_handle:
+            self._log_failure(
+                reaction_smiles=reaction_smiles,
+                exception_handle=exception_handle
+            )
+
+        finally:
+            if self.logger is not None and self.failure_report is None:
+                self.logger.info(
+                    msg=(
+                        "The atom-to-atom mapping of the chemical reaction SMILES string using the RXNMapper approach "
+                        "has been completed."
+                    )
+                )
+
+            return restore_pruned_reaction_compounds(
+                output={
+                    "mapped_reaction_smiles": rxnmapper_output[0].get("mapped_rxn", None),
+                    "confidence_score": rxnmapper_output[0].get("confidence", None),
+                    "mapped_by": rxnmapper_output[0].get("mapped_by", None),
+                },
+                removed_compound_smiles_strings=removed_compound_smiles_strings
+            )
+
+    def _get_number_of_tokens(
+            self,
+            reaction_smiles: str
+    ) -> int:
+        """
+        Get the number of RXNMapper model tokens of a chemical reaction SMILES string using the tokenizer of the
+        RXNMapper model. If the molecule cache is utilized, the chemical reaction compounds are tokenized individually
+        and the tokens of the separators are added.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+        :returns: The number of RXNMapper model tokens, including the special tokens.
+        """
+
+        tokenizer = self.rxnmapper.tokenizer
+
+        number_of_special_tokens = tokenizer.num_special_tokens_to_add()
+
+        reaction_compound_smiles_strings = None
+
+        if self.molecule_cache is not None:
+            reaction_compound_smiles_strings = get_reaction_compound_smiles_strings(
+                reaction_smiles=reaction_smiles
+            )
+
+        if reaction_compound_smiles_strings is None or ">".join(
+            ".".join(compound_smiles_strings) for compound_smiles_strings in reaction_compound_smiles_strings
+        ) != reaction_smiles.split(" ")[0]:
+            return len(tokenizer.tokenize(reaction_smiles.split(" ")[0])) + number_of_special_tokens
+
+        reactant_smiles_strings, reagent_smiles_strings, product_smiles_strings = reaction_compound_smiles_strings
+
+        return sum(
+            self.molecule_cache.get(
+                key=("rxnmapper_tokenization", compound_smiles, ),
+                function=lambda: len(tokenizer.tokenize(compound_smiles))
+            ) for compound_smiles in reactant_smiles_strings + reagent_smiles_strings + product_smiles_strings
+        ) + sum(
+            max(0, len(compound_smiles_strings) - 1) for compound_smiles_strings in reaction_compound_smiles_strings
+        ) + (1 if len(reagent_smiles_strings) == 0 else 2) + number_of_special_tokens
+
+    def _map_overlong_reaction_smiles_strings(
+            self,
+            reaction_smiles_strings: Sequence[str]
+    ) -> List[Dict[str, Optional[Union[float, str]]]]:
+        """
+        Map the chemical reaction SMILES strings that exceed the maximum number of RXNMapper model tokens using the
+        fallback atom-to-atom mapping approach, if any.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+        :returns: The mapped chemical reaction SMILES strings, atom-to-atom mapping confidence scores, and indicators of
+            whether the chemical reaction SMILES strings have been mapped using the fallback approach or skipped.
+        """
+
+        self.token_length_routing_summary["number_of_routed_reactions"] += len(reaction_smiles_strings)
+
+        if self.fallback_atom_to_atom_mapping is None:
+            if self.logger is not None:
+                self.logger.warning(
+                    msg=(
+                        "The {number_of_reactions:d} chemical reaction SMILES string(s) exceeding the maximum number "
+                        "of {maximum_number_of_tokens:d} tokens have not been mapped because no fallback atom-to-atom "
+                        "mapping approach has been specified."
+                    ).format(
+                        number_of_reactions=len(reaction_smiles_strings),
+                        maximum_number_of_tokens=self.maximum_number_of_tokens
+                    )
+                )
+
+            return [
+                {
+                    "mapped_reaction_smiles": None,
+                    "confidence_score": None,
+                    "mapped_by": "skipped_overlong",
+                } for _ in reaction_smiles_strings
+            ]
+
+        self.token_length_routing_summary["number_of_fallback_reactions"] += len(reaction_smiles_strings)
+
+        return [
+            {
+                "mapped_reaction_smiles": fallback_output.get("mapped_reaction_smiles", None),
+                "confidence_score": fallback_output.get("confidence_score", None),
+                "mapped_by": "fallback",
+            } for fallback_output in self.fallback_atom_to_atom_mapping.map_reaction_smiles_strings(
+                list(reaction_smiles_strings)
+            )
+        ]
+
+    def _preprocess_reaction_smiles_batch(
+            self,
+            reaction_smiles_strings: Sequence[str]
+    ) -> Tuple[List[str], Optional[List[List[str]]], List[bool]]:
+        """
+        Pre-process a batch of the chemical reaction SMILES strings by pruning the chemical reaction compounds, if
+        relevant, and checking which chemical reaction SMILES strings exceed the maximum number of RXNMapper model
+        tokens.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+
+        :returns: The pre-processed SMILES strings of the chemical reactions, the SMILES strings of the removed chemical
+            reaction compounds, and the indicators of whether the chemical reaction SMILES strings exceed the maximum
+            number of RXNMapper model tokens.
+        """
+
+        removed_compound_smiles_strings = None
+
+        if self.reaction_pruning_mode is not None:
+            reaction_smiles_strings, removed_compound_smiles_strings = prune_reaction_smiles_strings(
+                reaction_smiles_strings=reaction_smiles_strings,
+                pruning_mode=self.reaction_pruning_mode,
+                molecule_cache=self.molecule_cache
+            )
+
+        return list(reaction_smiles_strings), removed_compound_smiles_strings, [
+            self._get_number_of_tokens(
+                reaction_smiles=reaction_smiles
+            ) > self.maximum_number_of_tokens for reaction_smiles in reaction_smiles_strings
+        ]
+
+    def _map_preprocessed_reaction_smiles_batch(
+            self,
+            preprocessed_reaction_smiles_batch: Tuple[List[str], Optional[List[List[str]]], List[bool]],
+            **kwargs
+    ) -> List[Dict[str, Optional[Union[float, str]]]]:
+        """
+        Map a pre-processed batch of the chemical reaction SMILES strings. The chemical reaction SMILES strings that
+        exceed the maximum number of RXNMapper model tokens are routed to the fallback atom-to-atom mapping approach.
+
+        :parameter preprocessed_reaction_smiles_batch: The pre-processed batch of the chemical reaction SMILES strings.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
+            { `rxnmapper.core.RXNMapper.get_attention_guided_atom_maps` }.
+
+        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping confidence scores of the batch.
+        """
+
+        reaction_smiles_strings, removed_compound_smiles_strings, is_overlong = preprocessed_reaction_smiles_batch
+
+        rxnmapper_outputs = iter(self._map_reaction_smiles_batch_using_rxnmapper(
+            reaction_smiles_strings=[
+                reaction_smiles for reaction_smiles, is_reaction_overlong in zip(reaction_smiles_strings, is_overlong)
+                if not is_reaction_overlong
+            ],
+            **kwargs
+        ))
+
+        overlong_rxnmapper_outputs = iter(self._map_overlong_reaction_smiles_strings(
+            reaction_smiles_strings=[
+                reaction_smiles for reaction_smiles, is_reaction_overlong in zip(reaction_smiles_strings, is_overlong)
+                if is_reaction_overlong
+            ]
+        ) if any(is_overlong) else list())
+
+        rxnmapper_outputs = [
+            next(overlong_rxnmapper_outputs) if is_reaction_overlong else next(rxnmapper_outputs)
+            for is_reaction_overlong in is_overlong
+        ]
+
+        if removed_compound_smiles_strings is not None:
+            rxnmapper_outputs = [
+                restore_pruned_reaction_compounds(
+                    output=rxnmapper_output,
+                    removed_compound_smiles_strings=removed_compound_smiles
+                ) for rxnmapper_output, removed_compound_smiles in zip(
+                    rxnmapper_outputs,
+                    removed_compound_smiles_strings
+                )
+            ]
+
+        return rxnmapper_outputs
+
+    def _map_reaction_smiles_batch_using_rxnmapper(
+            self,
+            reaction_smiles_strings: Sequence[str],
+            **kwargs
+    ) -> List[Dict[str, Optional[Union[float, str]]]]:
+        """
+        Map a batch of the chemical reaction SMILES strings using the RXNMapper model. If the atom-to-atom mapping of
+        the batch is unsuccessful, the chemical reaction SMILES strings of the batch are mapped individually.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the batch.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
+            { `rxnmapper.core.RXNMapper.get_attention_guided_atom_maps` }.
+
+        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping confidence scores of the batch.
+        """
+
+        if len(reaction_smiles_strings) == 0:
+            return list()
+
+        rxnmapper_outputs = list()
+
+        try:
+            rxnmapper_batch_outputs = self.rxnmapper.get_attention_guided_atom_maps(
+                rxns=list(reaction_smiles_strings),
                 **kwargs
             )
 
+            for rxnmapper_batch_output in rxnmapper_batch_outputs:
+                rxnmapper_outputs.append({
+                    "mapped_reaction_smiles": rxnmapper_batch_output.get("mapped_rxn", None),
+                    "confidence_score": rxnmapper_batch_output.get("confidence", None),
+                    "mapped_by": "rxnmapper",
+                })
+
         except Exception as exception_handle:
             if self.logger is not None:
-                self.logger.error(
+                self.logger.warning(
                     msg=(
-                        "The atom-to-atom mapping of the chemical reaction SMILES string '{reaction_smiles:s}' has "
-                        "been unsuccessful."
-                    ).format(
-                        reaction_smiles=reaction_smiles
+                        "The atom-to-atom mapping of the chemical reaction SMILES string batch has been "
+                        "unsuccessful. Switching to the atom-to-atom mapping of the individual chemical "
+                        "reaction SMILES strings of the batch."
                     )
                 )
 
@@ -79,38 +497,57 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     exc_info=True
                 )
 
-        finally:
-            if self.logger is not None:
-                self.logger.info(
-                    msg=(
-                        "The atom-to-atom mapping of the chemical reaction SMILES string using the RXNMapper approach "
-                        "has been completed."
+            rxnmapper_outputs = list()
+
+            for reaction_smiles in reaction_smiles_strings:
+                try:
+                    rxnmapper_output = self.rxnmapper.get_attention_guided_atom_maps(
+                        rxns=[reaction_smiles, ],
+                        **kwargs
                     )
-                )
 
-            return {
-                "mapped_reaction_smiles": rxnmapper_output[0].get("mapped_rxn", None),
-                "confidence_score": rxnmapper_output[0].get("confidence", None),
-            }
+                    rxnmapper_outputs.append({
+                        "mapped_reaction_smiles": rxnmapper_output[0].get("mapped_rxn", None),
+                        "confidence_score": rxnmapper_output[0].get("confidence", None),
+                        "mapped_by": "rxnmapper",
+                    })
+
+                except Exception as exception_handle:
+                    self._log_failure(
+                        reaction_smiles=reaction_smiles,
+                        exception_handle=exception_handle
+                    )
+
+                    rxnmapper_outputs.append({
+                        "mapped_reaction_smiles": None,
+                        "confidence_score": None,
+                        "mapped_by": "rxnmapper",
+                    })
+
+        return rxnmapper_outputs
 
     def map_reaction_smiles_strings(
             self,
             reaction_smiles_strings: Sequence[str],
             batch_size: int = 10,
+            maximum_number_of_prefetched_batches: int = 0,
             **kwargs
-    ) -> List[Dict[str, Optional[Union[float, str]]]]:
+    ) -> MappingResultBatch:
         """
         Map the chemical reaction SMILES strings.
 
         :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
         :parameter batch_size: The size of the batch.
+        :parameter maximum_number_of_prefetched_batches: The maximum number of batches that are pre-processed in a
+            background thread ahead of the RXNMapper model inference. The value `0` indicates that the batches should
+            not be prefetched.
         :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
             { `rxnmapper.core.RXNMapper.get_attention_guided_atom_maps` }.
 
-        :returns: The mapped chemical reaction SMILES strings and atom-to-atom mapping confidence scores.
+        :returns: The batch of the mapped chemical reaction SMILES strings and atom-to-atom mapping confidence scores.
         """
 
-        rxnmapper_outputs = list()
+        rxnmapper_outputs = MappingResultBatchBuilder()
 
         try:
             if self.logger is not None:
@@ -125,75 +562,22 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
                 batch_size=batch_size
             )
 
-            for reaction_smiles_index in tqdm(
-                iterable=range(0, len(reaction_smiles_strings), batch_size),
+            for _, preprocessed_reaction_smiles_batch in tqdm(
+                iterable=self._get_preprocessed_reaction_smiles_batches(
+                    reaction_smiles_strings=reaction_smiles_strings,
+                    batch_size=batch_size,
+                    maximum_number_of_prefetched_batches=maximum_number_of_prefetched_batches
+                ),
                 desc=tqdm_description,
                 total=ceil(len(reaction_smiles_strings) / batch_size),
                 ncols=len(tqdm_description) + 50
             ):
-                try:
-                    rxnmapper_batch_outputs = self.rxnmapper.get_attention_guided_atom_maps(
-                        rxns=list(reaction_smiles_strings[
-                            reaction_smiles_index: min(reaction_smiles_index + batch_size, len(reaction_smiles_strings))
-                        ]),
+                rxnmapper_outputs.extend(
+                    self._map_preprocessed_reaction_smiles_batch(
+                        preprocessed_reaction_smiles_batch=preprocessed_reaction_smiles_batch,
                         **kwargs
                     )
-
-                    for rxnmapper_batch_output in rxnmapper_batch_outputs:
-                        rxnmapper_outputs.append({
-                            "mapped_reaction_smiles": rxnmapper_batch_output.get("mapped_rxn", None),
-                            "confidence_score": rxnmapper_batch_output.get("confidence", None),
-                        })
-
-                except Exception as exception_handle:
-                    if self.logger is not None:
-                        self.logger.warning(
-                            msg=(
-                                "The atom-to-atom mapping of the chemical reaction SMILES string batch has been "
-                                "unsuccessful. Switching to the atom-to-atom mapping of the individual chemical "
-                                "reaction SMILES strings of the batch."
-                            )
-                        )
-
-                        self.logger.debug(
-                            msg=exception_handle,
-                            exc_info=True
-                        )
-
-                    for reaction_smiles in reaction_smiles_strings[
-                        reaction_smiles_index: min(reaction_smiles_index + batch_size, len(reaction_smiles_strings))
-                    ]:
-                        try:
-                            rxnmapper_output = self.rxnmapper.get_attention_guided_atom_maps(
-                                rxns=[reaction_smiles, ],
-                                **kwargs
-                            )
-
-                            rxnmapper_outputs.append({
-                                "mapped_reaction_smiles": rxnmapper_output[0].get("mapped_rxn", None),
-                                "confidence_score": rxnmapper_output[0].get("confidence", None),
-                            })
-
-                        except Exception as exception_handle:
-                            if self.logger is not None:
-                                self.logger.error(
-                                    msg=(
-                                        "The atom-to-atom mapping of the chemical reaction SMILES string "
-                                        "'{reaction_smiles:s}' has been unsuccessful."
-                                    ).format(
-                                        reaction_smiles=reaction_smiles
-                                    )
-                                )
-
-                                self.logger.debug(
-                                    msg=exception_handle,
-                                    exc_info=True
-                                )
-
-                            rxnmapper_outputs.append({
-                                "mapped_reaction_smiles": None,
-                                "confidence_score": None,
-                            })
+                )
 
             if self.logger is not None:
                 self.logger.info(
@@ -203,7 +587,29 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     )
                 )
 
-            return rxnmapper_outputs
+                if self.molecule_cache is not None:
+                    self.logger.info(
+                        msg=(
+                            "The molecule cache hit rate: {hit_rate:.2%} (Number of Hits: {number_of_hits:d}, Number "
+                            "of Misses: {number_of_misses:d})."
+                        ).format(
+                            **self.molecule_cache.get_summary()
+                        )
+                    )
+
+                if self.token_length_routing_summary["number_of_routed_reactions"] > 0:
+                    self.logger.info(
+                        msg=(
+                            "The total number of chemical reaction SMILES strings exceeding the maximum number of "
+                            "{maximum_number_of_tokens:d} tokens: {number_of_routed_reactions:d} (Mapped using the "
+                            "fallback approach: {number_of_fallback_reactions:d})."
+                        ).format(
+                            maximum_number_of_tokens=self.maximum_number_of_tokens,
+                            **self.token_length_routing_summary
+                        )
+                    )
+
+            return rxnmapper_outputs.build()
 
         except Exception as exception_handle:
             if self.logger is not None:
@@ -216,4 +622,58 @@ class RXNMapperAtomToAtomMapping(AtomToAtomMappingBase):
                     exc_info=True
                 )
 
-            return rxnmapper_outputs
+            return rxnmapper_outputs.build()
+
+    def iter_map_reaction_smiles(
+            self,
+            reaction_smiles_strings: Iterable[str],
+            batch_size: int = 10,
+            return_indices: bool = False,
+            maximum_number_of_prefetched_batches: int = 0,
+            **kwargs
+    ) -> Iterator[Union[Dict[str, Optional[Union[float, str]]], Tuple[int, Dict[str, Optional[Union[float, str]]]]]]:
+        """
+        Map the chemical reaction SMILES strings and yield the outputs as soon as each batch has been mapped.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+        :parameter batch_size: The size of the batch.
+        :parameter return_indices: The indicator of whether the input indices of the chemical reaction SMILES strings
+            should be yielded together with the outputs.
+        :parameter maximum_number_of_prefetched_batches: The maximum number of batches that are read and pre-processed
+            in a background thread ahead of the RXNMapper model inference. The value `0` indicates that the batches
+            should not be prefetched.
+        :parameter kwargs: The keyword arguments for the adjustment of the following underlying methods:
+            { `rxnmapper.core.RXNMapper.get_attention_guided_atom_maps` }.
+
+        :returns: The iterator of the mapped chemical reaction SMILES strings and atom-to-atom mapping confidence
+            scores, optionally with their input indices.
+        """
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the RXNMapper "
+                    "approach has been started."
+                )
+            )
+
+        for reaction_smiles_index, preprocessed_reaction_smiles_batch in self._get_preprocessed_reaction_smiles_batches(
+            reaction_smiles_strings=reaction_smiles_strings,
+            batch_size=batch_size,
+            maximum_number_of_prefetched_batches=maximum_number_of_prefetched_batches
+        ):
+            for output_index, rxnmapper_output in enumerate(
+                self._map_preprocessed_reaction_smiles_batch(
+                    preprocessed_reaction_smiles_batch=preprocessed_reaction_smiles_batch,
+                    **kwargs
+                )
+            ):
+                yield (reaction_smiles_index + output_index, rxnmapper_output) if return_indices else rxnmapper_output
+
+        if self.logger is not None:
+            self.logger.info(
+                msg=(
+                    "The streaming atom-to-atom mapping of the chemical reaction SMILES strings using the RXNMapper "
+                    "approach has been completed."
+                )
+            )
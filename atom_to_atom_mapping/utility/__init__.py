@@ -0,0 +1,95 @@
+""" The ``atom_to_atom_mapping.utility`` package initialization module. """
+
+from atom_to_atom_mapping.utility.cpu_resources import (
+    CPUResourceManager,
+    configure_current_process_threads,
+    get_available_cpu_cores,
+    get_cpu_resource_manager,
+    set_cpu_resource_manager,
+)
+from atom_to_atom_mapping.utility.failure_report import (
+    FAILURE_RECORD_KEY,
+    FailureReport,
+    get_failure_class,
+    get_failure_record,
+)
+from atom_to_atom_mapping.utility.incremental_mapping import (
+    ROW_HASH_COLUMN_NAME,
+    IncrementalMapping,
+    get_incremental_manifest_file_path,
+    get_mapping_configuration_hash,
+    get_row_hash,
+)
+from atom_to_atom_mapping.utility.input_file_collection import (
+    INPUT_FILE_EXTENSIONS,
+    get_input_file_paths,
+    get_output_file_path,
+    is_supported_input_file,
+    read_input_manifest_file,
+)
+from atom_to_atom_mapping.utility.mapping_comparison import (
+    compare_bond_change_signatures,
+    compare_mapped_reaction_smiles_files,
+    get_bond_change_signature_list,
+    get_bond_change_signatures,
+)
+from atom_to_atom_mapping.utility.mapping_result_batch import (
+    OUTPUT_COLUMN_ARROW_DATA_TYPES,
+    MappingResultBatch,
+    MappingResultBatchBuilder,
+)
+from atom_to_atom_mapping.utility.mapping_validation import (
+    MAPPING_VALIDATION_COLUMN_NAMES,
+    validate_mapped_reaction_smiles_strings,
+)
+from atom_to_atom_mapping.utility.molecule_cache import (
+    MoleculeCache,
+    get_reaction_compound_smiles_strings,
+    merge_molecule_cache_summaries,
+)
+from atom_to_atom_mapping.utility.pipeline import iterate_in_background
+from atom_to_atom_mapping.utility.reaction_normalization import (
+    deduplicate_reaction_smiles_strings,
+    map_normalized_reaction_smiles_strings,
+    normalize_reaction_smiles,
+    normalize_reaction_smiles_strings,
+)
+from atom_to_atom_mapping.utility.reaction_pruning import (
+    prune_reaction_smiles,
+    prune_reaction_smiles_strings,
+    restore_pruned_reaction_compounds,
+)
+from atom_to_atom_mapping.utility.reaction_record_file import (
+    RXN_BLOCK_PREFIX,
+    convert_rxn_block_to_reaction_smiles,
+    is_reaction_record_file,
+    iterate_rxn_file_records,
+    read_reaction_record_file_chunks,
+    read_reaction_smiles_file_chunks,
+    read_rxn_file_chunks,
+)
+from atom_to_atom_mapping.utility.reaction_smiles_file import (
+    read_csv_file_chunks,
+    read_csv_file_row_range,
+    read_parquet_file_chunks,
+    read_parquet_file_row_range,
+    write_csv_file_chunks,
+    write_parquet_file_chunks,
+)
+from atom_to_atom_mapping.utility.reaction_smiles_line_file import ReactionSmilesLineFile, read_line_file_chunks
+from atom_to_atom_mapping.utility.reaction_template_index import ReactionTemplateIndex
+from atom_to_atom_mapping.utility.sharding import (
+    ROW_INDEX_COLUMN_NAME,
+    InputShard,
+    get_number_of_input_file_rows,
+    merge_row_indexed_output_files,
+    merge_shard_output_files,
+)
+from atom_to_atom_mapping.utility.time_budget import TimeBudget, write_remainder_file
+from atom_to_atom_mapping.utility.work_queue import ReactionSmilesWorkQueue, run_work_queue_worker
+from atom_to_atom_mapping.utility.worker_recycling import (
+    WorkerRecyclingProcessPool,
+    get_resident_set_size_in_mb,
+    map_reaction_smiles_strings_in_worker_process,
+    merge_worker_memory_summaries,
+)
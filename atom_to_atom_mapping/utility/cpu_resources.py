@@ -0,0 +1,313 @@
+""" The ``atom_to_atom_mapping.utility`` package ``cpu_resources`` module. """
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from logging import Logger
+from multiprocessing import current_process
+from os import cpu_count, environ
+from sys import modules
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    from os import sched_getaffinity, sched_setaffinity
+
+except ImportError:
+    sched_getaffinity, sched_setaffinity = None, None
+
+
+THREAD_COUNT_ENVIRONMENT_VARIABLE_NAMES = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+]
+
+
+def get_available_cpu_cores() -> List[int]:
+    """
+    Get the identifiers of the CPU cores that are available to the current process.
+
+    :returns: The identifiers of the available CPU cores.
+    """
+
+    if sched_getaffinity is not None:
+        return sorted(sched_getaffinity(0))
+
+    return list(range(cpu_count() or 1))
+
+
+def configure_current_process_threads(
+        number_of_threads: int,
+        cpu_cores: Optional[Sequence[int]] = None
+) -> None:
+    """
+    Configure the number of the BLAS, OpenMP and PyTorch threads, and optionally the CPU affinity, of the current
+    process. The PyTorch threads are configured only if PyTorch has already been imported, and the thread count
+    environment variables apply to the libraries that are loaded afterwards.
+
+    :parameter number_of_threads: The number of threads.
+    :parameter cpu_cores: The identifiers of the CPU cores to which the current process should be pinned. The value
+        `None` indicates that the CPU affinity should not be modified.
+    """
+
+    for environment_variable_name in THREAD_COUNT_ENVIRONMENT_VARIABLE_NAMES:
+        environ[environment_variable_name] = str(number_of_threads)
+
+    if "torch" in modules:
+        modules["torch"].set_num_threads(number_of_threads)
+
+        try:
+            modules["torch"].set_num_interop_threads(max(1, min(number_of_threads, 2)))
+
+        except RuntimeError:
+            pass
+
+    if cpu_cores is not None and len(cpu_cores) > 0 and sched_setaffinity is not None:
+        sched_setaffinity(0, set(cpu_cores))
+
+
+def _initialize_worker_process(
+        number_of_threads_per_process: int,
+        cpu_core_sets: Optional[List[List[int]]]
+) -> None:
+    """
+    Initialize a worker process of a process pool according to the CPU resource layout. The CPU core set of the worker
+    process is selected based on the sequence number of the worker process.
+
+    :parameter number_of_threads_per_process: The number of threads per worker process.
+    :parameter cpu_core_sets: The CPU core sets of the worker processes. The value `None` indicates that the worker
+        processes should not be pinned.
+    """
+
+    cpu_cores = None
+
+    if cpu_core_sets is not None and len(cpu_core_sets) > 0:
+        worker_process_identity = getattr(current_process(), "_identity", ())
+
+        cpu_cores = cpu_core_sets[
+            (worker_process_identity[-1] - 1 if len(worker_process_identity) > 0 else 0) % len(cpu_core_sets)
+        ]
+
+    configure_current_process_threads(
+        number_of_threads=number_of_threads_per_process,
+        cpu_cores=cpu_cores
+    )
+
+
+class CPUResourceManager:
+    """ The CPU topology-aware resource manager that prevents the oversubscription of the CPU cores. """
+
+    def __init__(
+            self,
+            number_of_cpu_cores: Optional[int] = None,
+            pin_cpu_affinity: bool = False,
+            first_cpu_core_index: int = 0
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter number_of_cpu_cores: The total CPU core budget. The value `None` indicates that all of the CPU cores
+            that are available to the current process should be utilized.
+        :parameter pin_cpu_affinity: The indicator of whether the processes should be pinned to disjoint CPU core sets.
+        :parameter first_cpu_core_index: The index of the first available CPU core of the budget, which allows several
+            jobs on the same host to utilize disjoint CPU core budgets.
+        """
+
+        available_cpu_cores = get_available_cpu_cores()[first_cpu_core_index:]
+
+        if number_of_cpu_cores is not None and number_of_cpu_cores < 1:
+            raise ValueError("The CPU core budget must be a positive integer.")
+
+        if len(available_cpu_cores) == 0:
+            raise ValueError("The index of the first CPU core exceeds the number of available CPU cores.")
+
+        self.cpu_cores = available_cpu_cores[:number_of_cpu_cores] if number_of_cpu_cores else available_cpu_cores
+
+        self.number_of_cpu_cores = len(self.cpu_cores)
+        self.pin_cpu_affinity = pin_cpu_affinity
+
+    def get_layout(
+            self,
+            number_of_processes: int = 1,
+            number_of_threads_per_process: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the CPU resource layout of a number of processes within the CPU core budget. The number of processes is
+        limited to the number of CPU cores, and the CPU cores are divided evenly between the processes.
+
+        :parameter number_of_processes: The requested number of processes.
+        :parameter number_of_threads_per_process: The requested number of threads per process. The value `None`
+            indicates that the CPU cores should be divided evenly between the processes.
+
+        :returns: The number of processes, the number of threads per process, and the CPU core sets of the processes.
+        """
+
+        number_of_processes = max(1, min(number_of_processes, self.number_of_cpu_cores))
+
+        maximum_number_of_threads_per_process = max(1, self.number_of_cpu_cores // number_of_processes)
+
+        if number_of_threads_per_process is None:
+            number_of_threads_per_process = maximum_number_of_threads_per_process
+
+        number_of_threads_per_process = max(1, min(
+            number_of_threads_per_process,
+            maximum_number_of_threads_per_process
+        ))
+
+        return {
+            "number_of_cpu_cores": self.number_of_cpu_cores,
+            "number_of_processes": number_of_processes,
+            "number_of_threads_per_process": number_of_threads_per_process,
+            "cpu_core_sets": [
+                self.cpu_cores[
+                    process_index * maximum_number_of_threads_per_process:
+                    (process_index + 1) * maximum_number_of_threads_per_process
+                ] for process_index in range(number_of_processes)
+            ] if self.pin_cpu_affinity else None,
+        }
+
+    def configure_current_process(
+            self,
+            number_of_threads: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Configure the threads and optionally the CPU affinity of the current process within the CPU core budget.
+
+        :parameter number_of_threads: The number of threads. The value `None` indicates that all of the CPU cores of the
+            budget should be utilized.
+
+        :returns: The CPU resource layout of the current process.
+        """
+
+        layout = self.get_layout(
+            number_of_processes=1,
+            number_of_threads_per_process=number_of_threads
+        )
+
+        configure_current_process_threads(
+            number_of_threads=layout["number_of_threads_per_process"],
+            cpu_cores=self.cpu_cores if self.pin_cpu_affinity else None
+        )
+
+        return layout
+
+    def create_process_pool_executor(
+            self,
+            number_of_processes: int,
+            number_of_threads_per_process: Optional[int] = None
+    ) -> ProcessPoolExecutor:
+        """
+        Create a process pool executor whose worker processes are configured according to the CPU resource layout.
+
+        :parameter number_of_processes: The requested number of worker processes.
+        :parameter number_of_threads_per_process: The requested number of threads per worker process. The value `None`
+            indicates that the CPU cores should be divided evenly between the worker processes.
+
+        :returns: The process pool executor.
+        """
+
+        layout = self.get_layout(
+            number_of_processes=number_of_processes,
+            number_of_threads_per_process=number_of_threads_per_process
+        )
+
+        return ProcessPoolExecutor(
+            max_workers=layout["number_of_processes"],
+            initializer=_initialize_worker_process,
+            initargs=(layout["number_of_threads_per_process"], layout["cpu_core_sets"], )
+        )
+
+    @contextmanager
+    def worker_process_environment(
+            self,
+            number_of_processes: int
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Temporarily set the thread count environment variables that are inherited by the worker processes which are
+        created by third-party process pools that do not support initializers.
+
+        :parameter number_of_processes: The requested number of worker processes.
+
+        :returns: The CPU resource layout of the worker processes.
+        """
+
+        layout = self.get_layout(
+            number_of_processes=number_of_processes
+        )
+
+        original_environment_variable_values = {
+            environment_variable_name: environ.get(environment_variable_name, None)
+            for environment_variable_name in THREAD_COUNT_ENVIRONMENT_VARIABLE_NAMES
+        }
+
+        try:
+            for environment_variable_name in THREAD_COUNT_ENVIRONMENT_VARIABLE_NAMES:
+                environ[environment_variable_name] = str(layout["number_of_threads_per_process"])
+
+            yield layout
+
+        finally:
+            for environment_variable_name, environment_variable_value in original_environment_variable_values.items():
+                if environment_variable_value is None:
+                    environ.pop(environment_variable_name, None)
+
+                else:
+                    environ[environment_variable_name] = environment_variable_value
+
+    def log_layout(
+            self,
+            logger: Logger,
+            layout: Dict[str, Any],
+            description: str
+    ) -> None:
+        """
+        Log a CPU resource layout.
+
+        :parameter logger: The logger.
+        :parameter layout: The CPU resource layout.
+        :parameter description: The description of the processes of the CPU resource layout.
+        """
+
+        logger.info(
+            msg=(
+                "The CPU resource layout of the {description:s}: {number_of_processes:d} process(es) with "
+                "{number_of_threads_per_process:d} thread(s) each within the budget of {number_of_cpu_cores:d} CPU "
+                "core(s){cpu_affinity:s}."
+            ).format(
+                description=description,
+                number_of_processes=layout["number_of_processes"],
+                number_of_threads_per_process=layout["number_of_threads_per_process"],
+                number_of_cpu_cores=layout["number_of_cpu_cores"],
+                cpu_affinity="" if layout["cpu_core_sets"] is None else " pinned to the CPU core sets {0}".format(
+                    layout["cpu_core_sets"]
+                )
+            )
+        )
+
+
+_cpu_resource_manager = CPUResourceManager()
+
+
+def get_cpu_resource_manager() -> CPUResourceManager:
+    """
+    Get the CPU resource manager that is utilized by all of the parallel paths of the package.
+
+    :returns: The CPU resource manager.
+    """
+
+    return _cpu_resource_manager
+
+
+def set_cpu_resource_manager(
+        cpu_resource_manager: CPUResourceManager
+) -> None:
+    """
+    Set the CPU resource manager that is utilized by all of the parallel paths of the package.
+
+    :parameter cpu_resource_manager: The CPU resource manager.
+    """
+
+    global _cpu_resource_manager
+
+    _cpu_resource_manager = cpu_resource_manager
@@ -0,0 +1,283 @@
+""" The ``atom_to_atom_mapping.utility`` package ``failure_report`` module. """
+
+from json import dump
+from random import Random
+from re import compile
+from traceback import format_exception
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+FAILURE_RECORD_KEY = "failure_record"
+
+FAILURE_REASON_QUOTED_TEXT_PATTERN = compile(
+    r"'[^']*'|\"[^\"]*\""
+)
+FAILURE_REASON_NUMBER_PATTERN = compile(
+    r"\d+"
+)
+
+
+def get_failure_class(
+        exception_handle: BaseException,
+        maximum_reason_length: int = 200
+) -> Tuple[str, str]:
+    """
+    Get the class of an atom-to-atom mapping failure, which consists of the exception type and the reason. The reason
+    is the first line of the exception message, in which the quoted texts and numbers are replaced with placeholders,
+    so that the failures of the different chemical reactions with the same cause fall into the same class.
+
+    :parameter exception_handle: The exception of the failure.
+    :parameter maximum_reason_length: The maximum length of the reason.
+
+    :returns: The exception type and the reason of the failure.
+    """
+
+    exception_message_lines = str(exception_handle).strip().splitlines()
+
+    reason = FAILURE_REASON_NUMBER_PATTERN.sub(
+        "<n>",
+        FAILURE_REASON_QUOTED_TEXT_PATTERN.sub(
+            "<s>",
+            exception_message_lines[0] if len(exception_message_lines) > 0 else ""
+        )
+    )
+
+    return type(exception_handle).__name__, reason[:maximum_reason_length]
+
+
+def get_failure_record(
+        reaction_smiles: Optional[str],
+        exception_handle: BaseException
+) -> Dict[str, Optional[str]]:
+    """
+    Get the compact record of an atom-to-atom mapping failure, which can be passed between the processes and added to
+    a failure report. The traceback is not formatted.
+
+    :parameter reaction_smiles: The SMILES string of the chemical reaction.
+    :parameter exception_handle: The exception of the failure.
+
+    :returns: The chemical reaction SMILES string, the exception type, the reason, and the exception message.
+    """
+
+    exception_type, reason = get_failure_class(
+        exception_handle=exception_handle
+    )
+
+    return {
+        "reaction_smiles": reaction_smiles,
+        "exception_type": exception_type,
+        "reason": reason,
+        "message": str(exception_handle),
+        "traceback": None,
+    }
+
+
+class FailureReport:
+    """
+    The aggregated report of the atom-to-atom mapping failures, which counts the failures per class and keeps a bounded
+    random sample of the example chemical reactions and tracebacks per class instead of logging every failure.
+    """
+
+    def __init__(
+            self,
+            maximum_number_of_examples: int = 5,
+            random_seed: int = 42
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter maximum_number_of_examples: The maximum number of the example failures that are kept per class.
+        :parameter random_seed: The random seed of the sampling of the example failures.
+        """
+
+        self.maximum_number_of_examples = maximum_number_of_examples
+
+        self._random = Random(random_seed)
+
+        self._failure_classes: Dict[Tuple[str, str], Dict[str, Any]] = dict()
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        The `__len__` method of the class.
+
+        :returns: The number of the reported failures.
+        """
+
+        return sum(failure_class["number_of_failures"] for failure_class in self._failure_classes.values())
+
+    def _add_failure(
+            self,
+            exception_type: str,
+            reason: str,
+            get_example: Callable[[], Dict[str, Optional[str]]]
+    ) -> None:
+        """
+        Add a failure to its class. The example of the failure is kept using the reservoir sampling, and it is only
+        constructed if it is kept.
+
+        :parameter exception_type: The exception type of the failure.
+        :parameter reason: The reason of the failure.
+        :parameter get_example: The function that constructs the example of the failure.
+        """
+
+        failure_class = self._failure_classes.setdefault((exception_type, reason, ), {
+            "number_of_failures": 0,
+            "examples": list(),
+        })
+
+        failure_class["number_of_failures"] += 1
+
+        if len(failure_class["examples"]) < self.maximum_number_of_examples:
+            failure_class["examples"].append(get_example())
+
+        elif self.maximum_number_of_examples > 0:
+            example_index = self._random.randrange(failure_class["number_of_failures"])
+
+            if example_index < self.maximum_number_of_examples:
+                failure_class["examples"][example_index] = get_example()
+
+    def add_failure(
+            self,
+            reaction_smiles: Optional[str],
+            exception_handle: BaseException
+    ) -> None:
+        """
+        Add an atom-to-atom mapping failure. The traceback is formatted only if the failure is kept as an example.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+        :parameter exception_handle: The exception of the failure.
+        """
+
+        exception_type, reason = get_failure_class(
+            exception_handle=exception_handle
+        )
+
+        self._add_failure(
+            exception_type=exception_type,
+            reason=reason,
+            get_example=lambda: {
+                "reaction_smiles": reaction_smiles,
+                "message": str(exception_handle),
+                "traceback": "".join(format_exception(
+                    type(exception_handle),
+                    exception_handle,
+                    exception_handle.__traceback__
+                )),
+            }
+        )
+
+    def add_failure_record(
+            self,
+            failure_record: Dict[str, Optional[str]]
+    ) -> None:
+        """
+        Add the compact record of an atom-to-atom mapping failure, for example, from a worker process.
+
+        :parameter failure_record: The record of the failure.
+        """
+
+        self._add_failure(
+            exception_type=failure_record["exception_type"],
+            reason=failure_record["reason"],
+            get_example=lambda: {
+                "reaction_smiles": failure_record["reaction_smiles"],
+                "message": failure_record["message"],
+                "traceback": failure_record.get("traceback", None),
+            }
+        )
+
+    def update(
+            self,
+            failure_report: "FailureReport"
+    ) -> None:
+        """
+        Update the failure report with the failures of another failure report. The example failures of each class are
+        randomly sampled from the example failures of both failure reports.
+
+        :parameter failure_report: The other failure report.
+        """
+
+        for (exception_type, reason), other_failure_class in failure_report._failure_classes.items():
+            failure_class = self._failure_classes.setdefault((exception_type, reason, ), {
+                "number_of_failures": 0,
+                "examples": list(),
+            })
+
+            failure_class["number_of_failures"] += other_failure_class["number_of_failures"]
+            failure_class["examples"].extend(other_failure_class["examples"])
+
+            if len(failure_class["examples"]) > self.maximum_number_of_examples:
+                failure_class["examples"] = self._random.sample(
+                    failure_class["examples"],
+                    self.maximum_number_of_examples
+                )
+
+    def collect_failure_records(
+            self,
+            outputs: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Collect the failure records that are attached to the atom-to-atom mapping outputs and remove them from the
+        outputs.
+
+        :parameter outputs: The atom-to-atom mapping outputs.
+
+        :returns: The iterator of the atom-to-atom mapping outputs without the failure records.
+        """
+
+        for output in outputs:
+            failure_record = output.pop(FAILURE_RECORD_KEY, None)
+
+            if failure_record is not None:
+                self.add_failure_record(
+                    failure_record=failure_record
+                )
+
+            yield output
+
+    def get_summary(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the summary of the failure report.
+
+        :returns: The number of the failures, the number of the failure classes, and the failure classes with their
+            number of failures and examples, in the descending order of the number of failures.
+        """
+
+        failure_classes: List[Dict[str, Any]] = [
+            {
+                "exception_type": exception_type,
+                "reason": reason,
+                "number_of_failures": failure_class["number_of_failures"],
+                "examples": list(failure_class["examples"]),
+            } for (exception_type, reason), failure_class in sorted(
+                self._failure_classes.items(),
+                key=lambda failure_class_item: -failure_class_item[1]["number_of_failures"]
+            )
+        ]
+
+        return {
+            "number_of_failures": len(self),
+            "number_of_failure_classes": len(failure_classes),
+            "failure_classes": failure_classes,
+        }
+
+    def write(
+            self,
+            file_path: str
+    ) -> None:
+        """
+        Write the failure report to a .json file.
+
+        :parameter file_path: The path to the .json file.
+        """
+
+        with open(file_path, "w") as file_handle:
+            dump(
+                obj=self.get_summary(),
+                fp=file_handle,
+                indent=4
+            )
@@ -0,0 +1,578 @@
+""" The ``atom_to_atom_mapping.utility`` package ``incremental_mapping`` module. """
+
+from collections import OrderedDict
+from hashlib import blake2b
+from json import dump, dumps, load
+from logging import Logger
+from os.path import exists
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from numpy import argsort, array, ndarray, searchsorted, uint64
+
+from pandas import DataFrame, isna, read_csv
+
+from pyarrow.parquet import ParquetFile
+
+from atom_to_atom_mapping.utility.mapping_result_batch import (
+    OUTPUT_COLUMN_ARROW_DATA_TYPES,
+    MappingResultBatch,
+    MappingResultBatchBuilder,
+)
+
+
+ROW_HASH_COLUMN_NAME = "row_hash"
+
+
+def get_mapping_configuration_hash(
+        mapping_configuration: Dict[str, Any]
+) -> str:
+    """
+    Get the hash of an atom-to-atom mapping configuration.
+
+    :parameter mapping_configuration: The atom-to-atom mapping configuration, which should contain only the settings
+        that affect the atom-to-atom mapping outputs.
+
+    :returns: The hexadecimal hash of the atom-to-atom mapping configuration.
+    """
+
+    return blake2b(
+        dumps(mapping_configuration, sort_keys=True, default=str).encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+
+
+def get_row_hash(
+        reaction_smiles: str,
+        mapping_configuration_hash: str
+) -> int:
+    """
+    Get the content hash of an input row from its chemical reaction SMILES string and the atom-to-atom mapping
+    configuration hash, so that the row hash changes if either of them changes.
+
+    :parameter reaction_smiles: The SMILES string of the chemical reaction.
+    :parameter mapping_configuration_hash: The hash of the atom-to-atom mapping configuration.
+
+    :returns: The 64-bit content hash of the input row.
+    """
+
+    return int.from_bytes(
+        blake2b(
+            "{mapping_configuration_hash:s}\n{reaction_smiles:s}".format(
+                mapping_configuration_hash=mapping_configuration_hash,
+                reaction_smiles=str(reaction_smiles)
+            ).encode("utf-8"),
+            digest_size=8
+        ).digest(),
+        byteorder="big"
+    )
+
+
+def get_incremental_manifest_file_path(
+        output_file_path: str
+) -> str:
+    """
+    Get the path to the incremental manifest file of an output file.
+
+    :parameter output_file_path: The path to the output file.
+
+    :returns: The path to the incremental manifest file of the output file.
+    """
+
+    return "{output_file_path:s}.incremental.json".format(
+        output_file_path=output_file_path
+    )
+
+
+def _read_output_file_chunks(
+        file_path: str,
+        chunk_size: int,
+        column_names: Optional[Sequence[str]] = None
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of a .csv or .parquet output file. The row hash column is read as text.
+
+    :parameter file_path: The path to the output file.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter column_names: The names of the columns that should be read. The value `None` indicates that all of the
+        columns should be read.
+
+    :returns: The iterator of the chunks of the output file.
+    """
+
+    if file_path.endswith(".parquet"):
+        for record_batch in ParquetFile(
+            source=file_path,
+            memory_map=True
+        ).iter_batches(
+            batch_size=chunk_size,
+            columns=None if column_names is None else list(column_names)
+        ):
+            yield record_batch.to_pandas()
+
+    else:
+        yield from read_csv(
+            filepath_or_buffer=file_path,
+            usecols=None if column_names is None else list(column_names),
+            dtype={
+                ROW_HASH_COLUMN_NAME: str,
+            },
+            chunksize=chunk_size,
+            low_memory=False
+        )
+
+
+def _get_output_file_column_names(
+        file_path: str
+) -> List[str]:
+    """
+    Get the names of the columns of a .csv or .parquet output file.
+
+    :parameter file_path: The path to the output file.
+
+    :returns: The names of the columns of the output file.
+    """
+
+    if file_path.endswith(".parquet"):
+        return list(ParquetFile(
+            source=file_path
+        ).schema_arrow.names)
+
+    return list(read_csv(
+        filepath_or_buffer=file_path,
+        nrows=0
+    ).columns)
+
+
+def _get_output_value(
+        value: Any,
+        column_name: str
+) -> Any:
+    """
+    Get the value of an atom-to-atom mapping output column that has been read from an output file, in which the
+    missing values can be represented as `NaN`, and the integer values as floats.
+
+    :parameter value: The value that has been read from the output file.
+    :parameter column_name: The name of the atom-to-atom mapping output column.
+
+    :returns: The value of the atom-to-atom mapping output column.
+    """
+
+    if value is None or isna(value):
+        return None
+
+    column_data_type = str(OUTPUT_COLUMN_ARROW_DATA_TYPES[column_name])
+
+    if column_data_type == "int64":
+        return int(value)
+
+    if column_data_type == "bool":
+        return value if isinstance(value, bool) else str(value).lower() == "true"
+
+    return value
+
+
+class IncrementalMapping:
+    """
+    The incremental atom-to-atom mapping of the updated input files. Each input row is hashed together with the
+    atom-to-atom mapping configuration, and only the input rows whose hashes are not found in the previous output file
+    are mapped. The outputs of the unchanged input rows are carried over by a streaming merge, which reads the previous
+    output file once and keeps only a bounded window of its rows in memory, so that the cost of a refresh scales with
+    the number of the new or changed input rows.
+    """
+
+    def __init__(
+            self,
+            mapping_configuration: Dict[str, Any],
+            previous_output_file_path: Optional[str] = None,
+            chunk_size: int = 10000,
+            maximum_window_size: int = 100000,
+            minimum_resynchronization_length: int = 4,
+            logger: Optional[Logger] = None
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter mapping_configuration: The atom-to-atom mapping configuration, which should contain only the settings
+            that affect the atom-to-atom mapping outputs.
+        :parameter previous_output_file_path: The path to the .csv or .parquet output file of the previous run, which
+            contains the row hash column. The value `None` indicates that all of the input rows should be mapped.
+        :parameter chunk_size: The number of rows of the previous output file that are read at once.
+        :parameter maximum_window_size: The maximum number of the rows of the previous output file that are kept in
+            memory. The rows of the previous output file are read ahead by at most half of the window, so that the
+            input rows that have been moved far from their previous position are mapped again instead.
+        :parameter minimum_resynchronization_length: The minimum number of the consecutive input rows of a chunk that
+            should be found in the same order in the previous output file beyond the read-ahead limit for the merge to
+            skip to them, for example, after a large block of the input rows has been removed.
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        """
+
+        self.mapping_configuration = mapping_configuration
+        self.mapping_configuration_hash = get_mapping_configuration_hash(
+            mapping_configuration=mapping_configuration
+        )
+
+        self.previous_output_file_path = previous_output_file_path
+        self.chunk_size = chunk_size
+        self.maximum_window_size = max(1, maximum_window_size)
+        self.minimum_resynchronization_length = max(1, minimum_resynchronization_length)
+
+        self.logger = logger
+
+        self.number_of_carried_over_rows = 0
+        self.number_of_mapped_rows = 0
+
+        self._previous_row_hashes: Optional[ndarray] = None
+        self._previous_row_indices: Optional[ndarray] = None
+        self._previous_output_column_names: List[str] = list()
+        self._previous_rows: Optional[Iterator[Tuple[Any, ...]]] = None
+
+        self._window: "OrderedDict[int, Tuple[Any, ...]]" = OrderedDict()
+        self._next_previous_row_index = 0
+
+        if previous_output_file_path is not None and self._is_previous_output_file_compatible():
+            self._index_previous_output_file()
+
+    def _is_previous_output_file_compatible(
+            self
+    ) -> bool:
+        """
+        Check whether the previous output file has been mapped using the same atom-to-atom mapping configuration, based
+        on its incremental manifest file, if any.
+
+        :returns: The indicator of whether the previous output file has been mapped using the same atom-to-atom mapping
+            configuration.
+        """
+
+        manifest_file_path = get_incremental_manifest_file_path(self.previous_output_file_path)
+
+        if not exists(manifest_file_path):
+            return True
+
+        with open(manifest_file_path, "r") as file_handle:
+            previous_mapping_configuration_hash = load(file_handle).get("mapping_configuration_hash", None)
+
+        if previous_mapping_configuration_hash == self.mapping_configuration_hash:
+            return True
+
+        if self.logger is not None:
+            self.logger.warning(
+                msg=(
+                    "The previous output file '{file_path:s}' has been mapped using a different atom-to-atom mapping "
+                    "configuration. All of the input rows are mapped again."
+                ).format(
+                    file_path=self.previous_output_file_path
+                )
+            )
+
+        return False
+
+    def _index_previous_output_file(
+            self
+    ) -> None:
+        """ Index the row hashes of the previous output file, which are sorted together with their row indices. """
+
+        previous_output_file_column_names = _get_output_file_column_names(
+            file_path=self.previous_output_file_path
+        )
+
+        if ROW_HASH_COLUMN_NAME not in previous_output_file_column_names:
+            raise ValueError(
+                "The previous output file '{file_path:s}' does not contain the '{column_name:s}' column.".format(
+                    file_path=self.previous_output_file_path,
+                    column_name=ROW_HASH_COLUMN_NAME
+                )
+            )
+
+        previous_row_hashes = list()
+
+        for chunk in _read_output_file_chunks(
+            file_path=self.previous_output_file_path,
+            chunk_size=self.chunk_size,
+            column_names=[ROW_HASH_COLUMN_NAME, ]
+        ):
+            previous_row_hashes.extend(
+                0 if isna(row_hash) else int(row_hash, 16) for row_hash in chunk[ROW_HASH_COLUMN_NAME].tolist()
+            )
+
+        previous_row_hashes = array(previous_row_hashes, dtype=uint64)
+
+        self._previous_row_indices = argsort(previous_row_hashes, kind="stable")
+        self._previous_row_hashes = previous_row_hashes[self._previous_row_indices]
+
+        self._previous_output_column_names = [
+            column_name for column_name in previous_output_file_column_names
+            if column_name in OUTPUT_COLUMN_ARROW_DATA_TYPES and column_name != ROW_HASH_COLUMN_NAME
+        ]
+
+        self._previous_rows = self._iterate_previous_rows()
+
+    def _iterate_previous_rows(
+            self
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over the atom-to-atom mapping output values of the rows of the previous output file.
+
+        :returns: The iterator of the atom-to-atom mapping output values of the rows of the previous output file.
+        """
+
+        for chunk in _read_output_file_chunks(
+            file_path=self.previous_output_file_path,
+            chunk_size=self.chunk_size,
+            column_names=self._previous_output_column_names
+        ):
+            yield from zip(*[
+                [
+                    _get_output_value(
+                        value=value,
+                        column_name=column_name
+                    ) for value in chunk[column_name].tolist()
+                ] for column_name in self._previous_output_column_names
+            ])
+
+    def _get_previous_row_indices(
+            self,
+            row_hash: int
+    ) -> Optional[ndarray]:
+        """
+        Get the indices of the rows of the previous output file with a row hash.
+
+        :parameter row_hash: The row hash.
+
+        :returns: The ascending indices of the rows of the previous output file with the row hash. The value `None`
+            indicates that the previous output file has not been indexed.
+        """
+
+        if self._previous_row_hashes is None:
+            return None
+
+        return self._previous_row_indices[
+            searchsorted(self._previous_row_hashes, uint64(row_hash), side="left"):
+            searchsorted(self._previous_row_hashes, uint64(row_hash), side="right")
+        ]
+
+    def _get_previous_row_index(
+            self,
+            row_hash: int
+    ) -> Optional[int]:
+        """
+        Get the index of the first row of the previous output file with a row hash that has not been evicted from the
+        window yet.
+
+        :parameter row_hash: The row hash.
+
+        :returns: The index of the row of the previous output file. The value `None` indicates that no such row exists.
+        """
+
+        previous_row_indices = self._get_previous_row_indices(
+            row_hash=row_hash
+        )
+
+        if previous_row_indices is None:
+            return None
+
+        previous_row_index_position = searchsorted(
+            previous_row_indices,
+            self._next_previous_row_index - len(self._window),
+            side="left"
+        )
+
+        if previous_row_index_position == len(previous_row_indices):
+            return None
+
+        return int(previous_row_indices[previous_row_index_position])
+
+    def _is_resynchronization_point(
+            self,
+            row_hashes: Sequence[int],
+            row_index: int,
+            previous_row_index: int
+    ) -> bool:
+        """
+        Check whether the input rows that follow an input row of a chunk are found in the same order after the matching
+        row of the previous output file.
+
+        :parameter row_hashes: The row hashes of the chunk.
+        :parameter row_index: The index of the input row in the chunk.
+        :parameter previous_row_index: The index of the matching row of the previous output file.
+
+        :returns: The indicator of whether the merge should skip to the matching row of the previous output file.
+        """
+
+        next_row_hashes = row_hashes[row_index + 1:row_index + 1 + self.minimum_resynchronization_length]
+
+        if len(next_row_hashes) < self.minimum_resynchronization_length:
+            return False
+
+        for row_offset, next_row_hash in enumerate(next_row_hashes, start=1):
+            if previous_row_index + row_offset not in self._get_previous_row_indices(
+                row_hash=next_row_hash
+            ):
+                return False
+
+        return True
+
+    def _read_previous_rows(
+            self,
+            previous_row_index: int
+    ) -> None:
+        """
+        Read the rows of the previous output file into the window up to a row, and evict the oldest rows of the window.
+
+        :parameter previous_row_index: The index of the row of the previous output file.
+        """
+
+        while self._next_previous_row_index <= previous_row_index:
+            previous_row = next(self._previous_rows, None)
+
+            if previous_row is None:
+                break
+
+            self._window[self._next_previous_row_index] = previous_row
+
+            self._next_previous_row_index += 1
+
+            if len(self._window) > self.maximum_window_size:
+                self._window.popitem(
+                    last=False
+                )
+
+    def _get_previous_row(
+            self,
+            row_hashes: Sequence[int],
+            row_index: int
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the atom-to-atom mapping output values of the row of the previous output file that matches an input row of
+        a chunk, if it is within the window or can be read into it.
+
+        :parameter row_hashes: The row hashes of the chunk.
+        :parameter row_index: The index of the input row in the chunk.
+
+        :returns: The atom-to-atom mapping output values of the matching row of the previous output file. The value
+            `None` indicates that the input row should be mapped.
+        """
+
+        previous_row_index = self._get_previous_row_index(
+            row_hash=row_hashes[row_index]
+        )
+
+        if previous_row_index is None:
+            return None
+
+        if previous_row_index >= self._next_previous_row_index:
+            if previous_row_index - self._next_previous_row_index >= self.maximum_window_size // 2 and not (
+                self._is_resynchronization_point(
+                    row_hashes=row_hashes,
+                    row_index=row_index,
+                    previous_row_index=previous_row_index
+                )
+            ):
+                return None
+
+            self._read_previous_rows(
+                previous_row_index=previous_row_index
+            )
+
+        return self._window.get(previous_row_index, None)
+
+    def map_reaction_smiles_strings(
+            self,
+            reaction_smiles_strings: Sequence[str],
+            atom_to_atom_mapping_function: Callable[[Sequence[str]], Union[MappingResultBatch, List[Dict[str, Any]]]]
+    ) -> MappingResultBatch:
+        """
+        Map the new or changed chemical reaction SMILES strings of a chunk, and carry over the atom-to-atom mapping
+        outputs of the unchanged ones from the previous output file. The chunks should be passed in the input order.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions of the chunk.
+        :parameter atom_to_atom_mapping_function: The atom-to-atom mapping function.
+
+        :returns: The batch of the atom-to-atom mapping outputs of the chunk, including the row hash column.
+        """
+
+        row_hashes = [
+            get_row_hash(
+                reaction_smiles=reaction_smiles,
+                mapping_configuration_hash=self.mapping_configuration_hash
+            ) for reaction_smiles in reaction_smiles_strings
+        ]
+
+        previous_rows = [
+            self._get_previous_row(
+                row_hashes=row_hashes,
+                row_index=row_index
+            ) if self._previous_rows is not None else None for row_index in range(len(row_hashes))
+        ]
+
+        reaction_smiles_indices = [
+            row_index for row_index, previous_row in enumerate(previous_rows) if previous_row is None
+        ]
+
+        outputs = iter(MappingResultBatch.from_outputs(
+            outputs=atom_to_atom_mapping_function([
+                reaction_smiles_strings[reaction_smiles_index] for reaction_smiles_index in reaction_smiles_indices
+            ])
+        ) if len(reaction_smiles_indices) > 0 else list())
+
+        mapping_result_batch_builder = MappingResultBatchBuilder()
+
+        for row_hash, previous_row in zip(row_hashes, previous_rows):
+            output = next(outputs) if previous_row is None else dict(zip(
+                self._previous_output_column_names,
+                previous_row
+            ))
+
+            output[ROW_HASH_COLUMN_NAME] = "{row_hash:016x}".format(
+                row_hash=row_hash
+            )
+
+            mapping_result_batch_builder.append(
+                output=output
+            )
+
+        self.number_of_carried_over_rows += len(row_hashes) - len(reaction_smiles_indices)
+        self.number_of_mapped_rows += len(reaction_smiles_indices)
+
+        return mapping_result_batch_builder.build()
+
+    def get_summary(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the summary of the incremental atom-to-atom mapping.
+
+        :returns: The number of rows, the number of carried over and mapped rows, and the carry-over rate.
+        """
+
+        number_of_rows = self.number_of_carried_over_rows + self.number_of_mapped_rows
+
+        return {
+            "number_of_rows": number_of_rows,
+            "number_of_carried_over_rows": self.number_of_carried_over_rows,
+            "number_of_mapped_rows": self.number_of_mapped_rows,
+            "carry_over_rate": self.number_of_carried_over_rows / number_of_rows if number_of_rows > 0 else 0.0,
+        }
+
+    def write_manifest_file(
+            self,
+            output_file_path: str
+    ) -> None:
+        """
+        Write the incremental manifest file beside the output file, which records the atom-to-atom mapping
+        configuration of the output file for the next incremental run.
+
+        :parameter output_file_path: The path to the output file.
+        """
+
+        with open(get_incremental_manifest_file_path(output_file_path), "w") as file_handle:
+            dump(
+                obj={
+                    "mapping_configuration": self.mapping_configuration,
+                    "mapping_configuration_hash": self.mapping_configuration_hash,
+                    "row_hash_column_name": ROW_HASH_COLUMN_NAME,
+                    "previous_output_file_path": self.previous_output_file_path,
+                    **self.get_summary(),
+                },
+                fp=file_handle,
+                indent=4
+            )
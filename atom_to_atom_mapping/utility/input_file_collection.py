@@ -0,0 +1,153 @@
+""" The ``atom_to_atom_mapping.utility`` package ``input_file_collection`` module. """
+
+from glob import glob, has_magic
+from os import listdir
+from os.path import basename, dirname, isabs, isdir, isfile, join
+from typing import List, Optional, Sequence
+
+from atom_to_atom_mapping.utility.reaction_record_file import is_reaction_record_file
+
+
+INPUT_FILE_EXTENSIONS = (".csv", ".csv.gz", ".parquet", )
+
+
+def is_supported_input_file(
+        file_path: str
+) -> bool:
+    """
+    Check whether a file is a supported input file based on its extension.
+
+    :parameter file_path: The path to the file.
+
+    :returns: The indicator of whether the file is a .csv, .parquet, RDF, RXN, .smi, or .rsmi file.
+    """
+
+    return file_path.lower().endswith(INPUT_FILE_EXTENSIONS) or is_reaction_record_file(
+        file_path=file_path
+    )
+
+
+def _expand_input_file_path(
+        input_file_path: str
+) -> List[str]:
+    """
+    Expand an input file path, directory path, or glob pattern to the paths to the input files.
+
+    :parameter input_file_path: The input file path, directory path, or glob pattern.
+
+    :returns: The sorted paths to the input files.
+    """
+
+    if has_magic(input_file_path):
+        return sorted(
+            file_path for file_path in glob(input_file_path) if isfile(file_path) and is_supported_input_file(
+                file_path=file_path
+            )
+        )
+
+    if isdir(input_file_path):
+        return sorted(
+            join(input_file_path, file_name) for file_name in listdir(input_file_path)
+            if isfile(join(input_file_path, file_name)) and is_supported_input_file(
+                file_path=file_name
+            )
+        )
+
+    return [input_file_path, ]
+
+
+def read_input_manifest_file(
+        file_path: str
+) -> List[str]:
+    """
+    Read the entries of an input manifest file, which lists one input file path, directory path, or glob pattern per
+    line. The empty lines and the lines starting with `#` are skipped, and the relative paths are resolved against the
+    directory of the input manifest file.
+
+    :parameter file_path: The path to the input manifest file.
+
+    :returns: The input file paths, directory paths, and glob patterns.
+    """
+
+    input_file_paths = list()
+
+    with open(file_path, "r") as file_handle:
+        for line in file_handle:
+            line = line.strip()
+
+            if line == "" or line.startswith("#"):
+                continue
+
+            input_file_paths.append(line if isabs(line) else join(dirname(file_path), line))
+
+    return input_file_paths
+
+
+def get_input_file_paths(
+        input_file_paths: Optional[Sequence[str]] = None,
+        input_manifest_file_path: Optional[str] = None
+) -> List[str]:
+    """
+    Get the paths to the input files of a multi-file run. The duplicate paths are kept only once, in the order of
+    their first occurrence.
+
+    :parameter input_file_paths: The input file paths, directory paths, and glob patterns. The value `None` indicates
+        that only the input manifest file should be utilized.
+    :parameter input_manifest_file_path: The path to the input manifest file. The value `None` indicates that no input
+        manifest file should be utilized.
+
+    :returns: The paths to the input files.
+    """
+
+    input_file_path_entries = list(input_file_paths or list())
+
+    if input_manifest_file_path is not None:
+        input_file_path_entries.extend(
+            read_input_manifest_file(
+                file_path=input_manifest_file_path
+            )
+        )
+
+    expanded_input_file_paths = list()
+
+    for input_file_path_entry in input_file_path_entries:
+        for input_file_path in _expand_input_file_path(
+            input_file_path=input_file_path_entry
+        ):
+            if input_file_path not in expanded_input_file_paths:
+                expanded_input_file_paths.append(input_file_path)
+
+    return expanded_input_file_paths
+
+
+def get_output_file_path(
+        input_file_path: str,
+        output_directory_path: str,
+        output_file_extension: str = ".parquet",
+        output_file_name_suffix: str = ""
+) -> str:
+    """
+    Get the path to the output file of an input file of a multi-file run.
+
+    :parameter input_file_path: The path to the input file.
+    :parameter output_directory_path: The path to the output directory.
+    :parameter output_file_extension: The extension of the output file. The value choices are: { `.csv`, `.parquet` }.
+    :parameter output_file_name_suffix: The suffix that is appended to the name of the output file, for example, to
+        distinguish the input files with the same name.
+
+    :returns: The path to the output file.
+    """
+
+    input_file_name = basename(input_file_path)
+
+    if input_file_name.lower().endswith(".gz"):
+        input_file_name = input_file_name[:-3]
+
+    if "." in input_file_name:
+        input_file_name = input_file_name[:input_file_name.rfind(".")]
+
+    return join(output_directory_path, "{input_file_name:s}{output_file_name_suffix:s}{output_file_extension:s}".format(
+        input_file_name=input_file_name,
+        output_file_name_suffix=output_file_name_suffix,
+        output_file_extension=output_file_extension
+    ))
@@ -0,0 +1,445 @@
+""" The ``atom_to_atom_mapping.utility`` package ``mapping_comparison`` module. """
+
+from hashlib import blake2b
+from itertools import combinations
+from json import dump
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pandas import DataFrame, Series, isna
+
+from pyarrow import Table
+from pyarrow.parquet import ParquetWriter
+
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdmolfiles import CanonicalRankAtoms, MolFromSmiles, MolToSmiles
+from rdkit.Chem.rdmolops import GetMolFrags
+
+from atom_to_atom_mapping.utility.cpu_resources import get_cpu_resource_manager
+from atom_to_atom_mapping.utility.reaction_smiles_file import read_csv_file_chunks, read_parquet_file_chunks
+from atom_to_atom_mapping.utility.sharding import ROW_INDEX_COLUMN_NAME
+
+
+def _get_mapped_atoms_and_bonds(
+        compound_smiles_strings: str
+) -> Optional[Tuple[Dict[int, Tuple[str, int]], Dict[Tuple[int, int], float]]]:
+    """
+    Get the map number independent keys of the mapped atoms and the bond orders between the mapped atoms of a chemical
+    reaction side. The key of an atom consists of the canonical SMILES string of its chemical compound and its
+    canonical symmetry class within that chemical compound.
+
+    :parameter compound_smiles_strings: The mapped SMILES string of the chemical reaction side.
+
+    :returns: The keys of the mapped atoms by their atom map numbers, and the bond orders by the atom map number pairs.
+        The value `None` indicates that the chemical reaction side could not be parsed.
+    """
+
+    if compound_smiles_strings == "":
+        return dict(), dict()
+
+    compounds: Optional[Mol] = MolFromSmiles(compound_smiles_strings)
+
+    if compounds is None:
+        return None
+
+    atom_map_numbers = [atom.GetAtomMapNum() for atom in compounds.GetAtoms()]
+
+    for atom in compounds.GetAtoms():
+        atom.SetAtomMapNum(0)
+
+    mapped_atom_keys = dict()
+
+    for compound_atom_indices, compound in zip(
+        GetMolFrags(compounds),
+        GetMolFrags(compounds, asMols=True)
+    ):
+        compound_smiles = MolToSmiles(compound)
+
+        for compound_atom_index, compound_atom_rank in zip(
+            compound_atom_indices,
+            CanonicalRankAtoms(compound, breakTies=False)
+        ):
+            if atom_map_numbers[compound_atom_index] > 0:
+                mapped_atom_keys[atom_map_numbers[compound_atom_index]] = (compound_smiles, compound_atom_rank)
+
+    mapped_bond_orders = dict()
+
+    for bond in compounds.GetBonds():
+        begin_atom_map_number = atom_map_numbers[bond.GetBeginAtomIdx()]
+        end_atom_map_number = atom_map_numbers[bond.GetEndAtomIdx()]
+
+        if begin_atom_map_number > 0 and end_atom_map_number > 0:
+            mapped_bond_orders[
+                (min(begin_atom_map_number, end_atom_map_number), max(begin_atom_map_number, end_atom_map_number))
+            ] = bond.GetBondTypeAsDouble()
+
+    return mapped_atom_keys, mapped_bond_orders
+
+
+def get_bond_change_signatures(
+        mapped_reaction_smiles: Any
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Get the map number independent signatures of the bond changes and the reaction center of a mapped chemical
+    reaction SMILES string. A bond change is described by the keys of its two reactant atoms and the bond orders
+    before and after the chemical reaction, where the key of an atom consists of the canonical SMILES string of its
+    reactant compound and its canonical symmetry class. Two atom-to-atom mappings of the same chemical reaction that
+    differ only in the labeling of the atom map numbers or in the choice between symmetry-equivalent atoms have
+    identical signatures.
+
+    :parameter mapped_reaction_smiles: The mapped SMILES string of the chemical reaction.
+
+    :returns: The 64-bit signatures of the bond changes and the reaction center. The value `None` indicates that the
+        mapped chemical reaction SMILES string could not be parsed.
+    """
+
+    try:
+        if not isinstance(mapped_reaction_smiles, str):
+            return None, None
+
+        mapped_reaction_sides = mapped_reaction_smiles.split(" ")[0].split(">")
+
+        if len(mapped_reaction_sides) != 3:
+            return None, None
+
+        reactant_atoms_and_bonds = _get_mapped_atoms_and_bonds(
+            compound_smiles_strings=".".join(
+                mapped_reaction_side for mapped_reaction_side in mapped_reaction_sides[:2] if mapped_reaction_side != ""
+            )
+        )
+
+        product_atoms_and_bonds = _get_mapped_atoms_and_bonds(
+            compound_smiles_strings=mapped_reaction_sides[2]
+        )
+
+        if reactant_atoms_and_bonds is None or product_atoms_and_bonds is None:
+            return None, None
+
+        reactant_atom_keys, reactant_bond_orders = reactant_atoms_and_bonds
+        product_atom_keys, product_bond_orders = product_atoms_and_bonds
+
+        bond_changes = list()
+
+        for atom_map_number_pair in set(reactant_bond_orders) | set(product_bond_orders):
+            if atom_map_number_pair[0] not in reactant_atom_keys or atom_map_number_pair[1] not in reactant_atom_keys:
+                continue
+
+            if atom_map_number_pair[0] not in product_atom_keys and atom_map_number_pair[1] not in product_atom_keys:
+                continue
+
+            reactant_bond_order = reactant_bond_orders.get(atom_map_number_pair, 0.0)
+            product_bond_order = product_bond_orders.get(atom_map_number_pair, 0.0)
+
+            if reactant_bond_order != product_bond_order:
+                bond_changes.append((
+                    tuple(sorted(reactant_atom_keys[atom_map_number] for atom_map_number in atom_map_number_pair)),
+                    reactant_bond_order,
+                    product_bond_order,
+                ))
+
+        return tuple(
+            int.from_bytes(
+                blake2b(
+                    repr(sorted(signature_items)).encode("utf-8"),
+                    digest_size=8
+                ).digest(),
+                byteorder="big",
+                signed=True
+            ) for signature_items in (
+                bond_changes,
+                [atom_key for bond_change in bond_changes for atom_key in bond_change[0]],
+            )
+        )
+
+    except Exception:
+        return None, None
+
+
+def get_bond_change_signature_list(
+        mapped_reaction_smiles_strings: Sequence[Any]
+) -> List[Tuple[Optional[int], Optional[int]]]:
+    """
+    Get the map number independent signatures of the bond changes and the reaction centers of the mapped chemical
+    reaction SMILES strings.
+
+    :parameter mapped_reaction_smiles_strings: The mapped SMILES strings of the chemical reactions.
+
+    :returns: The 64-bit signatures of the bond changes and the reaction centers.
+    """
+
+    return [
+        get_bond_change_signatures(
+            mapped_reaction_smiles=mapped_reaction_smiles
+        ) for mapped_reaction_smiles in mapped_reaction_smiles_strings
+    ]
+
+
+def compare_bond_change_signatures(
+        bond_change_signatures: Sequence[Sequence[Tuple[Optional[int], Optional[int]]]],
+        labels: Sequence[str]
+) -> DataFrame:
+    """
+    Compare the bond change and reaction center signatures of the atom-to-atom mapping outputs of the same chemical
+    reactions from different atom-to-atom mapping approaches.
+
+    :parameter bond_change_signatures: The bond change and reaction center signatures of each atom-to-atom mapping
+        approach.
+    :parameter labels: The labels of the atom-to-atom mapping approaches.
+
+    :returns: The per-row agreement flags. The pairwise flags are missing if either of the mapped chemical reaction
+        SMILES strings could not be parsed.
+    """
+
+    comparison_data = {
+        "number_of_parsed_mappings": [
+            sum(row_signature[0] is not None for row_signature in row_signatures)
+            for row_signatures in zip(*bond_change_signatures)
+        ],
+    }
+
+    for signature_index, signature_name in enumerate(("bond_changes", "reaction_centers", )):
+        comparison_data["are_all_{signature_name:s}_equivalent".format(
+            signature_name=signature_name
+        )] = [
+            len({
+                row_signature[signature_index] for row_signature in row_signatures
+                if row_signature[signature_index] is not None
+            }) == 1 and all(row_signature[signature_index] is not None for row_signature in row_signatures)
+            for row_signatures in zip(*bond_change_signatures)
+        ]
+
+        for (first_index, first_label), (second_index, second_label) in combinations(enumerate(labels), 2):
+            comparison_data["are_{signature_name:s}_equivalent_{first_label:s}_{second_label:s}".format(
+                signature_name=signature_name,
+                first_label=first_label,
+                second_label=second_label
+            )] = Series(
+                data=[
+                    None if first_signature[signature_index] is None or second_signature[signature_index] is None
+                    else first_signature[signature_index] == second_signature[signature_index]
+                    for first_signature, second_signature in zip(
+                        bond_change_signatures[first_index],
+                        bond_change_signatures[second_index]
+                    )
+                ],
+                dtype="boolean"
+            )
+
+    return DataFrame(
+        data=comparison_data
+    )
+
+
+def _read_mapped_reaction_smiles_chunks(
+        file_path: str,
+        mapped_reaction_smiles_column_name: str,
+        chunk_size: int
+) -> Iterator[List[Any]]:
+    """
+    Read the chunks of exactly the specified number of mapped chemical reaction SMILES strings of a .csv or .parquet
+    atom-to-atom mapping output file, except for the last chunk.
+
+    :parameter file_path: The path to the atom-to-atom mapping output file.
+    :parameter mapped_reaction_smiles_column_name: The name of the mapped chemical reaction SMILES column.
+    :parameter chunk_size: The number of rows per chunk.
+
+    :returns: The iterator of the chunks of the mapped chemical reaction SMILES strings.
+    """
+
+    if file_path.endswith(".parquet"):
+        input_chunks = read_parquet_file_chunks(
+            file_path=file_path,
+            reaction_smiles_column_name=mapped_reaction_smiles_column_name,
+            chunk_size=chunk_size
+        )
+
+    else:
+        input_chunks = read_csv_file_chunks(
+            file_path=file_path,
+            reaction_smiles_column_name=mapped_reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            read_reaction_smiles_column_only=True
+        )
+
+    mapped_reaction_smiles_buffer = list()
+
+    for input_chunk in input_chunks:
+        mapped_reaction_smiles_buffer.extend(
+            None if isna(mapped_reaction_smiles) else mapped_reaction_smiles
+            for mapped_reaction_smiles in input_chunk[mapped_reaction_smiles_column_name].values.tolist()
+        )
+
+        while len(mapped_reaction_smiles_buffer) >= chunk_size:
+            yield mapped_reaction_smiles_buffer[:chunk_size]
+
+            mapped_reaction_smiles_buffer = mapped_reaction_smiles_buffer[chunk_size:]
+
+    if len(mapped_reaction_smiles_buffer) > 0:
+        yield mapped_reaction_smiles_buffer
+
+
+def compare_mapped_reaction_smiles_files(
+        input_file_paths: Sequence[str],
+        labels: Sequence[str],
+        mapped_reaction_smiles_column_name: str = "mapped_reaction_smiles",
+        output_file_path: Optional[str] = None,
+        summary_file_path: Optional[str] = None,
+        number_of_processes: int = 1,
+        chunk_size: int = 100000,
+        process_chunk_size: int = 1000
+) -> Dict[str, Any]:
+    """
+    Compare the atom-to-atom mapping output files of the same chemical reactions from two or more atom-to-atom mapping
+    approaches. The input files are read in lockstep chunks, so that the memory usage does not depend on the number of
+    input file rows.
+
+    :parameter input_file_paths: The paths to the .csv or .parquet atom-to-atom mapping output files in the same row
+        order.
+    :parameter labels: The labels of the atom-to-atom mapping approaches.
+    :parameter mapped_reaction_smiles_column_name: The name of the mapped chemical reaction SMILES column.
+    :parameter output_file_path: The path to the .csv or .parquet output file of the per-row agreement flags. The
+        value `None` indicates that the per-row agreement flags should not be written.
+    :parameter summary_file_path: The path to the .json summary file. The value `None` indicates that the summary
+        should not be written.
+    :parameter number_of_processes: The number of processes.
+    :parameter chunk_size: The number of input file rows that are read and compared at once.
+    :parameter process_chunk_size: The number of mapped chemical reaction SMILES strings that are submitted to a
+        process at once.
+
+    :returns: The summary of the comparison.
+    """
+
+    if len(input_file_paths) < 2 or len(input_file_paths) != len(labels):
+        raise ValueError("The comparison requires at least two input files and exactly one label per input file.")
+
+    summary: Dict[str, Any] = {
+        "labels": list(labels),
+        "number_of_rows": 0,
+        "number_of_rows_with_all_mappings_parsed": 0,
+        "number_of_rows_with_all_bond_changes_equivalent": 0,
+        "number_of_rows_with_all_reaction_centers_equivalent": 0,
+        "pairwise": dict(),
+    }
+
+    parquet_writer = None
+
+    process_pool_executor = get_cpu_resource_manager().create_process_pool_executor(
+        number_of_processes=number_of_processes
+    ) if number_of_processes > 1 else None
+
+    input_file_chunks = [
+        _read_mapped_reaction_smiles_chunks(
+            file_path=input_file_path,
+            mapped_reaction_smiles_column_name=mapped_reaction_smiles_column_name,
+            chunk_size=chunk_size
+        ) for input_file_path in input_file_paths
+    ]
+
+    try:
+        for input_chunks in zip(*input_file_chunks):
+            if len({len(input_chunk) for input_chunk in input_chunks}) != 1:
+                raise ValueError("The input files do not contain the same number of rows.")
+
+            bond_change_signatures = list()
+
+            for input_chunk in input_chunks:
+                if process_pool_executor is None:
+                    bond_change_signatures.append(get_bond_change_signature_list(
+                        mapped_reaction_smiles_strings=input_chunk
+                    ))
+
+                else:
+                    bond_change_signatures.append([
+                        bond_change_signature
+                        for process_bond_change_signatures in process_pool_executor.map(
+                            get_bond_change_signature_list,
+                            [
+                                input_chunk[reaction_smiles_index: reaction_smiles_index + process_chunk_size]
+                                for reaction_smiles_index in range(0, len(input_chunk), process_chunk_size)
+                            ]
+                        ) for bond_change_signature in process_bond_change_signatures
+                    ])
+
+            comparison_chunk = compare_bond_change_signatures(
+                bond_change_signatures=bond_change_signatures,
+                labels=labels
+            )
+
+            comparison_chunk.insert(
+                loc=0,
+                column=ROW_INDEX_COLUMN_NAME,
+                value=range(summary["number_of_rows"], summary["number_of_rows"] + len(comparison_chunk))
+            )
+
+            summary["number_of_rows"] += len(comparison_chunk)
+            summary["number_of_rows_with_all_mappings_parsed"] += int(
+                (comparison_chunk["number_of_parsed_mappings"] == len(labels)).sum()
+            )
+            summary["number_of_rows_with_all_bond_changes_equivalent"] += int(
+                comparison_chunk["are_all_bond_changes_equivalent"].sum()
+            )
+            summary["number_of_rows_with_all_reaction_centers_equivalent"] += int(
+                comparison_chunk["are_all_reaction_centers_equivalent"].sum()
+            )
+
+            for column_name in comparison_chunk.columns:
+                if column_name.startswith("are_") and not column_name.startswith("are_all_"):
+                    pairwise_summary = summary["pairwise"].setdefault(column_name, {
+                        "number_of_compared_rows": 0,
+                        "number_of_equivalent_rows": 0,
+                    })
+
+                    pairwise_summary["number_of_compared_rows"] += int(comparison_chunk[column_name].notna().sum())
+                    pairwise_summary["number_of_equivalent_rows"] += int(comparison_chunk[column_name].sum())
+
+            if output_file_path is not None:
+                if output_file_path.endswith(".parquet"):
+                    comparison_table = Table.from_pandas(
+                        df=comparison_chunk,
+                        preserve_index=False
+                    )
+
+                    if parquet_writer is None:
+                        parquet_writer = ParquetWriter(
+                            where=output_file_path,
+                            schema=comparison_table.schema
+                        )
+
+                    parquet_writer.write_table(
+                        table=comparison_table.cast(
+                            target_schema=parquet_writer.schema
+                        )
+                    )
+
+                else:
+                    comparison_chunk.to_csv(
+                        path_or_buf=output_file_path,
+                        mode="w" if summary["number_of_rows"] == len(comparison_chunk) else "a",
+                        header=summary["number_of_rows"] == len(comparison_chunk),
+                        index=False
+                    )
+
+        if any(next(input_file_chunk, None) is not None for input_file_chunk in input_file_chunks):
+            raise ValueError("The input files do not contain the same number of rows.")
+
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+        if process_pool_executor is not None:
+            process_pool_executor.shutdown()
+
+    for pairwise_summary in summary["pairwise"].values():
+        pairwise_summary["agreement_rate"] = (
+            pairwise_summary["number_of_equivalent_rows"] / pairwise_summary["number_of_compared_rows"]
+            if pairwise_summary["number_of_compared_rows"] > 0 else None
+        )
+
+    if summary_file_path is not None:
+        with open(summary_file_path, "w") as summary_file_handle:
+            dump(
+                obj=summary,
+                fp=summary_file_handle,
+                indent=4
+            )
+
+    return summary
@@ -0,0 +1,447 @@
+""" The ``atom_to_atom_mapping.utility`` package ``mapping_result_batch`` module. """
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from pandas import DataFrame
+
+from pyarrow import Array, DataType, Table, array, bool_, concat_arrays, float64, int64, null, nulls, string
+
+
+OUTPUT_COLUMN_ARROW_DATA_TYPES = {
+    "mapped_reaction_smiles": string(),
+    "mapped_reaction_template_smarts": string(),
+    "confidence_score": float64(),
+    "status_code": int64(),
+    "is_confident": bool_(),
+    "mapped_by_template": bool_(),
+    "mapped_by": string(),
+    "is_remapped": bool_(),
+    "mapping_pass": int64(),
+    "row_hash": string(),
+}
+
+
+def _concatenate_column_chunks(
+        column_chunks: Sequence[Array]
+) -> Array:
+    """
+    Concatenate the chunks of a column. The chunks of the columns without a known data type that contain only the
+    missing values are cast to the data type of the other chunks.
+
+    :parameter column_chunks: The chunks of the column.
+
+    :returns: The concatenated column.
+    """
+
+    column_data_type = next(
+        (column_chunk.type for column_chunk in column_chunks if column_chunk.type != null()),
+        null()
+    )
+
+    if len(column_chunks) == 0:
+        return array(
+            obj=list(),
+            type=column_data_type
+        )
+
+    return concat_arrays([
+        column_chunk.cast(column_data_type) if column_chunk.type != column_data_type else column_chunk
+        for column_chunk in column_chunks
+    ])
+
+
+class MappingResultBatch:
+    """
+    The compact columnar batch of the atom-to-atom mapping outputs, which stores each output as a row of the typed
+    Apache Arrow columns instead of a dictionary. The dictionary view of the outputs is available on demand.
+    """
+
+    def __init__(
+            self,
+            columns: Optional[Dict[str, Array]] = None
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter columns: The typed columns of the atom-to-atom mapping outputs. All of the columns should be of the
+            same length.
+        """
+
+        self.columns = dict(columns or dict())
+
+        self._number_of_rows = len(next(iter(self.columns.values()))) if len(self.columns) > 0 else 0
+
+    @classmethod
+    def from_outputs(
+            cls,
+            outputs: Iterable[Dict[str, Any]],
+            flush_size: int = 10000
+    ) -> "MappingResultBatch":
+        """
+        Construct the batch from the atom-to-atom mapping outputs.
+
+        :parameter outputs: The atom-to-atom mapping outputs.
+        :parameter flush_size: The number of outputs that are converted to the typed columns at once.
+
+        :returns: The batch of the atom-to-atom mapping outputs.
+        """
+
+        if isinstance(outputs, MappingResultBatch):
+            return outputs
+
+        mapping_result_batch_builder = MappingResultBatchBuilder(
+            flush_size=flush_size
+        )
+
+        mapping_result_batch_builder.extend(
+            outputs=outputs
+        )
+
+        return mapping_result_batch_builder.build()
+
+    @classmethod
+    def concatenate(
+            cls,
+            mapping_result_batches: Iterable[Union["MappingResultBatch", List[Dict[str, Any]]]]
+    ) -> "MappingResultBatch":
+        """
+        Concatenate the batches of the atom-to-atom mapping outputs. The missing columns of a batch are filled with the
+        missing values.
+
+        :parameter mapping_result_batches: The batches of the atom-to-atom mapping outputs.
+
+        :returns: The concatenated batch of the atom-to-atom mapping outputs.
+        """
+
+        mapping_result_batches = [
+            cls.from_outputs(
+                outputs=mapping_result_batch
+            ) for mapping_result_batch in mapping_result_batches
+        ]
+
+        column_names = list()
+
+        for mapping_result_batch in mapping_result_batches:
+            column_names.extend(
+                column_name for column_name in mapping_result_batch.column_names if column_name not in column_names
+            )
+
+        return cls(
+            columns={
+                column_name: _concatenate_column_chunks(
+                    column_chunks=[
+                        mapping_result_batch.columns[column_name] if column_name in mapping_result_batch.columns else
+                        nulls(len(mapping_result_batch), OUTPUT_COLUMN_ARROW_DATA_TYPES.get(column_name, null()))
+                        for mapping_result_batch in mapping_result_batches if len(mapping_result_batch) > 0
+                    ]
+                ) for column_name in column_names
+            }
+        )
+
+    @property
+    def column_names(
+            self
+    ) -> List[str]:
+        """
+        Get the names of the columns.
+
+        :returns: The names of the columns.
+        """
+
+        return list(self.columns.keys())
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        The `__len__` method of the class.
+
+        :returns: The number of the atom-to-atom mapping outputs.
+        """
+
+        return self._number_of_rows
+
+    def __getitem__(
+            self,
+            index: int
+    ) -> Dict[str, Any]:
+        """
+        The `__getitem__` method of the class.
+
+        :parameter index: The index of the atom-to-atom mapping output.
+
+        :returns: The dictionary view of the atom-to-atom mapping output.
+        """
+
+        if index < 0:
+            index += self._number_of_rows
+
+        if not 0 <= index < self._number_of_rows:
+            raise IndexError("The index of the atom-to-atom mapping output is out of range.")
+
+        return {
+            column_name: column[index].as_py() for column_name, column in self.columns.items()
+        }
+
+    def __iter__(
+            self
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        The `__iter__` method of the class. The dictionary views are materialized one slice at a time.
+
+        :returns: The iterator of the dictionary views of the atom-to-atom mapping outputs.
+        """
+
+        for record_batch in self.to_arrow().to_batches(
+            max_chunksize=10000
+        ):
+            yield from record_batch.to_pylist()
+
+    def column(
+            self,
+            column_name: str
+    ) -> Array:
+        """
+        Get a column.
+
+        :parameter column_name: The name of the column.
+
+        :returns: The column.
+        """
+
+        return self.columns[column_name]
+
+    def align(
+            self,
+            column_names: Sequence[str],
+            number_of_rows: Optional[int] = None
+    ) -> "MappingResultBatch":
+        """
+        Align the batch to a fixed set of the columns, so that the batches of the different chunks share a schema. The
+        missing columns are filled with the missing values, and the columns that contain only the missing values are
+        cast to their known data type.
+
+        :parameter column_names: The names of the columns in the order of the aligned batch.
+        :parameter number_of_rows: The number of the atom-to-atom mapping outputs, which is required if the batch has no
+            columns. The value `None` indicates that the number of the atom-to-atom mapping outputs of the batch should
+            be utilized.
+
+        :returns: The aligned batch of the atom-to-atom mapping outputs.
+        """
+
+        if number_of_rows is None:
+            number_of_rows = self._number_of_rows
+
+        columns = dict()
+
+        for column_name in column_names:
+            column_data_type = OUTPUT_COLUMN_ARROW_DATA_TYPES.get(column_name, None)
+
+            if column_name not in self.columns:
+                columns[column_name] = nulls(number_of_rows, column_data_type or null())
+
+            elif column_data_type is not None and self.columns[column_name].type == null():
+                columns[column_name] = self.columns[column_name].cast(column_data_type)
+
+            else:
+                columns[column_name] = self.columns[column_name]
+
+        return MappingResultBatch(
+            columns=columns
+        )
+
+    def take(
+            self,
+            indices: Sequence[int]
+    ) -> "MappingResultBatch":
+        """
+        Select the atom-to-atom mapping outputs by their indices without the construction of the dictionaries.
+
+        :parameter indices: The indices of the atom-to-atom mapping outputs.
+
+        :returns: The batch of the selected atom-to-atom mapping outputs.
+        """
+
+        indices = array(
+            obj=indices,
+            type=int64()
+        )
+
+        return MappingResultBatch(
+            columns={
+                column_name: column.take(indices) for column_name, column in self.columns.items()
+            }
+        )
+
+    def to_arrow(
+            self
+    ) -> Table:
+        """
+        Convert the batch to an Apache Arrow table.
+
+        :returns: The Apache Arrow table of the atom-to-atom mapping outputs.
+        """
+
+        return Table.from_arrays(
+            arrays=list(self.columns.values()),
+            names=self.column_names
+        )
+
+    def to_pandas(
+            self
+    ) -> DataFrame:
+        """
+        Convert the batch to a pandas data frame.
+
+        :returns: The pandas data frame of the atom-to-atom mapping outputs.
+        """
+
+        if len(self.columns) == 0:
+            return DataFrame(
+                index=range(self._number_of_rows)
+            )
+
+        return self.to_arrow().to_pandas()
+
+    def to_dicts(
+            self
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert the batch to the dictionary view of the atom-to-atom mapping outputs.
+
+        :returns: The atom-to-atom mapping outputs as dictionaries.
+        """
+
+        return list(self)
+
+
+class MappingResultBatchBuilder:
+    """
+    The builder of the batches of the atom-to-atom mapping outputs, which converts the appended outputs to the typed
+    columns in chunks so that the dictionaries of the outputs are not retained.
+    """
+
+    def __init__(
+            self,
+            flush_size: int = 10000
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter flush_size: The number of outputs that are converted to the typed columns at once.
+        """
+
+        self.flush_size = max(1, flush_size)
+
+        self._column_chunks: Dict[str, List[Array]] = dict()
+        self._column_values: Dict[str, List[Any]] = dict()
+
+        self._number_of_flushed_rows = 0
+        self._number_of_buffered_rows = 0
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        The `__len__` method of the class.
+
+        :returns: The number of the appended atom-to-atom mapping outputs.
+        """
+
+        return self._number_of_flushed_rows + self._number_of_buffered_rows
+
+    @staticmethod
+    def _get_column_data_type(
+            column_name: str
+    ) -> Optional[DataType]:
+        """
+        Get the data type of a column.
+
+        :parameter column_name: The name of the column.
+
+        :returns: The data type of the column. The value `None` indicates that the data type should be inferred.
+        """
+
+        return OUTPUT_COLUMN_ARROW_DATA_TYPES.get(column_name, None)
+
+    def _flush(
+            self
+    ) -> None:
+        """ Convert the buffered atom-to-atom mapping outputs to the typed column chunks. """
+
+        if self._number_of_buffered_rows == 0:
+            return
+
+        for column_name, column_values in self._column_values.items():
+            self._column_chunks[column_name].append(
+                array(
+                    obj=column_values,
+                    type=self._get_column_data_type(column_name),
+                    from_pandas=True
+                )
+            )
+
+            column_values.clear()
+
+        self._number_of_flushed_rows += self._number_of_buffered_rows
+        self._number_of_buffered_rows = 0
+
+    def append(
+            self,
+            output: Dict[str, Any]
+    ) -> None:
+        """
+        Append an atom-to-atom mapping output.
+
+        :parameter output: The atom-to-atom mapping output.
+        """
+
+        for column_name in output.keys():
+            if column_name not in self._column_values:
+                self._column_chunks[column_name] = [
+                    nulls(self._number_of_flushed_rows, self._get_column_data_type(column_name) or null()),
+                ] if self._number_of_flushed_rows > 0 else list()
+
+                self._column_values[column_name] = [None, ] * self._number_of_buffered_rows
+
+        for column_name, column_values in self._column_values.items():
+            column_values.append(output.get(column_name, None))
+
+        self._number_of_buffered_rows += 1
+
+        if self._number_of_buffered_rows >= self.flush_size:
+            self._flush()
+
+    def extend(
+            self,
+            outputs: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Append the atom-to-atom mapping outputs.
+
+        :parameter outputs: The atom-to-atom mapping outputs.
+        """
+
+        for output in outputs:
+            self.append(
+                output=output
+            )
+
+    def build(
+            self
+    ) -> MappingResultBatch:
+        """
+        Build the batch of the appended atom-to-atom mapping outputs.
+
+        :returns: The batch of the atom-to-atom mapping outputs.
+        """
+
+        self._flush()
+
+        return MappingResultBatch(
+            columns={
+                column_name: _concatenate_column_chunks(
+                    column_chunks=column_chunks
+                ) for column_name, column_chunks in self._column_chunks.items()
+            }
+        )
@@ -0,0 +1,247 @@
+""" The ``atom_to_atom_mapping.utility`` package ``mapping_validation`` module. """
+
+from re import compile
+from typing import Any, Dict, List, Sequence
+
+from numpy import array, bincount, diff, int64, lexsort, ndarray, searchsorted, unique, zeros
+
+from pandas import DataFrame, concat
+
+from atom_to_atom_mapping.utility.cpu_resources import get_cpu_resource_manager
+
+
+MAPPED_ATOM_PATTERN = compile(
+    r"\[\d*([A-Za-z][a-z]?)[^\]:]*(?::(\d+))?]|(Br|Cl|[BCNOSPFIbcnosp])"
+)
+
+MAPPING_VALIDATION_COLUMN_NAMES = [
+    "is_mapping_valid",
+    "number_of_unmapped_product_atoms",
+    "number_of_duplicate_map_numbers",
+    "number_of_unmatched_product_map_numbers",
+    "number_of_element_mismatches",
+]
+
+
+def _get_mapped_atom_arrays(
+        mapped_reaction_smiles_strings: Sequence[Any]
+) -> Dict[str, ndarray]:
+    """
+    Get the flat arrays of the atom map number annotations of the mapped chemical reaction SMILES strings. Only the
+    atom symbols and atom map numbers are parsed. The reactant and reagent compounds are considered to be on the same
+    chemical reaction side.
+
+    :parameter mapped_reaction_smiles_strings: The mapped SMILES strings of the chemical reactions.
+
+    :returns: The reaction indices, chemical reaction sides, atom map numbers, element codes and hydrogen atom
+        indicators of the annotated atoms, and the indicators of whether the mapped chemical reaction SMILES strings
+        could be parsed.
+    """
+
+    reaction_indices, reaction_sides, map_numbers, element_codes = list(), list(), list(), list()
+
+    element_symbol_codes = {"H": 0, }
+
+    is_parsed = zeros(
+        shape=len(mapped_reaction_smiles_strings),
+        dtype=bool
+    )
+
+    for reaction_index, mapped_reaction_smiles in enumerate(mapped_reaction_smiles_strings):
+        if not isinstance(mapped_reaction_smiles, str):
+            continue
+
+        mapped_reaction_sides = mapped_reaction_smiles.split(" ")[0].split(">")
+
+        if len(mapped_reaction_sides) != 3:
+            continue
+
+        is_parsed[reaction_index] = True
+
+        for reaction_side, mapped_reaction_side in (
+            (0, mapped_reaction_sides[0]),
+            (0, mapped_reaction_sides[1]),
+            (1, mapped_reaction_sides[2]),
+        ):
+            for bracket_atom_symbol, map_number, organic_atom_symbol in MAPPED_ATOM_PATTERN.findall(
+                mapped_reaction_side
+            ):
+                element_symbol = bracket_atom_symbol or organic_atom_symbol
+                element_symbol = element_symbol[0].upper() + element_symbol[1:]
+
+                reaction_indices.append(reaction_index)
+                reaction_sides.append(reaction_side)
+                map_numbers.append(int(map_number) if map_number else 0)
+                element_codes.append(element_symbol_codes.setdefault(element_symbol, len(element_symbol_codes)))
+
+    element_codes = array(element_codes, dtype=int64)
+
+    return {
+        "reaction_indices": array(reaction_indices, dtype=int64),
+        "reaction_sides": array(reaction_sides, dtype=int64),
+        "map_numbers": array(map_numbers, dtype=int64),
+        "element_codes": element_codes,
+        "is_hydrogen": element_codes == 0,
+        "is_parsed": is_parsed,
+    }
+
+
+def _validate_mapped_reaction_smiles_chunk(
+        mapped_reaction_smiles_strings: Sequence[Any]
+) -> DataFrame:
+    """
+    Validate a chunk of the mapped chemical reaction SMILES strings using vectorized checks over the flat arrays of the
+    atom map number annotations.
+
+    :parameter mapped_reaction_smiles_strings: The mapped SMILES strings of the chemical reactions.
+
+    :returns: The mapping validation results of the chunk.
+    """
+
+    number_of_reactions = len(mapped_reaction_smiles_strings)
+
+    mapped_atom_arrays = _get_mapped_atom_arrays(
+        mapped_reaction_smiles_strings=mapped_reaction_smiles_strings
+    )
+
+    reaction_indices = mapped_atom_arrays["reaction_indices"]
+    reaction_sides = mapped_atom_arrays["reaction_sides"]
+    map_numbers = mapped_atom_arrays["map_numbers"]
+    element_codes = mapped_atom_arrays["element_codes"]
+
+    is_mapped = map_numbers > 0
+    is_product_atom = reaction_sides == 1
+
+    number_of_unmapped_product_atoms = bincount(
+        reaction_indices[is_product_atom & ~is_mapped & ~mapped_atom_arrays["is_hydrogen"]],
+        minlength=number_of_reactions
+    )
+
+    number_of_mapped_product_atoms = bincount(
+        reaction_indices[is_product_atom & is_mapped],
+        minlength=number_of_reactions
+    )
+
+    mapped_reaction_indices = reaction_indices[is_mapped]
+    mapped_reaction_sides = reaction_sides[is_mapped]
+    mapped_map_numbers = map_numbers[is_mapped]
+    mapped_element_codes = element_codes[is_mapped]
+
+    sorted_atom_indices = lexsort((mapped_map_numbers, mapped_reaction_sides, mapped_reaction_indices))
+
+    is_duplicate = zeros(
+        shape=len(sorted_atom_indices),
+        dtype=bool
+    )
+
+    if len(sorted_atom_indices) > 1:
+        is_duplicate[1:] = (
+            (diff(mapped_reaction_indices[sorted_atom_indices]) == 0) &
+            (diff(mapped_reaction_sides[sorted_atom_indices]) == 0) &
+            (diff(mapped_map_numbers[sorted_atom_indices]) == 0)
+        )
+
+    number_of_duplicate_map_numbers = bincount(
+        mapped_reaction_indices[sorted_atom_indices][is_duplicate],
+        minlength=number_of_reactions
+    )
+
+    map_number_base = int(mapped_map_numbers.max()) + 1 if len(mapped_map_numbers) > 0 else 1
+
+    atom_keys = mapped_reaction_indices * map_number_base + mapped_map_numbers
+
+    is_mapped_product_atom = mapped_reaction_sides == 1
+
+    reactant_atom_keys, reactant_atom_indices = unique(
+        atom_keys[~is_mapped_product_atom],
+        return_index=True
+    )
+
+    reactant_element_codes = mapped_element_codes[~is_mapped_product_atom][reactant_atom_indices]
+
+    product_atom_keys = atom_keys[is_mapped_product_atom]
+    product_element_codes = mapped_element_codes[is_mapped_product_atom]
+    product_reaction_indices = mapped_reaction_indices[is_mapped_product_atom]
+
+    reactant_atom_positions = searchsorted(reactant_atom_keys, product_atom_keys)
+    reactant_atom_positions[reactant_atom_positions == len(reactant_atom_keys)] = 0
+
+    is_matched = zeros(
+        shape=len(product_atom_keys),
+        dtype=bool
+    )
+
+    if len(reactant_atom_keys) > 0:
+        is_matched = reactant_atom_keys[reactant_atom_positions] == product_atom_keys
+
+    number_of_unmatched_product_map_numbers = bincount(
+        product_reaction_indices[~is_matched],
+        minlength=number_of_reactions
+    )
+
+    number_of_element_mismatches = bincount(
+        product_reaction_indices[is_matched][
+            reactant_element_codes[reactant_atom_positions[is_matched]] != product_element_codes[is_matched]
+        ],
+        minlength=number_of_reactions
+    )
+
+    return DataFrame(
+        data={
+            "is_mapping_valid": (
+                mapped_atom_arrays["is_parsed"] &
+                (number_of_mapped_product_atoms > 0) &
+                (number_of_unmapped_product_atoms == 0) &
+                (number_of_duplicate_map_numbers == 0) &
+                (number_of_unmatched_product_map_numbers == 0) &
+                (number_of_element_mismatches == 0)
+            ),
+            "number_of_unmapped_product_atoms": number_of_unmapped_product_atoms,
+            "number_of_duplicate_map_numbers": number_of_duplicate_map_numbers,
+            "number_of_unmatched_product_map_numbers": number_of_unmatched_product_map_numbers,
+            "number_of_element_mismatches": number_of_element_mismatches,
+        },
+        columns=MAPPING_VALIDATION_COLUMN_NAMES
+    )
+
+
+def validate_mapped_reaction_smiles_strings(
+        mapped_reaction_smiles_strings: Sequence[Any],
+        number_of_processes: int = 1,
+        chunk_size: int = 10000
+) -> DataFrame:
+    """
+    Validate the mapped chemical reaction SMILES strings. A mapped chemical reaction SMILES string is considered valid
+    if it can be parsed, all of the product heavy atoms are mapped, no atom map number is repeated on the same chemical
+    reaction side, each product atom map number is found on the reactant side, and the elements of the mapped atom
+    pairs are identical.
+
+    :parameter mapped_reaction_smiles_strings: The mapped SMILES strings of the chemical reactions. The values other
+        than strings are considered invalid.
+    :parameter number_of_processes: The number of processes.
+    :parameter chunk_size: The number of mapped chemical reaction SMILES strings that are submitted to a process at
+        once.
+
+    :returns: The mapping validation results aligned with the mapped chemical reaction SMILES strings.
+    """
+
+    mapped_reaction_smiles_chunks: List[Sequence[Any]] = [
+        mapped_reaction_smiles_strings[reaction_smiles_index: reaction_smiles_index + chunk_size]
+        for reaction_smiles_index in range(0, len(mapped_reaction_smiles_strings), chunk_size)
+    ]
+
+    if number_of_processes == 1 or len(mapped_reaction_smiles_chunks) < 2:
+        return _validate_mapped_reaction_smiles_chunk(
+            mapped_reaction_smiles_strings=mapped_reaction_smiles_strings
+        )
+
+    with get_cpu_resource_manager().create_process_pool_executor(
+        number_of_processes=number_of_processes
+    ) as process_pool_executor:
+        return concat(
+            objs=list(process_pool_executor.map(
+                _validate_mapped_reaction_smiles_chunk,
+                mapped_reaction_smiles_chunks
+            )),
+            ignore_index=True
+        )
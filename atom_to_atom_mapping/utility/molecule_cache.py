@@ -0,0 +1,159 @@
+""" The ``atom_to_atom_mapping.utility`` package ``molecule_cache`` module. """
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+
+def get_reaction_compound_smiles_strings(
+        reaction_smiles: str
+) -> Optional[List[List[str]]]:
+    """
+    Get the SMILES strings of the reactant, reagent and product compounds of a chemical reaction SMILES string.
+
+    :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+    :returns: The SMILES strings of the reactant, reagent and product compounds. The value `None` indicates that the
+        chemical reaction SMILES string cannot be split into the individual compounds, for example, if it contains the
+        CXSMILES extensions.
+    """
+
+    reaction_smiles_parts = reaction_smiles.split(" ")
+
+    reaction_sides = reaction_smiles_parts[0].split(">")
+
+    if len(reaction_sides) != 3 or (len(reaction_smiles_parts) > 1 and reaction_smiles_parts[1].startswith("|")):
+        return None
+
+    return [
+        [compound_smiles for compound_smiles in reaction_side.split(".") if compound_smiles != ""]
+        for reaction_side in reaction_sides
+    ]
+
+
+def merge_molecule_cache_summaries(
+        molecule_cache_summaries: Sequence[Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Merge the molecule cache summaries of several processes or runs.
+
+    :parameter molecule_cache_summaries: The molecule cache summaries. The values `None` are skipped.
+
+    :returns: The merged molecule cache summary. The value `None` indicates that no summary has been merged.
+    """
+
+    molecule_cache_summaries = [
+        molecule_cache_summary for molecule_cache_summary in molecule_cache_summaries
+        if molecule_cache_summary is not None
+    ]
+
+    if len(molecule_cache_summaries) == 0:
+        return None
+
+    number_of_hits = sum(
+        molecule_cache_summary["number_of_hits"] for molecule_cache_summary in molecule_cache_summaries
+    )
+    number_of_misses = sum(
+        molecule_cache_summary["number_of_misses"] for molecule_cache_summary in molecule_cache_summaries
+    )
+
+    return {
+        "number_of_hits": number_of_hits,
+        "number_of_misses": number_of_misses,
+        "hit_rate": number_of_hits / max(1, number_of_hits + number_of_misses),
+    }
+
+
+class MoleculeCache:
+    """
+    The bounded least recently used cache of the parsed or tokenized representations of the chemical compounds, which
+    allows the chemical reactions to be assembled from the cached compounds instead of being parsed from scratch.
+    """
+
+    def __init__(
+            self,
+            maximum_size: int = 100000
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter maximum_size: The maximum number of the cached chemical compound representations.
+        """
+
+        self.maximum_size = maximum_size
+
+        self._cached_values: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+        self.number_of_hits = 0
+        self.number_of_misses = 0
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        The `__len__` method of the class.
+
+        :returns: The number of the cached chemical compound representations.
+        """
+
+        return len(self._cached_values)
+
+    def get(
+            self,
+            key: Hashable,
+            function: Callable[[], Any]
+    ) -> Any:
+        """
+        Get the cached representation of a chemical compound, or compute and cache it if it is not cached. The least
+        recently used representation is evicted once the cache is full.
+
+        :parameter key: The key of the chemical compound, such as its SMILES string and the parsing options.
+        :parameter function: The function that computes the representation of the chemical compound. The exceptions of
+            the function are propagated, and nothing is cached in that case.
+
+        :returns: The representation of the chemical compound.
+        """
+
+        if key in self._cached_values:
+            self._cached_values.move_to_end(key)
+
+            self.number_of_hits += 1
+
+            return self._cached_values[key]
+
+        self.number_of_misses += 1
+
+        value = function()
+
+        self._cached_values[key] = value
+
+        if len(self._cached_values) > self.maximum_size:
+            self._cached_values.popitem(
+                last=False
+            )
+
+        return value
+
+    def clear(
+            self
+    ) -> None:
+        """ Clear the cached chemical compound representations and statistics. """
+
+        self._cached_values.clear()
+
+        self.number_of_hits = 0
+        self.number_of_misses = 0
+
+    def get_summary(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the summary of the molecule cache.
+
+        :returns: The number of cache hits and misses, and the cache hit rate.
+        """
+
+        return {
+            "number_of_hits": self.number_of_hits,
+            "number_of_misses": self.number_of_misses,
+            "hit_rate": self.number_of_hits / max(1, self.number_of_hits + self.number_of_misses),
+        }
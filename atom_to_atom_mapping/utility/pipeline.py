@@ -0,0 +1,134 @@
+""" The ``atom_to_atom_mapping.utility`` package ``pipeline`` module. """
+
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Any, Iterable, Iterator, TypeVar
+
+
+PIPELINE_STAGE_ITEM = TypeVar("PIPELINE_STAGE_ITEM")
+
+_END_OF_STAGE = object()
+
+
+class _PipelineStageException:
+    """ The wrapper of an exception that has been raised by the producer thread of a pipeline stage. """
+
+    def __init__(
+            self,
+            exception: BaseException
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter exception: The exception.
+        """
+
+        self.exception = exception
+
+
+def _produce_pipeline_stage_items(
+        iterable: Iterable[Any],
+        queue: Queue,
+        stop_event: Event,
+        polling_period_in_s: float
+) -> None:
+    """
+    Produce the items of a pipeline stage into a bounded queue until the iterable is exhausted or the consumer stops.
+
+    :parameter iterable: The iterable of the pipeline stage.
+    :parameter queue: The bounded queue between the pipeline stage and its consumer.
+    :parameter stop_event: The event that indicates that the consumer has stopped.
+    :parameter polling_period_in_s: The period in seconds in which the stop event is checked while the queue is full.
+    """
+
+    def put(
+            item: Any
+    ) -> bool:
+        while not stop_event.is_set():
+            try:
+                queue.put(
+                    item=item,
+                    timeout=polling_period_in_s
+                )
+
+                return True
+
+            except Full:
+                continue
+
+        return False
+
+    try:
+        for item in iterable:
+            if not put(item):
+                return
+
+        put(_END_OF_STAGE)
+
+    except BaseException as exception_handle:
+        put(_PipelineStageException(
+            exception=exception_handle
+        ))
+
+
+def iterate_in_background(
+        iterable: Iterable[PIPELINE_STAGE_ITEM],
+        maximum_queue_size: int = 2,
+        polling_period_in_s: float = 0.1
+) -> Iterator[PIPELINE_STAGE_ITEM]:
+    """
+    Iterate over an iterable in a background thread, so that the production of the next items overlaps with the
+    consumption of the current item. The items are passed through a bounded queue, so that at most the specified number
+    of items are produced ahead of the consumer. The exceptions of the producer are re-raised in the consumer.
+
+    :parameter iterable: The iterable.
+    :parameter maximum_queue_size: The maximum number of items that are produced ahead of the consumer.
+    :parameter polling_period_in_s: The period in seconds in which the producer checks whether the consumer has
+        stopped while the queue is full.
+
+    :returns: The iterator of the items of the iterable in the original order.
+    """
+
+    queue = Queue(
+        maxsize=max(1, maximum_queue_size)
+    )
+
+    stop_event = Event()
+
+    producer_thread = Thread(
+        target=_produce_pipeline_stage_items,
+        kwargs={
+            "iterable": iterable,
+            "queue": queue,
+            "stop_event": stop_event,
+            "polling_period_in_s": polling_period_in_s,
+        },
+        daemon=True
+    )
+
+    producer_thread.start()
+
+    try:
+        while True:
+            item = queue.get()
+
+            if item is _END_OF_STAGE:
+                break
+
+            if isinstance(item, _PipelineStageException):
+                raise item.exception
+
+            yield item
+
+    finally:
+        stop_event.set()
+
+        try:
+            while True:
+                queue.get_nowait()
+
+        except Empty:
+            pass
+
+        producer_thread.join()
+
@@ -0,0 +1,166 @@
+""" The ``atom_to_atom_mapping.utility`` package ``reaction_normalization`` module. """
+
+from logging import Logger
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from rdkit.Chem.rdmolfiles import MolFromSmiles, MolToSmiles
+
+from atom_to_atom_mapping.utility.cpu_resources import get_cpu_resource_manager
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+
+
+def normalize_reaction_smiles(
+        reaction_smiles: str
+) -> Optional[str]:
+    """
+    Normalize a chemical reaction SMILES string by removing the existing atom map numbers, canonicalizing each chemical
+    reaction compound using RDKit, and sorting the chemical reaction compounds within each chemical reaction side.
+
+    :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+    :returns: The normalized SMILES string of the chemical reaction. The value `None` indicates that the chemical
+        reaction SMILES string could not be normalized.
+    """
+
+    try:
+        reaction_sides = reaction_smiles.split(" ")[0].split(">")
+
+        if len(reaction_sides) != 3:
+            return None
+
+        normalized_reaction_sides = list()
+
+        for reaction_side in reaction_sides:
+            normalized_compound_smiles_strings = list()
+
+            for compound_smiles in reaction_side.split("."):
+                if compound_smiles == "":
+                    continue
+
+                compound = MolFromSmiles(compound_smiles)
+
+                if compound is None:
+                    return None
+
+                for atom in compound.GetAtoms():
+                    atom.SetAtomMapNum(0)
+
+                normalized_compound_smiles_strings.append(MolToSmiles(compound))
+
+            normalized_reaction_sides.append(".".join(sorted(normalized_compound_smiles_strings)))
+
+        return ">".join(normalized_reaction_sides)
+
+    except Exception:
+        return None
+
+
+def normalize_reaction_smiles_strings(
+        reaction_smiles_strings: Sequence[str],
+        number_of_processes: int = 1,
+        chunk_size: int = 1000
+) -> List[Optional[str]]:
+    """
+    Normalize the chemical reaction SMILES strings.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+    :parameter number_of_processes: The number of processes.
+    :parameter chunk_size: The number of chemical reaction SMILES strings that are submitted to a process at once.
+
+    :returns: The normalized SMILES strings of the chemical reactions. The value `None` indicates that the chemical
+        reaction SMILES string could not be normalized.
+    """
+
+    if number_of_processes == 1:
+        return [normalize_reaction_smiles(reaction_smiles) for reaction_smiles in reaction_smiles_strings]
+
+    with get_cpu_resource_manager().create_process_pool_executor(
+        number_of_processes=number_of_processes
+    ) as process_pool_executor:
+        return list(process_pool_executor.map(
+            normalize_reaction_smiles,
+            reaction_smiles_strings,
+            chunksize=chunk_size
+        ))
+
+
+def deduplicate_reaction_smiles_strings(
+        reaction_smiles_strings: Sequence[str],
+        normalized_reaction_smiles_strings: Sequence[Optional[str]]
+) -> Tuple[List[str], List[int]]:
+    """
+    Deduplicate the chemical reaction SMILES strings based on their normalized forms. The chemical reaction SMILES
+    strings that could not be normalized are deduplicated based on their original forms.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+    :parameter normalized_reaction_smiles_strings: The normalized SMILES strings of the chemical reactions.
+
+    :returns: The unique chemical reaction SMILES strings and the index of the unique chemical reaction SMILES string
+        of each input row.
+    """
+
+    unique_reaction_smiles_indices = dict()
+    unique_reaction_smiles_strings = list()
+
+    row_unique_reaction_smiles_indices = list()
+
+    for reaction_smiles, normalized_reaction_smiles in zip(reaction_smiles_strings, normalized_reaction_smiles_strings):
+        unique_reaction_smiles = reaction_smiles if normalized_reaction_smiles is None else normalized_reaction_smiles
+
+        if unique_reaction_smiles not in unique_reaction_smiles_indices:
+            unique_reaction_smiles_indices[unique_reaction_smiles] = len(unique_reaction_smiles_strings)
+
+            unique_reaction_smiles_strings.append(unique_reaction_smiles)
+
+        row_unique_reaction_smiles_indices.append(unique_reaction_smiles_indices[unique_reaction_smiles])
+
+    return unique_reaction_smiles_strings, row_unique_reaction_smiles_indices
+
+
+def map_normalized_reaction_smiles_strings(
+        reaction_smiles_strings: Sequence[str],
+        atom_to_atom_mapping_function: Callable[[Sequence[str]], Union[MappingResultBatch, List[Dict[str, Any]]]],
+        number_of_processes: int = 1,
+        chunk_size: int = 1000,
+        logger: Optional[Logger] = None
+) -> MappingResultBatch:
+    """
+    Normalize and deduplicate the chemical reaction SMILES strings, map the unique normalized chemical reaction SMILES
+    strings, and expand the outputs back to the input rows. The mapped chemical reaction SMILES strings are based on
+    the normalized chemical reaction SMILES strings.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+    :parameter atom_to_atom_mapping_function: The atom-to-atom mapping function.
+    :parameter number_of_processes: The number of normalization processes.
+    :parameter chunk_size: The number of chemical reaction SMILES strings that are submitted to a normalization
+        process at once.
+    :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+
+    :returns: The batch of the atom-to-atom mapping outputs aligned with the input rows.
+    """
+
+    unique_reaction_smiles_strings, row_unique_reaction_smiles_indices = deduplicate_reaction_smiles_strings(
+        reaction_smiles_strings=reaction_smiles_strings,
+        normalized_reaction_smiles_strings=normalize_reaction_smiles_strings(
+            reaction_smiles_strings=reaction_smiles_strings,
+            number_of_processes=number_of_processes,
+            chunk_size=chunk_size
+        )
+    )
+
+    if logger is not None:
+        logger.info(
+            msg=(
+                "The normalization of the chemical reaction SMILES strings has reduced {number_of_rows:d} input rows to "
+                "{number_of_unique_reactions:d} unique chemical reactions."
+            ).format(
+                number_of_rows=len(reaction_smiles_strings),
+                number_of_unique_reactions=len(unique_reaction_smiles_strings)
+            )
+        )
+
+    return MappingResultBatch.from_outputs(
+        outputs=atom_to_atom_mapping_function(unique_reaction_smiles_strings)
+    ).take(
+        indices=row_unique_reaction_smiles_indices
+    )
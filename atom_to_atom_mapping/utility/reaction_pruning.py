@@ -0,0 +1,288 @@
+""" The ``atom_to_atom_mapping.utility`` package ``reaction_pruning`` module. """
+
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdFingerprintGenerator import AdditionalOutput, GetMorganGenerator
+from rdkit.Chem.rdmolfiles import MolFromSmiles
+
+from atom_to_atom_mapping.utility.molecule_cache import MoleculeCache
+
+
+def _get_atom_environments(
+        compound: Mol
+) -> List[int]:
+    """
+    Get the radius-one Morgan atom environment identifiers of the heavy atoms of a chemical compound.
+
+    :parameter compound: The chemical compound.
+
+    :returns: The radius-one Morgan atom environment identifiers of the heavy atoms of the chemical compound.
+    """
+
+    additional_output = AdditionalOutput()
+
+    additional_output.AllocateAtomToBits()
+
+    GetMorganGenerator(
+        radius=1
+    ).GetSparseCountFingerprint(
+        compound,
+        additionalOutput=additional_output
+    )
+
+    return [
+        atom_bits[-1] for atom, atom_bits in zip(compound.GetAtoms(), additional_output.GetAtomToBits())
+        if atom.GetAtomicNum() > 1 and len(atom_bits) > 0
+    ]
+
+
+def _get_compound_features(
+        compound_smiles: str
+) -> Optional[Tuple[FrozenSet[int], List[int]]]:
+    """
+    Get the features of a chemical compound that are utilized for the pruning.
+
+    :parameter compound_smiles: The SMILES string of the chemical compound.
+
+    :returns: The atomic numbers and the radius-one Morgan atom environment identifiers of the heavy atoms of the
+        chemical compound. The value `None` indicates that the SMILES string of the chemical compound is invalid.
+    """
+
+    compound = MolFromSmiles(compound_smiles)
+
+    if compound is None:
+        return None
+
+    compound_elements = frozenset(atom.GetAtomicNum() for atom in compound.GetAtoms() if atom.GetAtomicNum() > 1)
+
+    return compound_elements, _get_atom_environments(
+        compound=compound
+    )
+
+
+def _get_cached_compound_features(
+        compound_smiles: str,
+        molecule_cache: Optional[MoleculeCache]
+) -> Optional[Tuple[FrozenSet[int], List[int]]]:
+    """
+    Get the features of a chemical compound that are utilized for the pruning from the molecule cache, if relevant.
+
+    :parameter compound_smiles: The SMILES string of the chemical compound.
+    :parameter molecule_cache: The molecule cache. The value `None` indicates that the features should not be cached.
+
+    :returns: The atomic numbers and the radius-one Morgan atom environment identifiers of the heavy atoms of the
+        chemical compound. The value `None` indicates that the SMILES string of the chemical compound is invalid.
+    """
+
+    if molecule_cache is None:
+        return _get_compound_features(
+            compound_smiles=compound_smiles
+        )
+
+    return molecule_cache.get(
+        key=("reaction_pruning", compound_smiles, ),
+        function=lambda: _get_compound_features(
+            compound_smiles=compound_smiles
+        )
+    )
+
+
+def _is_compound_non_contributing(
+        compound_elements: FrozenSet[int],
+        compound_atom_environments: List[int],
+        product_elements: Set[int],
+        product_atom_environments: Set[int],
+        minimum_shared_atom_environment_ratio: float
+) -> bool:
+    """
+    Check whether a chemical compound is unlikely to contribute any atoms to the chemical reaction products.
+
+    :parameter compound_elements: The atomic numbers of the heavy atoms of the chemical compound.
+    :parameter compound_atom_environments: The radius-one Morgan atom environment identifiers of the heavy atoms of the
+        chemical compound.
+    :parameter product_elements: The atomic numbers of the heavy atoms of the chemical reaction products.
+    :parameter product_atom_environments: The radius-one Morgan atom environment identifiers of the heavy atoms of the
+        chemical reaction products.
+    :parameter minimum_shared_atom_environment_ratio: The minimum ratio of the heavy atoms of a contributing chemical
+        compound whose atom environments are also found in the chemical reaction products.
+
+    :returns: The indicator of whether the chemical compound is unlikely to contribute any atoms to the chemical reaction
+        products.
+    """
+
+    if len(compound_elements) == 0:
+        return False
+
+    if len(compound_elements & product_elements) == 0:
+        return True
+
+    if len(compound_atom_environments) < 2:
+        return False
+
+    return sum(
+        compound_atom_environment in product_atom_environments
+        for compound_atom_environment in compound_atom_environments
+    ) / len(compound_atom_environments) < minimum_shared_atom_environment_ratio
+
+
+def prune_reaction_smiles(
+        reaction_smiles: str,
+        pruning_mode: str = "drop",
+        minimum_shared_atom_environment_ratio: float = 0.25,
+        molecule_cache: Optional[MoleculeCache] = None
+) -> Tuple[str, List[str]]:
+    """
+    Prune the chemical reaction compounds that are unlikely to contribute any atoms to the chemical reaction products.
+    A reactant compound is considered non-contributing if it has no heavy atom elements in common with the products or
+    if the radius-one environments of too few of its heavy atoms are found in the products.
+
+    :parameter reaction_smiles: The SMILES string of the chemical reaction.
+    :parameter pruning_mode: The indicator of how the non-contributing chemical reaction compounds should be pruned. The
+        value `move` indicates that the non-contributing reactant compounds should be moved to the reagent section. The
+        value `drop` indicates that the non-contributing reactant compounds and the reagent compounds should be removed
+        from the chemical reaction SMILES string.
+    :parameter minimum_shared_atom_environment_ratio: The minimum ratio of the heavy atoms of a contributing reactant
+        compound whose atom environments are also found in the products.
+    :parameter molecule_cache: The molecule cache of the chemical compound features. The value `None` indicates that
+        the chemical compound features should not be cached.
+
+    :returns: The pruned SMILES string of the chemical reaction and the SMILES strings of the removed chemical reaction
+        compounds.
+    """
+
+    try:
+        reaction_smiles_parts = reaction_smiles.split(" ")
+        reaction_sides = reaction_smiles_parts[0].split(">")
+
+        if len(reaction_sides) != 3 or len(reaction_smiles_parts) > 1:
+            return reaction_smiles, list()
+
+        reactant_smiles_strings, reagent_smiles_strings, product_smiles_strings = [
+            [compound_smiles for compound_smiles in reaction_side.split(".") if compound_smiles != ""]
+            for reaction_side in reaction_sides
+        ]
+
+        product_elements, product_atom_environments = set(), set()
+
+        for product_smiles in product_smiles_strings:
+            product_features = _get_cached_compound_features(
+                compound_smiles=product_smiles,
+                molecule_cache=molecule_cache
+            )
+
+            if product_features is None:
+                return reaction_smiles, list()
+
+            product_elements.update(product_features[0])
+            product_atom_environments.update(product_features[1])
+
+        contributing_reactant_smiles_strings, non_contributing_reactant_smiles_strings = list(), list()
+
+        for reactant_smiles in reactant_smiles_strings:
+            reactant_features = _get_cached_compound_features(
+                compound_smiles=reactant_smiles,
+                molecule_cache=molecule_cache
+            )
+
+            if reactant_features is not None and _is_compound_non_contributing(
+                compound_elements=reactant_features[0],
+                compound_atom_environments=reactant_features[1],
+                product_elements=product_elements,
+                product_atom_environments=product_atom_environments,
+                minimum_shared_atom_environment_ratio=minimum_shared_atom_environment_ratio
+            ):
+                non_contributing_reactant_smiles_strings.append(reactant_smiles)
+
+            else:
+                contributing_reactant_smiles_strings.append(reactant_smiles)
+
+        if len(contributing_reactant_smiles_strings) == 0:
+            return reaction_smiles, list()
+
+        if pruning_mode == "move":
+            return ">".join([
+                ".".join(contributing_reactant_smiles_strings),
+                ".".join(reagent_smiles_strings + non_contributing_reactant_smiles_strings),
+                ".".join(product_smiles_strings),
+            ]), list()
+
+        return ">>".join([
+            ".".join(contributing_reactant_smiles_strings),
+            ".".join(product_smiles_strings),
+        ]), reagent_smiles_strings + non_contributing_reactant_smiles_strings
+
+    except Exception:
+        return reaction_smiles, list()
+
+
+def prune_reaction_smiles_strings(
+        reaction_smiles_strings: Sequence[str],
+        pruning_mode: str = "drop",
+        minimum_shared_atom_environment_ratio: float = 0.25,
+        molecule_cache: Optional[MoleculeCache] = None
+) -> Tuple[List[str], List[List[str]]]:
+    """
+    Prune the chemical reaction compounds that are unlikely to contribute any atoms to the chemical reaction products.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+    :parameter pruning_mode: The indicator of how the non-contributing chemical reaction compounds should be pruned. The
+        value choices are: { `drop`, `move` }.
+    :parameter minimum_shared_atom_environment_ratio: The minimum ratio of the heavy atoms of a contributing reactant
+        compound whose atom environments are also found in the products.
+    :parameter molecule_cache: The molecule cache of the chemical compound features. The value `None` indicates that
+        the chemical compound features should not be cached.
+
+    :returns: The pruned SMILES strings of the chemical reactions and the SMILES strings of the removed chemical
+        reaction compounds of each chemical reaction.
+    """
+
+    pruned_reaction_smiles_strings, removed_compound_smiles_strings = list(), list()
+
+    for reaction_smiles in reaction_smiles_strings:
+        pruned_reaction_smiles, removed_compound_smiles = prune_reaction_smiles(
+            reaction_smiles=reaction_smiles,
+            pruning_mode=pruning_mode,
+            minimum_shared_atom_environment_ratio=minimum_shared_atom_environment_ratio,
+            molecule_cache=molecule_cache
+        )
+
+        pruned_reaction_smiles_strings.append(pruned_reaction_smiles)
+        removed_compound_smiles_strings.append(removed_compound_smiles)
+
+    return pruned_reaction_smiles_strings, removed_compound_smiles_strings
+
+
+def restore_pruned_reaction_compounds(
+        output: Dict[str, Any],
+        removed_compound_smiles_strings: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    Restore the removed chemical reaction compounds in the reagent section of the mapped chemical reaction SMILES
+    string of an atom-to-atom mapping output. The restored chemical reaction compounds are not mapped.
+
+    :parameter output: The atom-to-atom mapping output.
+    :parameter removed_compound_smiles_strings: The SMILES strings of the removed chemical reaction compounds.
+
+    :returns: The atom-to-atom mapping output with the restored chemical reaction compounds.
+    """
+
+    mapped_reaction_smiles: Optional[str] = output.get("mapped_reaction_smiles", None)
+
+    if mapped_reaction_smiles is None or len(removed_compound_smiles_strings) == 0:
+        return output
+
+    mapped_reaction_sides = mapped_reaction_smiles.split(">")
+
+    if len(mapped_reaction_sides) != 3:
+        return output
+
+    mapped_reaction_sides[1] = ".".join(
+        [compound_smiles for compound_smiles in mapped_reaction_sides[1].split(".") if compound_smiles != ""] +
+        list(removed_compound_smiles_strings)
+    )
+
+    return {
+        **output,
+        "mapped_reaction_smiles": ">".join(mapped_reaction_sides),
+    }
@@ -0,0 +1,333 @@
+""" The ``atom_to_atom_mapping.utility`` package ``reaction_record_file`` module. """
+
+from gzip import open as open_gzip_file
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from pandas import DataFrame
+
+from rdkit.Chem.rdChemReactions import ReactionFromRxnBlock, ReactionToSmiles
+
+
+RXN_BLOCK_PREFIX = "$RXN"
+
+RXN_FILE_EXTENSIONS = (".rdf", ".rxn", )
+REACTION_SMILES_FILE_EXTENSIONS = (".smi", ".rsmi", )
+
+
+def _open_text_file(
+        file_path: str
+) -> TextIO:
+    """
+    Open a text file for the streaming reading. The files with the `.gz` extension are decompressed on the fly.
+
+    :parameter file_path: The path to the text file.
+
+    :returns: The text file handle.
+    """
+
+    if file_path.endswith(".gz"):
+        return open_gzip_file(file_path, "rt")
+
+    return open(file_path, "r")
+
+
+def _get_file_extension(
+        file_path: str
+) -> str:
+    """
+    Get the extension of a reaction record file, disregarding the `.gz` compression extension.
+
+    :parameter file_path: The path to the reaction record file.
+
+    :returns: The lowercase extension of the reaction record file.
+    """
+
+    file_path = file_path.lower()
+
+    if file_path.endswith(".gz"):
+        file_path = file_path[:-3]
+
+    return file_path[file_path.rfind("."):] if "." in file_path else ""
+
+
+def is_reaction_record_file(
+        file_path: str
+) -> bool:
+    """
+    Check whether a file is an RXN, RDF, or chemical reaction SMILES file based on its extension.
+
+    :parameter file_path: The path to the file.
+
+    :returns: The indicator of whether the file is an RXN, RDF, or chemical reaction SMILES file.
+    """
+
+    return _get_file_extension(file_path) in RXN_FILE_EXTENSIONS + REACTION_SMILES_FILE_EXTENSIONS
+
+
+def iterate_rxn_file_records(
+        file_path: str
+) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """
+    Iterate over the records of an RDF or multi-record RXN file. The file is parsed line by line, so that only a single
+    record is kept in memory at once.
+
+    :parameter file_path: The path to the RDF or RXN file.
+
+    :returns: The iterator of the RXN blocks and the data fields of the records.
+    """
+
+    rxn_block_lines: List[str] = list()
+    data_fields: Dict[str, str] = dict()
+
+    data_field_name, data_field_lines = None, None
+
+    with _open_text_file(file_path) as file_handle:
+        for line in file_handle:
+            line = line.rstrip("\r\n")
+
+            is_record_start = line.startswith("$RFMT") or line.startswith("$MFMT") or line == "$$$$" or (
+                line.startswith(RXN_BLOCK_PREFIX) and len(rxn_block_lines) > 0 and data_field_name is None
+            )
+
+            if is_record_start or line.startswith("$DTYPE"):
+                if data_field_name is not None:
+                    data_fields[data_field_name] = "\n".join(data_field_lines)
+
+                    data_field_name, data_field_lines = None, None
+
+            if is_record_start:
+                if len(rxn_block_lines) > 0:
+                    yield "\n".join(rxn_block_lines), data_fields
+
+                rxn_block_lines, data_fields = list(), dict()
+
+                if not line.startswith(RXN_BLOCK_PREFIX):
+                    continue
+
+            if line.startswith("$RDFILE") or line.startswith("$DATM") or line.startswith("$RIREG") or \
+                    line.startswith("$REREG"):
+                continue
+
+            if line.startswith("$DTYPE"):
+                data_field_name, data_field_lines = line[len("$DTYPE"):].strip(), list()
+
+            elif data_field_name is not None:
+                data_field_lines.append(line[len("$DATUM"):].strip() if line.startswith("$DATUM") else line)
+
+            elif line.startswith(RXN_BLOCK_PREFIX) or len(rxn_block_lines) > 0:
+                rxn_block_lines.append(line)
+
+        if data_field_name is not None:
+            data_fields[data_field_name] = "\n".join(data_field_lines)
+
+        if len(rxn_block_lines) > 0:
+            yield "\n".join(rxn_block_lines), data_fields
+
+
+def convert_rxn_block_to_reaction_smiles(
+        rxn_block: str
+) -> Optional[str]:
+    """
+    Convert an RXN block to a chemical reaction SMILES string. The chemical reaction compounds are sanitized if
+    possible, so that the aromaticity is perceived, and are converted as they are otherwise.
+
+    :parameter rxn_block: The RXN block of the chemical reaction.
+
+    :returns: The SMILES string of the chemical reaction. The value `None` indicates that the RXN block cannot be
+        parsed.
+    """
+
+    for sanitize in (True, False, ):
+        try:
+            reaction = ReactionFromRxnBlock(
+                rxn_block,
+                sanitize=sanitize,
+                removeHs=False
+            )
+
+            if reaction is not None:
+                return ReactionToSmiles(reaction)
+
+        except Exception:
+            continue
+
+    return None
+
+
+def get_reaction_smiles_from_line(
+        line: str
+) -> Optional[str]:
+    """
+    Get the chemical reaction SMILES string from a line of a .smi or .rsmi file. The line can contain additional
+    whitespace-separated fields, such as the identifier of the chemical reaction, which are discarded, except for the
+    CXSMILES extensions.
+
+    :parameter line: The line of the .smi or .rsmi file.
+
+    :returns: The SMILES string of the chemical reaction. The value `None` indicates that the line is empty or a
+        comment.
+    """
+
+    line_fields = line.split()
+
+    if len(line_fields) == 0 or line_fields[0].startswith("#"):
+        return None
+
+    if len(line_fields) > 1 and line_fields[1].startswith("|"):
+        return " ".join(line_fields[:2])
+
+    return line_fields[0]
+
+
+def read_rxn_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunk_size: int,
+        data_field_names: Optional[Sequence[str]] = None,
+        read_rxn_blocks: bool = False
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of an RDF or multi-record RXN file.
+
+    :parameter file_path: The path to the RDF or RXN file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the chunks.
+    :parameter chunk_size: The number of records per chunk.
+    :parameter data_field_names: The names of the RDF data fields that should be read as additional columns. The value
+        `None` indicates that no data fields should be read.
+    :parameter read_rxn_blocks: The indicator of whether the RXN blocks should be read as they are instead of being
+        converted to the chemical reaction SMILES strings, which allows the atom-to-atom mapping approaches that parse
+        the RXN blocks directly to skip the conversion.
+
+    :returns: The iterator of the chunks of the RDF or RXN file.
+    """
+
+    data_field_names = list() if data_field_names is None else list(data_field_names)
+
+    chunk_rows: List[List[Optional[str]]] = list()
+
+    for rxn_block, data_fields in iterate_rxn_file_records(
+        file_path=file_path
+    ):
+        chunk_rows.append([
+            rxn_block if read_rxn_blocks else convert_rxn_block_to_reaction_smiles(
+                rxn_block=rxn_block
+            ),
+        ] + [
+            data_fields.get(data_field_name, None) for data_field_name in data_field_names
+        ])
+
+        if len(chunk_rows) == chunk_size:
+            yield DataFrame(
+                data=chunk_rows,
+                columns=[reaction_smiles_column_name, ] + data_field_names
+            )
+
+            chunk_rows = list()
+
+    if len(chunk_rows) > 0:
+        yield DataFrame(
+            data=chunk_rows,
+            columns=[reaction_smiles_column_name, ] + data_field_names
+        )
+
+
+def read_reaction_smiles_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunk_size: int
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of a .smi or .rsmi chemical reaction SMILES file. The empty lines, the comment lines, and the header
+    line, if any, are skipped.
+
+    :parameter file_path: The path to the .smi or .rsmi file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the chunks.
+    :parameter chunk_size: The number of rows per chunk.
+
+    :returns: The iterator of the chunks of the .smi or .rsmi file.
+    """
+
+    reaction_smiles_strings: List[str] = list()
+
+    is_first_line = True
+
+    with _open_text_file(file_path) as file_handle:
+        for line in file_handle:
+            reaction_smiles = get_reaction_smiles_from_line(
+                line=line
+            )
+
+            if reaction_smiles is None:
+                continue
+
+            if is_first_line:
+                is_first_line = False
+
+                if ">" not in reaction_smiles:
+                    continue
+
+            reaction_smiles_strings.append(reaction_smiles)
+
+            if len(reaction_smiles_strings) == chunk_size:
+                yield DataFrame(
+                    data={
+                        reaction_smiles_column_name: reaction_smiles_strings,
+                    }
+                )
+
+                reaction_smiles_strings = list()
+
+    if len(reaction_smiles_strings) > 0:
+        yield DataFrame(
+            data={
+                reaction_smiles_column_name: reaction_smiles_strings,
+            }
+        )
+
+
+def read_reaction_record_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunk_size: int,
+        data_field_names: Optional[Sequence[str]] = None,
+        read_rxn_blocks: bool = False
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of an RDF, RXN, .smi, or .rsmi file, based on the file extension. The files with the `.gz`
+    extension are decompressed on the fly.
+
+    :parameter file_path: The path to the RDF, RXN, .smi, or .rsmi file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the chunks.
+    :parameter chunk_size: The number of records per chunk.
+    :parameter data_field_names: The names of the RDF data fields that should be read as additional columns. The value
+        `None` indicates that no data fields should be read.
+    :parameter read_rxn_blocks: The indicator of whether the RXN blocks should be read as they are instead of being
+        converted to the chemical reaction SMILES strings.
+
+    :returns: The iterator of the chunks of the RDF, RXN, .smi, or .rsmi file.
+    """
+
+    file_extension = _get_file_extension(file_path)
+
+    if file_extension in RXN_FILE_EXTENSIONS:
+        yield from read_rxn_file_chunks(
+            file_path=file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            data_field_names=data_field_names,
+            read_rxn_blocks=read_rxn_blocks
+        )
+
+    elif file_extension in REACTION_SMILES_FILE_EXTENSIONS:
+        yield from read_reaction_smiles_file_chunks(
+            file_path=file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunk_size=chunk_size
+        )
+
+    else:
+        raise ValueError(
+            "The extension '{file_extension:s}' of the reaction record file is not supported.".format(
+                file_extension=file_extension
+            )
+        )
@@ -0,0 +1,391 @@
+""" The ``atom_to_atom_mapping.utility`` package ``reaction_smiles_file`` module. """
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pandas import DataFrame, concat, read_csv
+
+from pyarrow import Table, array, int64, string
+from pyarrow.parquet import ParquetFile, ParquetWriter
+
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+
+
+def read_csv_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunk_size: int,
+        read_reaction_smiles_column_only: bool = False,
+        start_row_index: int = 0,
+        end_row_index: Optional[int] = None
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of a .csv file.
+
+    :parameter file_path: The path to the .csv file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the .csv file.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter read_reaction_smiles_column_only: The indicator of whether only the chemical reaction SMILES column
+        should be read.
+    :parameter start_row_index: The index of the first row that should be read. The preceding rows are skipped by the
+        parser without being converted to the chunks.
+    :parameter end_row_index: The index of the row after the last row that should be read. The value `None` indicates
+        the end of the file.
+
+    :returns: The iterator of the chunks of the .csv file.
+    """
+
+    if end_row_index is not None and end_row_index <= start_row_index:
+        return
+
+    yield from read_csv(
+        filepath_or_buffer=file_path,
+        usecols=[reaction_smiles_column_name, ] if read_reaction_smiles_column_only else None,
+        skiprows=range(1, start_row_index + 1) if start_row_index > 0 else None,
+        nrows=None if end_row_index is None else end_row_index - start_row_index,
+        chunksize=chunk_size,
+        low_memory=False
+    )
+
+
+def read_parquet_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunk_size: int,
+        read_reaction_smiles_column_only: bool = True,
+        start_row_index: int = 0,
+        end_row_index: Optional[int] = None
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of a .parquet file.
+
+    :parameter file_path: The path to the .parquet file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the .parquet file.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter read_reaction_smiles_column_only: The indicator of whether only the chemical reaction SMILES column
+        should be read.
+    :parameter start_row_index: The index of the first row that should be read. Only the row groups that overlap the
+        row range are read.
+    :parameter end_row_index: The index of the row after the last row that should be read. The value `None` indicates
+        the end of the file.
+
+    :returns: The iterator of the chunks of the .parquet file.
+    """
+
+    parquet_file = ParquetFile(
+        source=file_path,
+        memory_map=True
+    )
+
+    if end_row_index is None:
+        end_row_index = parquet_file.metadata.num_rows
+
+    row_group_indices, row_index, row_group_start_row_index = list(), None, 0
+
+    for row_group_index in range(parquet_file.num_row_groups):
+        row_group_end_row_index = row_group_start_row_index + parquet_file.metadata.row_group(row_group_index).num_rows
+
+        if row_group_start_row_index < end_row_index and start_row_index < row_group_end_row_index:
+            if row_index is None:
+                row_index = row_group_start_row_index
+
+            row_group_indices.append(row_group_index)
+
+        row_group_start_row_index = row_group_end_row_index
+
+    if len(row_group_indices) == 0:
+        return
+
+    for record_batch in parquet_file.iter_batches(
+        batch_size=chunk_size,
+        row_groups=row_group_indices,
+        columns=[reaction_smiles_column_name, ] if read_reaction_smiles_column_only else None
+    ):
+        batch_start_row_index = row_index
+
+        row_index += record_batch.num_rows
+
+        if row_index <= start_row_index:
+            continue
+
+        record_batch = record_batch.slice(
+            offset=max(0, start_row_index - batch_start_row_index),
+            length=min(row_index, end_row_index) - max(start_row_index, batch_start_row_index)
+        )
+
+        if not read_reaction_smiles_column_only:
+            yield record_batch.to_pandas()
+
+        else:
+            yield DataFrame(
+                data={
+                    reaction_smiles_column_name: record_batch.column(0).to_pylist(),
+                }
+            )
+
+        if row_index >= end_row_index:
+            break
+
+
+def read_csv_file_row_range(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        start_row_index: int,
+        end_row_index: int,
+        read_reaction_smiles_column_only: bool = False
+) -> DataFrame:
+    """
+    Read a row range of a .csv file.
+
+    :parameter file_path: The path to the .csv file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the .csv file.
+    :parameter start_row_index: The index of the first row of the range.
+    :parameter end_row_index: The index of the row after the last row of the range.
+    :parameter read_reaction_smiles_column_only: The indicator of whether only the chemical reaction SMILES column
+        should be read.
+
+    :returns: The row range of the .csv file.
+    """
+
+    return read_csv(
+        filepath_or_buffer=file_path,
+        usecols=[reaction_smiles_column_name, ] if read_reaction_smiles_column_only else None,
+        skiprows=range(1, start_row_index + 1),
+        nrows=end_row_index - start_row_index,
+        low_memory=False
+    )
+
+
+def read_parquet_file_row_range(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        start_row_index: int,
+        end_row_index: int
+) -> DataFrame:
+    """
+    Read a row range of the chemical reaction SMILES column of a .parquet file. Only the overlapping row groups are
+    read.
+
+    :parameter file_path: The path to the .parquet file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the .parquet file.
+    :parameter start_row_index: The index of the first row of the range.
+    :parameter end_row_index: The index of the row after the last row of the range.
+
+    :returns: The row range of the chemical reaction SMILES column of the .parquet file.
+    """
+
+    parquet_file = ParquetFile(
+        source=file_path,
+        memory_map=True
+    )
+
+    row_group_indices, first_row_group_start_row_index, row_group_start_row_index = list(), None, 0
+
+    for row_group_index in range(parquet_file.num_row_groups):
+        row_group_end_row_index = row_group_start_row_index + parquet_file.metadata.row_group(row_group_index).num_rows
+
+        if row_group_start_row_index < end_row_index and start_row_index < row_group_end_row_index:
+            if first_row_group_start_row_index is None:
+                first_row_group_start_row_index = row_group_start_row_index
+
+            row_group_indices.append(row_group_index)
+
+        row_group_start_row_index = row_group_end_row_index
+
+    if len(row_group_indices) == 0:
+        return DataFrame(
+            data={
+                reaction_smiles_column_name: list(),
+            }
+        )
+
+    return DataFrame(
+        data={
+            reaction_smiles_column_name: parquet_file.read_row_groups(
+                row_groups=row_group_indices,
+                columns=[reaction_smiles_column_name, ]
+            ).column(0).slice(
+                offset=start_row_index - first_row_group_start_row_index,
+                length=end_row_index - start_row_index
+            ).to_pylist(),
+        }
+    )
+
+
+def _get_aligned_outputs(
+        outputs: Union[MappingResultBatch, List[Dict[str, Any]]],
+        output_column_names: Optional[List[str]],
+        number_of_rows: int
+) -> MappingResultBatch:
+    """
+    Get the atom-to-atom mapping outputs of a chunk aligned to the output columns of the first chunk, so that all of
+    the chunks of an output file share the same columns.
+
+    :parameter outputs: The atom-to-atom mapping outputs of the chunk.
+    :parameter output_column_names: The names of the output columns of the first chunk. The value `None` indicates that
+        the chunk is the first chunk.
+    :parameter number_of_rows: The number of the input rows of the chunk.
+
+    :returns: The aligned batch of the atom-to-atom mapping outputs.
+    """
+
+    outputs = MappingResultBatch.from_outputs(
+        outputs=outputs
+    )
+
+    if output_column_names is None:
+        output_column_names = outputs.column_names
+
+    unexpected_column_names = [
+        column_name for column_name in outputs.column_names if column_name not in output_column_names
+    ]
+
+    if len(unexpected_column_names) > 0:
+        raise ValueError(
+            "The atom-to-atom mapping output columns {column_names:s} are not contained in the first chunk.".format(
+                column_names=", ".join("'{column_name:s}'".format(
+                    column_name=column_name
+                ) for column_name in unexpected_column_names)
+            )
+        )
+
+    return outputs.align(
+        column_names=output_column_names,
+        number_of_rows=number_of_rows
+    )
+
+
+def write_csv_file_chunks(
+        file_path: str,
+        chunks: Iterable[Tuple[DataFrame, Union[MappingResultBatch, List[Dict[str, Any]]]]]
+) -> int:
+    """
+    Write the chunks of the input rows and atom-to-atom mapping outputs to a .csv file. The outputs of each chunk are
+    aligned to the output columns of the first chunk.
+
+    :parameter file_path: The path to the .csv file.
+    :parameter chunks: The chunks of the input rows and atom-to-atom mapping outputs. The outputs can be either a batch
+        of the atom-to-atom mapping outputs or a list of the dictionaries.
+
+    :returns: The number of written rows.
+    """
+
+    number_of_rows, output_column_names = 0, None
+
+    for input_dataframe, outputs in chunks:
+        outputs = _get_aligned_outputs(
+            outputs=outputs,
+            output_column_names=output_column_names,
+            number_of_rows=len(input_dataframe)
+        )
+
+        output_column_names = outputs.column_names
+
+        concat(
+            objs=[
+                input_dataframe.reset_index(
+                    drop=True
+                ),
+                outputs.to_pandas(),
+            ],
+            axis=1
+        ).to_csv(
+            path_or_buf=file_path,
+            mode="w" if number_of_rows == 0 else "a",
+            header=number_of_rows == 0,
+            index=False
+        )
+
+        number_of_rows += len(input_dataframe)
+
+    return number_of_rows
+
+
+def write_parquet_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunks: Iterable[Tuple[DataFrame, Union[MappingResultBatch, List[Dict[str, Any]]]]],
+        row_index_column_name: Optional[str] = None
+) -> int:
+    """
+    Write the chunks of the chemical reaction SMILES strings and atom-to-atom mapping outputs to a .parquet file as
+    typed columns. Each chunk is written as a separate row group, and its outputs are aligned to the output columns of
+    the first chunk.
+
+    :parameter file_path: The path to the .parquet file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the .parquet file.
+    :parameter chunks: The chunks of the input rows and atom-to-atom mapping outputs. The outputs can be either a batch
+        of the atom-to-atom mapping outputs or a list of the dictionaries.
+    :parameter row_index_column_name: The name of the original row index column of the input rows. The value `None`
+        indicates that the input rows do not have an original row index column.
+
+    :returns: The number of written rows.
+    """
+
+    parquet_writer, output_column_names = None, None
+
+    number_of_rows = 0
+
+    try:
+        for input_dataframe, outputs in chunks:
+            if len(input_dataframe) == 0:
+                continue
+
+            outputs = _get_aligned_outputs(
+                outputs=outputs,
+                output_column_names=output_column_names,
+                number_of_rows=len(input_dataframe)
+            )
+
+            output_column_names = outputs.column_names
+
+            input_column_names = [reaction_smiles_column_name, ]
+
+            if row_index_column_name is not None:
+                input_column_names.insert(0, row_index_column_name)
+
+            table = Table.from_arrays(
+                arrays=[
+                    array(
+                        obj=input_dataframe[input_column_name].tolist(),
+                        type=int64() if input_column_name == row_index_column_name else string(),
+                        from_pandas=True
+                    ) for input_column_name in input_column_names
+                ] + [
+                    outputs.column(output_column_name) for output_column_name in outputs.column_names
+                ],
+                names=input_column_names + outputs.column_names
+            )
+
+            if parquet_writer is None:
+                parquet_writer = ParquetWriter(
+                    where=file_path,
+                    schema=table.schema
+                )
+
+            parquet_writer.write_table(
+                table=table.cast(
+                    target_schema=parquet_writer.schema
+                )
+            )
+
+            number_of_rows += len(input_dataframe)
+
+        if parquet_writer is None:
+            parquet_writer = ParquetWriter(
+                where=file_path,
+                schema=Table.from_arrays(
+                    arrays=[
+                        array(
+                            obj=list(),
+                            type=string()
+                        ),
+                    ],
+                    names=[reaction_smiles_column_name, ]
+                ).schema
+            )
+
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    return number_of_rows
@@ -0,0 +1,277 @@
+""" The ``atom_to_atom_mapping.utility`` package ``reaction_smiles_line_file`` module. """
+
+from mmap import ACCESS_READ, mmap
+from os import replace
+from os.path import exists, getmtime, getsize
+from typing import Iterator, List, Optional, Tuple
+
+from numpy import array, concatenate, flatnonzero, frombuffer, int64, load, ndarray, save, uint8
+
+from pandas import DataFrame
+
+
+class ReactionSmilesLineFile:
+    """
+    The memory-mapped newline-delimited chemical reaction SMILES file class. The start offsets of the lines are indexed
+    once and persisted beside the file, which allows the retrieval of arbitrary row ranges without reading the complete
+    file.
+    """
+
+    def __init__(
+            self,
+            file_path: str,
+            index_file_path: Optional[str] = None,
+            index_block_size: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter file_path: The path to the newline-delimited chemical reaction SMILES file.
+        :parameter index_file_path: The path to the line offset index .npy file. The value `None` indicates that the
+            index file should be placed beside the newline-delimited chemical reaction SMILES file.
+        :parameter index_block_size: The number of bytes that are scanned at once while building the line offset index.
+        """
+
+        self.file_path = file_path
+
+        self.index_file_path = (
+            "{file_path:s}.offsets.npy".format(
+                file_path=file_path
+            ) if index_file_path is None else index_file_path
+        )
+
+        self._file_handle = open(file_path, "rb")
+
+        self._memory_map = mmap(
+            self._file_handle.fileno(),
+            length=0,
+            access=ACCESS_READ
+        ) if getsize(file_path) > 0 else b""
+
+        self._line_offsets = self._get_line_offsets(
+            index_block_size=index_block_size
+        )
+
+    def __enter__(
+            self
+    ) -> "ReactionSmilesLineFile":
+        """
+        The `__enter__` method of the class.
+
+        :returns: The newline-delimited chemical reaction SMILES file.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """
+        The `__exit__` method of the class.
+
+        :parameter args: The exception type, value, and traceback.
+        """
+
+        self.close()
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        The `__len__` method of the class.
+
+        :returns: The number of lines.
+        """
+
+        return len(self._line_offsets) - 1
+
+    def _build_line_offsets(
+            self,
+            index_block_size: int
+    ) -> ndarray:
+        """
+        Build the line offset index.
+
+        :parameter index_block_size: The number of bytes that are scanned at once.
+
+        :returns: The start offsets of the lines, followed by the size of the file.
+        """
+
+        file_size = len(self._memory_map)
+
+        line_offsets = [array([0, ], dtype=int64), ]
+
+        for block_offset in range(0, file_size, index_block_size):
+            block = frombuffer(
+                self._memory_map,
+                dtype=uint8,
+                count=min(index_block_size, file_size - block_offset),
+                offset=block_offset
+            )
+
+            line_offsets.append(
+                (flatnonzero(block == ord("\n")) + block_offset + 1).astype(int64)
+            )
+
+        line_offsets = concatenate(line_offsets)
+
+        if line_offsets[-1] != file_size:
+            line_offsets = concatenate([line_offsets, [file_size, ]]).astype(int64)
+
+        return line_offsets
+
+    def _get_line_offsets(
+            self,
+            index_block_size: int
+    ) -> ndarray:
+        """
+        Get the line offset index by reusing the persisted index file if it is up-to-date or by building and persisting
+        a new one otherwise.
+
+        :parameter index_block_size: The number of bytes that are scanned at once while building the line offset index.
+
+        :returns: The start offsets of the lines, followed by the size of the file.
+        """
+
+        if exists(self.index_file_path) and getmtime(self.index_file_path) >= getmtime(self.file_path):
+            line_offsets = load(
+                file=self.index_file_path,
+                mmap_mode="r"
+            )
+
+            if len(line_offsets) > 0 and line_offsets[-1] == len(self._memory_map):
+                return line_offsets
+
+        line_offsets = self._build_line_offsets(
+            index_block_size=index_block_size
+        )
+
+        temporary_index_file_path = "{index_file_path:s}.tmp.npy".format(
+            index_file_path=self.index_file_path
+        )
+
+        save(
+            file=temporary_index_file_path,
+            arr=line_offsets
+        )
+
+        replace(temporary_index_file_path, self.index_file_path)
+
+        return line_offsets
+
+    def get_reaction_smiles_strings(
+            self,
+            start_row_index: int,
+            end_row_index: int
+    ) -> List[str]:
+        """
+        Get the chemical reaction SMILES strings of a row range.
+
+        :parameter start_row_index: The index of the first row of the range.
+        :parameter end_row_index: The index of the row after the last row of the range.
+
+        :returns: The chemical reaction SMILES strings of the row range.
+        """
+
+        start_row_index = max(0, start_row_index)
+        end_row_index = min(len(self), end_row_index)
+
+        if start_row_index >= end_row_index:
+            return list()
+
+        return [
+            line.rstrip(b"\r").decode("utf-8")
+            for line in self._memory_map[
+                int(self._line_offsets[start_row_index]): int(self._line_offsets[end_row_index])
+            ].split(b"\n")[:end_row_index - start_row_index]
+        ]
+
+    def get_row_ranges(
+            self,
+            number_of_partitions: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the contiguous row ranges that partition the file into approximately equally sized parts.
+
+        :parameter number_of_partitions: The number of partitions.
+
+        :returns: The start and end row indices of the partitions.
+        """
+
+        return [
+            (
+                len(self) * partition_index // number_of_partitions,
+                len(self) * (partition_index + 1) // number_of_partitions,
+            ) for partition_index in range(number_of_partitions)
+        ]
+
+    def iter_reaction_smiles_chunks(
+            self,
+            chunk_size: int,
+            start_row_index: int = 0,
+            end_row_index: Optional[int] = None
+    ) -> Iterator[List[str]]:
+        """
+        Iterate over the chunks of the chemical reaction SMILES strings of a row range.
+
+        :parameter chunk_size: The number of rows per chunk.
+        :parameter start_row_index: The index of the first row of the range.
+        :parameter end_row_index: The index of the row after the last row of the range. The value `None` indicates the
+            end of the file.
+
+        :returns: The iterator of the chunks of the chemical reaction SMILES strings.
+        """
+
+        end_row_index = len(self) if end_row_index is None else min(len(self), end_row_index)
+
+        for chunk_start_row_index in range(start_row_index, end_row_index, chunk_size):
+            yield self.get_reaction_smiles_strings(
+                start_row_index=chunk_start_row_index,
+                end_row_index=min(chunk_start_row_index + chunk_size, end_row_index)
+            )
+
+    def close(
+            self
+    ) -> None:
+        """ Close the newline-delimited chemical reaction SMILES file. """
+
+        if isinstance(self._memory_map, mmap):
+            self._memory_map.close()
+
+        self._file_handle.close()
+
+
+def read_line_file_chunks(
+        file_path: str,
+        reaction_smiles_column_name: str,
+        chunk_size: int,
+        start_row_index: int = 0,
+        end_row_index: Optional[int] = None
+) -> Iterator[DataFrame]:
+    """
+    Read the chunks of a newline-delimited chemical reaction SMILES file.
+
+    :parameter file_path: The path to the newline-delimited chemical reaction SMILES file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the chunks.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter start_row_index: The index of the first row that should be read.
+    :parameter end_row_index: The index of the row after the last row that should be read. The value `None` indicates
+        the end of the file.
+
+    :returns: The iterator of the chunks of the newline-delimited chemical reaction SMILES file.
+    """
+
+    with ReactionSmilesLineFile(
+        file_path=file_path
+    ) as reaction_smiles_line_file:
+        for reaction_smiles_strings in reaction_smiles_line_file.iter_reaction_smiles_chunks(
+            chunk_size=chunk_size,
+            start_row_index=start_row_index,
+            end_row_index=end_row_index
+        ):
+            yield DataFrame(
+                data={
+                    reaction_smiles_column_name: reaction_smiles_strings,
+                }
+            )
@@ -0,0 +1,369 @@
+""" The ``atom_to_atom_mapping.utility`` package ``reaction_template_index`` module. """
+
+from collections import Counter
+from json import dump, load
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rdkit.Chem.rdChemReactions import ChemicalReaction, ReactionFromSmarts
+from rdkit.Chem.rdchem import Mol
+from rdkit.Chem.rdmolfiles import MolFromSmiles, MolToSmiles
+from rdkit.Chem.rdmolops import PatternFingerprint, SanitizeMol
+from rdkit.DataStructs import AllProbeBitsMatch, ExplicitBitVect
+
+from atom_to_atom_mapping.utility.molecule_cache import MoleculeCache
+
+
+class ReactionTemplateIndex:
+    """
+    The persistent index of the mapped chemical reaction templates of the past atom-to-atom mapping outputs, which maps
+    the new chemical reactions of the recurring chemical reaction types by the application of the known templates.
+    """
+
+    def __init__(
+            self,
+            reaction_template_counts: Optional[Dict[str, int]] = None,
+            minimum_reaction_template_count: int = 1,
+            maximum_number_of_candidate_reaction_templates: int = 10,
+            maximum_number_of_template_products: int = 10,
+            maximum_number_of_compiled_reaction_templates: int = 1000
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter reaction_template_counts: The number of occurrences of each mapped chemical reaction template SMARTS.
+        :parameter minimum_reaction_template_count: The minimum number of occurrences of a chemical reaction template to
+            be considered as a candidate.
+        :parameter maximum_number_of_candidate_reaction_templates: The maximum number of the most frequent chemical
+            reaction templates that are applied to a chemical reaction.
+        :parameter maximum_number_of_template_products: The maximum number of the product sets that are generated by
+            the application of a chemical reaction template.
+        :parameter maximum_number_of_compiled_reaction_templates: The maximum number of the chemical reaction templates
+            whose compiled forms are cached.
+        """
+
+        self.reaction_template_counts = Counter(reaction_template_counts or dict())
+
+        self.minimum_reaction_template_count = minimum_reaction_template_count
+        self.maximum_number_of_candidate_reaction_templates = maximum_number_of_candidate_reaction_templates
+        self.maximum_number_of_template_products = maximum_number_of_template_products
+
+        self._candidate_reaction_templates: Optional[List[str]] = None
+        self._compiled_reaction_templates = MoleculeCache(
+            maximum_size=maximum_number_of_compiled_reaction_templates
+        )
+
+    def __len__(
+            self
+    ) -> int:
+        """
+        The `__len__` method of the class.
+
+        :returns: The number of the distinct chemical reaction templates.
+        """
+
+        return len(self.reaction_template_counts)
+
+    @classmethod
+    def load(
+            cls,
+            file_path: str,
+            **kwargs
+    ) -> "ReactionTemplateIndex":
+        """
+        Load the chemical reaction template index from a .json file.
+
+        :parameter file_path: The path to the .json file.
+        :parameter kwargs: The keyword arguments for the adjustment of the `__init__` method.
+
+        :returns: The chemical reaction template index.
+        """
+
+        with open(file_path, "r") as file_handle:
+            return cls(
+                reaction_template_counts=load(file_handle)["reaction_template_counts"],
+                **kwargs
+            )
+
+    def save(
+            self,
+            file_path: str
+    ) -> None:
+        """
+        Save the chemical reaction template index to a .json file.
+
+        :parameter file_path: The path to the .json file.
+        """
+
+        with open(file_path, "w") as file_handle:
+            dump(
+                obj={
+                    "reaction_template_counts": dict(self.reaction_template_counts.most_common()),
+                },
+                fp=file_handle
+            )
+
+    def add_reaction_template_smarts(
+            self,
+            reaction_template_smarts_strings: Iterable[Optional[str]]
+    ) -> None:
+        """
+        Add the mapped chemical reaction template SMARTS strings to the chemical reaction template index.
+
+        :parameter reaction_template_smarts_strings: The mapped chemical reaction template SMARTS strings. The values
+            other than non-empty strings are skipped.
+        """
+
+        reaction_template_smarts_strings = [
+            reaction_template_smarts for reaction_template_smarts in reaction_template_smarts_strings
+            if isinstance(reaction_template_smarts, str) and ">>" in reaction_template_smarts
+        ]
+
+        if len(reaction_template_smarts_strings) > 0:
+            self.reaction_template_counts.update(reaction_template_smarts_strings)
+
+            self._candidate_reaction_templates = None
+
+    def add_outputs(
+            self,
+            outputs: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Add the mapped chemical reaction templates of the confident atom-to-atom mapping outputs to the chemical
+        reaction template index.
+
+        :parameter outputs: The atom-to-atom mapping outputs.
+        """
+
+        self.add_reaction_template_smarts(
+            reaction_template_smarts_strings=(
+                output.get("mapped_reaction_template_smarts", None) for output in outputs
+                if output.get("is_confident", None) is True
+            )
+        )
+
+    def _get_candidate_reaction_templates(
+            self
+    ) -> List[str]:
+        """
+        Get the candidate chemical reaction templates in the descending order of their number of occurrences.
+
+        :returns: The candidate mapped chemical reaction template SMARTS strings.
+        """
+
+        if self._candidate_reaction_templates is None:
+            self._candidate_reaction_templates = [
+                reaction_template_smarts
+                for reaction_template_smarts, reaction_template_count in self.reaction_template_counts.most_common(
+                    self.maximum_number_of_candidate_reaction_templates
+                ) if reaction_template_count >= self.minimum_reaction_template_count
+            ]
+
+        return self._candidate_reaction_templates
+
+    @staticmethod
+    def _compile_reaction_templates(
+            reaction_template_smarts: str
+    ) -> List[Tuple[ChemicalReaction, ExplicitBitVect, ExplicitBitVect]]:
+        """
+        Compile a chemical reaction template in the forward and, as the direction of the chemical reaction templates is
+        not known in advance, reversed direction. The templates are compiled as single-component reactant and product
+        templates, so that they can be applied to all of the reactants at once.
+
+        :parameter reaction_template_smarts: The mapped chemical reaction template SMARTS string.
+
+        :returns: The compiled chemical reaction templates that could be initialized, and the pattern fingerprints of
+            their reactant and product templates.
+        """
+
+        compiled_reaction_templates = list()
+
+        reaction_template_sides = reaction_template_smarts.split(">")
+
+        if len(reaction_template_sides) == 3:
+            for reactant_template_smarts, product_template_smarts in (
+                (reaction_template_sides[0], reaction_template_sides[2]),
+                (reaction_template_sides[2], reaction_template_sides[0]),
+            ):
+                try:
+                    compiled_reaction_template = ReactionFromSmarts(
+                        "({reactant_template_smarts:s})>>({product_template_smarts:s})".format(
+                            reactant_template_smarts=reactant_template_smarts,
+                            product_template_smarts=product_template_smarts
+                        )
+                    )
+
+                    compiled_reaction_template.Initialize()
+
+                    template_fingerprints = list()
+
+                    for template_mol in (
+                        compiled_reaction_template.GetReactantTemplate(0),
+                        compiled_reaction_template.GetProductTemplate(0),
+                    ):
+                        template_mol.UpdatePropertyCache(
+                            strict=False
+                        )
+
+                        template_fingerprints.append(PatternFingerprint(template_mol))
+
+                    compiled_reaction_templates.append((compiled_reaction_template, *template_fingerprints, ))
+
+                except Exception:
+                    continue
+
+        return compiled_reaction_templates
+
+    def _get_compiled_reaction_templates(
+            self,
+            reaction_template_smarts: str
+    ) -> List[Tuple[ChemicalReaction, ExplicitBitVect, ExplicitBitVect]]:
+        """
+        Get the cached compiled chemical reaction template in the forward and reversed direction.
+
+        :parameter reaction_template_smarts: The mapped chemical reaction template SMARTS string.
+
+        :returns: The compiled chemical reaction templates that could be initialized, and the pattern fingerprints of
+            their reactant and product templates.
+        """
+
+        return self._compiled_reaction_templates.get(
+            key=reaction_template_smarts,
+            function=lambda: self._compile_reaction_templates(
+                reaction_template_smarts=reaction_template_smarts
+            )
+        )
+
+    def _apply_reaction_template(
+            self,
+            compiled_reaction_template: ChemicalReaction,
+            reactant_mol: Mol,
+            product_mol: Mol,
+            product_smiles: str
+    ) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        Apply a compiled chemical reaction template to the reactants and find the generated product set that is
+        identical to the products of the chemical reaction.
+
+        :parameter compiled_reaction_template: The compiled chemical reaction template.
+        :parameter reactant_mol: The reactants of the chemical reaction.
+        :parameter product_mol: The products of the chemical reaction.
+        :parameter product_smiles: The canonical SMILES string of the products of the chemical reaction.
+
+        :returns: The reactant atom index and the product atom index of each mapped atom. The value `None` indicates
+            that no generated product set is identical to the products of the chemical reaction.
+        """
+
+        if not product_mol.HasSubstructMatch(compiled_reaction_template.GetProductTemplate(0)):
+            return None
+
+        for generated_product_mols in compiled_reaction_template.RunReactants(
+            (reactant_mol, ),
+            self.maximum_number_of_template_products
+        ):
+            generated_product_mol = generated_product_mols[0]
+
+            try:
+                SanitizeMol(generated_product_mol)
+
+            except Exception:
+                continue
+
+            if MolToSmiles(generated_product_mol, isomericSmiles=False) != product_smiles:
+                continue
+
+            product_atom_indices = product_mol.GetSubstructMatch(generated_product_mol)
+
+            if len(product_atom_indices) != generated_product_mol.GetNumAtoms():
+                continue
+
+            reactant_atom_indices = [
+                atom.GetIntProp("react_atom_idx") if atom.HasProp("react_atom_idx") else None
+                for atom in generated_product_mol.GetAtoms()
+            ]
+
+            if any(reactant_atom_index is None for reactant_atom_index in reactant_atom_indices):
+                continue
+
+            return reactant_atom_indices, list(product_atom_indices)
+
+        return None
+
+    def map_reaction_smiles(
+            self,
+            reaction_smiles: str
+    ) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Map a chemical reaction SMILES string by the application of the candidate chemical reaction templates. The
+        candidate chemical reaction templates whose reactant or product template pattern fingerprints are not contained
+        in the ones of the chemical reaction are skipped without a substructure search. A chemical reaction template is
+        considered matched only if it regenerates exactly the products of the chemical reaction from its reactants.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+        :returns: The mapped chemical reaction SMILES string and the matched mapped chemical reaction template SMARTS
+            string. The value `None` indicates that no chemical reaction template has been matched.
+        """
+
+        reaction_smiles_sides = reaction_smiles.split(" ")[0].split(">")
+
+        if len(reaction_smiles_sides) != 3 or len(self._get_candidate_reaction_templates()) == 0:
+            return None
+
+        reactant_mol, product_mol = MolFromSmiles(reaction_smiles_sides[0]), MolFromSmiles(reaction_smiles_sides[2])
+
+        if reactant_mol is None or product_mol is None or product_mol.GetNumAtoms() == 0:
+            return None
+
+        for mol in (reactant_mol, product_mol, ):
+            for atom in mol.GetAtoms():
+                atom.SetAtomMapNum(0)
+
+        product_smiles = MolToSmiles(product_mol, isomericSmiles=False)
+
+        reactant_fingerprint, product_fingerprint = PatternFingerprint(reactant_mol), PatternFingerprint(product_mol)
+
+        for reaction_template_smarts in self._get_candidate_reaction_templates():
+            for (
+                compiled_reaction_template,
+                reactant_template_fingerprint,
+                product_template_fingerprint,
+            ) in self._get_compiled_reaction_templates(
+                reaction_template_smarts=reaction_template_smarts
+            ):
+                if not (
+                    AllProbeBitsMatch(product_template_fingerprint, product_fingerprint) and
+                    AllProbeBitsMatch(reactant_template_fingerprint, reactant_fingerprint)
+                ):
+                    continue
+
+                try:
+                    mapped_atom_indices = self._apply_reaction_template(
+                        compiled_reaction_template=compiled_reaction_template,
+                        reactant_mol=reactant_mol,
+                        product_mol=product_mol,
+                        product_smiles=product_smiles
+                    )
+
+                except Exception:
+                    continue
+
+                if mapped_atom_indices is None:
+                    continue
+
+                for map_number, (reactant_atom_index, product_atom_index) in enumerate(
+                    zip(*mapped_atom_indices),
+                    start=1
+                ):
+                    reactant_mol.GetAtomWithIdx(reactant_atom_index).SetAtomMapNum(map_number)
+                    product_mol.GetAtomWithIdx(product_atom_index).SetAtomMapNum(map_number)
+
+                return {
+                    "mapped_reaction_smiles": "{reactants:s}>{agents:s}>{products:s}".format(
+                        reactants=MolToSmiles(reactant_mol),
+                        agents=reaction_smiles_sides[1],
+                        products=MolToSmiles(product_mol)
+                    ),
+                    "mapped_reaction_template_smarts": reaction_template_smarts,
+                }
+
+        return None
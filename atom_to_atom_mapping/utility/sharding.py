@@ -0,0 +1,653 @@
+""" The ``atom_to_atom_mapping.utility`` package ``sharding`` module. """
+
+from hashlib import blake2b
+from json import dump, load
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pandas import DataFrame, concat, read_csv
+
+from pyarrow import Schema, Table, null, schema
+from pyarrow.parquet import ParquetFile, ParquetWriter
+
+from atom_to_atom_mapping.utility.mapping_result_batch import OUTPUT_COLUMN_ARROW_DATA_TYPES
+from atom_to_atom_mapping.utility.reaction_record_file import read_reaction_record_file_chunks
+from atom_to_atom_mapping.utility.reaction_smiles_line_file import ReactionSmilesLineFile
+
+
+ROW_INDEX_COLUMN_NAME = "row_index"
+
+
+class InputShard:
+    """ The deterministic input file shard class. """
+
+    def __init__(
+            self,
+            number_of_shards: int,
+            shard_index: int,
+            sharding_mode: str = "row_range"
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter number_of_shards: The number of shards.
+        :parameter shard_index: The index of the shard.
+        :parameter sharding_mode: The indicator of how the input file rows should be partitioned. The value choices are:
+            { `hash`, `row_range` }.
+        """
+
+        if number_of_shards < 1 or not 0 <= shard_index < number_of_shards:
+            raise ValueError(
+                "The shard index {shard_index:d} is not valid for {number_of_shards:d} shard(s).".format(
+                    shard_index=shard_index,
+                    number_of_shards=number_of_shards
+                )
+            )
+
+        if sharding_mode not in ["hash", "row_range", ]:
+            raise ValueError(
+                "The sharding mode '{sharding_mode:s}' is not supported.".format(
+                    sharding_mode=sharding_mode
+                )
+            )
+
+        self.number_of_shards = number_of_shards
+        self.shard_index = shard_index
+        self.sharding_mode = sharding_mode
+
+        self.number_of_input_rows = 0
+        self.number_of_shard_rows = 0
+
+    def get_row_range(
+            self,
+            number_of_rows: int
+    ) -> Tuple[int, int]:
+        """
+        Get the contiguous row range of the shard.
+
+        :parameter number_of_rows: The number of input file rows.
+
+        :returns: The start and end row indices of the shard.
+        """
+
+        return (
+            number_of_rows * self.shard_index // self.number_of_shards,
+            number_of_rows * (self.shard_index + 1) // self.number_of_shards,
+        )
+
+    def get_reaction_smiles_shard_index(
+            self,
+            reaction_smiles: Any
+    ) -> int:
+        """
+        Get the hash-based shard index of a chemical reaction SMILES string. The hash is stable across processes and
+        hosts.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+        :returns: The shard index of the chemical reaction SMILES string.
+        """
+
+        return int.from_bytes(
+            blake2b(
+                str(reaction_smiles).encode("utf-8"),
+                digest_size=8
+            ).digest(),
+            byteorder="big"
+        ) % self.number_of_shards
+
+    def select(
+            self,
+            input_chunks: Iterable[DataFrame],
+            reaction_smiles_column_name: str,
+            number_of_rows: Optional[int] = None,
+            first_row_index: int = 0
+    ) -> Iterator[DataFrame]:
+        """
+        Select the rows of the shard from the input file chunks and add the original row index column. The row counters
+        of the shard are reset, so that the same shard can be utilized for several input files.
+
+        :parameter input_chunks: The chunks of the input file.
+        :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the input file.
+        :parameter number_of_rows: The number of input file rows. The value is required for the `row_range` mode.
+        :parameter first_row_index: The original row index of the first row of the first chunk.
+
+        :returns: The iterator of the chunks of the shard.
+        """
+
+        if self.sharding_mode == "row_range":
+            if number_of_rows is None:
+                raise ValueError("The number of input file rows is required for the 'row_range' sharding mode.")
+
+            start_row_index, end_row_index = self.get_row_range(
+                number_of_rows=number_of_rows
+            )
+
+        self.number_of_input_rows = 0
+        self.number_of_shard_rows = 0
+
+        row_index = first_row_index
+
+        for input_chunk in input_chunks:
+            row_indices = range(row_index, row_index + len(input_chunk))
+
+            if self.sharding_mode == "row_range":
+                shard_mask = [start_row_index <= chunk_row_index < end_row_index for chunk_row_index in row_indices]
+
+            else:
+                shard_mask = [
+                    self.get_reaction_smiles_shard_index(
+                        reaction_smiles=reaction_smiles
+                    ) == self.shard_index for reaction_smiles in input_chunk[reaction_smiles_column_name].tolist()
+                ]
+
+            row_index += len(input_chunk)
+
+            self.number_of_input_rows = row_index
+
+            shard_chunk = input_chunk.reset_index(
+                drop=True
+            )
+
+            shard_chunk.insert(
+                loc=0,
+                column=ROW_INDEX_COLUMN_NAME,
+                value=list(row_indices)
+            )
+
+            shard_chunk = shard_chunk[shard_mask]
+
+            self.number_of_shard_rows += len(shard_chunk)
+
+            if len(shard_chunk) > 0:
+                yield shard_chunk
+
+            if self.sharding_mode == "row_range" and row_index >= end_row_index:
+                break
+
+        if number_of_rows is not None:
+            self.number_of_input_rows = number_of_rows
+
+    def write_manifest_file(
+            self,
+            output_file_path: str,
+            number_of_written_rows: Optional[int] = None,
+            number_of_remainder_rows: int = 0,
+            **kwargs
+    ) -> None:
+        """
+        Write the manifest file of the shard beside the shard output file.
+
+        :parameter output_file_path: The path to the shard output file.
+        :parameter number_of_written_rows: The number of shard rows that have been written to the shard output file. The
+            value `None` indicates that all of the shard rows have been written.
+        :parameter number_of_remainder_rows: The number of shard rows that have been written to the remainder file of
+            the time budget instead of the shard output file.
+        :parameter kwargs: The additional information that should be recorded in the manifest file.
+        """
+
+        with open(get_shard_manifest_file_path(output_file_path), "w") as file_handle:
+            dump(
+                obj={
+                    "number_of_shards": self.number_of_shards,
+                    "shard_index": self.shard_index,
+                    "sharding_mode": self.sharding_mode,
+                    "number_of_input_rows": self.number_of_input_rows,
+                    "number_of_shard_rows": self.number_of_shard_rows,
+                    "number_of_written_rows": (
+                        self.number_of_shard_rows - number_of_remainder_rows if number_of_written_rows is None
+                        else number_of_written_rows
+                    ),
+                    "number_of_remainder_rows": number_of_remainder_rows,
+                    **kwargs,
+                },
+                fp=file_handle,
+                indent=4
+            )
+
+
+def get_shard_manifest_file_path(
+        output_file_path: str
+) -> str:
+    """
+    Get the path to the manifest file of a shard output file.
+
+    :parameter output_file_path: The path to the shard output file.
+
+    :returns: The path to the manifest file of the shard output file.
+    """
+
+    return "{output_file_path:s}.shard.json".format(
+        output_file_path=output_file_path
+    )
+
+
+def _read_shard_output_file_chunks(
+        file_path: str,
+        chunk_size: int
+) -> Iterator[DataFrame]:
+    """
+    Read the non-empty chunks of a .csv or .parquet shard output file.
+
+    :parameter file_path: The path to the shard output file.
+    :parameter chunk_size: The number of rows per chunk.
+
+    :returns: The iterator of the chunks of the shard output file.
+    """
+
+    if file_path.endswith(".parquet"):
+        chunks = (
+            record_batch.to_pandas() for record_batch in ParquetFile(
+                source=file_path,
+                memory_map=True
+            ).iter_batches(
+                batch_size=chunk_size
+            )
+        )
+
+    else:
+        chunks = read_csv(
+            filepath_or_buffer=file_path,
+            chunksize=chunk_size,
+            low_memory=False
+        )
+
+    for chunk in chunks:
+        if len(chunk) > 0:
+            yield chunk.reset_index(
+                drop=True
+            )
+
+
+def _validate_shard_manifests(
+        shard_output_file_paths: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    Validate the completeness and consistency of the shard output files based on their manifest files.
+
+    :parameter shard_output_file_paths: The paths to the shard output files.
+
+    :returns: The manifests of the shard output files.
+    """
+
+    shard_manifests = list()
+
+    for shard_output_file_path in shard_output_file_paths:
+        with open(get_shard_manifest_file_path(shard_output_file_path), "r") as file_handle:
+            shard_manifests.append(load(file_handle))
+
+    for manifest_key in ["number_of_shards", "sharding_mode", "number_of_input_rows", ]:
+        manifest_values = {shard_manifest[manifest_key] for shard_manifest in shard_manifests}
+
+        if len(manifest_values) != 1:
+            raise ValueError(
+                (
+                    "The shard output files are inconsistent with respect to the '{manifest_key:s}' value: {values}."
+                ).format(
+                    manifest_key=manifest_key,
+                    values=sorted(manifest_values, key=str)
+                )
+            )
+
+    number_of_shards = shard_manifests[0]["number_of_shards"]
+
+    shard_indices = sorted(shard_manifest["shard_index"] for shard_manifest in shard_manifests)
+
+    if shard_indices != list(range(number_of_shards)):
+        raise ValueError(
+            "The shard output files are incomplete. The expected shard indices are 0 to {last_shard_index:d}, but the "
+            "found shard indices are {shard_indices}.".format(
+                last_shard_index=number_of_shards - 1,
+                shard_indices=shard_indices
+            )
+        )
+
+    if sum(shard_manifest["number_of_shard_rows"] for shard_manifest in shard_manifests) != (
+        shard_manifests[0]["number_of_input_rows"]
+    ):
+        raise ValueError("The number of shard rows does not match the number of input file rows.")
+
+    for shard_output_file_path, shard_manifest in zip(shard_output_file_paths, shard_manifests):
+        number_of_written_rows = shard_manifest.get("number_of_written_rows", shard_manifest["number_of_shard_rows"])
+        number_of_remainder_rows = shard_manifest.get("number_of_remainder_rows", 0)
+
+        if number_of_written_rows + number_of_remainder_rows != shard_manifest["number_of_shard_rows"]:
+            raise ValueError(
+                (
+                    "The number of written and remainder rows of the shard output file '{file_path:s}' does not match "
+                    "the number of shard rows."
+                ).format(
+                    file_path=shard_output_file_path
+                )
+            )
+
+        if number_of_remainder_rows > 0:
+            raise ValueError(
+                (
+                    "The shard output file '{file_path:s}' is incomplete because {number_of_remainder_rows:d} shard "
+                    "row(s) have been written to the remainder file of the time budget. The remainder rows should be "
+                    "mapped before the shard output files are merged."
+                ).format(
+                    file_path=shard_output_file_path,
+                    number_of_remainder_rows=number_of_remainder_rows
+                )
+            )
+
+    return shard_manifests
+
+
+def _merge_shard_output_file_chunks(
+        shard_output_file_paths: Sequence[str],
+        chunk_size: int,
+        skipped_row_ranges: Sequence[Tuple[int, int]] = ()
+) -> Iterator[DataFrame]:
+    """
+    Merge the chunks of the shard output files in the original row order. Only the current chunk of each shard output
+    file is kept in memory.
+
+    :parameter shard_output_file_paths: The paths to the shard output files, each sorted by the original row index.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter skipped_row_ranges: The start and end row indices of the row ranges that are expected to be missing
+        from the shard output files.
+
+    :returns: The iterator of the merged chunks without the original row index column.
+    """
+
+    shard_chunk_iterators = [
+        _read_shard_output_file_chunks(
+            file_path=shard_output_file_path,
+            chunk_size=chunk_size
+        ) for shard_output_file_path in shard_output_file_paths
+    ]
+
+    shard_chunks = [next(shard_chunk_iterator, None) for shard_chunk_iterator in shard_chunk_iterators]
+
+    skipped_row_range_ends = {
+        start_row_index: end_row_index for start_row_index, end_row_index in skipped_row_ranges
+    }
+
+    expected_row_index = skipped_row_range_ends.get(0, 0)
+
+    while any(shard_chunk is not None for shard_chunk in shard_chunks):
+        row_index_watermark = min(
+            shard_chunk[ROW_INDEX_COLUMN_NAME].iloc[-1] for shard_chunk in shard_chunks if shard_chunk is not None
+        )
+
+        merged_chunk_parts = list()
+
+        for shard_chunk_index, shard_chunk in enumerate(shard_chunks):
+            if shard_chunk is None:
+                continue
+
+            is_merged = shard_chunk[ROW_INDEX_COLUMN_NAME] <= row_index_watermark
+
+            merged_chunk_parts.append(shard_chunk[is_merged])
+
+            shard_chunks[shard_chunk_index] = (
+                shard_chunk[~is_merged].reset_index(
+                    drop=True
+                ) if not is_merged.all() else next(shard_chunk_iterators[shard_chunk_index], None)
+            )
+
+        merged_chunk = concat(
+            objs=merged_chunk_parts,
+            axis=0
+        ).sort_values(
+            by=ROW_INDEX_COLUMN_NAME,
+            kind="stable"
+        )
+
+        for row_index in merged_chunk[ROW_INDEX_COLUMN_NAME].tolist():
+            if row_index != expected_row_index:
+                raise ValueError(
+                    "The shard output files do not contain a contiguous sequence of row indices after the row index "
+                    "{row_index:d}.".format(
+                        row_index=expected_row_index
+                    )
+                )
+
+            expected_row_index = row_index + 1
+
+            while expected_row_index in skipped_row_range_ends:
+                expected_row_index = skipped_row_range_ends[expected_row_index]
+
+        yield merged_chunk.drop(
+            columns=[ROW_INDEX_COLUMN_NAME, ]
+        ).reset_index(
+            drop=True
+        )
+
+
+def _get_merged_output_file_schema(
+        output_file_paths: Sequence[str]
+) -> Schema:
+    """
+    Get the union schema of the .parquet output files without the original row index column. The columns are ordered
+    by their first occurrence. The data type of a column is the first one that is not null, or the known data type of
+    the output column if the column only contains the null values.
+
+    :parameter output_file_paths: The paths to the .parquet output files.
+
+    :returns: The union schema of the .parquet output files.
+    """
+
+    column_data_types = dict()
+
+    for output_file_path in output_file_paths:
+        for field in ParquetFile(
+            source=output_file_path
+        ).schema_arrow:
+            if field.name == ROW_INDEX_COLUMN_NAME:
+                continue
+
+            if column_data_types.get(field.name, null()) == null():
+                column_data_types[field.name] = field.type
+
+    return schema([
+        (
+            column_name,
+            OUTPUT_COLUMN_ARROW_DATA_TYPES.get(column_name, column_data_type) if column_data_type == null()
+            else column_data_type,
+        ) for column_name, column_data_type in column_data_types.items()
+    ])
+
+
+def _get_merged_output_file_column_names(
+        output_file_paths: Sequence[str]
+) -> List[str]:
+    """
+    Get the union of the column names of the .csv output files without the original row index column. The columns are
+    ordered by their first occurrence.
+
+    :parameter output_file_paths: The paths to the .csv output files.
+
+    :returns: The union of the column names of the .csv output files.
+    """
+
+    column_names = dict()
+
+    for output_file_path in output_file_paths:
+        for column_name in read_csv(
+            filepath_or_buffer=output_file_path,
+            nrows=0
+        ).columns:
+            if column_name != ROW_INDEX_COLUMN_NAME:
+                column_names[column_name] = None
+
+    return list(column_names)
+
+
+def merge_row_indexed_output_files(
+        output_file_paths: Sequence[str],
+        merged_output_file_path: str,
+        chunk_size: int = 100000,
+        skipped_row_ranges: Sequence[Tuple[int, int]] = ()
+) -> int:
+    """
+    Merge the output files that contain the original row index column into a single .csv or .parquet output file in
+    the original row order.
+
+    :parameter output_file_paths: The paths to the non-empty output files, each sorted by the original row index. The
+        output files should be of the same type as the merged output file. The columns of the output files are aligned
+        to their union, and the missing columns are filled with the null values.
+    :parameter merged_output_file_path: The path to the merged output file.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter skipped_row_ranges: The start and end row indices of the row ranges that are expected to be missing
+        from the output files, for example, the row ranges of the failed work queue chunks.
+
+    :returns: The number of merged rows.
+    """
+
+    is_parquet_file = merged_output_file_path.endswith(".parquet")
+
+    for output_file_path in output_file_paths:
+        if output_file_path.endswith(".parquet") != is_parquet_file:
+            raise ValueError(
+                (
+                    "The type of the output file '{file_path:s}' does not match the type of the merged output file "
+                    "'{merged_file_path:s}'."
+                ).format(
+                    file_path=output_file_path,
+                    merged_file_path=merged_output_file_path
+                )
+            )
+
+    merged_chunks = _merge_shard_output_file_chunks(
+        shard_output_file_paths=output_file_paths,
+        chunk_size=chunk_size,
+        skipped_row_ranges=skipped_row_ranges
+    )
+
+    number_of_rows = 0
+
+    if is_parquet_file and len(output_file_paths) > 0:
+        parquet_schema = _get_merged_output_file_schema(
+            output_file_paths=output_file_paths
+        )
+
+        with ParquetWriter(
+            where=merged_output_file_path,
+            schema=parquet_schema
+        ) as parquet_writer:
+            for merged_chunk in merged_chunks:
+                parquet_writer.write_table(
+                    table=Table.from_pandas(
+                        df=merged_chunk.reindex(
+                            columns=parquet_schema.names
+                        ),
+                        schema=parquet_schema,
+                        preserve_index=False
+                    )
+                )
+
+                number_of_rows += len(merged_chunk)
+
+    else:
+        column_names = _get_merged_output_file_column_names(
+            output_file_paths=output_file_paths
+        )
+
+        for merged_chunk in merged_chunks:
+            merged_chunk.reindex(
+                columns=column_names
+            ).to_csv(
+                path_or_buf=merged_output_file_path,
+                mode="w" if number_of_rows == 0 else "a",
+                header=number_of_rows == 0,
+                index=False
+            )
+
+            number_of_rows += len(merged_chunk)
+
+    return number_of_rows
+
+
+def merge_shard_output_files(
+        shard_output_file_paths: Sequence[str],
+        output_file_path: str,
+        chunk_size: int = 100000
+) -> int:
+    """
+    Validate the completeness of the shard output files and merge them into a single .csv or .parquet output file in
+    the original row order.
+
+    :parameter shard_output_file_paths: The paths to the shard output files.
+    :parameter output_file_path: The path to the merged output file.
+    :parameter chunk_size: The number of rows per chunk.
+
+    :returns: The number of merged rows.
+    """
+
+    shard_manifests = _validate_shard_manifests(
+        shard_output_file_paths=shard_output_file_paths
+    )
+
+    number_of_rows = merge_row_indexed_output_files(
+        output_file_paths=[
+            shard_output_file_path for shard_manifest, shard_output_file_path in sorted(
+                zip(shard_manifests, shard_output_file_paths),
+                key=lambda shard: shard[0]["shard_index"]
+            ) if shard_manifest.get("number_of_written_rows", shard_manifest["number_of_shard_rows"]) > 0
+        ],
+        merged_output_file_path=output_file_path,
+        chunk_size=chunk_size
+    )
+
+    if number_of_rows != sum(
+        shard_manifest.get("number_of_written_rows", shard_manifest["number_of_shard_rows"])
+        for shard_manifest in shard_manifests
+    ):
+        raise ValueError("The number of merged rows does not match the number of written shard output file rows.")
+
+    return number_of_rows
+
+
+def get_number_of_input_file_rows(
+        reaction_smiles_column_name: str,
+        input_csv_file_path: Optional[str] = None,
+        input_parquet_file_path: Optional[str] = None,
+        input_line_file_path: Optional[str] = None,
+        input_reaction_file_path: Optional[str] = None,
+        chunk_size: int = 100000
+) -> int:
+    """
+    Get the number of input file rows without loading the input file into memory.
+
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the input file.
+    :parameter input_csv_file_path: The path to the input .csv file.
+    :parameter input_parquet_file_path: The path to the input .parquet file.
+    :parameter input_line_file_path: The path to the input newline-delimited chemical reaction SMILES file.
+    :parameter input_reaction_file_path: The path to the input RDF, RXN, .smi, or .rsmi file.
+    :parameter chunk_size: The number of rows per chunk.
+
+    :returns: The number of input file rows.
+    """
+
+    if input_reaction_file_path is not None:
+        return sum(
+            len(input_chunk) for input_chunk in read_reaction_record_file_chunks(
+                file_path=input_reaction_file_path,
+                reaction_smiles_column_name=reaction_smiles_column_name,
+                chunk_size=chunk_size,
+                read_rxn_blocks=True
+            )
+        )
+
+    if input_line_file_path is not None:
+        with ReactionSmilesLineFile(
+            file_path=input_line_file_path
+        ) as reaction_smiles_line_file:
+            return len(reaction_smiles_line_file)
+
+    if input_parquet_file_path is not None:
+        return ParquetFile(
+            source=input_parquet_file_path
+        ).metadata.num_rows
+
+    return sum(
+        len(input_chunk) for input_chunk in read_csv(
+            filepath_or_buffer=input_csv_file_path,
+            usecols=[reaction_smiles_column_name, ],
+            chunksize=chunk_size,
+            low_memory=False
+        )
+    )
@@ -0,0 +1,364 @@
+""" The ``atom_to_atom_mapping.utility`` package ``time_budget`` module. """
+
+from itertools import chain
+from logging import Logger
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+from pandas import DataFrame
+
+from pyarrow import Table
+from pyarrow.parquet import ParquetWriter
+
+from atom_to_atom_mapping.utility.sharding import ROW_INDEX_COLUMN_NAME
+
+
+def write_remainder_file(
+        file_path: str,
+        chunks: Iterable[DataFrame]
+) -> int:
+    """
+    Write the chunks of the remaining input rows to a .csv or .parquet remainder file, based on the file extension.
+
+    :parameter file_path: The path to the remainder file.
+    :parameter chunks: The chunks of the remaining input rows.
+
+    :returns: The number of written rows.
+    """
+
+    parquet_writer = None
+
+    number_of_rows = 0
+
+    try:
+        for chunk in chunks:
+            if file_path.endswith(".parquet"):
+                table = Table.from_pandas(
+                    df=chunk,
+                    preserve_index=False
+                )
+
+                if parquet_writer is None:
+                    parquet_writer = ParquetWriter(
+                        where=file_path,
+                        schema=table.schema.remove_metadata()
+                    )
+
+                parquet_writer.write_table(
+                    table=table.cast(
+                        target_schema=parquet_writer.schema
+                    )
+                )
+
+            else:
+                chunk.to_csv(
+                    path_or_buf=file_path,
+                    mode="w" if number_of_rows == 0 else "a",
+                    header=number_of_rows == 0,
+                    index=False
+                )
+
+            number_of_rows += len(chunk)
+
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    return number_of_rows
+
+
+class TimeBudget:
+    """
+    The total time budget of a run, which tracks the throughput of the run as it goes to predict whether the next
+    chunk of the input rows can be completed before the deadline.
+    """
+
+    def __init__(
+            self,
+            time_budget_in_s: float,
+            safety_factor: float = 1.5
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter time_budget_in_s: The total time budget of the run in seconds, which starts with the construction of
+            the instance.
+        :parameter safety_factor: The factor by which the predicted time of the next chunk is multiplied before it is
+            compared to the remaining time budget.
+        """
+
+        self.time_budget_in_s = time_budget_in_s
+        self.safety_factor = safety_factor
+
+        self._start_time = monotonic()
+
+        self.number_of_processed_rows = 0
+        self.number_of_remaining_rows = 0
+        self.processing_time_in_s = 0.0
+
+    def get_elapsed_time_in_s(
+            self
+    ) -> float:
+        """
+        Get the elapsed time of the run.
+
+        :returns: The elapsed time of the run in seconds.
+        """
+
+        return monotonic() - self._start_time
+
+    def get_remaining_time_in_s(
+            self
+    ) -> float:
+        """
+        Get the remaining time budget of the run.
+
+        :returns: The remaining time budget of the run in seconds.
+        """
+
+        return max(0.0, self.time_budget_in_s - self.get_elapsed_time_in_s())
+
+    def is_expired(
+            self
+    ) -> bool:
+        """
+        Check whether the time budget of the run has expired.
+
+        :returns: The indicator of whether the time budget of the run has expired.
+        """
+
+        return self.get_remaining_time_in_s() == 0.0
+
+    def get_throughput(
+            self
+    ) -> Optional[float]:
+        """
+        Get the throughput of the run.
+
+        :returns: The number of processed rows per second. The value `None` indicates that no rows have been processed.
+        """
+
+        if self.number_of_processed_rows == 0 or self.processing_time_in_s == 0.0:
+            return None
+
+        return self.number_of_processed_rows / self.processing_time_in_s
+
+    def record_progress(
+            self,
+            number_of_rows: int,
+            processing_time_in_s: float
+    ) -> None:
+        """
+        Record the progress of the run.
+
+        :parameter number_of_rows: The number of processed rows.
+        :parameter processing_time_in_s: The time in seconds in which the rows have been processed.
+        """
+
+        self.number_of_processed_rows += number_of_rows
+        self.processing_time_in_s += processing_time_in_s
+
+    def can_process(
+            self,
+            number_of_rows: int
+    ) -> bool:
+        """
+        Predict whether a number of rows can be processed within the remaining time budget based on the throughput of
+        the run. Before any rows have been processed, the rows are considered processable unless the time budget has
+        expired.
+
+        :parameter number_of_rows: The number of rows.
+
+        :returns: The indicator of whether the rows can be processed within the remaining time budget.
+        """
+
+        if self.is_expired():
+            return False
+
+        throughput = self.get_throughput()
+
+        if throughput is None:
+            return True
+
+        return self.safety_factor * number_of_rows / throughput <= self.get_remaining_time_in_s()
+
+    def track_processing_time(
+            self,
+            function: Callable[[Sequence[str]], Any]
+    ) -> Callable[[Sequence[str]], Any]:
+        """
+        Wrap a function that processes a chunk of the input rows, so that the progress of the run is recorded from its
+        processing time. This is required when the chunks are processed in a pipeline, in which the time until the
+        next chunk is requested reflects only the waiting time of the pipeline queue.
+
+        :parameter function: The function that processes the values of a chunk of the input rows.
+
+        :returns: The wrapped function.
+        """
+
+        def process_chunk(
+                values: Sequence[str]
+        ) -> Any:
+            """
+            Process the values of a chunk of the input rows and record the progress of the run.
+
+            :parameter values: The values of the chunk of the input rows.
+
+            :returns: The output of the function.
+            """
+
+            processing_start_time = monotonic()
+
+            output = function(values)
+
+            self.record_progress(
+                number_of_rows=len(values),
+                processing_time_in_s=monotonic() - processing_start_time
+            )
+
+            return output
+
+        return process_chunk
+
+    def get_timeout_period_in_ms(
+            self,
+            timeout_period_in_ms: int,
+            number_of_reactions: int,
+            number_of_processes: int = 1,
+            minimum_timeout_period_in_ms: int = 100
+    ) -> int:
+        """
+        Get the timeout period of the atom-to-atom mapping of a chemical reaction, which is limited so that the
+        chemical reactions can be mapped within the remaining time budget even if all of them time out.
+
+        :parameter timeout_period_in_ms: The requested timeout period in milliseconds.
+        :parameter number_of_reactions: The number of chemical reactions.
+        :parameter number_of_processes: The number of processes that map the chemical reactions.
+        :parameter minimum_timeout_period_in_ms: The minimum timeout period in milliseconds.
+
+        :returns: The timeout period in milliseconds.
+        """
+
+        return min(timeout_period_in_ms, max(
+            minimum_timeout_period_in_ms,
+            int(1000 * self.get_remaining_time_in_s() * max(1, number_of_processes) / max(1, number_of_reactions))
+        ))
+
+    def iterate_chunks(
+            self,
+            chunks: Iterable[DataFrame],
+            remainder_file_path: str,
+            first_row_index: int = 0,
+            measure_processing_time: bool = True,
+            logger: Optional[Logger] = None
+    ) -> Iterator[DataFrame]:
+        """
+        Iterate over the chunks of the input rows while the next chunk, together with the yielded chunks that have not
+        been processed yet, is predicted to be processed within the remaining time budget. Once the time budget does not
+        suffice, the remaining chunks are written to the remainder file together with the original row index column, so
+        that they can be processed by the next run. The number of remaining rows is accumulated across the calls, so
+        that the same time budget can be shared by several input files.
+
+        :parameter chunks: The chunks of the input rows.
+        :parameter remainder_file_path: The path to the .csv or .parquet remainder file.
+        :parameter first_row_index: The original row index of the first row of the first chunk, if the chunks do not
+            contain the original row index column.
+        :parameter measure_processing_time: The indicator of whether the processing time of a chunk should be measured
+            until the next chunk is requested. Otherwise, the progress should be recorded by the consumer of the chunks,
+            for example, using the `track_processing_time` method.
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+
+        :returns: The iterator of the chunks of the input rows that fit within the time budget.
+        """
+
+        chunks = iter(chunks)
+
+        row_index = first_row_index
+
+        number_of_yielded_rows = self.number_of_processed_rows
+
+        for chunk in chunks:
+            if not self.can_process(len(chunk) + max(0, number_of_yielded_rows - self.number_of_processed_rows)):
+                if logger is not None:
+                    logger.warning(
+                        msg=(
+                            "The remaining time budget of {remaining_time_in_s:.1f} s does not suffice for the next "
+                            "chunk. The remaining input rows are written to the remainder file '{file_path:s}'."
+                        ).format(
+                            remaining_time_in_s=self.get_remaining_time_in_s(),
+                            file_path=remainder_file_path
+                        )
+                    )
+
+                self.number_of_remaining_rows += write_remainder_file(
+                    file_path=remainder_file_path,
+                    chunks=self._get_remainder_chunks(
+                        chunks=chain([chunk, ], chunks),
+                        first_row_index=row_index
+                    )
+                )
+
+                return
+
+            processing_start_time = monotonic()
+
+            number_of_yielded_rows += len(chunk)
+
+            yield chunk
+
+            if measure_processing_time:
+                self.record_progress(
+                    number_of_rows=len(chunk),
+                    processing_time_in_s=monotonic() - processing_start_time
+                )
+
+            row_index += len(chunk)
+
+    @staticmethod
+    def _get_remainder_chunks(
+            chunks: Iterable[DataFrame],
+            first_row_index: int
+    ) -> Iterator[DataFrame]:
+        """
+        Get the remainder chunks by adding the original row index column to the chunks that do not contain it.
+
+        :parameter chunks: The remaining chunks.
+        :parameter first_row_index: The original row index of the first row of the first remaining chunk.
+
+        :returns: The iterator of the remainder chunks.
+        """
+
+        row_index = first_row_index
+
+        for chunk in chunks:
+            if ROW_INDEX_COLUMN_NAME not in chunk.columns:
+                chunk = chunk.reset_index(
+                    drop=True
+                )
+
+                chunk.insert(
+                    loc=0,
+                    column=ROW_INDEX_COLUMN_NAME,
+                    value=list(range(row_index, row_index + len(chunk)))
+                )
+
+            row_index += len(chunk)
+
+            yield chunk
+
+    def get_summary(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the summary of the time budget.
+
+        :returns: The time budget, the elapsed time, the number of processed and remaining rows, and the throughput.
+        """
+
+        return {
+            "time_budget_in_s": self.time_budget_in_s,
+            "elapsed_time_in_s": self.get_elapsed_time_in_s(),
+            "number_of_processed_rows": self.number_of_processed_rows,
+            "number_of_remaining_rows": self.number_of_remaining_rows,
+            "throughput": self.get_throughput() or 0.0,
+        }
@@ -0,0 +1,753 @@
+""" The ``atom_to_atom_mapping.utility`` package ``work_queue`` module. """
+
+from json import dump
+from logging import Logger
+from os import getpid, makedirs, replace
+from os.path import join
+from socket import gethostname
+from sqlite3 import Connection, connect
+from threading import Event, Thread
+from time import sleep, time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pandas import DataFrame
+
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+from atom_to_atom_mapping.utility.reaction_smiles_file import (
+    read_csv_file_row_range,
+    read_parquet_file_row_range,
+    write_csv_file_chunks,
+    write_parquet_file_chunks,
+)
+from atom_to_atom_mapping.utility.reaction_smiles_line_file import ReactionSmilesLineFile
+from atom_to_atom_mapping.utility.sharding import (
+    ROW_INDEX_COLUMN_NAME,
+    get_number_of_input_file_rows,
+    merge_row_indexed_output_files,
+)
+from atom_to_atom_mapping.utility.time_budget import TimeBudget
+
+
+class ReactionSmilesWorkQueue:
+    """
+    The file-based chemical reaction SMILES work queue class. The input file rows are split into row range chunks that
+    are leased to the workers through an SQLite database. The leases of the workers that stop sending heartbeats expire
+    and are reclaimed by the other workers. On network filesystems, the database file requires working POSIX file locks
+    and the clocks of the hosts should be synchronized.
+    """
+
+    def __init__(
+            self,
+            database_file_path: str,
+            lease_duration_in_s: float = 600.0,
+            maximum_number_of_attempts: int = 3,
+            worker_id: Optional[str] = None
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter database_file_path: The path to the SQLite database file of the work queue.
+        :parameter lease_duration_in_s: The duration of a chunk lease in seconds.
+        :parameter maximum_number_of_attempts: The maximum number of times a chunk is leased before it is considered
+            failed.
+        :parameter worker_id: The identifier of the worker. The value `None` indicates that the host name and process
+            identifier should be utilized.
+        """
+
+        self.database_file_path = database_file_path
+        self.lease_duration_in_s = lease_duration_in_s
+        self.maximum_number_of_attempts = maximum_number_of_attempts
+
+        self.worker_id = "{host_name:s}:{process_id:d}".format(
+            host_name=gethostname(),
+            process_id=getpid()
+        ) if worker_id is None else worker_id
+
+    def _connect(
+            self
+    ) -> Connection:
+        """
+        Connect to the SQLite database of the work queue.
+
+        :returns: The connection to the SQLite database of the work queue.
+        """
+
+        return connect(
+            database=self.database_file_path,
+            timeout=60.0,
+            isolation_level=None
+        )
+
+    def is_initialized(
+            self
+    ) -> bool:
+        """
+        Check whether the chunks of the work queue have been initialized.
+
+        :returns: The indicator of whether the chunks of the work queue have been initialized.
+        """
+
+        connection = self._connect()
+
+        try:
+            return connection.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'chunks'"
+            ).fetchone()[0] == 1
+
+        finally:
+            connection.close()
+
+    def initialize(
+            self,
+            number_of_rows: int,
+            chunk_size: int
+    ) -> None:
+        """
+        Initialize the chunks of the work queue. If the work queue has already been initialized by another worker with
+        the same parameters, the existing chunks are kept.
+
+        :parameter number_of_rows: The number of input file rows.
+        :parameter chunk_size: The number of rows per chunk.
+        """
+
+        connection = self._connect()
+
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "chunk_index INTEGER PRIMARY KEY, "
+                "start_row_index INTEGER NOT NULL, "
+                "end_row_index INTEGER NOT NULL, "
+                "status TEXT NOT NULL DEFAULT 'pending', "
+                "worker_id TEXT, "
+                "lease_expiration_time REAL, "
+                "number_of_attempts INTEGER NOT NULL DEFAULT 0"
+                ")"
+            )
+
+            metadata = dict(connection.execute("SELECT key, value FROM metadata").fetchall())
+
+            if len(metadata) == 0:
+                connection.executemany(
+                    "INSERT INTO metadata (key, value) VALUES (?, ?)",
+                    [
+                        ("number_of_rows", number_of_rows),
+                        ("chunk_size", chunk_size),
+                        ("is_merged", 0),
+                    ]
+                )
+
+                connection.executemany(
+                    "INSERT INTO chunks (chunk_index, start_row_index, end_row_index) VALUES (?, ?, ?)",
+                    [
+                        (
+                            chunk_index,
+                            start_row_index,
+                            min(start_row_index + chunk_size, number_of_rows),
+                        ) for chunk_index, start_row_index in enumerate(range(0, number_of_rows, chunk_size))
+                    ]
+                )
+
+            elif metadata["number_of_rows"] != number_of_rows or metadata["chunk_size"] != chunk_size:
+                raise ValueError(
+                    "The work queue '{database_file_path:s}' has been initialized with {initialized_number_of_rows:d} "
+                    "rows and a chunk size of {initialized_chunk_size:d}, which is inconsistent with "
+                    "{number_of_rows:d} rows and a chunk size of {chunk_size:d}.".format(
+                        database_file_path=self.database_file_path,
+                        initialized_number_of_rows=metadata["number_of_rows"],
+                        initialized_chunk_size=metadata["chunk_size"],
+                        number_of_rows=number_of_rows,
+                        chunk_size=chunk_size
+                    )
+                )
+
+            connection.execute("COMMIT")
+
+        except Exception:
+            connection.execute("ROLLBACK")
+
+            raise
+
+        finally:
+            connection.close()
+
+    def claim(
+            self
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Claim the lease of the next pending chunk or of a chunk whose lease has expired.
+
+        :returns: The index, start row index, and end row index of the claimed chunk. The value `None` indicates that
+            there are no claimable chunks at the moment.
+        """
+
+        connection = self._connect()
+
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+
+            current_time = time()
+
+            chunk = connection.execute(
+                "SELECT chunk_index, start_row_index, end_row_index FROM chunks "
+                "WHERE (status = 'pending' OR (status = 'leased' AND lease_expiration_time < ?)) "
+                "AND number_of_attempts < ? "
+                "ORDER BY chunk_index LIMIT 1",
+                (current_time, self.maximum_number_of_attempts, )
+            ).fetchone()
+
+            if chunk is not None:
+                connection.execute(
+                    "UPDATE chunks SET status = 'leased', worker_id = ?, lease_expiration_time = ?, "
+                    "number_of_attempts = number_of_attempts + 1 WHERE chunk_index = ?",
+                    (self.worker_id, current_time + self.lease_duration_in_s, chunk[0], )
+                )
+
+            connection.execute("COMMIT")
+
+            return chunk
+
+        except Exception:
+            connection.execute("ROLLBACK")
+
+            raise
+
+        finally:
+            connection.close()
+
+    def _update_leased_chunk(
+            self,
+            chunk_index: int,
+            status: str,
+            lease_expiration_time: Optional[float]
+    ) -> bool:
+        """
+        Update a chunk that is leased by the worker.
+
+        :parameter chunk_index: The index of the chunk.
+        :parameter status: The new status of the chunk.
+        :parameter lease_expiration_time: The new lease expiration time of the chunk.
+
+        :returns: The indicator of whether the chunk is still leased by the worker and has been updated.
+        """
+
+        connection = self._connect()
+
+        try:
+            return connection.execute(
+                "UPDATE chunks SET status = ?, lease_expiration_time = ? "
+                "WHERE chunk_index = ? AND status = 'leased' AND worker_id = ?",
+                (status, lease_expiration_time, chunk_index, self.worker_id, )
+            ).rowcount == 1
+
+        finally:
+            connection.close()
+
+    def heartbeat(
+            self,
+            chunk_index: int
+    ) -> bool:
+        """
+        Extend the lease of a chunk.
+
+        :parameter chunk_index: The index of the chunk.
+
+        :returns: The indicator of whether the chunk is still leased by the worker.
+        """
+
+        return self._update_leased_chunk(
+            chunk_index=chunk_index,
+            status="leased",
+            lease_expiration_time=time() + self.lease_duration_in_s
+        )
+
+    def complete(
+            self,
+            chunk_index: int
+    ) -> bool:
+        """
+        Mark a chunk as completed.
+
+        :parameter chunk_index: The index of the chunk.
+
+        :returns: The indicator of whether the chunk has been marked as completed by the worker.
+        """
+
+        return self._update_leased_chunk(
+            chunk_index=chunk_index,
+            status="completed",
+            lease_expiration_time=None
+        )
+
+    def release(
+            self,
+            chunk_index: int
+    ) -> bool:
+        """
+        Release the lease of a chunk so that it can be claimed again.
+
+        :parameter chunk_index: The index of the chunk.
+
+        :returns: The indicator of whether the chunk has been released by the worker.
+        """
+
+        return self._update_leased_chunk(
+            chunk_index=chunk_index,
+            status="pending",
+            lease_expiration_time=None
+        )
+
+    def get_progress(
+            self
+    ) -> Dict[str, int]:
+        """
+        Get the progress of the work queue.
+
+        :returns: The number of chunks per status. The chunks that have reached the maximum number of attempts without
+            being completed are counted as `failed`.
+        """
+
+        connection = self._connect()
+
+        try:
+            progress = {
+                "pending": 0,
+                "leased": 0,
+                "completed": 0,
+                "failed": 0,
+            }
+
+            for status, number_of_chunks in connection.execute(
+                "SELECT CASE WHEN status != 'completed' AND number_of_attempts >= ? AND "
+                "(status = 'pending' OR lease_expiration_time < ?) THEN 'failed' ELSE status END, COUNT(*) "
+                "FROM chunks GROUP BY 1",
+                (self.maximum_number_of_attempts, time(), )
+            ).fetchall():
+                progress[status] = number_of_chunks
+
+            return progress
+
+        finally:
+            connection.close()
+
+    def get_completed_chunk_indices(
+            self
+    ) -> List[int]:
+        """
+        Get the indices of the completed chunks.
+
+        :returns: The sorted indices of the completed chunks.
+        """
+
+        connection = self._connect()
+
+        try:
+            return [
+                chunk_index for chunk_index, in connection.execute(
+                    "SELECT chunk_index FROM chunks WHERE status = 'completed' ORDER BY chunk_index"
+                ).fetchall()
+            ]
+
+        finally:
+            connection.close()
+
+    def get_failed_chunks(
+            self
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Get the chunks that have reached the maximum number of attempts without being completed.
+
+        :returns: The sorted indices, start row indices, and end row indices of the failed chunks.
+        """
+
+        connection = self._connect()
+
+        try:
+            return connection.execute(
+                "SELECT chunk_index, start_row_index, end_row_index FROM chunks "
+                "WHERE status != 'completed' AND number_of_attempts >= ? AND "
+                "(status = 'pending' OR lease_expiration_time < ?) ORDER BY chunk_index",
+                (self.maximum_number_of_attempts, time(), )
+            ).fetchall()
+
+        finally:
+            connection.close()
+
+    def claim_merge(
+            self
+    ) -> bool:
+        """
+        Claim the merge of the chunk output files if all of the chunks have been either completed or failed. Only a
+        single worker can claim the merge.
+
+        :returns: The indicator of whether the merge has been claimed by the worker.
+        """
+
+        connection = self._connect()
+
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+
+            is_claimed = connection.execute(
+                "SELECT COUNT(*) FROM chunks WHERE status != 'completed' AND "
+                "(number_of_attempts < ? OR (status = 'leased' AND lease_expiration_time >= ?))",
+                (self.maximum_number_of_attempts, time(), )
+            ).fetchone()[0] == 0 and connection.execute(
+                "UPDATE metadata SET value = 1 WHERE key = 'is_merged' AND value = 0"
+            ).rowcount == 1
+
+            connection.execute("COMMIT")
+
+            return is_claimed
+
+        except Exception:
+            connection.execute("ROLLBACK")
+
+            raise
+
+        finally:
+            connection.close()
+
+
+def get_chunk_output_file_path(
+        output_directory_path: str,
+        chunk_index: int,
+        file_extension: str
+) -> str:
+    """
+    Get the path to the output file of a work queue chunk.
+
+    :parameter output_directory_path: The path to the directory of the chunk output files.
+    :parameter chunk_index: The index of the chunk.
+    :parameter file_extension: The extension of the chunk output file.
+
+    :returns: The path to the output file of the work queue chunk.
+    """
+
+    return join(
+        output_directory_path,
+        "chunk_{chunk_index:09d}{file_extension:s}".format(
+            chunk_index=chunk_index,
+            file_extension=file_extension
+        )
+    )
+
+
+def get_failed_chunk_manifest_file_path(
+        output_file_path: str
+) -> str:
+    """
+    Get the path to the manifest file of the failed work queue chunks of an output file.
+
+    :parameter output_file_path: The path to the output file.
+
+    :returns: The path to the manifest file of the failed work queue chunks.
+    """
+
+    return "{output_file_path:s}.failed_chunks.json".format(
+        output_file_path=output_file_path
+    )
+
+
+def run_work_queue_worker(
+        work_queue: ReactionSmilesWorkQueue,
+        atom_to_atom_mapping_function: Callable[[Sequence[str]], Union[MappingResultBatch, List[Dict[str, Any]]]],
+        reaction_smiles_column_name: str,
+        chunk_size: int,
+        input_csv_file_path: Optional[str] = None,
+        input_parquet_file_path: Optional[str] = None,
+        input_line_file_path: Optional[str] = None,
+        output_csv_file_path: Optional[str] = None,
+        output_parquet_file_path: Optional[str] = None,
+        polling_period_in_s: float = 10.0,
+        time_budget: Optional[TimeBudget] = None,
+        logger: Optional[Logger] = None
+) -> Dict[str, int]:
+    """
+    Run a work queue worker that claims, maps, and completes the chunks of the input file rows until none are left. The
+    worker that observes the completion or failure of all of the chunks merges the completed chunk output files into
+    the output file. The rows of the failed chunks are left out of the output file, and their row ranges are written to
+    the failed chunk manifest file beside the output file.
+
+    :parameter work_queue: The work queue.
+    :parameter atom_to_atom_mapping_function: The atom-to-atom mapping function.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the input file.
+    :parameter chunk_size: The number of rows per chunk.
+    :parameter input_csv_file_path: The path to the input .csv file.
+    :parameter input_parquet_file_path: The path to the input .parquet file.
+    :parameter input_line_file_path: The path to the input newline-delimited chemical reaction SMILES file.
+    :parameter output_csv_file_path: The path to the output .csv file.
+    :parameter output_parquet_file_path: The path to the output .parquet file.
+    :parameter polling_period_in_s: The period in seconds in which the worker checks for expired leases while the other
+        workers are still mapping.
+    :parameter time_budget: The time budget of the worker. If the next chunk is not predicted to be mapped within the
+        remaining time budget, the worker stops cleanly and the pending chunks remain in the work queue for the next
+        run. The value `None` indicates that the worker should run until no chunks are left.
+    :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+
+    :returns: The progress of the work queue after the worker has finished.
+    """
+
+    output_file_path = output_csv_file_path if output_parquet_file_path is None else output_parquet_file_path
+    output_file_extension = ".csv" if output_parquet_file_path is None else ".parquet"
+    output_directory_path = "{output_file_path:s}.chunks".format(
+        output_file_path=output_file_path
+    )
+
+    makedirs(output_directory_path, exist_ok=True)
+
+    if not work_queue.is_initialized():
+        work_queue.initialize(
+            number_of_rows=get_number_of_input_file_rows(
+                reaction_smiles_column_name=reaction_smiles_column_name,
+                input_csv_file_path=input_csv_file_path,
+                input_parquet_file_path=input_parquet_file_path,
+                input_line_file_path=input_line_file_path,
+                chunk_size=chunk_size
+            ),
+            chunk_size=chunk_size
+        )
+
+    reaction_smiles_line_file = None if input_line_file_path is None else ReactionSmilesLineFile(
+        file_path=input_line_file_path
+    )
+
+    try:
+        while True:
+            if time_budget is not None and not time_budget.can_process(chunk_size):
+                if logger is not None:
+                    logger.warning(
+                        msg=(
+                            "The remaining time budget of {remaining_time_in_s:.1f} s does not suffice for the next "
+                            "work queue chunk. The worker has stopped, and the pending chunks remain in the work queue."
+                        ).format(
+                            remaining_time_in_s=time_budget.get_remaining_time_in_s()
+                        )
+                    )
+
+                break
+
+            chunk = work_queue.claim()
+
+            if chunk is None:
+                progress = work_queue.get_progress()
+
+                if progress["pending"] == 0 and progress["leased"] == 0:
+                    break
+
+                sleep(polling_period_in_s)
+
+                continue
+
+            chunk_index, start_row_index, end_row_index = chunk
+
+            chunk_start_time = time()
+
+            heartbeat_stop_event = Event()
+
+            heartbeat_thread = Thread(
+                target=_send_heartbeats,
+                kwargs={
+                    "work_queue": work_queue,
+                    "chunk_index": chunk_index,
+                    "heartbeat_stop_event": heartbeat_stop_event,
+                },
+                daemon=True
+            )
+
+            heartbeat_thread.start()
+
+            try:
+                if reaction_smiles_line_file is not None:
+                    input_dataframe = DataFrame(
+                        data={
+                            reaction_smiles_column_name: reaction_smiles_line_file.get_reaction_smiles_strings(
+                                start_row_index=start_row_index,
+                                end_row_index=end_row_index
+                            ),
+                        }
+                    )
+
+                elif input_parquet_file_path is not None:
+                    input_dataframe = read_parquet_file_row_range(
+                        file_path=input_parquet_file_path,
+                        reaction_smiles_column_name=reaction_smiles_column_name,
+                        start_row_index=start_row_index,
+                        end_row_index=end_row_index
+                    )
+
+                else:
+                    input_dataframe = read_csv_file_row_range(
+                        file_path=input_csv_file_path,
+                        reaction_smiles_column_name=reaction_smiles_column_name,
+                        start_row_index=start_row_index,
+                        end_row_index=end_row_index,
+                        read_reaction_smiles_column_only=output_csv_file_path is None
+                    )
+
+                input_dataframe.insert(
+                    loc=0,
+                    column=ROW_INDEX_COLUMN_NAME,
+                    value=list(range(start_row_index, start_row_index + len(input_dataframe)))
+                )
+
+                output_chunks = [
+                    (
+                        input_dataframe,
+                        atom_to_atom_mapping_function(
+                            input_dataframe[reaction_smiles_column_name].values.tolist()
+                        ),
+                    ),
+                ]
+
+                chunk_output_file_path = get_chunk_output_file_path(
+                    output_directory_path=output_directory_path,
+                    chunk_index=chunk_index,
+                    file_extension=output_file_extension
+                )
+
+                temporary_chunk_output_file_path = "{chunk_output_file_path:s}.{worker_id:s}.tmp".format(
+                    chunk_output_file_path=chunk_output_file_path,
+                    worker_id=work_queue.worker_id.replace(":", "_")
+                )
+
+                if output_parquet_file_path is not None:
+                    write_parquet_file_chunks(
+                        file_path=temporary_chunk_output_file_path,
+                        reaction_smiles_column_name=reaction_smiles_column_name,
+                        chunks=output_chunks,
+                        row_index_column_name=ROW_INDEX_COLUMN_NAME
+                    )
+
+                else:
+                    write_csv_file_chunks(
+                        file_path=temporary_chunk_output_file_path,
+                        chunks=output_chunks
+                    )
+
+                heartbeat_stop_event.set()
+
+                heartbeat_thread.join()
+
+                replace(temporary_chunk_output_file_path, chunk_output_file_path)
+
+                if time_budget is not None:
+                    time_budget.record_progress(
+                        number_of_rows=end_row_index - start_row_index,
+                        processing_time_in_s=time() - chunk_start_time
+                    )
+
+                if not work_queue.complete(
+                    chunk_index=chunk_index
+                ) and logger is not None:
+                    logger.warning(
+                        msg=(
+                            "The lease of the work queue chunk {chunk_index:d} has expired before its completion. The "
+                            "chunk output file of the worker that completes it will be utilized."
+                        ).format(
+                            chunk_index=chunk_index
+                        )
+                    )
+
+            except Exception as exception_handle:
+                if logger is not None:
+                    logger.error(
+                        msg="The mapping of the work queue chunk {chunk_index:d} has been unsuccessful.".format(
+                            chunk_index=chunk_index
+                        )
+                    )
+
+                    logger.debug(
+                        msg=exception_handle,
+                        exc_info=True
+                    )
+
+                work_queue.release(
+                    chunk_index=chunk_index
+                )
+
+            finally:
+                heartbeat_stop_event.set()
+
+                heartbeat_thread.join()
+
+    finally:
+        if reaction_smiles_line_file is not None:
+            reaction_smiles_line_file.close()
+
+    if work_queue.claim_merge():
+        failed_chunks = work_queue.get_failed_chunks()
+
+        merge_row_indexed_output_files(
+            output_file_paths=[
+                get_chunk_output_file_path(
+                    output_directory_path=output_directory_path,
+                    chunk_index=chunk_index,
+                    file_extension=output_file_extension
+                ) for chunk_index in work_queue.get_completed_chunk_indices()
+            ],
+            merged_output_file_path=output_file_path,
+            chunk_size=chunk_size,
+            skipped_row_ranges=[
+                (start_row_index, end_row_index, ) for _, start_row_index, end_row_index in failed_chunks
+            ]
+        )
+
+        if len(failed_chunks) > 0:
+            with open(get_failed_chunk_manifest_file_path(output_file_path), "w") as file_handle:
+                dump(
+                    obj={
+                        "number_of_failed_chunks": len(failed_chunks),
+                        "number_of_failed_rows": sum(
+                            end_row_index - start_row_index for _, start_row_index, end_row_index in failed_chunks
+                        ),
+                        "failed_chunks": [
+                            {
+                                "chunk_index": chunk_index,
+                                "start_row_index": start_row_index,
+                                "end_row_index": end_row_index,
+                            } for chunk_index, start_row_index, end_row_index in failed_chunks
+                        ],
+                    },
+                    fp=file_handle,
+                    indent=4
+                )
+
+        if logger is not None:
+            logger.info(
+                msg=(
+                    "The work queue chunk output files have been merged into the output file '{output_file_path:s}'."
+                ).format(
+                    output_file_path=output_file_path
+                )
+            )
+
+    return work_queue.get_progress()
+
+
+def _send_heartbeats(
+        work_queue: ReactionSmilesWorkQueue,
+        chunk_index: int,
+        heartbeat_stop_event: Event
+) -> None:
+    """
+    Send the heartbeats of a leased chunk until the stop event is set or the lease is lost.
+
+    :parameter work_queue: The work queue.
+    :parameter chunk_index: The index of the chunk.
+    :parameter heartbeat_stop_event: The event that stops the heartbeats.
+    """
+
+    while not heartbeat_stop_event.wait(
+        timeout=work_queue.lease_duration_in_s / 3
+    ):
+        if not work_queue.heartbeat(
+            chunk_index=chunk_index
+        ):
+            break
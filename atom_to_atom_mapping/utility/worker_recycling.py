@@ -0,0 +1,388 @@
+""" The ``atom_to_atom_mapping.utility`` package ``worker_recycling`` module. """
+
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from logging import Logger
+from os import getpid, sysconf
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from atom_to_atom_mapping.utility.cpu_resources import get_cpu_resource_manager
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+
+
+_worker_process_atom_to_atom_mappings: Dict[Tuple[Any, str], Any] = dict()
+
+
+def get_resident_set_size_in_mb() -> float:
+    """
+    Get the resident set size of the current process.
+
+    :returns: The resident set size of the current process in megabytes.
+    """
+
+    try:
+        with open("/proc/self/statm", "r") as file_handle:
+            return int(file_handle.read().split()[1]) * sysconf("SC_PAGE_SIZE") / 1048576
+
+    except (OSError, ValueError, IndexError):
+        from resource import RUSAGE_SELF, getrusage
+
+        return getrusage(RUSAGE_SELF).ru_maxrss / 1024
+
+
+def merge_worker_memory_summaries(
+        worker_memory_summaries: Sequence[Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Merge the worker process memory summaries of several runs.
+
+    :parameter worker_memory_summaries: The worker process memory summaries. The values `None` are skipped.
+
+    :returns: The merged worker process memory summary. The value `None` indicates that no summary has been merged.
+    """
+
+    worker_memory_summaries = [
+        worker_memory_summary for worker_memory_summary in worker_memory_summaries
+        if worker_memory_summary is not None
+    ]
+
+    if len(worker_memory_summaries) == 0:
+        return None
+
+    number_of_tasks = sum(worker_memory_summary["number_of_tasks"] for worker_memory_summary in worker_memory_summaries)
+
+    return {
+        "number_of_tasks": number_of_tasks,
+        "number_of_recycles": sum(
+            worker_memory_summary["number_of_recycles"] for worker_memory_summary in worker_memory_summaries
+        ),
+        "peak_worker_memory_in_mb": max(
+            worker_memory_summary["peak_worker_memory_in_mb"] for worker_memory_summary in worker_memory_summaries
+        ),
+        "average_worker_memory_in_mb": sum(
+            worker_memory_summary["average_worker_memory_in_mb"] * worker_memory_summary["number_of_tasks"]
+            for worker_memory_summary in worker_memory_summaries
+        ) / max(1, number_of_tasks),
+    }
+
+
+def _run_worker_process_task(
+        function: Callable[..., Any],
+        *args,
+        **kwargs
+) -> Tuple[Any, int, float]:
+    """
+    Run a task in a worker process and measure the resident set size of the worker process afterwards.
+
+    :parameter function: The function of the task.
+    :parameter args: The positional arguments of the function.
+    :parameter kwargs: The keyword arguments of the function.
+
+    :returns: The result of the task, the identifier of the worker process, and the resident set size of the worker
+        process in megabytes.
+    """
+
+    return function(*args, **kwargs), getpid(), get_resident_set_size_in_mb()
+
+
+def map_reaction_smiles_strings_in_worker_process(
+        reaction_smiles_strings: Sequence[str],
+        atom_to_atom_mapping_class: Type[Any],
+        atom_to_atom_mapping_arguments: Optional[Dict[str, Any]] = None,
+        **kwargs
+) -> MappingResultBatch:
+    """
+    Map the chemical reaction SMILES strings in a worker process. The atom-to-atom mapping instance is constructed once
+    per worker process and reused until the worker process is recycled.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+    :parameter atom_to_atom_mapping_class: The atom-to-atom mapping class.
+    :parameter atom_to_atom_mapping_arguments: The keyword arguments for the construction of the atom-to-atom mapping
+        instance.
+    :parameter kwargs: The keyword arguments for the adjustment of the `map_reaction_smiles_strings` method.
+
+    :returns: The batch of the mapped chemical reaction SMILES strings.
+    """
+
+    atom_to_atom_mapping_arguments = atom_to_atom_mapping_arguments or dict()
+
+    atom_to_atom_mapping_key = (atom_to_atom_mapping_class, repr(sorted(atom_to_atom_mapping_arguments.items())))
+
+    if atom_to_atom_mapping_key not in _worker_process_atom_to_atom_mappings:
+        _worker_process_atom_to_atom_mappings[atom_to_atom_mapping_key] = atom_to_atom_mapping_class(
+            **atom_to_atom_mapping_arguments
+        )
+
+    return _worker_process_atom_to_atom_mappings[atom_to_atom_mapping_key].map_reaction_smiles_strings(
+        reaction_smiles_strings,
+        **kwargs
+    )
+
+
+class WorkerRecyclingProcessPool:
+    """
+    The process pool whose worker processes are recycled after a number of tasks per worker process or once their
+    resident set size exceeds a threshold. The recycling is graceful: the tasks that are in flight are completed by the
+    retiring worker processes, while the new tasks are submitted to the fresh worker processes.
+    """
+
+    def __init__(
+            self,
+            number_of_processes: int,
+            maximum_number_of_tasks_per_worker: Optional[int] = None,
+            maximum_worker_memory_in_mb: Optional[float] = None,
+            logger: Optional[Logger] = None
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter number_of_processes: The number of worker processes.
+        :parameter maximum_number_of_tasks_per_worker: The number of tasks after which a worker process is recycled. The
+            value `None` indicates that the worker processes should not be recycled based on the number of tasks.
+        :parameter maximum_worker_memory_in_mb: The resident set size in megabytes above which a worker process is
+            recycled. The value `None` indicates that the worker processes should not be recycled based on the resident
+            set size.
+        :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+        """
+
+        self.number_of_processes = number_of_processes
+        self.maximum_number_of_tasks_per_worker = maximum_number_of_tasks_per_worker
+        self.maximum_worker_memory_in_mb = maximum_worker_memory_in_mb
+        self.logger = logger
+
+        self._lock = Lock()
+
+        self._process_pool_executor = self._create_process_pool_executor()
+        self._process_pool_generation = 0
+        self._is_recycling_required = False
+
+        self._number_of_tasks_per_worker = defaultdict(int)
+
+        self._number_of_tasks = 0
+        self._number_of_recycles = 0
+        self._peak_worker_memory_in_mb = 0.0
+        self._total_worker_memory_in_mb = 0.0
+
+    def _create_process_pool_executor(
+            self
+    ) -> ProcessPoolExecutor:
+        """
+        Create the process pool executor of the fresh worker processes.
+
+        :returns: The process pool executor.
+        """
+
+        return get_cpu_resource_manager().create_process_pool_executor(
+            number_of_processes=self.number_of_processes
+        )
+
+    def _complete_task(
+            self,
+            future: Future,
+            worker_future: Future,
+            process_pool_generation: int
+    ) -> None:
+        """
+        Complete a task by unwrapping the result of the worker process and updating the worker process statistics.
+
+        :parameter future: The future of the task that is returned to the caller.
+        :parameter worker_future: The future of the task in the worker process.
+        :parameter process_pool_generation: The generation of the process pool executor to which the task was submitted.
+        """
+
+        try:
+            result, worker_process_identifier, worker_memory_in_mb = worker_future.result()
+
+        except BaseException as exception_handle:
+            future.set_exception(exception_handle)
+
+            return
+
+        with self._lock:
+            self._number_of_tasks += 1
+            self._peak_worker_memory_in_mb = max(self._peak_worker_memory_in_mb, worker_memory_in_mb)
+            self._total_worker_memory_in_mb += worker_memory_in_mb
+
+            if process_pool_generation == self._process_pool_generation:
+                self._number_of_tasks_per_worker[worker_process_identifier] += 1
+
+                if (
+                    self.maximum_number_of_tasks_per_worker is not None and
+                    self._number_of_tasks_per_worker[worker_process_identifier] >=
+                    self.maximum_number_of_tasks_per_worker
+                ) or (
+                    self.maximum_worker_memory_in_mb is not None and
+                    worker_memory_in_mb > self.maximum_worker_memory_in_mb
+                ):
+                    self._is_recycling_required = True
+
+        future.set_result(result)
+
+    def _recycle_worker_processes(
+            self
+    ) -> None:
+        """ Retire the current worker processes after their in-flight tasks and start the fresh worker processes. """
+
+        with self._lock:
+            retiring_process_pool_executor = self._process_pool_executor
+
+            self._process_pool_executor = self._create_process_pool_executor()
+            self._process_pool_generation += 1
+            self._is_recycling_required = False
+
+            self._number_of_tasks_per_worker.clear()
+
+            self._number_of_recycles += 1
+
+        retiring_process_pool_executor.shutdown(
+            wait=False
+        )
+
+        if self.logger is not None:
+            self.logger.info(
+                msg="The worker processes have been recycled (Number of Recycles: {number_of_recycles:d}).".format(
+                    number_of_recycles=self._number_of_recycles
+                )
+            )
+
+    def submit(
+            self,
+            function: Callable[..., Any],
+            *args,
+            **kwargs
+    ) -> Future:
+        """
+        Submit a task to the worker processes. If a worker process has reached the number of tasks or resident set size
+        threshold, the worker processes are recycled before the task is submitted.
+
+        :parameter function: The function of the task.
+        :parameter args: The positional arguments of the function.
+        :parameter kwargs: The keyword arguments of the function.
+
+        :returns: The future of the task.
+        """
+
+        if self._is_recycling_required:
+            self._recycle_worker_processes()
+
+        future = Future()
+
+        process_pool_generation = self._process_pool_generation
+
+        self._process_pool_executor.submit(
+            _run_worker_process_task,
+            function,
+            *args,
+            **kwargs
+        ).add_done_callback(
+            lambda worker_future: self._complete_task(
+                future=future,
+                worker_future=worker_future,
+                process_pool_generation=process_pool_generation
+            )
+        )
+
+        return future
+
+    def map_in_batches(
+            self,
+            items: Sequence[Any],
+            function: Callable[[List[Any]], Union[MappingResultBatch, List[Any]]],
+            batch_size: int,
+            maximum_number_of_pending_batches: Optional[int] = None
+    ) -> Union[MappingResultBatch, List[Any]]:
+        """
+        Map the batches of the items using the worker processes and concatenate the results in the input order. The
+        batches are submitted as the earlier batches complete instead of all at once.
+
+        :parameter items: The items.
+        :parameter function: The function that maps a batch of the items to a list or a batch of the results.
+        :parameter batch_size: The size of the batch that is submitted to a worker process.
+        :parameter maximum_number_of_pending_batches: The maximum number of the batches that are in flight, so that the
+            recycling of the worker processes takes effect for the remaining batches. The value `None` indicates that
+            the number of worker processes should be utilized.
+
+        :returns: The results in the input order. If the function returns the batches of the atom-to-atom mapping
+            outputs, the batches are concatenated without the construction of the dictionaries.
+        """
+
+        if maximum_number_of_pending_batches is None:
+            maximum_number_of_pending_batches = self.number_of_processes
+
+        pending_futures, results = deque(), list()
+
+        for item_index in range(0, len(items), max(1, batch_size)):
+            pending_futures.append(
+                self.submit(function, list(items[item_index: item_index + max(1, batch_size)]))
+            )
+
+            if len(pending_futures) >= max(1, maximum_number_of_pending_batches):
+                results.append(pending_futures.popleft().result())
+
+        while len(pending_futures) > 0:
+            results.append(pending_futures.popleft().result())
+
+        if len(results) > 0 and all(isinstance(result, MappingResultBatch) for result in results):
+            return MappingResultBatch.concatenate(
+                mapping_result_batches=results
+            )
+
+        return [result for batch_results in results for result in batch_results]
+
+    def get_memory_summary(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the summary of the worker process memory, which is sampled after each task.
+
+        :returns: The number of completed tasks, the number of recycles, and the peak and average resident set size of
+            the worker processes in megabytes.
+        """
+
+        with self._lock:
+            return {
+                "number_of_tasks": self._number_of_tasks,
+                "number_of_recycles": self._number_of_recycles,
+                "peak_worker_memory_in_mb": self._peak_worker_memory_in_mb,
+                "average_worker_memory_in_mb": self._total_worker_memory_in_mb / max(1, self._number_of_tasks),
+            }
+
+    def shutdown(
+            self,
+            wait: bool = True
+    ) -> None:
+        """
+        Shut down the worker processes.
+
+        :parameter wait: The indicator of whether the method should wait for the in-flight tasks to be completed.
+        """
+
+        self._process_pool_executor.shutdown(
+            wait=wait
+        )
+
+    def __enter__(
+            self
+    ) -> "WorkerRecyclingProcessPool":
+        """
+        The `__enter__` method of the class.
+
+        :returns: The process pool.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            *args
+    ) -> None:
+        """
+        The `__exit__` method of the class.
+
+        :parameter args: The exception type, value and traceback, if any.
+        """
+
+        self.shutdown(
+            wait=True
+        )
@@ -0,0 +1,86 @@
+""" The ``scripts`` directory ``build_reaction_template_index`` script. """
+
+from argparse import ArgumentParser, Namespace
+from os.path import exists
+
+from atom_to_atom_mapping.utility import ReactionTemplateIndex, read_csv_file_chunks, read_parquet_file_chunks
+
+
+def get_script_arguments() -> Namespace:
+    """
+    Get the script arguments.
+
+    :returns: The script arguments.
+    """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-ifp",
+        "--input_file_paths",
+        nargs="+",
+        required=True,
+        type=str,
+        help="The paths to the output .csv or .parquet files of the 'local_mapper' approach."
+    )
+
+    argument_parser.add_argument(
+        "-ofp",
+        "--output_file_path",
+        required=True,
+        type=str,
+        help=(
+            "The path to the .json chemical reaction template index file. If the file exists, the index is extended "
+            "with the templates of the input files."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-cs",
+        "--chunk_size",
+        default=100000,
+        type=int,
+        help="The number of input file rows that are read at once."
+    )
+
+    return argument_parser.parse_args()
+
+
+if __name__ == "__main__":
+    script_arguments = get_script_arguments()
+
+    reaction_template_index = ReactionTemplateIndex.load(
+        file_path=script_arguments.output_file_path
+    ) if exists(script_arguments.output_file_path) else ReactionTemplateIndex()
+
+    for input_file_path in script_arguments.input_file_paths:
+        if input_file_path.endswith(".parquet"):
+            input_file_chunks = read_parquet_file_chunks(
+                file_path=input_file_path,
+                reaction_smiles_column_name="mapped_reaction_template_smarts",
+                chunk_size=script_arguments.chunk_size,
+                read_reaction_smiles_column_only=False
+            )
+
+        else:
+            input_file_chunks = read_csv_file_chunks(
+                file_path=input_file_path,
+                reaction_smiles_column_name="mapped_reaction_template_smarts",
+                chunk_size=script_arguments.chunk_size,
+                read_reaction_smiles_column_only=False
+            )
+
+        for input_file_chunk in input_file_chunks:
+            reaction_template_index.add_outputs(
+                outputs=input_file_chunk[["mapped_reaction_template_smarts", "is_confident", ]].to_dict(
+                    orient="records"
+                )
+            )
+
+    reaction_template_index.save(
+        file_path=script_arguments.output_file_path
+    )
+
+    print("number_of_reaction_templates: {number_of_reaction_templates:d}".format(
+        number_of_reaction_templates=len(reaction_template_index)
+    ))
@@ -0,0 +1,99 @@
+""" The ``scripts`` directory ``compare_mapped_reaction_smiles_strings`` script. """
+
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from os.path import basename, splitext
+
+from atom_to_atom_mapping.utility import compare_mapped_reaction_smiles_files
+
+
+def get_script_arguments() -> Namespace:
+    """
+    Get the script arguments.
+
+    :returns: The script arguments.
+    """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-ifp",
+        "--input_file_paths",
+        nargs="+",
+        required=True,
+        type=str,
+        help=(
+            "The paths to the output .csv or .parquet files of the map_reaction_smiles_strings script for the same "
+            "input file and different atom-to-atom mapping approaches."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-il",
+        "--input_labels",
+        nargs="+",
+        default=None,
+        type=str,
+        help="The labels of the input files. By default, the input file names are utilized."
+    )
+
+    argument_parser.add_argument(
+        "-mrscn",
+        "--mapped_reaction_smiles_column_name",
+        default="mapped_reaction_smiles",
+        type=str,
+        help="The name of the mapped chemical reaction SMILES column in the input files."
+    )
+
+    argument_parser.add_argument(
+        "-ofp",
+        "--output_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .csv or .parquet file of the per-row agreement flags."
+    )
+
+    argument_parser.add_argument(
+        "-sfp",
+        "--summary_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .json file of the comparison summary."
+    )
+
+    argument_parser.add_argument(
+        "-nop",
+        "--number_of_processes",
+        default=1,
+        type=int,
+        help="The number of processes."
+    )
+
+    argument_parser.add_argument(
+        "-cs",
+        "--chunk_size",
+        default=100000,
+        type=int,
+        help="The number of input file rows that are read and compared at once."
+    )
+
+    return argument_parser.parse_args()
+
+
+if __name__ == "__main__":
+    script_arguments = get_script_arguments()
+
+    print(dumps(
+        obj=compare_mapped_reaction_smiles_files(
+            input_file_paths=script_arguments.input_file_paths,
+            labels=script_arguments.input_labels if script_arguments.input_labels is not None else [
+                splitext(basename(input_file_path))[0] for input_file_path in script_arguments.input_file_paths
+            ],
+            mapped_reaction_smiles_column_name=script_arguments.mapped_reaction_smiles_column_name,
+            output_file_path=script_arguments.output_file_path,
+            summary_file_path=script_arguments.summary_file_path,
+            number_of_processes=script_arguments.number_of_processes,
+            chunk_size=script_arguments.chunk_size
+        ),
+        indent=4
+    ))
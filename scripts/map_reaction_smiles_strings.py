@@ -2,10 +2,40 @@
 
 from argparse import ArgumentParser, Namespace
 from functools import partial
+from json import dump
 from logging import Formatter, Logger, StreamHandler, getLogger
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from os import makedirs
+from os.path import abspath, basename, exists, join
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
-from pandas import DataFrame, concat, read_csv
+from atom_to_atom_mapping.utility import (
+    ROW_INDEX_COLUMN_NAME,
+    CPUResourceManager,
+    FailureReport,
+    IncrementalMapping,
+    InputShard,
+    MappingResultBatch,
+    ReactionSmilesWorkQueue,
+    ReactionTemplateIndex,
+    TimeBudget,
+    WorkerRecyclingProcessPool,
+    get_input_file_paths,
+    get_number_of_input_file_rows,
+    get_output_file_path,
+    is_reaction_record_file,
+    iterate_in_background,
+    map_normalized_reaction_smiles_strings,
+    map_reaction_smiles_strings_in_worker_process,
+    read_csv_file_chunks,
+    read_line_file_chunks,
+    read_parquet_file_chunks,
+    read_reaction_record_file_chunks,
+    run_work_queue_worker,
+    set_cpu_resource_manager,
+    write_csv_file_chunks,
+    write_parquet_file_chunks,
+)
 
 
 def get_script_arguments() -> Namespace:
@@ -47,12 +77,59 @@ def get_script_arguments() -> Namespace:
         help="The path to the input .csv file."
     )
 
+    argument_parser.add_argument(
+        "-ipfp",
+        "--input_parquet_file_path",
+        default=None,
+        type=str,
+        help="The path to the input .parquet file."
+    )
+
+    argument_parser.add_argument(
+        "-ilfp",
+        "--input_line_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the input newline-delimited chemical reaction SMILES file. The file is memory-mapped and its "
+            "line offset index is persisted beside it."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-irfp",
+        "--input_reaction_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the input RDF, multi-record RXN, .smi, or .rsmi file, which can be compressed with the '.gz' "
+            "extension. The file is parsed incrementally. In the case of the 'indigo' approach, the RXN blocks are "
+            "loaded directly without the conversion to the chemical reaction SMILES strings."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-rdfn",
+        "--rdf_data_field_names",
+        default=None,
+        nargs="+",
+        type=str,
+        help=(
+            "The names of the RDF data fields of the input reaction file that should be written to the output .csv "
+            "file as additional columns."
+        )
+    )
+
     argument_parser.add_argument(
         "-rscn",
         "--reaction_smiles_column_name",
         default=None,
         type=str,
-        help="The name of the chemical reaction SMILES column in the input .csv file."
+        help=(
+            "The name of the chemical reaction SMILES column in the input .csv or .parquet file. In the case of the "
+            "input newline-delimited chemical reaction SMILES file or the input reaction file, the name of the column "
+            "in the output file."
+        )
     )
 
     argument_parser.add_argument(
@@ -63,6 +140,66 @@ def get_script_arguments() -> Namespace:
         help="The path to the output .csv file."
     )
 
+    argument_parser.add_argument(
+        "-opfp",
+        "--output_parquet_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .parquet file."
+    )
+
+    argument_parser.add_argument(
+        "-ifps",
+        "--input_file_paths",
+        default=None,
+        nargs="+",
+        type=str,
+        help=(
+            "The paths to the input .csv, .parquet, RDF, RXN, .smi, or .rsmi files, the paths to the directories that "
+            "contain them, or the glob patterns that match them. All of the input files are mapped by the same "
+            "atom-to-atom mapping approach instance, which is loaded only once."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-imfp",
+        "--input_manifest_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the input manifest file, which lists one input file path, directory path, or glob pattern "
+            "per line. The relative paths are resolved against the directory of the input manifest file."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-odp",
+        "--output_directory_path",
+        default=None,
+        type=str,
+        help="The path to the directory of the output files of the multiple input files."
+    )
+
+    argument_parser.add_argument(
+        "-oft",
+        "--output_file_type",
+        default="parquet",
+        type=str,
+        choices=[
+            "csv",
+            "parquet",
+        ],
+        help="The type of the output files of the multiple input files."
+    )
+
+    argument_parser.add_argument(
+        "-rsfp",
+        "--run_summary_file_path",
+        default=None,
+        type=str,
+        help="The path to the .json file to which the combined summary of the multiple input files is written."
+    )
+
     argument_parser.add_argument(
         "-nop",
         "--number_of_processes",
@@ -79,6 +216,331 @@ def get_script_arguments() -> Namespace:
         help="The size of the batch, if relevant."
     )
 
+    argument_parser.add_argument(
+        "-cs",
+        "--chunk_size",
+        default=100000,
+        type=int,
+        help="The number of input file rows that are read, mapped, and written at once."
+    )
+
+    argument_parser.add_argument(
+        "-nos",
+        "--number_of_shards",
+        default=1,
+        type=int,
+        help="The number of shards into which the input file rows are deterministically partitioned."
+    )
+
+    argument_parser.add_argument(
+        "-si",
+        "--shard_index",
+        default=0,
+        type=int,
+        help="The index of the shard that should be mapped."
+    )
+
+    argument_parser.add_argument(
+        "-sm",
+        "--sharding_mode",
+        default="row_range",
+        type=str,
+        choices=[
+            "hash",
+            "row_range",
+        ],
+        help="The indicator of how the input file rows are partitioned into shards."
+    )
+
+    argument_parser.add_argument(
+        "-wqfp",
+        "--work_queue_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the SQLite work queue file. If specified, the script runs as one of any number of workers "
+            "that lease the chunks of the input file rows from the shared work queue."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-wqld",
+        "--work_queue_lease_duration",
+        default=600.0,
+        type=float,
+        help="The duration of the work queue chunk leases in seconds."
+    )
+
+    argument_parser.add_argument(
+        "-nrss",
+        "--normalize_reaction_smiles_strings",
+        action="store_true",
+        help=(
+            "The indicator of whether the chemical reaction SMILES strings should be normalized and deduplicated "
+            "before the atom-to-atom mapping. The mapped chemical reaction SMILES strings are based on the normalized "
+            "chemical reaction SMILES strings."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-rpm",
+        "--reaction_pruning_mode",
+        default=None,
+        type=str,
+        choices=[
+            "drop",
+            "move",
+        ],
+        help=(
+            "The indicator of how the chemical reaction compounds that are unlikely to contribute any atoms to the "
+            "products should be pruned before the atom-to-atom mapping, if relevant."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-mnot",
+        "--maximum_number_of_tokens",
+        default=None,
+        type=int,
+        help=(
+            "The maximum number of RXNMapper model tokens of a chemical reaction SMILES string. By default, the "
+            "maximum number of position embeddings of the RXNMapper model is utilized."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-tfp",
+        "--truncate_forward_pass",
+        action="store_true",
+        help=(
+            "The indicator of whether the forward pass of the RXNMapper model should stop after the layer whose "
+            "attention weights are utilized for the atom-to-atom mapping, which yields identical outputs at a lower "
+            "cost."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-fatama",
+        "--fallback_atom_to_atom_mapping_approach",
+        default=None,
+        type=str,
+        choices=[
+            "chytorch_rxnmap",
+            "indigo",
+            "local_mapper",
+        ],
+        help=(
+            "The atom-to-atom mapping approach for the chemical reaction SMILES strings that exceed the maximum number "
+            "of RXNMapper model tokens. By default, such chemical reaction SMILES strings are not mapped."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-pe",
+        "--pipelined_execution",
+        action="store_true",
+        help=(
+            "The indicator of whether the reading and pre-processing, the atom-to-atom mapping, and the writing of the "
+            "chunks should run as concurrent stages joined by bounded queues."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-mqs",
+        "--maximum_queue_size",
+        default=2,
+        type=int,
+        help="The maximum number of chunks or batches that are queued between the stages of the pipelined execution."
+    )
+
+    argument_parser.add_argument(
+        "-ncc",
+        "--number_of_cpu_cores",
+        default=None,
+        type=int,
+        help=(
+            "The total CPU core budget of the job, which is divided between the processes and threads. By default, all "
+            "of the available CPU cores are utilized."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-fcci",
+        "--first_cpu_core_index",
+        default=0,
+        type=int,
+        help="The index of the first available CPU core of the budget, if several jobs share the same host."
+    )
+
+    argument_parser.add_argument(
+        "-pca",
+        "--pin_cpu_affinity",
+        action="store_true",
+        help="The indicator of whether the processes should be pinned to disjoint CPU core sets."
+    )
+
+    argument_parser.add_argument(
+        "-mtpw",
+        "--maximum_number_of_tasks_per_worker",
+        default=None,
+        type=int,
+        help=(
+            "The number of task batches after which a worker process of the 'indigo' or 'local_mapper' approach is "
+            "recycled. If specified, the 'local_mapper' approach runs in the worker processes."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-mwm",
+        "--maximum_worker_memory_in_mb",
+        default=None,
+        type=float,
+        help=(
+            "The resident set size in megabytes above which a worker process of the 'indigo' or 'local_mapper' "
+            "approach is recycled. If specified, the 'local_mapper' approach runs in the worker processes."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-rtifp",
+        "--reaction_template_index_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the .json chemical reaction template index file of the 'local_mapper' approach. The known "
+            "templates are applied before the model inference, and the index is updated with the new confident model "
+            "templates at the end of the run. It cannot be combined with the recycling of the worker processes."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-mmcs",
+        "--maximum_molecule_cache_size",
+        default=0,
+        type=int,
+        help=(
+            "The maximum number of the parsed or tokenized chemical compounds that are cached per process by the "
+            "'chytorch_rxnmap', 'indigo' and 'rxnmapper' approaches. By default, the chemical compounds are not cached."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-schm",
+        "--scheduling_mode",
+        default="input_order",
+        type=str,
+        choices=[
+            "input_order",
+            "longest_first",
+        ],
+        help=(
+            "The order in which the chemical reaction SMILES strings are dispatched to the processes of the 'indigo' "
+            "approach. The 'longest_first' mode dispatches the chemical reactions with the largest estimated cost "
+            "first, which reduces the makespan of the skewed datasets. The outputs are written in the input order."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-tpims",
+        "--timeout_period_in_ms",
+        default=10000,
+        type=int,
+        help="The timeout period in milliseconds of the 'indigo' approach."
+    )
+
+    argument_parser.add_argument(
+        "-mtpims",
+        "--maximum_timeout_period_in_ms",
+        default=None,
+        type=int,
+        help=(
+            "The maximum timeout period in milliseconds of the 'indigo' approach. If specified, only the chemical "
+            "reaction SMILES strings that have not been mapped within the timeout period are re-mapped in the further "
+            "passes with the progressively longer timeout periods up to the maximum timeout period."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-tbis",
+        "--time_budget_in_s",
+        default=None,
+        type=float,
+        help=(
+            "The total time budget of the run in seconds. The throughput is tracked as the run goes, the timeout "
+            "periods of the 'indigo' approach are reduced to fit the remaining time budget, and once the next chunk is "
+            "not predicted to be mapped in time, the run stops cleanly with a consistent partial output file and the "
+            "remaining input rows are written to the remainder file. By default, the run is not time budgeted."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-rfp",
+        "--remainder_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the .csv or .parquet remainder file of the time budgeted run, which contains the unmapped "
+            "input rows and their original row indices. By default, the path to the output file with the '.remainder' "
+            "suffix is utilized."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-frfp",
+        "--failure_report_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the .json failure report file. If specified, the atom-to-atom mapping failures are not "
+            "logged individually, but aggregated by the exception type and the normalized reason, with the number of "
+            "failures and a bounded random sample of the example chemical reactions and tracebacks per class."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-mnofe",
+        "--maximum_number_of_failure_examples",
+        default=5,
+        type=int,
+        help="The maximum number of the example failures per class in the failure report."
+    )
+
+    argument_parser.add_argument(
+        "-im",
+        "--incremental_mapping",
+        action="store_true",
+        help=(
+            "The indicator of whether the input rows should be mapped incrementally. Each input row is hashed together "
+            "with the atom-to-atom mapping configuration, the row hashes are written to the 'row_hash' column of the "
+            "output file, and an incremental manifest file is written beside the output file, so that the next run can "
+            "map only the new or changed input rows."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-pofp",
+        "--previous_output_file_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the .csv or .parquet output file of the previous incremental run. The outputs of the input "
+            "rows whose hashes are found in it are carried over by a streaming merge instead of being mapped again. "
+            "If specified, the incremental mapping is utilized."
+        )
+    )
+
+    argument_parser.add_argument(
+        "-podp",
+        "--previous_output_directory_path",
+        default=None,
+        type=str,
+        help=(
+            "The path to the output directory of the previous incremental multiple input file run, in which the "
+            "previous output files are looked up by the names of the input files. If specified, the incremental "
+            "mapping is utilized."
+        )
+    )
+
     return argument_parser.parse_args()
 
 
@@ -119,6 +581,43 @@ def get_script_logger() -> Logger:
     return logger
 
 
+def get_mapping_configuration(
+        script_arguments: Namespace
+) -> Dict[str, Any]:
+    """
+    Get the atom-to-atom mapping configuration of the incremental mapping, which contains only the script arguments
+    that affect the atom-to-atom mapping outputs, so that the changes of the performance-related script arguments do
+    not invalidate the outputs of the previous run. The approach-specific script arguments are contained only for the
+    relevant atom-to-atom mapping approach.
+
+    :parameter script_arguments: The script arguments.
+
+    :returns: The atom-to-atom mapping configuration.
+    """
+
+    mapping_configuration = {
+        "atom_to_atom_mapping_approach": script_arguments.atom_to_atom_mapping_approach,
+        "fallback_atom_to_atom_mapping_approach": script_arguments.fallback_atom_to_atom_mapping_approach,
+        "reaction_pruning_mode": script_arguments.reaction_pruning_mode,
+        "maximum_number_of_tokens": script_arguments.maximum_number_of_tokens,
+        "normalize_reaction_smiles_strings": script_arguments.normalize_reaction_smiles_strings,
+        "read_rxn_blocks": (
+            script_arguments.atom_to_atom_mapping_approach == "indigo" and
+            not script_arguments.normalize_reaction_smiles_strings
+        ),
+        "time_budget_in_s": script_arguments.time_budget_in_s,
+    }
+
+    if script_arguments.atom_to_atom_mapping_approach == "indigo":
+        mapping_configuration["timeout_period_in_ms"] = script_arguments.timeout_period_in_ms
+        mapping_configuration["maximum_timeout_period_in_ms"] = script_arguments.maximum_timeout_period_in_ms
+
+    if script_arguments.atom_to_atom_mapping_approach == "local_mapper":
+        mapping_configuration["reaction_template_index_file_path"] = script_arguments.reaction_template_index_file_path
+
+    return mapping_configuration
+
+
 def map_reaction_smiles(
         reaction_smiles: str,
         atom_to_atom_mapping_function: Callable[[str], Dict[str, Any]]
@@ -136,158 +635,932 @@ def map_reaction_smiles(
 
 
 def map_reaction_smiles_strings(
-        input_csv_file_path: str,
-        atom_to_atom_mapping_function: Callable[[Sequence[str]], Optional[List[Dict[str, Any]]]],
+        atom_to_atom_mapping_function: Callable[[Sequence[str]], Union[MappingResultBatch, List[Dict[str, Any]]]],
         reaction_smiles_column_name: str,
-        output_csv_file_path: str
-) -> None:
+        chunk_size: int,
+        input_csv_file_path: Optional[str] = None,
+        input_parquet_file_path: Optional[str] = None,
+        input_line_file_path: Optional[str] = None,
+        input_reaction_file_path: Optional[str] = None,
+        rdf_data_field_names: Optional[Sequence[str]] = None,
+        read_rxn_blocks: bool = False,
+        output_csv_file_path: Optional[str] = None,
+        output_parquet_file_path: Optional[str] = None,
+        input_shard: Optional[InputShard] = None,
+        maximum_queue_size: int = 0,
+        time_budget: Optional[TimeBudget] = None,
+        remainder_file_path: Optional[str] = None,
+        mapping_configuration: Optional[Dict[str, Any]] = None,
+        previous_output_file_path: Optional[str] = None,
+        logger: Optional[Logger] = None
+) -> int:
     """
     Map the chemical reaction SMILES strings.
 
-    :parameter input_csv_file_path: The path to the input .csv file.
     :parameter atom_to_atom_mapping_function: The atom-to-atom mapping function.
-    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the input .csv file.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the input file.
+    :parameter chunk_size: The number of input file rows that are read, mapped, and written at once.
+    :parameter input_csv_file_path: The path to the input .csv file.
+    :parameter input_parquet_file_path: The path to the input .parquet file.
+    :parameter input_line_file_path: The path to the input newline-delimited chemical reaction SMILES file.
+    :parameter input_reaction_file_path: The path to the input RDF, RXN, .smi, or .rsmi file.
+    :parameter rdf_data_field_names: The names of the RDF data fields that should be read as additional columns. The
+        value `None` indicates that no data fields should be read.
+    :parameter read_rxn_blocks: The indicator of whether the RXN blocks of the input RDF or RXN file should be passed
+        to the atom-to-atom mapping function as they are instead of being converted to the chemical reaction SMILES
+        strings.
     :parameter output_csv_file_path: The path to the output .csv file.
+    :parameter output_parquet_file_path: The path to the output .parquet file.
+    :parameter input_shard: The input file shard that should be mapped. The value `None` indicates that all of the input
+        file rows should be mapped.
+    :parameter maximum_queue_size: The maximum number of chunks that are queued between the reading, atom-to-atom
+        mapping, and writing stages, which run concurrently. The value `0` indicates that the stages should run
+        serially.
+    :parameter time_budget: The time budget of the run. The value `None` indicates that all of the input file rows
+        should be mapped regardless of the time.
+    :parameter remainder_file_path: The path to the .csv or .parquet file to which the input file rows that do not fit
+        within the time budget are written, if relevant.
+    :parameter mapping_configuration: The atom-to-atom mapping configuration of the incremental mapping. The value
+        `None` indicates that the input rows should not be mapped incrementally.
+    :parameter previous_output_file_path: The path to the output file of the previous incremental run, if relevant. The
+        value `None` indicates that all of the input rows should be mapped.
+    :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+
+    :returns: The number of written output file rows.
     """
 
-    input_dataframe = read_csv(
-        filepath_or_buffer=input_csv_file_path,
-        low_memory=False
-    )
+    output_file_path = output_csv_file_path if output_parquet_file_path is None else output_parquet_file_path
 
-    concat(
-        objs=[
-            input_dataframe,
-            DataFrame(
-                data=atom_to_atom_mapping_function(
-                    input_dataframe[reaction_smiles_column_name].values.tolist()
+    incremental_mapping = None
+
+    if mapping_configuration is not None:
+        if previous_output_file_path is not None and abspath(previous_output_file_path) == abspath(output_file_path):
+            raise ValueError(
+                "The output file '{file_path:s}' cannot be utilized as the previous output file of the incremental "
+                "mapping.".format(
+                    file_path=output_file_path
                 )
+            )
+
+        incremental_mapping = IncrementalMapping(
+            mapping_configuration=mapping_configuration,
+            previous_output_file_path=previous_output_file_path,
+            chunk_size=chunk_size,
+            logger=logger
+        )
+
+        atom_to_atom_mapping_function = partial(
+            incremental_mapping.map_reaction_smiles_strings,
+            atom_to_atom_mapping_function=atom_to_atom_mapping_function
+        )
+
+    number_of_rows, start_row_index, end_row_index = None, 0, None
+
+    if input_shard is not None and input_shard.sharding_mode == "row_range":
+        number_of_rows = get_number_of_input_file_rows(
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            input_csv_file_path=input_csv_file_path,
+            input_parquet_file_path=input_parquet_file_path,
+            input_line_file_path=input_line_file_path,
+            input_reaction_file_path=input_reaction_file_path,
+            chunk_size=chunk_size
+        )
+
+        if input_reaction_file_path is None:
+            start_row_index, end_row_index = input_shard.get_row_range(
+                number_of_rows=number_of_rows
+            )
+
+    if input_reaction_file_path is not None:
+        input_chunks = read_reaction_record_file_chunks(
+            file_path=input_reaction_file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            data_field_names=rdf_data_field_names,
+            read_rxn_blocks=read_rxn_blocks
+        )
+
+    elif input_line_file_path is not None:
+        input_chunks = read_line_file_chunks(
+            file_path=input_line_file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            start_row_index=start_row_index,
+            end_row_index=end_row_index
+        )
+
+    elif input_parquet_file_path is not None:
+        input_chunks = read_parquet_file_chunks(
+            file_path=input_parquet_file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            start_row_index=start_row_index,
+            end_row_index=end_row_index
+        )
+
+    else:
+        input_chunks = read_csv_file_chunks(
+            file_path=input_csv_file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            read_reaction_smiles_column_only=output_csv_file_path is None,
+            start_row_index=start_row_index,
+            end_row_index=end_row_index
+        )
+
+    if input_shard is not None:
+        input_chunks = input_shard.select(
+            input_chunks=input_chunks,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            number_of_rows=number_of_rows,
+            first_row_index=start_row_index
+        )
+
+    number_of_remaining_rows = 0 if time_budget is None else time_budget.number_of_remaining_rows
+
+    if time_budget is not None:
+        input_chunks = time_budget.iterate_chunks(
+            chunks=input_chunks,
+            remainder_file_path=remainder_file_path,
+            first_row_index=start_row_index,
+            measure_processing_time=maximum_queue_size == 0,
+            logger=logger
+        )
+
+        if maximum_queue_size > 0:
+            atom_to_atom_mapping_function = time_budget.track_processing_time(
+                function=atom_to_atom_mapping_function
+            )
+
+    if maximum_queue_size > 0:
+        input_chunks = iterate_in_background(
+            iterable=input_chunks,
+            maximum_queue_size=maximum_queue_size
+        )
+
+    output_chunks = (
+        (
+            input_dataframe,
+            atom_to_atom_mapping_function(
+                input_dataframe[reaction_smiles_column_name].values.tolist()
             ),
-        ],
-        axis=1
-    ).to_csv(
-        path_or_buf=output_csv_file_path,
-        index=False
+        ) for input_dataframe in input_chunks
+    )
+
+    if maximum_queue_size > 0:
+        output_chunks = iterate_in_background(
+            iterable=output_chunks,
+            maximum_queue_size=maximum_queue_size
+        )
+
+    if output_parquet_file_path is not None:
+        number_of_output_file_rows = write_parquet_file_chunks(
+            file_path=output_parquet_file_path,
+            reaction_smiles_column_name=reaction_smiles_column_name,
+            chunks=output_chunks,
+            row_index_column_name=None if input_shard is None else ROW_INDEX_COLUMN_NAME
+        )
+
+    else:
+        number_of_output_file_rows = write_csv_file_chunks(
+            file_path=output_csv_file_path,
+            chunks=output_chunks
+        )
+
+    if input_shard is not None:
+        input_shard.write_manifest_file(
+            output_file_path=output_file_path,
+            number_of_written_rows=number_of_output_file_rows,
+            number_of_remainder_rows=0 if time_budget is None else (
+                time_budget.number_of_remaining_rows - number_of_remaining_rows
+            )
+        )
+
+    if incremental_mapping is not None:
+        incremental_mapping.write_manifest_file(
+            output_file_path=output_file_path
+        )
+
+        if logger is not None:
+            logger.info(
+                msg=(
+                    "The incremental mapping summary. The number of rows: {number_of_rows:d}, carried over rows: "
+                    "{number_of_carried_over_rows:d} ({carry_over_rate:.2%}), mapped rows: {number_of_mapped_rows:d}."
+                ).format(
+                    **incremental_mapping.get_summary()
+                )
+            )
+
+    return number_of_output_file_rows
+
+
+def get_remainder_file_path(
+        output_csv_file_path: Optional[str] = None,
+        output_parquet_file_path: Optional[str] = None
+) -> str:
+    """
+    Get the default path to the remainder file of a time budgeted run, which matches the type of the output file.
+
+    :parameter output_csv_file_path: The path to the output .csv file.
+    :parameter output_parquet_file_path: The path to the output .parquet file.
+
+    :returns: The path to the remainder file.
+    """
+
+    if output_parquet_file_path is not None:
+        return "{output_file_path:s}.remainder.parquet".format(
+            output_file_path=output_parquet_file_path
+        )
+
+    return "{output_file_path:s}.remainder.csv".format(
+        output_file_path=output_csv_file_path
     )
 
 
+def map_input_files(
+        input_file_mapping_function: Callable[..., int],
+        input_file_paths: Sequence[str],
+        output_directory_path: str,
+        output_file_type: str = "parquet",
+        previous_output_directory_path: Optional[str] = None,
+        time_budget: Optional[TimeBudget] = None,
+        logger: Optional[Logger] = None
+) -> Dict[str, Any]:
+    """
+    Map the chemical reaction SMILES strings of multiple input files using the same atom-to-atom mapping approach
+    instance. Each input file is mapped to a separate output file, and the failure of an input file does not stop the
+    mapping of the other input files.
+
+    :parameter input_file_mapping_function: The function that maps the chemical reaction SMILES strings of an input
+        file, such as the partially applied `map_reaction_smiles_strings` function.
+    :parameter input_file_paths: The paths to the input files.
+    :parameter output_directory_path: The path to the directory of the output files.
+    :parameter output_file_type: The type of the output files. The value choices are: { `csv`, `parquet` }.
+    :parameter previous_output_directory_path: The path to the output directory of the previous incremental run, in
+        which the previous output files have the same names as the output files. The value `None` indicates that the
+        previous output files should not be utilized.
+    :parameter time_budget: The time budget that is shared by the input file mapping function across the input files.
+        The value `None` indicates that the remainder files should not be reported.
+    :parameter logger: The logger. The value `None` indicates that the logger should not be utilized.
+
+    :returns: The combined summary of the mapping of the input files, including the remainder file of each input file
+        whose rows have not fit within the time budget.
+    """
+
+    makedirs(output_directory_path, exist_ok=True)
+
+    input_file_summaries = list()
+
+    run_start_time = perf_counter()
+
+    for input_file_index, input_file_path in enumerate(input_file_paths):
+        output_file_path = get_output_file_path(
+            input_file_path=input_file_path,
+            output_directory_path=output_directory_path,
+            output_file_extension=".{output_file_type:s}".format(
+                output_file_type=output_file_type
+            )
+        )
+
+        if any(
+            input_file_summary["output_file_path"] == output_file_path for input_file_summary in input_file_summaries
+        ):
+            output_file_path = get_output_file_path(
+                input_file_path=input_file_path,
+                output_directory_path=output_directory_path,
+                output_file_extension=".{output_file_type:s}".format(
+                    output_file_type=output_file_type
+                ),
+                output_file_name_suffix="_{input_file_index:d}".format(
+                    input_file_index=input_file_index
+                )
+            )
+
+        output_file_keyword_arguments = {
+            "output_csv_file_path": output_file_path if output_file_type == "csv" else None,
+            "output_parquet_file_path": output_file_path if output_file_type == "parquet" else None,
+        }
+
+        if input_file_path.lower().endswith(".parquet"):
+            input_file_keyword_arguments = {
+                "input_parquet_file_path": input_file_path,
+            }
+
+        elif is_reaction_record_file(input_file_path):
+            input_file_keyword_arguments = {
+                "input_reaction_file_path": input_file_path,
+            }
+
+        else:
+            input_file_keyword_arguments = {
+                "input_csv_file_path": input_file_path,
+            }
+
+        if previous_output_directory_path is not None:
+            previous_output_file_path = join(previous_output_directory_path, basename(output_file_path))
+
+            output_file_keyword_arguments["previous_output_file_path"] = (
+                previous_output_file_path if exists(previous_output_file_path) else None
+            )
+
+        remainder_file_path = get_remainder_file_path(
+            output_csv_file_path=output_file_keyword_arguments["output_csv_file_path"],
+            output_parquet_file_path=output_file_keyword_arguments["output_parquet_file_path"]
+        )
+
+        number_of_remaining_rows = 0 if time_budget is None else time_budget.number_of_remaining_rows
+
+        input_file_start_time = perf_counter()
+
+        try:
+            number_of_rows = input_file_mapping_function(
+                remainder_file_path=remainder_file_path,
+                **input_file_keyword_arguments,
+                **output_file_keyword_arguments
+            )
+
+            status = "successful"
+
+        except Exception as exception_handle:
+            if logger is not None:
+                logger.error(
+                    msg=(
+                        "The atom-to-atom mapping of the input file '{input_file_path:s}' has been unsuccessful."
+                    ).format(
+                        input_file_path=input_file_path
+                    )
+                )
+
+                logger.debug(
+                    msg=exception_handle,
+                    exc_info=True
+                )
+
+            number_of_rows, status = 0, "unsuccessful"
+
+        number_of_remainder_rows = 0 if time_budget is None else (
+            time_budget.number_of_remaining_rows - number_of_remaining_rows
+        )
+
+        input_file_summaries.append({
+            "input_file_path": input_file_path,
+            "output_file_path": output_file_path,
+            "status": status,
+            "number_of_rows": number_of_rows,
+            "number_of_remainder_rows": number_of_remainder_rows,
+            "remainder_file_path": remainder_file_path if number_of_remainder_rows > 0 else None,
+            "elapsed_time_in_s": perf_counter() - input_file_start_time,
+        })
+
+        if logger is not None:
+            logger.info(
+                msg=(
+                    "The atom-to-atom mapping of the input file {input_file_number:d}/{number_of_input_files:d} "
+                    "'{input_file_path:s}' has been {status:s}. The number of rows: {number_of_rows:d}, elapsed time: "
+                    "{elapsed_time_in_s:.1f} s."
+                ).format(
+                    input_file_number=input_file_index + 1,
+                    number_of_input_files=len(input_file_paths),
+                    input_file_path=input_file_path,
+                    status=status,
+                    number_of_rows=number_of_rows,
+                    elapsed_time_in_s=input_file_summaries[-1]["elapsed_time_in_s"]
+                )
+            )
+
+    elapsed_time_in_s = perf_counter() - run_start_time
+    number_of_rows = sum(input_file_summary["number_of_rows"] for input_file_summary in input_file_summaries)
+
+    return {
+        "number_of_input_files": len(input_file_summaries),
+        "number_of_successful_input_files": sum(
+            input_file_summary["status"] == "successful" for input_file_summary in input_file_summaries
+        ),
+        "number_of_unsuccessful_input_files": sum(
+            input_file_summary["status"] == "unsuccessful" for input_file_summary in input_file_summaries
+        ),
+        "number_of_rows": number_of_rows,
+        "number_of_remainder_rows": sum(
+            input_file_summary["number_of_remainder_rows"] for input_file_summary in input_file_summaries
+        ),
+        "remainder_file_paths": [
+            input_file_summary["remainder_file_path"] for input_file_summary in input_file_summaries
+            if input_file_summary["remainder_file_path"] is not None
+        ],
+        "elapsed_time_in_s": elapsed_time_in_s,
+        "throughput": number_of_rows / elapsed_time_in_s if elapsed_time_in_s > 0.0 else 0.0,
+        "input_files": input_file_summaries,
+    }
+
+
 if __name__ == "__main__":
     script_arguments = get_script_arguments()
 
     script_logger = get_script_logger()
 
+    time_budget = TimeBudget(
+        time_budget_in_s=script_arguments.time_budget_in_s
+    ) if script_arguments.time_budget_in_s is not None else None
+
+    mapping_configuration = get_mapping_configuration(
+        script_arguments=script_arguments
+    ) if (
+        script_arguments.incremental_mapping or
+        script_arguments.previous_output_file_path is not None or
+        script_arguments.previous_output_directory_path is not None
+    ) else None
+
+    failure_report = FailureReport(
+        maximum_number_of_examples=script_arguments.maximum_number_of_failure_examples
+    ) if script_arguments.failure_report_file_path is not None else None
+
+    indigo, local_mapper, rxnmapper = None, None, None
+
+    reaction_template_index, worker_recycling_process_pool = None, None
+
+    cpu_resource_manager = CPUResourceManager(
+        number_of_cpu_cores=script_arguments.number_of_cpu_cores,
+        pin_cpu_affinity=script_arguments.pin_cpu_affinity,
+        first_cpu_core_index=script_arguments.first_cpu_core_index
+    )
+
+    set_cpu_resource_manager(
+        cpu_resource_manager=cpu_resource_manager
+    )
+
     if script_arguments.atom_to_atom_mapping_approach == "chytorch_rxnmap":
         from atom_to_atom_mapping.chytorch_rxnmap import ChytorchRxnMapAtomToAtomMapping
 
         chytorch_rxnmap = ChytorchRxnMapAtomToAtomMapping(
-            logger=script_logger
+            logger=script_logger,
+            maximum_molecule_cache_size=script_arguments.maximum_molecule_cache_size
         )
 
-        if script_arguments.reaction_smiles is not None:
-            map_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles,
-                atom_to_atom_mapping_function=chytorch_rxnmap.map_reaction_smiles
-            )
+        chytorch_rxnmap.failure_report = failure_report
 
-        if (
-            script_arguments.input_csv_file_path is not None and
-            script_arguments.reaction_smiles_column_name is not None and
-            script_arguments.output_csv_file_path is not None
-        ):
-            map_reaction_smiles_strings(
-                input_csv_file_path=script_arguments.input_csv_file_path,
-                atom_to_atom_mapping_function=chytorch_rxnmap.map_reaction_smiles_strings,
-                reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
-                output_csv_file_path=script_arguments.output_csv_file_path
-            )
+        atom_to_atom_mapping_function = chytorch_rxnmap.map_reaction_smiles
+
+        atom_to_atom_mapping_batch_function = chytorch_rxnmap.map_reaction_smiles_strings
 
     elif script_arguments.atom_to_atom_mapping_approach == "indigo":
         from atom_to_atom_mapping.indigo import IndigoAtomToAtomMapping
 
         indigo = IndigoAtomToAtomMapping(
-            logger=script_logger
+            logger=script_logger,
+            maximum_molecule_cache_size=script_arguments.maximum_molecule_cache_size
         )
 
-        if script_arguments.reaction_smiles is not None:
-            map_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles,
-                atom_to_atom_mapping_function=indigo.map_reaction_smiles
-            )
+        indigo.failure_report = failure_report
 
-        if (
-            script_arguments.input_csv_file_path is not None and
-            script_arguments.reaction_smiles_column_name is not None and
-            script_arguments.output_csv_file_path is not None
-        ):
-            map_reaction_smiles_strings(
-                input_csv_file_path=script_arguments.input_csv_file_path,
-                atom_to_atom_mapping_function=partial(
-                    indigo.map_reaction_smiles_strings,
-                    number_of_processes=script_arguments.number_of_processes
-                ),
-                reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
-                output_csv_file_path=script_arguments.output_csv_file_path
-            )
+        atom_to_atom_mapping_function = partial(
+            indigo.map_reaction_smiles,
+            timeout_period_in_ms=script_arguments.timeout_period_in_ms
+        )
+
+        atom_to_atom_mapping_batch_function = partial(
+            indigo.map_reaction_smiles_strings,
+            number_of_processes=script_arguments.number_of_processes,
+            maximum_number_of_tasks_per_worker=script_arguments.maximum_number_of_tasks_per_worker,
+            maximum_worker_memory_in_mb=script_arguments.maximum_worker_memory_in_mb,
+            scheduling_mode=script_arguments.scheduling_mode,
+            timeout_period_in_ms=script_arguments.timeout_period_in_ms,
+            maximum_timeout_period_in_ms=script_arguments.maximum_timeout_period_in_ms,
+            time_budget=time_budget
+        )
 
     elif script_arguments.atom_to_atom_mapping_approach == "local_mapper":
         from atom_to_atom_mapping.local_mapper import LocalMapperAtomToAtomMapping
 
+        if script_arguments.reaction_template_index_file_path is not None and (
+            script_arguments.maximum_number_of_tasks_per_worker is not None or
+            script_arguments.maximum_worker_memory_in_mb is not None
+        ):
+            script_logger.error(
+                msg=(
+                    "The reaction template index does not support the recycling of the worker processes, which map the "
+                    "chemical reaction SMILES strings without the reaction template index of the main process."
+                )
+            )
+
+            raise SystemExit(1)
+
+        if script_arguments.reaction_template_index_file_path is not None:
+            reaction_template_index = (
+                ReactionTemplateIndex.load(
+                    file_path=script_arguments.reaction_template_index_file_path
+                ) if exists(script_arguments.reaction_template_index_file_path) else ReactionTemplateIndex()
+            )
+
         local_mapper = LocalMapperAtomToAtomMapping(
-            logger=script_logger
+            logger=script_logger,
+            reaction_pruning_mode=script_arguments.reaction_pruning_mode,
+            reaction_template_index=reaction_template_index
         )
 
-        if script_arguments.reaction_smiles is not None:
-            map_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles,
-                atom_to_atom_mapping_function=local_mapper.map_reaction_smiles
-            )
+        local_mapper.failure_report = failure_report
+
+        atom_to_atom_mapping_function = local_mapper.map_reaction_smiles
 
         if (
-            script_arguments.input_csv_file_path is not None and
-            script_arguments.reaction_smiles_column_name is not None and
-            script_arguments.output_csv_file_path is not None
+            script_arguments.maximum_number_of_tasks_per_worker is not None or
+            script_arguments.maximum_worker_memory_in_mb is not None
         ):
-            map_reaction_smiles_strings(
-                input_csv_file_path=script_arguments.input_csv_file_path,
-                atom_to_atom_mapping_function=partial(
-                    local_mapper.map_reaction_smiles_strings,
+            worker_recycling_process_pool = WorkerRecyclingProcessPool(
+                number_of_processes=script_arguments.number_of_processes,
+                maximum_number_of_tasks_per_worker=script_arguments.maximum_number_of_tasks_per_worker,
+                maximum_worker_memory_in_mb=script_arguments.maximum_worker_memory_in_mb,
+                logger=script_logger
+            )
+
+            atom_to_atom_mapping_batch_function = partial(
+                worker_recycling_process_pool.map_in_batches,
+                function=partial(
+                    map_reaction_smiles_strings_in_worker_process,
+                    atom_to_atom_mapping_class=LocalMapperAtomToAtomMapping,
+                    atom_to_atom_mapping_arguments={
+                        "reaction_pruning_mode": script_arguments.reaction_pruning_mode,
+                    },
                     batch_size=script_arguments.batch_size
                 ),
-                reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
-                output_csv_file_path=script_arguments.output_csv_file_path
+                batch_size=max(script_arguments.batch_size, script_arguments.chunk_size // 10)
+            )
+
+        else:
+            atom_to_atom_mapping_batch_function = partial(
+                local_mapper.map_reaction_smiles_strings,
+                batch_size=script_arguments.batch_size,
+                maximum_number_of_prefetched_batches=(
+                    script_arguments.maximum_queue_size if script_arguments.pipelined_execution else 0
+                )
             )
 
     elif script_arguments.atom_to_atom_mapping_approach == "rxnmapper":
         from atom_to_atom_mapping.rxnmapper import RXNMapperAtomToAtomMapping
 
+        fallback_atom_to_atom_mapping = None
+
+        if script_arguments.fallback_atom_to_atom_mapping_approach == "chytorch_rxnmap":
+            from atom_to_atom_mapping.chytorch_rxnmap import ChytorchRxnMapAtomToAtomMapping
+
+            fallback_atom_to_atom_mapping = ChytorchRxnMapAtomToAtomMapping(
+                logger=script_logger
+            )
+
+        elif script_arguments.fallback_atom_to_atom_mapping_approach == "indigo":
+            from atom_to_atom_mapping.indigo import IndigoAtomToAtomMapping
+
+            fallback_atom_to_atom_mapping = IndigoAtomToAtomMapping(
+                logger=script_logger
+            )
+
+        elif script_arguments.fallback_atom_to_atom_mapping_approach == "local_mapper":
+            from atom_to_atom_mapping.local_mapper import LocalMapperAtomToAtomMapping
+
+            fallback_atom_to_atom_mapping = LocalMapperAtomToAtomMapping(
+                logger=script_logger
+            )
+
+        if fallback_atom_to_atom_mapping is not None:
+            fallback_atom_to_atom_mapping.failure_report = failure_report
+
         rxnmapper = RXNMapperAtomToAtomMapping(
+            logger=script_logger,
+            reaction_pruning_mode=script_arguments.reaction_pruning_mode,
+            maximum_number_of_tokens=script_arguments.maximum_number_of_tokens,
+            fallback_atom_to_atom_mapping=fallback_atom_to_atom_mapping,
+            maximum_molecule_cache_size=script_arguments.maximum_molecule_cache_size,
+            truncate_forward_pass=script_arguments.truncate_forward_pass
+        )
+
+        rxnmapper.failure_report = failure_report
+
+        atom_to_atom_mapping_function = rxnmapper.map_reaction_smiles
+
+        atom_to_atom_mapping_batch_function = partial(
+            rxnmapper.map_reaction_smiles_strings,
+            batch_size=script_arguments.batch_size,
+            maximum_number_of_prefetched_batches=(
+                script_arguments.maximum_queue_size if script_arguments.pipelined_execution else 0
+            )
+        )
+
+    else:
+        script_logger.error(
+            msg="The atom-to-atom mapping approach '{atom_to_atom_mapping_approach:s}' is not supported.".format(
+                atom_to_atom_mapping_approach=script_arguments.atom_to_atom_mapping_approach
+            )
+        )
+
+        raise SystemExit(1)
+
+    cpu_resource_manager.log_layout(
+        logger=script_logger,
+        layout=cpu_resource_manager.configure_current_process(
+            number_of_threads=1 if script_arguments.atom_to_atom_mapping_approach == "indigo" else None
+        ),
+        description="main process"
+    )
+
+    if script_arguments.atom_to_atom_mapping_approach == "indigo" or script_arguments.normalize_reaction_smiles_strings:
+        cpu_resource_manager.log_layout(
+            logger=script_logger,
+            layout=cpu_resource_manager.get_layout(
+                number_of_processes=script_arguments.number_of_processes
+            ),
+            description="worker processes"
+        )
+
+    if script_arguments.normalize_reaction_smiles_strings:
+        atom_to_atom_mapping_batch_function = partial(
+            map_normalized_reaction_smiles_strings,
+            atom_to_atom_mapping_function=atom_to_atom_mapping_batch_function,
+            number_of_processes=script_arguments.number_of_processes,
             logger=script_logger
         )
 
-        if script_arguments.reaction_smiles is not None:
-            map_reaction_smiles(
-                reaction_smiles=script_arguments.reaction_smiles,
-                atom_to_atom_mapping_function=rxnmapper.map_reaction_smiles
+    if script_arguments.reaction_smiles is not None:
+        map_reaction_smiles(
+            reaction_smiles=script_arguments.reaction_smiles,
+            atom_to_atom_mapping_function=atom_to_atom_mapping_function
+        )
+
+    if (
+        (
+            script_arguments.input_csv_file_path is not None or
+            script_arguments.input_parquet_file_path is not None or
+            script_arguments.input_line_file_path is not None or
+            script_arguments.input_reaction_file_path is not None
+        ) and
+        (
+            script_arguments.reaction_smiles_column_name is not None or
+            script_arguments.input_line_file_path is not None or
+            script_arguments.input_reaction_file_path is not None
+        ) and
+        (
+            script_arguments.output_csv_file_path is not None or
+            script_arguments.output_parquet_file_path is not None
+        )
+    ):
+        if script_arguments.work_queue_file_path is not None and script_arguments.input_reaction_file_path is not None:
+            script_logger.error(
+                msg="The work queue does not support the input reaction files, which can only be read sequentially."
             )
 
-        if (
-            script_arguments.input_csv_file_path is not None and
-            script_arguments.reaction_smiles_column_name is not None and
-            script_arguments.output_csv_file_path is not None
-        ):
+            raise SystemExit(1)
+
+        if script_arguments.work_queue_file_path is not None and mapping_configuration is not None:
+            script_logger.error(
+                msg="The work queue does not support the incremental mapping, which merges the outputs sequentially."
+            )
+
+            raise SystemExit(1)
+
+        if script_arguments.previous_output_file_path is not None and abspath(
+            script_arguments.previous_output_file_path
+        ) in [
+            abspath(output_file_path) for output_file_path in [
+                script_arguments.output_csv_file_path,
+                script_arguments.output_parquet_file_path,
+            ] if output_file_path is not None
+        ]:
+            script_logger.error(
+                msg="The previous output file of the incremental mapping cannot be overwritten by the output file."
+            )
+
+            raise SystemExit(1)
+
+        if script_arguments.work_queue_file_path is not None:
+            work_queue = ReactionSmilesWorkQueue(
+                database_file_path=script_arguments.work_queue_file_path,
+                lease_duration_in_s=script_arguments.work_queue_lease_duration
+            )
+
+            work_queue_progress = run_work_queue_worker(
+                work_queue=work_queue,
+                atom_to_atom_mapping_function=atom_to_atom_mapping_batch_function,
+                reaction_smiles_column_name=(
+                    "reaction_smiles" if script_arguments.reaction_smiles_column_name is None
+                    else script_arguments.reaction_smiles_column_name
+                ),
+                chunk_size=script_arguments.chunk_size,
+                input_csv_file_path=script_arguments.input_csv_file_path,
+                input_parquet_file_path=script_arguments.input_parquet_file_path,
+                input_line_file_path=script_arguments.input_line_file_path,
+                output_csv_file_path=script_arguments.output_csv_file_path,
+                output_parquet_file_path=script_arguments.output_parquet_file_path,
+                time_budget=time_budget,
+                logger=script_logger
+            )
+
+            script_logger.info(
+                msg=(
+                    "The work queue worker has finished. The number of chunks per status: {work_queue_progress}."
+                ).format(
+                    work_queue_progress=work_queue_progress
+                )
+            )
+
+            if work_queue_progress["failed"] > 0:
+                script_logger.error(
+                    msg=(
+                        "The mapping of {number_of_failed_chunks:d} work queue chunk(s) has been unsuccessful after "
+                        "the maximum number of attempts. The failed row ranges: {failed_row_ranges:s}."
+                    ).format(
+                        number_of_failed_chunks=work_queue_progress["failed"],
+                        failed_row_ranges=", ".join(
+                            "{start_row_index:d}-{end_row_index:d}".format(
+                                start_row_index=start_row_index,
+                                end_row_index=end_row_index
+                            ) for _, start_row_index, end_row_index in work_queue.get_failed_chunks()
+                        )
+                    )
+                )
+
+                raise SystemExit(1)
+
+        else:
             map_reaction_smiles_strings(
+                atom_to_atom_mapping_function=atom_to_atom_mapping_batch_function,
+                reaction_smiles_column_name=(
+                    "reaction_smiles" if script_arguments.reaction_smiles_column_name is None
+                    else script_arguments.reaction_smiles_column_name
+                ),
+                chunk_size=script_arguments.chunk_size,
                 input_csv_file_path=script_arguments.input_csv_file_path,
-                atom_to_atom_mapping_function=partial(
-                    rxnmapper.map_reaction_smiles_strings,
-                    batch_size=script_arguments.batch_size
+                input_parquet_file_path=script_arguments.input_parquet_file_path,
+                input_line_file_path=script_arguments.input_line_file_path,
+                input_reaction_file_path=script_arguments.input_reaction_file_path,
+                rdf_data_field_names=script_arguments.rdf_data_field_names,
+                read_rxn_blocks=(
+                    script_arguments.atom_to_atom_mapping_approach == "indigo" and
+                    not script_arguments.normalize_reaction_smiles_strings
                 ),
-                reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
-                output_csv_file_path=script_arguments.output_csv_file_path
+                output_csv_file_path=script_arguments.output_csv_file_path,
+                output_parquet_file_path=script_arguments.output_parquet_file_path,
+                input_shard=InputShard(
+                    number_of_shards=script_arguments.number_of_shards,
+                    shard_index=script_arguments.shard_index,
+                    sharding_mode=script_arguments.sharding_mode
+                ) if script_arguments.number_of_shards > 1 else None,
+                maximum_queue_size=script_arguments.maximum_queue_size if script_arguments.pipelined_execution else 0,
+                time_budget=time_budget,
+                remainder_file_path=(
+                    script_arguments.remainder_file_path if script_arguments.remainder_file_path is not None
+                    else get_remainder_file_path(
+                        output_csv_file_path=script_arguments.output_csv_file_path,
+                        output_parquet_file_path=script_arguments.output_parquet_file_path
+                    )
+                ),
+                mapping_configuration=mapping_configuration,
+                previous_output_file_path=script_arguments.previous_output_file_path,
+                logger=script_logger
             )
 
-    else:
-        script_logger.error(
-            msg="The atom-to-atom mapping approach '{atom_to_atom_mapping_approach:s}' is not supported.".format(
-                atom_to_atom_mapping_approach=script_arguments.atom_to_atom_mapping_approach
+    if (
+        (script_arguments.input_file_paths is not None or script_arguments.input_manifest_file_path is not None) and
+        script_arguments.output_directory_path is not None
+    ):
+        run_summary = map_input_files(
+            input_file_mapping_function=partial(
+                map_reaction_smiles_strings,
+                atom_to_atom_mapping_function=atom_to_atom_mapping_batch_function,
+                reaction_smiles_column_name=(
+                    "reaction_smiles" if script_arguments.reaction_smiles_column_name is None
+                    else script_arguments.reaction_smiles_column_name
+                ),
+                chunk_size=script_arguments.chunk_size,
+                rdf_data_field_names=script_arguments.rdf_data_field_names,
+                read_rxn_blocks=(
+                    script_arguments.atom_to_atom_mapping_approach == "indigo" and
+                    not script_arguments.normalize_reaction_smiles_strings
+                ),
+                input_shard=InputShard(
+                    number_of_shards=script_arguments.number_of_shards,
+                    shard_index=script_arguments.shard_index,
+                    sharding_mode=script_arguments.sharding_mode
+                ) if script_arguments.number_of_shards > 1 else None,
+                maximum_queue_size=script_arguments.maximum_queue_size if script_arguments.pipelined_execution else 0,
+                time_budget=time_budget,
+                mapping_configuration=mapping_configuration,
+                logger=script_logger
+            ),
+            input_file_paths=get_input_file_paths(
+                input_file_paths=script_arguments.input_file_paths,
+                input_manifest_file_path=script_arguments.input_manifest_file_path
+            ),
+            output_directory_path=script_arguments.output_directory_path,
+            output_file_type=script_arguments.output_file_type,
+            previous_output_directory_path=script_arguments.previous_output_directory_path,
+            time_budget=time_budget,
+            logger=script_logger
+        )
+
+        script_logger.info(
+            msg=(
+                "The multiple input file summary. The number of input files: {number_of_input_files:d} (Successful: "
+                "{number_of_successful_input_files:d}, Unsuccessful: {number_of_unsuccessful_input_files:d}), rows: "
+                "{number_of_rows:d}, elapsed time: {elapsed_time_in_s:.1f} s, throughput: {throughput:.1f} rows/s."
+            ).format(
+                **run_summary
+            )
+        )
+
+        if len(run_summary["remainder_file_paths"]) > 0:
+            script_logger.warning(
+                msg=(
+                    "The {number_of_remainder_rows:d} input file row(s) that have not fit within the time budget have "
+                    "been written to the remainder files: {remainder_file_paths:s}."
+                ).format(
+                    number_of_remainder_rows=run_summary["number_of_remainder_rows"],
+                    remainder_file_paths=", ".join(
+                        "'{file_path:s}'".format(
+                            file_path=remainder_file_path
+                        ) for remainder_file_path in run_summary["remainder_file_paths"]
+                    )
+                )
+            )
+
+        if rxnmapper is not None:
+            run_summary["token_length_routing_summary"] = dict(rxnmapper.token_length_routing_summary)
+
+        if script_arguments.run_summary_file_path is not None:
+            with open(script_arguments.run_summary_file_path, "w") as run_summary_file_handle:
+                dump(
+                    obj=run_summary,
+                    fp=run_summary_file_handle,
+                    indent=4
+                )
+
+    if worker_recycling_process_pool is not None:
+        worker_recycling_process_pool.shutdown()
+
+    worker_memory_summary = (
+        worker_recycling_process_pool.get_memory_summary() if worker_recycling_process_pool is not None
+        else indigo.worker_memory_summary if indigo is not None else None
+    )
+
+    if worker_memory_summary is not None:
+        script_logger.info(
+            msg=(
+                "The worker process memory summary. The number of tasks: {number_of_tasks:d}, recycles: "
+                "{number_of_recycles:d}, peak memory: {peak_worker_memory_in_mb:.1f} MB, average memory: "
+                "{average_worker_memory_in_mb:.1f} MB."
+            ).format(
+                **worker_memory_summary
+            )
+        )
+
+    if local_mapper is not None and reaction_template_index is not None:
+        reaction_template_index.save(
+            file_path=script_arguments.reaction_template_index_file_path
+        )
+
+        script_logger.info(
+            msg=(
+                "The chemical reaction template fast path summary. The number of chemical reactions: "
+                "{number_of_reactions:d}, template matches: {number_of_template_matches:d} "
+                "({template_match_rate:.2%}), template miss time: {template_miss_time_in_s:.1f} s, estimated saved "
+                "time: {estimated_saved_time_in_s:.1f} s."
+            ).format(
+                **local_mapper.get_template_fast_path_summary()
+            )
+        )
+
+    if rxnmapper is not None:
+        script_logger.info(
+            msg=(
+                "The token length routing summary. The maximum number of tokens: {maximum_number_of_tokens:d}, "
+                "chemical reactions exceeding it: {number_of_routed_reactions:d}, mapped using the fallback approach: "
+                "{number_of_fallback_reactions:d}."
+            ).format(
+                maximum_number_of_tokens=rxnmapper.maximum_number_of_tokens,
+                **rxnmapper.token_length_routing_summary
+            )
+        )
+
+    if time_budget is not None:
+        script_logger.info(
+            msg=(
+                "The time budget summary. The time budget: {time_budget_in_s:.1f} s, elapsed time: "
+                "{elapsed_time_in_s:.1f} s, mapped rows: {number_of_processed_rows:d}, remaining rows: "
+                "{number_of_remaining_rows:d}, throughput: {throughput:.1f} rows/s."
+            ).format(
+                **time_budget.get_summary()
+            )
+        )
+
+    if failure_report is not None:
+        failure_report.write(
+            file_path=script_arguments.failure_report_file_path
+        )
+
+        script_logger.info(
+            msg=(
+                "The failure report summary. The number of failures: {number_of_failures:d}, failure classes: "
+                "{number_of_failure_classes:d}. The failure report has been written to '{file_path:s}'."
+            ).format(
+                number_of_failures=len(failure_report),
+                number_of_failure_classes=failure_report.get_summary()["number_of_failure_classes"],
+                file_path=script_arguments.failure_report_file_path
             )
         )
@@ -0,0 +1,54 @@
+""" The ``scripts`` directory ``merge_shard_output_files`` script. """
+
+from argparse import ArgumentParser, Namespace
+
+from atom_to_atom_mapping.utility import merge_shard_output_files
+
+
+def get_script_arguments() -> Namespace:
+    """
+    Get the script arguments.
+
+    :returns: The script arguments.
+    """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-isofp",
+        "--input_shard_output_file_paths",
+        nargs="+",
+        required=True,
+        type=str,
+        help="The paths to the shard output .csv or .parquet files of the map_reaction_smiles_strings script."
+    )
+
+    argument_parser.add_argument(
+        "-ofp",
+        "--output_file_path",
+        required=True,
+        type=str,
+        help="The path to the merged output .csv or .parquet file."
+    )
+
+    argument_parser.add_argument(
+        "-cs",
+        "--chunk_size",
+        default=100000,
+        type=int,
+        help="The number of shard output file rows that are read from each shard at once."
+    )
+
+    return argument_parser.parse_args()
+
+
+if __name__ == "__main__":
+    script_arguments = get_script_arguments()
+
+    print("The number of merged rows: {number_of_rows:d}".format(
+        number_of_rows=merge_shard_output_files(
+            shard_output_file_paths=script_arguments.input_shard_output_file_paths,
+            output_file_path=script_arguments.output_file_path,
+            chunk_size=script_arguments.chunk_size
+        )
+    ))
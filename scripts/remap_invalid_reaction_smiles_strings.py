@@ -0,0 +1,372 @@
+""" The ``scripts`` directory ``remap_invalid_reaction_smiles_strings`` script. """
+
+from argparse import ArgumentParser, Namespace
+from functools import partial
+from itertools import chain
+from logging import Formatter, Logger, StreamHandler, getLogger
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from numpy import flatnonzero
+
+from pandas import DataFrame
+
+from atom_to_atom_mapping.utility import (
+    OUTPUT_COLUMN_ARROW_DATA_TYPES,
+    ROW_INDEX_COLUMN_NAME,
+    read_csv_file_chunks,
+    read_parquet_file_chunks,
+    validate_mapped_reaction_smiles_strings,
+    write_csv_file_chunks,
+    write_parquet_file_chunks,
+)
+
+
+def get_script_arguments() -> Namespace:
+    """
+    Get the script arguments.
+
+    :returns: The script arguments.
+    """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-atama",
+        "--atom_to_atom_mapping_approach",
+        default="indigo",
+        type=str,
+        choices=[
+            "chytorch_rxnmap",
+            "indigo",
+            "local_mapper",
+            "rxnmapper",
+        ],
+        help="The atom-to-atom mapping approach for the re-mapping of the invalid rows."
+    )
+
+    argument_parser.add_argument(
+        "-icfp",
+        "--input_csv_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .csv file of the map_reaction_smiles_strings script."
+    )
+
+    argument_parser.add_argument(
+        "-ipfp",
+        "--input_parquet_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .parquet file of the map_reaction_smiles_strings script."
+    )
+
+    argument_parser.add_argument(
+        "-rscn",
+        "--reaction_smiles_column_name",
+        default="reaction_smiles",
+        type=str,
+        help="The name of the chemical reaction SMILES column in the input file."
+    )
+
+    argument_parser.add_argument(
+        "-ocfp",
+        "--output_csv_file_path",
+        default=None,
+        type=str,
+        help="The path to the merged output .csv file."
+    )
+
+    argument_parser.add_argument(
+        "-opfp",
+        "--output_parquet_file_path",
+        default=None,
+        type=str,
+        help="The path to the merged output .parquet file."
+    )
+
+    argument_parser.add_argument(
+        "-nop",
+        "--number_of_processes",
+        default=1,
+        type=int,
+        help="The number of processes, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-bs",
+        "--batch_size",
+        default=10,
+        type=int,
+        help="The size of the batch, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-cs",
+        "--chunk_size",
+        default=100000,
+        type=int,
+        help="The number of input file rows that are read, validated and re-mapped at once."
+    )
+
+    argument_parser.add_argument(
+        "-rpm",
+        "--reaction_pruning_mode",
+        default=None,
+        type=str,
+        choices=[
+            "drop",
+            "move",
+        ],
+        help=(
+            "The indicator of how the chemical reaction compounds that are unlikely to contribute any atoms to the "
+            "products should be pruned before the atom-to-atom mapping, if relevant."
+        )
+    )
+
+    return argument_parser.parse_args()
+
+
+def get_script_logger() -> Logger:
+    """
+    Get the script logger.
+
+    :returns: The script logger.
+    """
+
+    logger = getLogger(
+        name="script_logger"
+    )
+
+    logger.setLevel(
+        level="DEBUG"
+    )
+
+    formatter = Formatter(
+        fmt="[{name:s} @ {asctime:s}] {levelname:s}: \"{message:s}\"",
+        style="{"
+    )
+
+    stream_handler = StreamHandler()
+
+    stream_handler.setLevel(
+        level="DEBUG"
+    )
+
+    stream_handler.setFormatter(
+        fmt=formatter
+    )
+
+    logger.addHandler(
+        hdlr=stream_handler
+    )
+
+    return logger
+
+
+def remap_invalid_reaction_smiles_chunks(
+        input_chunks: Iterator[DataFrame],
+        atom_to_atom_mapping_function: Callable[[Sequence[str]], Optional[List[Dict[str, Any]]]],
+        reaction_smiles_column_name: str,
+        number_of_processes: int,
+        remapping_summary: Dict[str, int]
+) -> Iterator[Tuple[DataFrame, List[Dict[str, Any]]]]:
+    """
+    Validate the chunks of the atom-to-atom mapping outputs, re-map only the chemical reaction SMILES strings of the
+    invalid rows, and merge the valid re-mapped outputs back into the chunks.
+
+    :parameter input_chunks: The chunks of the input rows and atom-to-atom mapping outputs.
+    :parameter atom_to_atom_mapping_function: The atom-to-atom mapping function.
+    :parameter reaction_smiles_column_name: The name of the chemical reaction SMILES column in the input chunks.
+    :parameter number_of_processes: The number of mapping validation processes.
+    :parameter remapping_summary: The summary of the re-mapping that is updated in place.
+
+    :returns: The iterator of the chunks of the input rows and merged atom-to-atom mapping outputs.
+    """
+
+    for input_chunk in input_chunks:
+        output_column_names = [
+            column_name for column_name in input_chunk.columns
+            if column_name in OUTPUT_COLUMN_ARROW_DATA_TYPES and column_name != "is_remapped"
+        ]
+
+        outputs = input_chunk[output_column_names].to_dict(
+            orient="records"
+        )
+
+        for output, is_remapped in zip(
+            outputs,
+            input_chunk["is_remapped"].fillna(False).astype(bool).values if "is_remapped" in input_chunk.columns
+            else [False, ] * len(outputs)
+        ):
+            output["is_remapped"] = bool(is_remapped)
+
+        invalid_row_indices = flatnonzero(~validate_mapped_reaction_smiles_strings(
+            mapped_reaction_smiles_strings=input_chunk["mapped_reaction_smiles"].values.tolist(),
+            number_of_processes=number_of_processes,
+            chunk_size=max(1, -(-len(input_chunk) // number_of_processes))
+        )["is_mapping_valid"].values)
+
+        remapping_summary["number_of_rows"] += len(input_chunk)
+        remapping_summary["number_of_invalid_rows"] += len(invalid_row_indices)
+
+        if len(invalid_row_indices) > 0:
+            remapped_outputs = atom_to_atom_mapping_function(
+                input_chunk[reaction_smiles_column_name].values[invalid_row_indices].tolist()
+            )
+
+            is_remapping_valid = validate_mapped_reaction_smiles_strings(
+                mapped_reaction_smiles_strings=[
+                    remapped_output.get("mapped_reaction_smiles", None) for remapped_output in remapped_outputs
+                ]
+            )["is_mapping_valid"].values
+
+            for invalid_row_index, remapped_output, is_remapped_output_valid in zip(
+                invalid_row_indices,
+                remapped_outputs,
+                is_remapping_valid
+            ):
+                if is_remapped_output_valid:
+                    outputs[invalid_row_index] = {
+                        **{
+                            output_column_name: remapped_output.get(output_column_name, None)
+                            for output_column_name in output_column_names
+                        },
+                        "is_remapped": True,
+                    }
+
+                    remapping_summary["number_of_remapped_rows"] += 1
+
+        yield input_chunk.drop(
+            columns=output_column_names + (["is_remapped", ] if "is_remapped" in input_chunk.columns else [])
+        ), outputs
+
+
+if __name__ == "__main__":
+    script_arguments = get_script_arguments()
+
+    script_logger = get_script_logger()
+
+    if script_arguments.atom_to_atom_mapping_approach == "chytorch_rxnmap":
+        from atom_to_atom_mapping.chytorch_rxnmap import ChytorchRxnMapAtomToAtomMapping
+
+        atom_to_atom_mapping_batch_function = ChytorchRxnMapAtomToAtomMapping(
+            logger=script_logger
+        ).map_reaction_smiles_strings
+
+    elif script_arguments.atom_to_atom_mapping_approach == "indigo":
+        from atom_to_atom_mapping.indigo import IndigoAtomToAtomMapping
+
+        atom_to_atom_mapping_batch_function = partial(
+            IndigoAtomToAtomMapping(
+                logger=script_logger
+            ).map_reaction_smiles_strings,
+            number_of_processes=script_arguments.number_of_processes
+        )
+
+    elif script_arguments.atom_to_atom_mapping_approach == "local_mapper":
+        from atom_to_atom_mapping.local_mapper import LocalMapperAtomToAtomMapping
+
+        atom_to_atom_mapping_batch_function = partial(
+            LocalMapperAtomToAtomMapping(
+                logger=script_logger,
+                reaction_pruning_mode=script_arguments.reaction_pruning_mode
+            ).map_reaction_smiles_strings,
+            batch_size=script_arguments.batch_size
+        )
+
+    elif script_arguments.atom_to_atom_mapping_approach == "rxnmapper":
+        from atom_to_atom_mapping.rxnmapper import RXNMapperAtomToAtomMapping
+
+        atom_to_atom_mapping_batch_function = partial(
+            RXNMapperAtomToAtomMapping(
+                logger=script_logger,
+                reaction_pruning_mode=script_arguments.reaction_pruning_mode
+            ).map_reaction_smiles_strings,
+            batch_size=script_arguments.batch_size
+        )
+
+    else:
+        script_logger.error(
+            msg="The atom-to-atom mapping approach '{atom_to_atom_mapping_approach:s}' is not supported.".format(
+                atom_to_atom_mapping_approach=script_arguments.atom_to_atom_mapping_approach
+            )
+        )
+
+        raise SystemExit(1)
+
+    if script_arguments.input_parquet_file_path is not None:
+        input_file_chunks = read_parquet_file_chunks(
+            file_path=script_arguments.input_parquet_file_path,
+            reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
+            chunk_size=script_arguments.chunk_size,
+            read_reaction_smiles_column_only=False
+        )
+
+    elif script_arguments.input_csv_file_path is not None:
+        input_file_chunks = read_csv_file_chunks(
+            file_path=script_arguments.input_csv_file_path,
+            reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
+            chunk_size=script_arguments.chunk_size
+        )
+
+    else:
+        script_logger.error(
+            msg="The path to the input .csv or .parquet file has not been specified."
+        )
+
+        raise SystemExit(1)
+
+    first_input_file_chunk = next(input_file_chunks, None)
+
+    if first_input_file_chunk is None:
+        script_logger.error(
+            msg="The input file does not contain any rows."
+        )
+
+        raise SystemExit(1)
+
+    script_remapping_summary = {
+        "number_of_rows": 0,
+        "number_of_invalid_rows": 0,
+        "number_of_remapped_rows": 0,
+    }
+
+    output_file_chunks = remap_invalid_reaction_smiles_chunks(
+        input_chunks=chain([first_input_file_chunk, ], input_file_chunks),
+        atom_to_atom_mapping_function=atom_to_atom_mapping_batch_function,
+        reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
+        number_of_processes=script_arguments.number_of_processes,
+        remapping_summary=script_remapping_summary
+    )
+
+    if script_arguments.output_parquet_file_path is not None:
+        write_parquet_file_chunks(
+            file_path=script_arguments.output_parquet_file_path,
+            reaction_smiles_column_name=script_arguments.reaction_smiles_column_name,
+            chunks=output_file_chunks,
+            row_index_column_name=(
+                ROW_INDEX_COLUMN_NAME if ROW_INDEX_COLUMN_NAME in first_input_file_chunk.columns else None
+            )
+        )
+
+    elif script_arguments.output_csv_file_path is not None:
+        write_csv_file_chunks(
+            file_path=script_arguments.output_csv_file_path,
+            chunks=output_file_chunks
+        )
+
+    else:
+        script_logger.error(
+            msg="The path to the output .csv or .parquet file has not been specified."
+        )
+
+        raise SystemExit(1)
+
+    script_logger.info(
+        msg=(
+            "The re-mapping of the invalid rows has been completed. The number of rows: {number_of_rows:d}, invalid "
+            "rows: {number_of_invalid_rows:d}, successfully re-mapped rows: {number_of_remapped_rows:d}."
+        ).format(
+            **script_remapping_summary
+        )
+    )
@@ -0,0 +1,207 @@
+""" The ``scripts`` directory ``validate_mapped_reaction_smiles_strings`` script. """
+
+from argparse import ArgumentParser, Namespace
+from typing import Dict, Iterator, Optional
+
+from pandas import DataFrame
+
+from pyarrow import Table
+from pyarrow.parquet import ParquetWriter
+
+from atom_to_atom_mapping.utility import (
+    MAPPING_VALIDATION_COLUMN_NAMES,
+    ROW_INDEX_COLUMN_NAME,
+    read_csv_file_chunks,
+    read_parquet_file_chunks,
+    validate_mapped_reaction_smiles_strings,
+)
+
+
+def get_script_arguments() -> Namespace:
+    """
+    Get the script arguments.
+
+    :returns: The script arguments.
+    """
+
+    argument_parser = ArgumentParser()
+
+    argument_parser.add_argument(
+        "-icfp",
+        "--input_csv_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .csv file of the map_reaction_smiles_strings script."
+    )
+
+    argument_parser.add_argument(
+        "-ipfp",
+        "--input_parquet_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .parquet file of the map_reaction_smiles_strings script."
+    )
+
+    argument_parser.add_argument(
+        "-mrscn",
+        "--mapped_reaction_smiles_column_name",
+        default="mapped_reaction_smiles",
+        type=str,
+        help="The name of the mapped chemical reaction SMILES column in the input file."
+    )
+
+    argument_parser.add_argument(
+        "-ocfp",
+        "--output_csv_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .csv file of the mapping validation results."
+    )
+
+    argument_parser.add_argument(
+        "-opfp",
+        "--output_parquet_file_path",
+        default=None,
+        type=str,
+        help="The path to the output .parquet file of the mapping validation results."
+    )
+
+    argument_parser.add_argument(
+        "-nop",
+        "--number_of_processes",
+        default=1,
+        type=int,
+        help="The number of processes."
+    )
+
+    argument_parser.add_argument(
+        "-cs",
+        "--chunk_size",
+        default=100000,
+        type=int,
+        help="The number of input file rows that are read and validated at once."
+    )
+
+    return argument_parser.parse_args()
+
+
+def validate_mapped_reaction_smiles_file_chunks(
+        mapped_reaction_smiles_column_name: str,
+        chunk_size: int,
+        number_of_processes: int,
+        input_csv_file_path: Optional[str] = None,
+        input_parquet_file_path: Optional[str] = None
+) -> Iterator[DataFrame]:
+    """
+    Validate the chunks of the mapped chemical reaction SMILES strings of an input file.
+
+    :parameter mapped_reaction_smiles_column_name: The name of the mapped chemical reaction SMILES column in the input
+        file.
+    :parameter chunk_size: The number of input file rows that are read and validated at once.
+    :parameter number_of_processes: The number of processes.
+    :parameter input_csv_file_path: The path to the input .csv file.
+    :parameter input_parquet_file_path: The path to the input .parquet file.
+
+    :returns: The iterator of the chunks of the mapping validation results with the input file row indices.
+    """
+
+    if input_parquet_file_path is not None:
+        input_chunks = read_parquet_file_chunks(
+            file_path=input_parquet_file_path,
+            reaction_smiles_column_name=mapped_reaction_smiles_column_name,
+            chunk_size=chunk_size
+        )
+
+    else:
+        input_chunks = read_csv_file_chunks(
+            file_path=input_csv_file_path,
+            reaction_smiles_column_name=mapped_reaction_smiles_column_name,
+            chunk_size=chunk_size,
+            read_reaction_smiles_column_only=True
+        )
+
+    number_of_rows = 0
+
+    for input_chunk in input_chunks:
+        validation_chunk = validate_mapped_reaction_smiles_strings(
+            mapped_reaction_smiles_strings=input_chunk[mapped_reaction_smiles_column_name].values.tolist(),
+            number_of_processes=number_of_processes,
+            chunk_size=max(1, -(-len(input_chunk) // number_of_processes))
+        )
+
+        validation_chunk.insert(
+            loc=0,
+            column=ROW_INDEX_COLUMN_NAME,
+            value=range(number_of_rows, number_of_rows + len(validation_chunk))
+        )
+
+        number_of_rows += len(validation_chunk)
+
+        yield validation_chunk
+
+
+if __name__ == "__main__":
+    script_arguments = get_script_arguments()
+
+    if script_arguments.input_csv_file_path is None and script_arguments.input_parquet_file_path is None:
+        raise SystemExit("The path to the input .csv or .parquet file has not been specified.")
+
+    validation_summary: Dict[str, int] = {
+        "number_of_rows": 0,
+        "number_of_invalid_rows": 0,
+    }
+
+    for validation_column_name in MAPPING_VALIDATION_COLUMN_NAMES[1:]:
+        validation_summary[validation_column_name.replace("number_of_", "number_of_rows_with_", 1)] = 0
+
+    parquet_writer = None
+
+    try:
+        for validation_chunk in validate_mapped_reaction_smiles_file_chunks(
+            mapped_reaction_smiles_column_name=script_arguments.mapped_reaction_smiles_column_name,
+            chunk_size=script_arguments.chunk_size,
+            number_of_processes=script_arguments.number_of_processes,
+            input_csv_file_path=script_arguments.input_csv_file_path,
+            input_parquet_file_path=script_arguments.input_parquet_file_path
+        ):
+            validation_summary["number_of_rows"] += len(validation_chunk)
+            validation_summary["number_of_invalid_rows"] += int((~validation_chunk["is_mapping_valid"]).sum())
+
+            for validation_column_name in MAPPING_VALIDATION_COLUMN_NAMES[1:]:
+                validation_summary[validation_column_name.replace("number_of_", "number_of_rows_with_", 1)] += int(
+                    (validation_chunk[validation_column_name] > 0).sum()
+                )
+
+            if script_arguments.output_csv_file_path is not None:
+                validation_chunk.to_csv(
+                    path_or_buf=script_arguments.output_csv_file_path,
+                    mode="w" if validation_summary["number_of_rows"] == len(validation_chunk) else "a",
+                    header=validation_summary["number_of_rows"] == len(validation_chunk),
+                    index=False
+                )
+
+            if script_arguments.output_parquet_file_path is not None:
+                validation_table = Table.from_pandas(
+                    df=validation_chunk,
+                    preserve_index=False
+                )
+
+                if parquet_writer is None:
+                    parquet_writer = ParquetWriter(
+                        where=script_arguments.output_parquet_file_path,
+                        schema=validation_table.schema
+                    )
+
+                parquet_writer.write_table(
+                    table=validation_table
+                )
+
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    for validation_summary_key, validation_summary_value in validation_summary.items():
+        print("{validation_summary_key:s}: {validation_summary_value:d}".format(
+            validation_summary_key=validation_summary_key,
+            validation_summary_value=validation_summary_value
+        ))
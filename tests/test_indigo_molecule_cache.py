@@ -0,0 +1,83 @@
+""" The ``tests`` directory ``test_indigo_molecule_cache`` module. """
+
+import pytest
+
+pytest.importorskip("indigo")
+
+from atom_to_atom_mapping.indigo import IndigoAtomToAtomMapping  # noqa: E402
+from atom_to_atom_mapping.indigo.indigo import _get_process_indigo_molecule_cache  # noqa: E402
+
+
+REACTION_SMILES_STRINGS = [
+    "CC(=O)O.OCC>>CC(=O)OCC",
+    "CN.CC(=O)Cl>>CNC(C)=O",
+    "c1ccccc1Br.OB(O)c1ccccc1>[Pd].CCO>c1ccc(-c2ccccc2)cc1",
+    "CC=O.[BH4-].[Na+]>>CCO",
+    "C[C@H](N)C(=O)O.CO>>C[C@H](N)C(=O)OC",
+    "[13CH3]I.[O-]c1ccccc1>>[13CH3]Oc1ccccc1",
+    "O=C1CCCCC1.[NH4+].[Cl-]>O>NC1CCCCC1",
+    "CC(=O)O.OCC>>CC(=O)OCC",
+]
+
+UNSPLITTABLE_REACTION_SMILES_STRINGS = [
+    "(CC(=O)O.OCC)>>CC(=O)OCC",
+    "CC(=O)[O-].[Na+].BrCC>>CC(=O)OCC |f:0.1|",
+    "[CH3:1][NH2:2]>>[CH3:1][NH:2]C",
+]
+
+
+def test_cached_reaction_loading_parity() -> None:
+    """
+    Test whether the chemical reactions that are assembled from the cached chemical compounds are mapped identically
+    to the chemical reactions that are loaded without the molecule cache.
+    """
+
+    uncached_atom_to_atom_mapping = IndigoAtomToAtomMapping()
+    cached_atom_to_atom_mapping = IndigoAtomToAtomMapping(
+        maximum_molecule_cache_size=100
+    )
+
+    for reaction_smiles in REACTION_SMILES_STRINGS + UNSPLITTABLE_REACTION_SMILES_STRINGS:
+        uncached_output = uncached_atom_to_atom_mapping._map_reaction_smiles(
+            reaction_smiles=reaction_smiles
+        )
+
+        cached_output = cached_atom_to_atom_mapping._map_reaction_smiles(
+            reaction_smiles=reaction_smiles
+        )
+
+        assert cached_output["mapped_reaction_smiles"] == uncached_output["mapped_reaction_smiles"]
+        assert cached_output["status_code"] == uncached_output["status_code"]
+
+
+def test_unsplittable_reactions_bypass_the_molecule_cache() -> None:
+    """
+    Test whether the chemical reactions with the component-level grouping, CXSMILES extensions or atom map numbers are
+    loaded without the molecule cache.
+    """
+
+    _, molecule_cache = _get_process_indigo_molecule_cache(
+        maximum_molecule_cache_size=101
+    )
+
+    atom_to_atom_mapping = IndigoAtomToAtomMapping(
+        maximum_molecule_cache_size=101
+    )
+
+    for reaction_smiles in UNSPLITTABLE_REACTION_SMILES_STRINGS:
+        atom_to_atom_mapping._load_reaction(
+            reaction_smiles=reaction_smiles
+        )
+
+    assert molecule_cache.number_of_hits + molecule_cache.number_of_misses == 0
+
+
+def test_molecule_caches_are_keyed_by_maximum_size() -> None:
+    """ Test whether the molecule caches of the current process are keyed by their maximum size. """
+
+    for maximum_molecule_cache_size in (10, 20, ):
+        _, molecule_cache = _get_process_indigo_molecule_cache(
+            maximum_molecule_cache_size=maximum_molecule_cache_size
+        )
+
+        assert molecule_cache.maximum_size == maximum_molecule_cache_size
@@ -0,0 +1,125 @@
+""" The ``tests`` directory ``test_indigo_time_budget_escalation`` module. """
+
+from pandas import DataFrame, read_csv
+
+from pyarrow.parquet import read_table
+
+import pytest
+
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+from atom_to_atom_mapping.utility.reaction_smiles_file import write_csv_file_chunks, write_parquet_file_chunks
+from atom_to_atom_mapping.utility.time_budget import TimeBudget
+
+
+REACTION_SMILES_STRINGS = [
+    "CC(=O)O.OCC>>CC(=O)OCC",
+    "CN.CC(=O)Cl>>CNC(C)=O",
+    "c1ccccc1Br.OB(O)c1ccccc1>>c1ccc(-c2ccccc2)cc1",
+]
+
+
+def test_parquet_file_chunks_are_aligned(
+        tmp_path
+) -> None:
+    """ Test whether the .parquet file chunks with the missing output columns are aligned to the first chunk. """
+
+    file_path = str(tmp_path / "output.parquet")
+
+    number_of_rows = write_parquet_file_chunks(
+        file_path=file_path,
+        reaction_smiles_column_name="reaction_smiles",
+        chunks=[
+            (
+                DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS[:2]}),
+                [
+                    {"mapped_reaction_smiles": None, "status_code": None, "mapping_pass": None, },
+                    {"mapped_reaction_smiles": "[CH3:1][NH2:2]>>[CH3:1][NH2:2]", "status_code": 1, "mapping_pass": 2, },
+                ],
+            ),
+            (
+                DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS[2:]}),
+                [
+                    {"mapped_reaction_smiles": "[CH3:1][NH2:2]>>[CH3:1][NH2:2]", "status_code": 1, },
+                ],
+            ),
+        ]
+    )
+
+    table = read_table(file_path)
+
+    assert number_of_rows == 3
+    assert table.column_names == ["reaction_smiles", "mapped_reaction_smiles", "status_code", "mapping_pass", ]
+    assert table.column("mapping_pass").to_pylist() == [None, 2, None, ]
+
+
+def test_csv_file_chunks_are_aligned(
+        tmp_path
+) -> None:
+    """ Test whether the .csv file chunks with the missing output columns are aligned to the first chunk. """
+
+    file_path = str(tmp_path / "output.csv")
+
+    write_csv_file_chunks(
+        file_path=file_path,
+        chunks=[
+            (
+                DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS[:1]}),
+                [{"mapped_reaction_smiles": "A", "status_code": 1, "mapping_pass": 1, }, ],
+            ),
+            (
+                DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS[1:]}),
+                MappingResultBatch.from_outputs([
+                    {"status_code": 1, "mapped_reaction_smiles": "B", },
+                    {"status_code": 0, "mapped_reaction_smiles": "C", },
+                ]),
+            ),
+        ]
+    )
+
+    dataframe = read_csv(file_path)
+
+    assert dataframe.columns.tolist() == ["reaction_smiles", "mapped_reaction_smiles", "status_code", "mapping_pass", ]
+    assert dataframe["mapped_reaction_smiles"].tolist() == ["A", "B", "C", ]
+    assert dataframe["status_code"].tolist() == [1, 1, 0, ]
+
+
+def test_budget_limited_timeout_escalation_to_parquet_file(
+        tmp_path
+) -> None:
+    """
+    Test whether the timeout escalation that is reduced to one pass by the time budget still produces the mapping pass
+    column, so that the chunks can be written to a .parquet file.
+    """
+
+    pytest.importorskip("indigo")
+
+    from atom_to_atom_mapping.indigo import IndigoAtomToAtomMapping
+
+    indigo = IndigoAtomToAtomMapping()
+
+    chunks = list()
+
+    for time_budget in (TimeBudget(time_budget_in_s=3600.0), TimeBudget(time_budget_in_s=0.0), ):
+        indigo_outputs = indigo.map_reaction_smiles_strings(
+            REACTION_SMILES_STRINGS,
+            timeout_period_in_ms=100,
+            maximum_timeout_period_in_ms=1000,
+            time_budget=time_budget
+        )
+
+        assert "mapping_pass" in indigo_outputs.column_names
+
+        chunks.append((DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS}), indigo_outputs, ))
+
+    file_path = str(tmp_path / "output.parquet")
+
+    number_of_rows = write_parquet_file_chunks(
+        file_path=file_path,
+        reaction_smiles_column_name="reaction_smiles",
+        chunks=chunks
+    )
+
+    table = read_table(file_path)
+
+    assert number_of_rows == table.num_rows == 2 * len(REACTION_SMILES_STRINGS)
+    assert "mapping_pass" in table.column_names
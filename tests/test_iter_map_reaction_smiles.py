@@ -0,0 +1,113 @@
+""" The ``tests`` directory ``test_iter_map_reaction_smiles`` module. """
+
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from atom_to_atom_mapping.base import AtomToAtomMappingBase
+from atom_to_atom_mapping.utility.mapping_result_batch import MappingResultBatch
+
+
+REACTION_SMILES_STRINGS = ["C{row_index:d}>>CC".format(row_index=row_index) for row_index in range(10)]
+
+
+class _PlaceholderAtomToAtomMapping(AtomToAtomMappingBase):
+    """ The placeholder chemical reaction compound atom-to-atom mapping class that records its batch sizes. """
+
+    default_batch_size = 3
+
+    def __init__(
+            self
+    ) -> None:
+        """ The `__init__` method of the class. """
+
+        super().__init__()
+
+        self.batch_sizes: List[int] = list()
+
+    def map_reaction_smiles(
+            self,
+            reaction_smiles: str
+    ) -> Dict[str, Any]:
+        """
+        Map a chemical reaction SMILES string.
+
+        :parameter reaction_smiles: The SMILES string of the chemical reaction.
+
+        :returns: The placeholder mapped chemical reaction SMILES string.
+        """
+
+        return {
+            "mapped_reaction_smiles": reaction_smiles,
+        }
+
+    def map_reaction_smiles_strings(
+            self,
+            reaction_smiles_strings: Sequence[str]
+    ) -> MappingResultBatch:
+        """
+        Map the chemical reaction SMILES strings.
+
+        :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+        :returns: The batch of the placeholder mapped chemical reaction SMILES strings.
+        """
+
+        self.batch_sizes.append(len(reaction_smiles_strings))
+
+        return MappingResultBatch.from_outputs([
+            self.map_reaction_smiles(
+                reaction_smiles=reaction_smiles
+            ) for reaction_smiles in reaction_smiles_strings
+        ])
+
+
+@pytest.mark.parametrize("batch_size, expected_batch_sizes", [(None, [3, 3, 3, 1, ], ), (4, [4, 4, 2, ], ), ])
+def test_default_batch_size_is_adjustable(
+        batch_size,
+        expected_batch_sizes: List[int]
+) -> None:
+    """ Test whether the batch size of the default streaming method is set by the subclass or by the caller. """
+
+    atom_to_atom_mapping = _PlaceholderAtomToAtomMapping()
+
+    outputs = list(atom_to_atom_mapping.iter_map_reaction_smiles(
+        iter(REACTION_SMILES_STRINGS),
+        batch_size=batch_size,
+        return_indices=True
+    ))
+
+    assert atom_to_atom_mapping.batch_sizes == expected_batch_sizes
+    assert [
+        (row_index, output["mapped_reaction_smiles"], ) for row_index, output in outputs
+    ] == list(enumerate(REACTION_SMILES_STRINGS))
+
+
+def test_indigo_stream_reuses_one_process_pool(
+        monkeypatch
+) -> None:
+    """ Test whether the streaming Indigo atom-to-atom mapping reuses one process pool for all of the batches. """
+
+    pytest.importorskip("indigo")
+
+    from atom_to_atom_mapping.indigo import IndigoAtomToAtomMapping
+    from atom_to_atom_mapping.indigo import indigo as indigo_module
+
+    process_pools = list()
+
+    class _WorkerRecyclingProcessPool(indigo_module.WorkerRecyclingProcessPool):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+
+            process_pools.append(self)
+
+    monkeypatch.setattr(indigo_module, "WorkerRecyclingProcessPool", _WorkerRecyclingProcessPool)
+
+    outputs = list(IndigoAtomToAtomMapping().iter_map_reaction_smiles(
+        iter(["CC(=O)O.OCC>>CC(=O)OCC", ] * 10),
+        batch_size=2,
+        number_of_processes=2
+    ))
+
+    assert len(outputs) == 10
+    assert len(process_pools) == 1
@@ -0,0 +1,71 @@
+""" The ``tests`` directory ``test_reaction_template_index`` module. """
+
+from atom_to_atom_mapping.utility.reaction_template_index import ReactionTemplateIndex
+
+
+ESTERIFICATION_TEMPLATE_SMARTS = "[C:1](=[O:2])[OH:3].[OH:4][CH2:5]>>[C:1](=[O:2])[O:4][CH2:5]"
+SUZUKI_COUPLING_TEMPLATE_SMARTS = "[c:1][Br:2].[B:3][c:4]>>[c:1][c:4]"
+
+
+def test_reaction_templates_are_screened_and_matched(
+        monkeypatch
+) -> None:
+    """
+    Test whether the chemical reaction templates whose pattern fingerprints do not fit the chemical reaction are not
+    applied, and whether the matching chemical reaction template maps the chemical reaction.
+    """
+
+    reaction_template_index = ReactionTemplateIndex(
+        reaction_template_counts={
+            SUZUKI_COUPLING_TEMPLATE_SMARTS: 3,
+            ESTERIFICATION_TEMPLATE_SMARTS: 2,
+        }
+    )
+
+    applied_reaction_templates = list()
+
+    apply_reaction_template = reaction_template_index._apply_reaction_template
+
+    def _apply_reaction_template(**kwargs):
+        applied_reaction_templates.append(kwargs["compiled_reaction_template"])
+
+        return apply_reaction_template(**kwargs)
+
+    monkeypatch.setattr(reaction_template_index, "_apply_reaction_template", _apply_reaction_template)
+
+    template_output = reaction_template_index.map_reaction_smiles(
+        reaction_smiles="CC(=O)O.OCC>>CC(=O)OCC"
+    )
+
+    assert template_output is not None
+    assert template_output["mapped_reaction_template_smarts"] == ESTERIFICATION_TEMPLATE_SMARTS
+    assert all(
+        compiled_reaction_template not in applied_reaction_templates
+        for compiled_reaction_template, _, _ in reaction_template_index._get_compiled_reaction_templates(
+            reaction_template_smarts=SUZUKI_COUPLING_TEMPLATE_SMARTS
+        )
+    )
+
+    applied_reaction_templates.clear()
+
+    assert reaction_template_index.map_reaction_smiles(
+        reaction_smiles="CN>>CNC"
+    ) is None
+    assert len(applied_reaction_templates) == 0
+
+
+def test_compiled_reaction_templates_are_bounded() -> None:
+    """ Test whether the number of the cached compiled chemical reaction templates is bounded. """
+
+    reaction_template_index = ReactionTemplateIndex(
+        reaction_template_counts={
+            ESTERIFICATION_TEMPLATE_SMARTS: 3,
+            SUZUKI_COUPLING_TEMPLATE_SMARTS: 2,
+        },
+        maximum_number_of_compiled_reaction_templates=1
+    )
+
+    assert reaction_template_index.map_reaction_smiles(
+        reaction_smiles="c1ccccc1Br.OB(O)c1ccccc1>>c1ccc(-c2ccccc2)cc1"
+    )["mapped_reaction_template_smarts"] == SUZUKI_COUPLING_TEMPLATE_SMARTS
+    assert len(reaction_template_index._compiled_reaction_templates) == 1
@@ -0,0 +1,181 @@
+""" The ``tests`` directory ``test_rxnmapper_truncated_forward_pass`` module. """
+
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+rxnmapper_core = pytest.importorskip("rxnmapper.core")
+rxnmapper_tokenization_smiles = pytest.importorskip("rxnmapper.tokenization_smiles")
+
+from atom_to_atom_mapping.rxnmapper import RXNMapperAtomToAtomMapping  # noqa: E402
+from atom_to_atom_mapping.rxnmapper import rxnmapper as rxnmapper_module  # noqa: E402
+
+
+REACTION_SMILES_STRINGS = [
+    "CC(=O)O.OCC>>CC(=O)OCC",
+    "c1ccccc1Br.OB(O)c1ccccc1>>c1ccc(-c2ccccc2)cc1",
+    "CN.CC(=O)Cl>>CNC(C)=O",
+]
+
+
+def _get_vocabulary_file_path() -> str:
+    """
+    Get the path to the vocabulary file of the RXNMapper tokenizer that is distributed with the `rxnmapper` package.
+
+    :returns: The path to the vocabulary file.
+    """
+
+    vocabulary_file_paths = sorted(Path(rxnmapper_core.__file__).parent.glob("**/vocab.txt"))
+
+    if len(vocabulary_file_paths) == 0:
+        pytest.skip("The vocabulary file of the RXNMapper tokenizer is not available.")
+
+    return str(vocabulary_file_paths[0])
+
+
+@pytest.fixture
+def get_random_rxnmapper() -> Callable[[], "rxnmapper_core.RXNMapper"]:
+    """
+    Get the function that constructs the RXNMapper instances with a small random ALBERT model instead of the
+    pre-trained one. The constructed instances share the same model.
+
+    :returns: The function that constructs the RXNMapper instances.
+    """
+
+    tokenizer = rxnmapper_tokenization_smiles.SmilesTokenizer(
+        _get_vocabulary_file_path()
+    )
+
+    torch.manual_seed(0)
+
+    model = transformers.AlbertModel(
+        transformers.AlbertConfig(
+            vocab_size=len(tokenizer),
+            embedding_size=16,
+            hidden_size=32,
+            num_hidden_layers=12,
+            num_attention_heads=8,
+            intermediate_size=48,
+            output_attentions=True,
+            attn_implementation="eager"
+        )
+    ).eval()
+
+    def _get_rxnmapper() -> "rxnmapper_core.RXNMapper":
+        rxnmapper = rxnmapper_core.RXNMapper.__new__(rxnmapper_core.RXNMapper)
+
+        rxnmapper.config = dict()
+        rxnmapper.model_type = "albert"
+        rxnmapper.attention_multiplier = 90.0
+        rxnmapper.head = 5
+        rxnmapper.layers = [10, ]
+        rxnmapper.logger = getLogger(__name__)
+        rxnmapper.model = model
+        rxnmapper.tokenizer = tokenizer
+        rxnmapper.device = torch.device("cpu")
+
+        return rxnmapper
+
+    return _get_rxnmapper
+
+
+def _get_atom_to_atom_mapping(
+        monkeypatch,
+        get_random_rxnmapper: Callable[[], "rxnmapper_core.RXNMapper"],
+        truncate_forward_pass: bool
+) -> RXNMapperAtomToAtomMapping:
+    """
+    Get the RXNMapper approach instance with a small random ALBERT model.
+
+    :parameter monkeypatch: The `pytest` monkeypatch fixture.
+    :parameter get_random_rxnmapper: The function that constructs the RXNMapper instances.
+    :parameter truncate_forward_pass: The indicator of whether the forward pass of the RXNMapper model should be
+        truncated.
+
+    :returns: The RXNMapper approach instance.
+    """
+
+    monkeypatch.setattr(rxnmapper_module, "RXNMapper", get_random_rxnmapper)
+
+    return RXNMapperAtomToAtomMapping(
+        truncate_forward_pass=truncate_forward_pass
+    )
+
+
+@pytest.mark.parametrize("force_layer, force_head", [(None, None, ), (0, 3, ), (4, None, ), (-1, 2, ), ])
+def test_truncated_forward_pass_attention_parity(
+        monkeypatch,
+        get_random_rxnmapper: Callable[[], "rxnmapper_core.RXNMapper"],
+        force_layer,
+        force_head
+) -> None:
+    """ Test whether the truncated forward pass produces the identical attention weights as the complete one. """
+
+    complete_atom_to_atom_mapping = _get_atom_to_atom_mapping(monkeypatch, get_random_rxnmapper, False)
+    truncated_atom_to_atom_mapping = _get_atom_to_atom_mapping(monkeypatch, get_random_rxnmapper, True)
+
+    complete_attentions = complete_atom_to_atom_mapping.rxnmapper.convert_batch_to_attns(
+        REACTION_SMILES_STRINGS,
+        force_layer=force_layer,
+        force_head=force_head
+    )
+
+    truncated_attentions = truncated_atom_to_atom_mapping.rxnmapper.convert_batch_to_attns(
+        REACTION_SMILES_STRINGS,
+        force_layer=force_layer,
+        force_head=force_head
+    )
+
+    assert len(truncated_attentions) == len(complete_attentions)
+
+    for truncated_attention, complete_attention in zip(truncated_attentions, complete_attentions):
+        assert torch.equal(truncated_attention, complete_attention)
+
+    assert truncated_atom_to_atom_mapping.rxnmapper.model.config.num_hidden_layers == 12
+
+
+def test_truncated_forward_pass_mapping_parity(
+        monkeypatch,
+        get_random_rxnmapper: Callable[[], "rxnmapper_core.RXNMapper"]
+) -> None:
+    """ Test whether the truncated forward pass produces the identical atom-to-atom mapping outputs. """
+
+    outputs = list()
+
+    for truncate_forward_pass in (False, True, ):
+        atom_to_atom_mapping = _get_atom_to_atom_mapping(monkeypatch, get_random_rxnmapper, truncate_forward_pass)
+
+        outputs.append([
+            (output["mapped_reaction_smiles"], output["confidence_score"], )
+            for output in atom_to_atom_mapping.map_reaction_smiles_strings(
+                REACTION_SMILES_STRINGS
+            ).to_dicts()
+        ])
+
+    assert all(mapped_reaction_smiles is not None for mapped_reaction_smiles, _ in outputs[0])
+    assert outputs[1] == outputs[0]
+
+
+def test_truncated_forward_pass_skips_layers(
+        monkeypatch,
+        get_random_rxnmapper: Callable[[], "rxnmapper_core.RXNMapper"]
+) -> None:
+    """ Test whether the truncated forward pass stops after the last utilized layer. """
+
+    atom_to_atom_mapping = _get_atom_to_atom_mapping(monkeypatch, get_random_rxnmapper, True)
+
+    executed_layers: List[int] = list()
+
+    atom_to_atom_mapping.rxnmapper.model.encoder.albert_layer_groups[0].register_forward_hook(
+        lambda module, inputs, outputs: executed_layers.append(1)
+    )
+
+    atom_to_atom_mapping.rxnmapper.convert_batch_to_attns(
+        REACTION_SMILES_STRINGS
+    )
+
+    assert len(executed_layers) == 11
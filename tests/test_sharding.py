@@ -0,0 +1,213 @@
+""" The ``tests`` directory ``test_sharding`` module. """
+
+from typing import Any, Dict, List, Optional
+
+from pandas import DataFrame, read_csv
+
+from pyarrow import Table, int64, schema, string
+from pyarrow.parquet import ParquetWriter, read_table
+
+import pytest
+
+from atom_to_atom_mapping.utility.reaction_smiles_file import read_csv_file_chunks, read_parquet_file_chunks
+from atom_to_atom_mapping.utility.sharding import (
+    ROW_INDEX_COLUMN_NAME,
+    InputShard,
+    merge_row_indexed_output_files,
+    merge_shard_output_files,
+)
+
+
+REACTION_SMILES_STRINGS = ["C{row_index:d}>>CC".format(row_index=row_index) for row_index in range(100)]
+
+
+def _write_shard_output_file(
+        file_path: str,
+        shard_index: int,
+        rows: List[Dict[str, Any]],
+        number_of_remainder_rows: int = 0,
+        parquet_schema: Optional[Any] = None
+) -> None:
+    """
+    Write a row range shard output file of two shards and its manifest file.
+
+    :parameter file_path: The path to the .parquet shard output file.
+    :parameter shard_index: The index of the shard.
+    :parameter rows: The rows of the shard output file, including the original row index column.
+    :parameter number_of_remainder_rows: The number of shard rows that have been written to the remainder file.
+    :parameter parquet_schema: The schema of the shard output file. The value `None` indicates that the schema should
+        be inferred.
+    """
+
+    table = Table.from_pylist(rows, schema=parquet_schema)
+
+    with ParquetWriter(
+        where=file_path,
+        schema=table.schema
+    ) as parquet_writer:
+        parquet_writer.write_table(table)
+
+    input_shard = InputShard(
+        number_of_shards=2,
+        shard_index=shard_index
+    )
+
+    input_shard.number_of_input_rows = 4
+    input_shard.number_of_shard_rows = len(rows) + number_of_remainder_rows
+
+    input_shard.write_manifest_file(
+        output_file_path=file_path,
+        number_of_written_rows=len(rows),
+        number_of_remainder_rows=number_of_remainder_rows
+    )
+
+
+@pytest.mark.parametrize("file_extension", [".csv", ".parquet", ])
+def test_row_range_chunks_are_read_from_the_start_row(
+        tmp_path,
+        file_extension: str
+) -> None:
+    """ Test whether the row range shard of the .csv and .parquet input files is read from its start row. """
+
+    file_path = str(tmp_path / "input{file_extension:s}".format(
+        file_extension=file_extension
+    ))
+
+    if file_extension == ".parquet":
+        DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS}).to_parquet(file_path, index=False, row_group_size=7)
+
+    else:
+        DataFrame({"reaction_smiles": REACTION_SMILES_STRINGS}).to_csv(file_path, index=False)
+
+    input_shard = InputShard(
+        number_of_shards=3,
+        shard_index=1
+    )
+
+    start_row_index, end_row_index = input_shard.get_row_range(
+        number_of_rows=len(REACTION_SMILES_STRINGS)
+    )
+
+    read_file_chunks = read_parquet_file_chunks if file_extension == ".parquet" else read_csv_file_chunks
+
+    input_chunks = list(read_file_chunks(
+        file_path=file_path,
+        reaction_smiles_column_name="reaction_smiles",
+        chunk_size=10,
+        start_row_index=start_row_index,
+        end_row_index=end_row_index
+    ))
+
+    shard_chunks = list(input_shard.select(
+        input_chunks=input_chunks,
+        reaction_smiles_column_name="reaction_smiles",
+        number_of_rows=len(REACTION_SMILES_STRINGS),
+        first_row_index=start_row_index
+    ))
+
+    assert sum(len(input_chunk) for input_chunk in input_chunks) == end_row_index - start_row_index
+    assert [
+        row_index for shard_chunk in shard_chunks for row_index in shard_chunk[ROW_INDEX_COLUMN_NAME].tolist()
+    ] == list(range(start_row_index, end_row_index))
+    assert [
+        reaction_smiles for shard_chunk in shard_chunks for reaction_smiles in shard_chunk["reaction_smiles"].tolist()
+    ] == REACTION_SMILES_STRINGS[start_row_index:end_row_index]
+    assert input_shard.number_of_shard_rows == end_row_index - start_row_index
+
+
+def test_shard_output_files_are_merged_to_the_union_schema(
+        tmp_path
+) -> None:
+    """ Test whether the shard output files with the different optional columns are merged to their union schema. """
+
+    shard_output_file_paths = [str(tmp_path / "shard_0.parquet"), str(tmp_path / "shard_1.parquet"), ]
+
+    _write_shard_output_file(
+        file_path=shard_output_file_paths[0],
+        shard_index=0,
+        rows=[
+            {ROW_INDEX_COLUMN_NAME: 0, "reaction_smiles": "A", "mapped_reaction_smiles": "a", "mapping_pass": None, },
+            {ROW_INDEX_COLUMN_NAME: 1, "reaction_smiles": "B", "mapped_reaction_smiles": "b", "mapping_pass": None, },
+        ],
+        parquet_schema=schema([
+            (ROW_INDEX_COLUMN_NAME, int64(), ),
+            ("reaction_smiles", string(), ),
+            ("mapped_reaction_smiles", string(), ),
+            ("mapping_pass", "null", ),
+        ])
+    )
+
+    _write_shard_output_file(
+        file_path=shard_output_file_paths[1],
+        shard_index=1,
+        rows=[
+            {ROW_INDEX_COLUMN_NAME: 2, "reaction_smiles": "C", "mapped_reaction_smiles": "c", "status_code": 1, },
+            {ROW_INDEX_COLUMN_NAME: 3, "reaction_smiles": "D", "mapped_reaction_smiles": None, "status_code": 0, },
+        ]
+    )
+
+    output_file_path = str(tmp_path / "output.parquet")
+
+    assert merge_shard_output_files(
+        shard_output_file_paths=shard_output_file_paths,
+        output_file_path=output_file_path,
+        chunk_size=1
+    ) == 4
+
+    table = read_table(output_file_path)
+
+    assert table.column_names == ["reaction_smiles", "mapped_reaction_smiles", "mapping_pass", "status_code", ]
+    assert table.schema.field("mapping_pass").type == int64()
+    assert table.column("status_code").to_pylist() == [None, None, 1, 0, ]
+
+    with pytest.raises(ValueError):
+        merge_row_indexed_output_files(
+            output_file_paths=shard_output_file_paths,
+            merged_output_file_path=str(tmp_path / "output.csv")
+        )
+
+    csv_shard_output_file_paths = list()
+
+    for shard_output_file_path in shard_output_file_paths:
+        csv_shard_output_file_paths.append(shard_output_file_path.replace(".parquet", ".csv"))
+
+        read_table(shard_output_file_path).to_pandas().to_csv(csv_shard_output_file_paths[-1], index=False)
+
+    merge_row_indexed_output_files(
+        output_file_paths=csv_shard_output_file_paths,
+        merged_output_file_path=str(tmp_path / "output.csv")
+    )
+
+    assert read_csv(str(tmp_path / "output.csv")).columns.tolist() == table.column_names
+
+
+def test_shard_remainder_rows_are_validated(
+        tmp_path
+) -> None:
+    """ Test whether the shard output files with the remainder rows of the time budget are not merged. """
+
+    shard_output_file_paths = [str(tmp_path / "shard_0.parquet"), str(tmp_path / "shard_1.parquet"), ]
+
+    _write_shard_output_file(
+        file_path=shard_output_file_paths[0],
+        shard_index=0,
+        rows=[
+            {ROW_INDEX_COLUMN_NAME: 0, "reaction_smiles": "A", },
+            {ROW_INDEX_COLUMN_NAME: 1, "reaction_smiles": "B", },
+        ]
+    )
+
+    _write_shard_output_file(
+        file_path=shard_output_file_paths[1],
+        shard_index=1,
+        rows=[
+            {ROW_INDEX_COLUMN_NAME: 2, "reaction_smiles": "C", },
+        ],
+        number_of_remainder_rows=1
+    )
+
+    with pytest.raises(ValueError, match="remainder"):
+        merge_shard_output_files(
+            shard_output_file_paths=shard_output_file_paths,
+            output_file_path=str(tmp_path / "output.parquet")
+        )
@@ -0,0 +1,284 @@
+""" The ``tests`` directory ``test_work_queue`` module. """
+
+from json import load
+from multiprocessing import get_context
+from os.path import exists
+from sqlite3 import connect
+from time import sleep, time
+from typing import Any, Dict, List, Optional, Sequence
+
+from pandas import DataFrame, read_csv
+
+from atom_to_atom_mapping.utility.work_queue import (
+    ReactionSmilesWorkQueue,
+    get_failed_chunk_manifest_file_path,
+    run_work_queue_worker,
+)
+
+
+NUMBER_OF_ROWS = 50
+CHUNK_SIZE = 5
+
+
+def _map_reaction_smiles_strings(
+        reaction_smiles_strings: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    Map the chemical reaction SMILES strings by a placeholder atom-to-atom mapping function.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+    :returns: The placeholder atom-to-atom mapping outputs.
+    """
+
+    if any("BAD" in reaction_smiles for reaction_smiles in reaction_smiles_strings):
+        raise ValueError("The chemical reaction SMILES string batch cannot be mapped.")
+
+    sleep(0.05)
+
+    return [
+        {
+            "mapped_reaction_smiles": "mapped:{reaction_smiles:s}".format(
+                reaction_smiles=reaction_smiles
+            ),
+        } for reaction_smiles in reaction_smiles_strings
+    ]
+
+
+def _map_reaction_smiles_strings_forever(
+        reaction_smiles_strings: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """
+    Simulate a worker that hangs while mapping the chemical reaction SMILES strings.
+
+    :parameter reaction_smiles_strings: The SMILES strings of the chemical reactions.
+
+    :returns: The function never returns.
+    """
+
+    sleep(3600)
+
+    return list()
+
+
+def _run_worker(
+        database_file_path: str,
+        input_csv_file_path: str,
+        output_csv_file_path: str,
+        worker_id: str,
+        hangs: bool = False
+) -> None:
+    """
+    Run a work queue worker process.
+
+    :parameter database_file_path: The path to the SQLite database file of the work queue.
+    :parameter input_csv_file_path: The path to the input .csv file.
+    :parameter output_csv_file_path: The path to the output .csv file.
+    :parameter worker_id: The identifier of the worker.
+    :parameter hangs: The indicator of whether the worker should hang while mapping its first chunk.
+    """
+
+    run_work_queue_worker(
+        work_queue=ReactionSmilesWorkQueue(
+            database_file_path=database_file_path,
+            lease_duration_in_s=1.0,
+            worker_id=worker_id
+        ),
+        atom_to_atom_mapping_function=(
+            _map_reaction_smiles_strings_forever if hangs else _map_reaction_smiles_strings
+        ),
+        reaction_smiles_column_name="reaction_smiles",
+        chunk_size=CHUNK_SIZE,
+        input_csv_file_path=input_csv_file_path,
+        output_csv_file_path=output_csv_file_path,
+        polling_period_in_s=0.2
+    )
+
+
+def _get_chunk_lease(
+        database_file_path: str,
+        worker_id: str
+) -> Optional[int]:
+    """
+    Get the index of the chunk that is leased by a worker.
+
+    :parameter database_file_path: The path to the SQLite database file of the work queue.
+    :parameter worker_id: The identifier of the worker.
+
+    :returns: The index of the leased chunk. The value `None` indicates that the worker has no leased chunk.
+    """
+
+    if not exists(database_file_path):
+        return None
+
+    connection = connect(database_file_path, timeout=60.0)
+
+    try:
+        chunk = connection.execute(
+            "SELECT chunk_index FROM chunks WHERE status = 'leased' AND worker_id = ?",
+            (worker_id, )
+        ).fetchone()
+
+    except Exception:
+        return None
+
+    finally:
+        connection.close()
+
+    return None if chunk is None else chunk[0]
+
+
+def _write_input_csv_file(
+        file_path: str,
+        bad_row_indices: Sequence[int] = ()
+) -> List[str]:
+    """
+    Write the input .csv file of the work queue.
+
+    :parameter file_path: The path to the input .csv file.
+    :parameter bad_row_indices: The indices of the rows that cannot be mapped.
+
+    :returns: The chemical reaction SMILES strings of the input .csv file.
+    """
+
+    reaction_smiles_strings = [
+        "{prefix:s}C{row_index:d}>>CC".format(
+            prefix="BAD" if row_index in bad_row_indices else "",
+            row_index=row_index
+        ) for row_index in range(NUMBER_OF_ROWS)
+    ]
+
+    DataFrame({"reaction_smiles": reaction_smiles_strings}).to_csv(file_path, index=False)
+
+    return reaction_smiles_strings
+
+
+def test_killed_worker_lease_is_reclaimed(
+        tmp_path
+) -> None:
+    """
+    Test whether the chunk lease of a killed worker is reclaimed by the other local workers, and whether the merged
+    output file contains every row in the original order.
+    """
+
+    database_file_path = str(tmp_path / "work_queue.sqlite")
+    input_csv_file_path = str(tmp_path / "input.csv")
+    output_csv_file_path = str(tmp_path / "output.csv")
+
+    reaction_smiles_strings = _write_input_csv_file(
+        file_path=input_csv_file_path
+    )
+
+    context = get_context("spawn")
+
+    hanging_worker = context.Process(
+        target=_run_worker,
+        args=(database_file_path, input_csv_file_path, output_csv_file_path, "hanging_worker", True, )
+    )
+
+    hanging_worker.start()
+
+    start_time = time()
+
+    while _get_chunk_lease(database_file_path, "hanging_worker") is None:
+        assert time() - start_time < 60.0, "The hanging worker has not leased a chunk."
+
+        sleep(0.05)
+
+    killed_chunk_index = _get_chunk_lease(database_file_path, "hanging_worker")
+
+    hanging_worker.kill()
+    hanging_worker.join()
+
+    workers = [
+        context.Process(
+            target=_run_worker,
+            args=(database_file_path, input_csv_file_path, output_csv_file_path, "worker_{index:d}".format(
+                index=worker_index
+            ), )
+        ) for worker_index in range(2)
+    ]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join(timeout=120.0)
+
+        assert worker.exitcode == 0
+
+    connection = connect(database_file_path)
+
+    try:
+        status, worker_id, number_of_attempts = connection.execute(
+            "SELECT status, worker_id, number_of_attempts FROM chunks WHERE chunk_index = ?",
+            (killed_chunk_index, )
+        ).fetchone()
+
+    finally:
+        connection.close()
+
+    assert status == "completed"
+    assert worker_id != "hanging_worker"
+    assert number_of_attempts == 2
+
+    output_dataframe = read_csv(output_csv_file_path)
+
+    assert output_dataframe["reaction_smiles"].tolist() == reaction_smiles_strings
+    assert output_dataframe["mapped_reaction_smiles"].tolist() == [
+        "mapped:{reaction_smiles:s}".format(
+            reaction_smiles=reaction_smiles
+        ) for reaction_smiles in reaction_smiles_strings
+    ]
+
+    assert not exists(get_failed_chunk_manifest_file_path(output_csv_file_path))
+
+
+def test_failed_chunks_are_reported(
+        tmp_path
+) -> None:
+    """
+    Test whether the chunks that fail after the maximum number of attempts do not block the merge, and whether their
+    row ranges are written to the failed chunk manifest file.
+    """
+
+    database_file_path = str(tmp_path / "work_queue.sqlite")
+    input_csv_file_path = str(tmp_path / "input.csv")
+    output_csv_file_path = str(tmp_path / "output.csv")
+
+    reaction_smiles_strings = _write_input_csv_file(
+        file_path=input_csv_file_path,
+        bad_row_indices=(7, 31, )
+    )
+
+    work_queue_progress = run_work_queue_worker(
+        work_queue=ReactionSmilesWorkQueue(
+            database_file_path=database_file_path,
+            lease_duration_in_s=1.0
+        ),
+        atom_to_atom_mapping_function=_map_reaction_smiles_strings,
+        reaction_smiles_column_name="reaction_smiles",
+        chunk_size=CHUNK_SIZE,
+        input_csv_file_path=input_csv_file_path,
+        output_csv_file_path=output_csv_file_path,
+        polling_period_in_s=0.2
+    )
+
+    assert work_queue_progress["failed"] == 2
+    assert work_queue_progress["completed"] == NUMBER_OF_ROWS // CHUNK_SIZE - 2
+
+    output_dataframe = read_csv(output_csv_file_path)
+
+    assert output_dataframe["reaction_smiles"].tolist() == [
+        reaction_smiles for row_index, reaction_smiles in enumerate(reaction_smiles_strings)
+        if not 5 <= row_index < 10 and not 30 <= row_index < 35
+    ]
+
+    with open(get_failed_chunk_manifest_file_path(output_csv_file_path), "r") as file_handle:
+        failed_chunk_manifest = load(file_handle)
+
+    assert failed_chunk_manifest["number_of_failed_rows"] == 10
+    assert [
+        (failed_chunk["start_row_index"], failed_chunk["end_row_index"], )
+        for failed_chunk in failed_chunk_manifest["failed_chunks"]
+    ] == [(5, 10, ), (30, 35, ), ]